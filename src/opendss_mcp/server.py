@@ -5,23 +5,32 @@ This module implements an MCP server for OpenDSS power system simulations,
 providing comprehensive tools for distribution planning, DER integration analysis,
 and power quality assessment. Reduces distribution planning studies from weeks to minutes
 through conversational AI interaction.
+
+Tool modules (and with them OpenDSS, matplotlib and networkx) are imported
+when a tool first needs them, so the server answers the MCP handshake
+quickly. Set OPENDSS_MCP_PREWARM=1 to import them in the background once the
+client has finished initializing.
 """
 
+import asyncio
+import importlib
+import json
 import logging
+import os
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
 
 # MCP SDK imports
-from mcp.server.fastmcp import FastMCP
+from mcp import types
+from mcp.server.fastmcp import Context, FastMCP
 
-# Local imports - All 7 tools
-from .tools.feeder_loader import load_ieee_test_feeder
-from .tools.power_flow import run_power_flow
-from .tools.voltage_checker import check_voltage_violations
-from .tools.capacity import analyze_feeder_capacity
-from .tools.der_optimizer import optimize_der_placement
-from .tools.timeseries import run_time_series_simulation
-from .tools.visualization import generate_visualization
+# Local imports - tool modules are imported on first use (see tool_function)
+from .utils.formatters import format_error_response, format_success_response
+from .utils.instrumentation import instrumentation
+from .utils.jobs import job_manager
+from .utils.sessions import run_in_session, session_manager
 
 # Configure logging
 logging.basicConfig(
@@ -34,24 +43,102 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP(name="opendss-mcp-server")
 
+# Environment variable that imports the tool modules in the background
+PREWARM_ENV = "OPENDSS_MCP_PREWARM"
+
+# Tool functions, as "module:attribute" relative to this package
+TOOL_FUNCTIONS = {
+    "get_loaded_feeder": ".tools.feeder_loader:get_loaded_feeder",
+    "load_ieee_test_feeder": ".tools.feeder_loader:load_ieee_test_feeder",
+    "run_power_flow": ".tools.power_flow:run_power_flow",
+    "check_voltage_violations": ".tools.voltage_checker:check_voltage_violations",
+    "run_fault_study": ".tools.fault_study:run_fault_study",
+    "analyze_feeder_capacity": ".tools.capacity:analyze_feeder_capacity",
+    "analyze_hosting_capacity_map": ".tools.hosting_capacity:analyze_hosting_capacity_map",
+    "analyze_stochastic_hosting_capacity": ".tools.stochastic_capacity:analyze_stochastic_hosting_capacity",
+    "run_contingency_analysis": ".tools.contingency:run_contingency_analysis",
+    "optimize_der_placement": ".tools.der_optimizer:optimize_der_placement",
+    "fetch_result": ".tools.results:fetch_result",
+    "delete_result": ".tools.results:delete_result",
+    "run_time_series_simulation": ".tools.timeseries:run_time_series_simulation",
+    "generate_visualization": ".tools.visualization:generate_visualization",
+}
+
+# Tools that can be run as background jobs: MCP tool name -> tool function
+JOB_TOOLS = {
+    "analyze_capacity": "analyze_feeder_capacity",
+    "analyze_hosting_capacity_map": "analyze_hosting_capacity_map",
+    "analyze_stochastic_hosting_capacity": "analyze_stochastic_hosting_capacity",
+    "optimize_der": "optimize_der_placement",
+    "run_contingency_analysis": "run_contingency_analysis",
+    "run_timeseries": "run_time_series_simulation",
+}
+
+
+def tool_function(name: str) -> Callable[..., Any]:
+    """
+    Return a tool function, importing its module on first use.
+
+    Args:
+        name: Key of TOOL_FUNCTIONS
+
+    Returns:
+        The module-level tool function (picklable, so it can be sent to
+        session and job processes)
+    """
+    module_name, attribute = TOOL_FUNCTIONS[name].split(":")
+    return getattr(importlib.import_module(module_name, __package__), attribute)
+
+
+def prewarm() -> float:
+    """
+    Import every tool module now instead of on first use.
+
+    Returns:
+        Seconds spent importing
+    """
+    started = time.perf_counter()
+    for name in TOOL_FUNCTIONS:
+        tool_function(name)
+    elapsed = time.perf_counter() - started
+    logger.info(f"Pre-warmed tool modules in {elapsed:.2f}s")
+    return elapsed
+
+
+async def _prewarm_after_initialized(
+    notification: types.InitializedNotification,
+) -> None:
+    """Start importing the tool modules once the client has finished the handshake."""
+    threading.Thread(target=prewarm, name="opendss-prewarm", daemon=True).start()
+
 
 @mcp.tool()
-def load_feeder(
-    feeder_id: str, modifications: Optional[Dict[str, Any]] = None
+@instrumentation.tool()
+async def load_feeder(
+    feeder_id: str,
+    modifications: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Load an IEEE test feeder into the OpenDSS engine.
 
     Args:
         feeder_id: Identifier of the IEEE test feeder (e.g., 'IEEE13', 'IEEE34', 'IEEE123')
+            or a synthetic feeder for scaling studies ('SYNTH1K', 'SYNTH10K', 'SYNTH50K')
         modifications: Optional dictionary of modifications to apply to the feeder
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary containing the loaded feeder data and metadata
     """
     try:
         logger.info(f"Loading feeder: {feeder_id}")
-        result = load_ieee_test_feeder(feeder_id, modifications or {})
+        result = await run_in_session(
+            session_id,
+            tool_function("load_ieee_test_feeder"),
+            feeder_id,
+            modifications or {},
+        )
 
         if not result.get("success", False):
             error_msg = result.get("errors", ["Unknown error loading feeder"])
@@ -66,8 +153,11 @@ def load_feeder(
 
 
 @mcp.tool()
-def run_power_flow_analysis(
-    feeder_id: str, options: Optional[Dict[str, Any]] = None
+@instrumentation.tool()
+async def run_power_flow_analysis(
+    feeder_id: str,
+    options: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Run power flow analysis on a loaded feeder.
@@ -78,13 +168,21 @@ def run_power_flow_analysis(
             - max_iterations: Maximum number of iterations (default: 100)
             - tolerance: Convergence tolerance (default: 0.0001)
             - control_mode: Control mode for the solution (default: 'snapshot')
+            - solve_strategy: Start of the solution ("auto", "warm", "cold")
+              (default: "auto")
+            - inline_limit: Maximum number of per-bus values returned inline;
+              larger results return a result_handle for fetch_result
+              (default: 10000)
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary containing power flow results and metadata
     """
     try:
         logger.info(f"Running power flow for feeder: {feeder_id}")
-        result = run_power_flow(feeder_id, options or {})
+        result = await run_in_session(
+            session_id, tool_function("run_power_flow"), feeder_id, options or {}
+        )
 
         if not result.get("success", False):
             error_msg = result.get("errors", ["Unknown error running power flow"])
@@ -99,10 +197,12 @@ def run_power_flow_analysis(
 
 
 @mcp.tool()
-def check_voltages(
+@instrumentation.tool()
+async def check_voltages(
     min_voltage_pu: float = 0.95,
     max_voltage_pu: float = 1.05,
     phase: Optional[str] = None,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Check all bus voltages against specified limits and identify violations.
@@ -111,6 +211,7 @@ def check_voltages(
         min_voltage_pu: Minimum acceptable voltage in per-unit (default: 0.95)
         max_voltage_pu: Maximum acceptable voltage in per-unit (default: 1.05)
         phase: Optional phase filter ('1', '2', '3', or None for all phases)
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary containing violations list, summary statistics, and metadata
@@ -119,7 +220,13 @@ def check_voltages(
         logger.info(
             f"Checking voltage violations with limits [{min_voltage_pu}, {max_voltage_pu}] pu"
         )
-        result = check_voltage_violations(min_voltage_pu, max_voltage_pu, phase)
+        result = await run_in_session(
+            session_id,
+            tool_function("check_voltage_violations"),
+            min_voltage_pu,
+            max_voltage_pu,
+            phase,
+        )
 
         if not result.get("success", False):
             error_msg = result.get("errors", ["Unknown error checking voltages"])
@@ -139,12 +246,69 @@ def check_voltages(
 
 
 @mcp.tool()
-def analyze_capacity(
+@instrumentation.tool()
+async def run_fault_study(
+    buses: Optional[List[str]] = None,
+    fault_resistance_ohm: float = 0.0,
+    inline_limit: Optional[int] = 10000,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compute short-circuit currents and Thevenin impedances for all buses.
+
+    Solves the feeder once in FaultStudy mode and returns, per bus, the
+    all-phase (3-phase), single-line-to-ground (max and min over phases) and
+    line-to-line fault currents in amperes, plus the positive and zero
+    sequence Thevenin impedances and X/R ratio, for protection screening.
+
+    Args:
+        buses: Buses to report (default: all)
+        fault_resistance_ohm: Fault resistance in ohms (default: 0, bolted faults)
+        inline_limit: Maximum number of per-bus values returned inline; larger
+            feeders return a result_handle for fetch_result (default: 10000)
+        session_id: Session to run in (default: the server's own circuit)
+
+    Returns:
+        Dictionary containing per-bus fault currents and impedances and the
+        maximum and minimum fault currents
+    """
+    try:
+        logger.info("Running fault study")
+        result = await run_in_session(
+            session_id,
+            tool_function("run_fault_study"),
+            buses=buses,
+            fault_resistance_ohm=fault_resistance_ohm,
+            inline_limit=inline_limit,
+        )
+
+        if not result.get("success", False):
+            error_msg = result.get("errors", ["Unknown error running fault study"])
+            logger.error(f"Fault study failed: {error_msg}")
+        else:
+            summary = result.get("data", {}).get("summary", {})
+            logger.info(f"Fault study completed for {summary.get('num_buses')} buses")
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Error running fault study: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def analyze_capacity(
     bus_id: str,
     der_type: str = "solar",
     increment_kw: float = 100,
     max_capacity_kw: float = 10000,
     constraints: Optional[Dict[str, Any]] = None,
+    search: str = "linear",
+    tolerance_kw: Optional[float] = None,
+    solve_strategy: str = "auto",
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Analyze maximum DER hosting capacity at a specific bus.
@@ -155,14 +319,27 @@ def analyze_capacity(
         increment_kw: Capacity increment for each iteration in kW (default: 100)
         max_capacity_kw: Maximum capacity to test in kW (default: 10000)
         constraints: Optional constraint limits (min_voltage_pu, max_voltage_pu, max_line_loading_pct)
+        search: Search strategy ("linear", "bisection", "secant") - default: "linear"
+        tolerance_kw: Final bracket width for bisection/secant search in kW (default: increment_kw)
+        solve_strategy: Start of each solution ("auto", "warm", "cold") - default: "auto"
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary containing capacity analysis results with max capacity, limiting constraint, and capacity curve
     """
     try:
         logger.info(f"Analyzing capacity at bus {bus_id} for {der_type} DER")
-        result = analyze_feeder_capacity(
-            bus_id, der_type, increment_kw, max_capacity_kw, constraints or {}
+        result = await run_in_session(
+            session_id,
+            tool_function("analyze_feeder_capacity"),
+            bus_id,
+            der_type,
+            increment_kw,
+            max_capacity_kw,
+            constraints or {},
+            search=search,
+            tolerance_kw=tolerance_kw,
+            solve_strategy=solve_strategy,
         )
 
         if not result.get("success", False):
@@ -181,14 +358,231 @@ def analyze_capacity(
         return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
 
 
+@mcp.tool(name="analyze_hosting_capacity_map")
+@instrumentation.tool("analyze_hosting_capacity_map")
+async def analyze_capacity_map(
+    bus_ids: Optional[list] = None,
+    der_type: str = "solar",
+    increment_kw: float = 100,
+    max_capacity_kw: float = 10000,
+    constraints: Optional[Dict[str, Any]] = None,
+    search: str = "bisection",
+    tolerance_kw: Optional[float] = None,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compute DER hosting capacity for every bus of the loaded feeder in parallel.
+
+    Args:
+        bus_ids: Buses to analyze (default: all buses except the source bus)
+        der_type: Type of DER ("solar", "battery", "wind") - default: "solar"
+        increment_kw: Capacity increment for the linear search in kW (default: 100)
+        max_capacity_kw: Maximum capacity to test in kW (default: 10000)
+        constraints: Optional constraint limits (min_voltage_pu, max_voltage_pu, max_line_loading_pct)
+        search: Search strategy ("linear", "bisection", "secant") - default: "bisection"
+        tolerance_kw: Final bracket width for bisection/secant search in kW (default: increment_kw)
+        solve_strategy: Start of each solution ("auto", "warm", "cold") - default: "auto"
+        max_workers: Number of worker processes (default: CPU count)
+        session_id: Session to run in (default: the server's own circuit)
+
+    Returns:
+        Dictionary containing a per-bus hosting capacity table and summary statistics
+    """
+    try:
+        logger.info(f"Analyzing hosting capacity map for {der_type} DER")
+        result = await run_in_session(
+            session_id,
+            tool_function("analyze_hosting_capacity_map"),
+            bus_ids=bus_ids,
+            der_type=der_type,
+            increment_kw=increment_kw,
+            max_capacity_kw=max_capacity_kw,
+            constraints=constraints or {},
+            search=search,
+            tolerance_kw=tolerance_kw,
+            solve_strategy=solve_strategy,
+            max_workers=max_workers,
+        )
+
+        if not result.get("success", False):
+            error_msg = result.get("errors", ["Unknown error analyzing capacity map"])
+            logger.error(f"Hosting capacity map failed: {error_msg}")
+        else:
+            summary = result.get("data", {}).get("summary", {})
+            logger.info(
+                f"Hosting capacity map: {summary.get('buses_analyzed', 0)} buses, "
+                f"min {summary.get('min_capacity_kw')} kW"
+            )
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Error analyzing hosting capacity map: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
+
+
 @mcp.tool()
-def optimize_der(
+@instrumentation.tool()
+async def analyze_stochastic_hosting_capacity(
+    num_scenarios: int = 100,
+    penetration_levels: Optional[List[float]] = None,
+    pv_size_range: Optional[List[float]] = None,
+    load_multiplier: float = 1.0,
+    constraints: Optional[Dict[str, Any]] = None,
+    seed: int = 0,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    inline_limit: Optional[int] = 10000,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate hosting capacity from many random customer PV deployments (Monte Carlo).
+
+    Each scenario places PV on a random order of customers (the feeder's
+    loads) with random sizes and is solved at every penetration level. Returns
+    the probability of a violation (overvoltage, undervoltage, line overload,
+    non-convergence) at each level and the distribution of scenario hosting
+    capacities. Long studies can be run with submit_job.
+
+    Args:
+        num_scenarios: Number of random deployments (default: 100, at most 10000)
+        penetration_levels: Percent of customers with PV to evaluate (default: 10, 20, ..., 100)
+        pv_size_range: [low, high] PV size as a multiple of customer load kW (default: [0.5, 2.0])
+        load_multiplier: Load level during the study, e.g. 0.3 for minimum daytime load (default: 1.0)
+        constraints: Optional constraint limits (min_voltage_pu, max_voltage_pu, max_line_loading_pct)
+        seed: Seed of the random deployments (default: 0)
+        solve_strategy: Start of each solution ("auto", "warm", "cold") - default: "auto"
+        max_workers: Number of worker processes (default: CPU count)
+        inline_limit: Maximum number of per-scenario values returned inline;
+            larger studies return a result_handle for fetch_result (default: 10000)
+        session_id: Session to run in (default: the server's own circuit)
+
+    Returns:
+        Dictionary containing the penetration curve, hosting capacity statistics
+        and per-scenario hosting capacities
+    """
+    try:
+        logger.info(
+            f"Analyzing stochastic hosting capacity over {num_scenarios} scenarios"
+        )
+        result = await run_in_session(
+            session_id,
+            tool_function("analyze_stochastic_hosting_capacity"),
+            num_scenarios=num_scenarios,
+            penetration_levels=penetration_levels,
+            pv_size_range=pv_size_range,
+            load_multiplier=load_multiplier,
+            constraints=constraints or {},
+            seed=seed,
+            solve_strategy=solve_strategy,
+            max_workers=max_workers,
+            inline_limit=inline_limit,
+        )
+
+        if not result.get("success", False):
+            error_msg = result.get(
+                "errors", ["Unknown error analyzing stochastic hosting capacity"]
+            )
+            logger.error(f"Stochastic hosting capacity failed: {error_msg}")
+        else:
+            hosting = result.get("data", {}).get("hosting_capacity", {})
+            logger.info(
+                f"Stochastic hosting capacity: minimum {hosting.get('minimum_pct')}%, "
+                f"median {hosting.get('scenario_pct', {}).get('median')}% of customers"
+            )
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Error analyzing stochastic hosting capacity: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def run_contingency_analysis(
+    elements: Optional[List[str]] = None,
+    element_types: Optional[List[str]] = None,
+    constraints: Optional[Dict[str, Any]] = None,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    inline_limit: Optional[int] = 10000,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run an N-1 contingency analysis: take each line/transformer out in turn.
+
+    Each element is opened, the feeder is re-solved and the new voltage and
+    line loading violations are recorded. Every contingency is classified as
+    non_convergent, islanded (nodes lost supply, with the load lost),
+    violations or secure without aborting the run. Long studies can be run
+    with submit_job.
+
+    Args:
+        elements: Elements to open, e.g. ["Line.650632", "Transformer.xfm1"] (default: all)
+        element_types: Types to screen when elements is not given ("line", "transformer") - default: both
+        constraints: Optional constraint limits (min_voltage_pu, max_voltage_pu, max_line_loading_pct)
+        solve_strategy: Start of each solution ("auto", "warm", "cold") - default: "auto"
+        max_workers: Number of worker processes (default: CPU count)
+        inline_limit: Maximum number of contingency table values returned inline;
+            larger studies return a result_handle for fetch_result (default: 10000)
+        session_id: Session to run in (default: the server's own circuit)
+
+    Returns:
+        Dictionary containing the per-contingency table, status counts and the
+        most critical contingencies
+    """
+    try:
+        logger.info("Running contingency analysis")
+        result = await run_in_session(
+            session_id,
+            tool_function("run_contingency_analysis"),
+            elements=elements,
+            element_types=element_types,
+            constraints=constraints or {},
+            solve_strategy=solve_strategy,
+            max_workers=max_workers,
+            inline_limit=inline_limit,
+        )
+
+        if not result.get("success", False):
+            error_msg = result.get(
+                "errors", ["Unknown error running contingency analysis"]
+            )
+            logger.error(f"Contingency analysis failed: {error_msg}")
+        else:
+            summary = result.get("data", {}).get("summary", {})
+            logger.info(
+                f"Contingency analysis: {summary.get('contingencies_analyzed')} contingencies, "
+                f"{summary.get('status_counts')}"
+            )
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Error running contingency analysis: {str(e)}"
+        logger.exception(error_msg)
+        return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def optimize_der(
     der_type: str,
     capacity_kw: float,
     battery_kwh: Optional[float] = None,
     objective: str = "minimize_losses",
     candidate_buses: Optional[list] = None,
     constraints: Optional[Dict[str, Any]] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    screening: str = "none",
+    top_k: int = 10,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Optimize DER placement to achieve specified objective.
@@ -198,8 +592,13 @@ def optimize_der(
         capacity_kw: DER capacity in kW
         battery_kwh: Battery energy capacity in kWh (optional)
         objective: Optimization objective ("minimize_losses", "maximize_capacity", "minimize_violations")
-        candidate_buses: List of bus IDs to evaluate (None = all buses, limited to 20)
+        candidate_buses: List of bus IDs to evaluate (None = all buses, limited to 20 unless parallel or screening)
         constraints: Optional constraint limits (min_voltage_pu, max_voltage_pu, max_candidates)
+        parallel: Evaluate candidates across worker processes (default: False)
+        max_workers: Number of worker processes when parallel (default: CPU count)
+        screening: Candidate pre-screening ("none" or "sensitivity")
+        top_k: Number of screened candidates evaluated with a full power flow (default: 10)
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary containing optimal bus, improvement metrics, and comparison table
@@ -208,13 +607,19 @@ def optimize_der(
         logger.info(
             f"Optimizing {der_type} DER placement ({capacity_kw} kW) with objective: {objective}"
         )
-        result = optimize_der_placement(
+        result = await run_in_session(
+            session_id,
+            tool_function("optimize_der_placement"),
             der_type,
             capacity_kw,
             battery_kwh,
             objective,
             candidate_buses,
             constraints or {},
+            parallel=parallel,
+            max_workers=max_workers,
+            screening=screening,
+            top_k=top_k,
         )
 
         if not result.get("success", False):
@@ -236,12 +641,20 @@ def optimize_der(
 
 
 @mcp.tool()
-def run_timeseries(
+@instrumentation.tool()
+async def run_timeseries(
     load_profile: str | dict,
     generation_profile: Optional[str | dict] = None,
     duration_hours: int = 24,
     timestep_minutes: int = 60,
     output_variables: Optional[list] = None,
+    mode: str = "snapshot",
+    stream: bool = False,
+    shard_steps: int = 1000,
+    constraints: Optional[Dict[str, float]] = None,
+    inline_limit: Optional[int] = 10000,
+    solve_strategy: str = "auto",
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Run time-series power flow simulation with load and generation profiles.
@@ -264,6 +677,22 @@ def run_timeseries(
             - "losses": System losses per timestep
             - "loadings": Line loading percentages
             - "powers": Bus power injections
+        mode: How profiles are applied (default: "snapshot"):
+            - "snapshot": Rescale loads from Python before each snapshot solve
+            - "loadshape": Attach profiles as OpenDSS LoadShapes and step natively
+        stream: Write per-step arrays to .npz shards on disk and return only the
+            summary and a result handle (default: False)
+        shard_steps: Timesteps per shard file when streaming (default: 1000)
+        constraints: Limits for the time-beyond-limit summary (min_voltage_pu,
+            max_voltage_pu, max_line_loading_pct; default: 0.95, 1.05, 100)
+        inline_limit: Maximum number of per-step values returned inline; longer
+            runs return a result_handle for fetch_result (default: 10000)
+        solve_strategy: Start of each step's solution (default: "auto"):
+            - "auto": Continue from the previous step unless it failed or the
+              load changed by more than 25%
+            - "warm": Always continue from the previous step
+            - "cold": Always start from a direct solution
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary with time-series results, summary statistics, and convergence info
@@ -272,12 +701,20 @@ def run_timeseries(
         logger.info(
             f"Running time-series simulation: {duration_hours}h at {timestep_minutes}min steps"
         )
-        result = run_time_series_simulation(
+        result = await run_in_session(
+            session_id,
+            tool_function("run_time_series_simulation"),
             load_profile=load_profile,
             generation_profile=generation_profile,
             duration_hours=duration_hours,
             timestep_minutes=timestep_minutes,
             output_variables=output_variables,
+            mode=mode,
+            stream=stream,
+            shard_steps=shard_steps,
+            constraints=constraints,
+            inline_limit=inline_limit,
+            solve_strategy=solve_strategy,
         )
 
         if not result.get("success", False):
@@ -305,10 +742,63 @@ def run_timeseries(
 
 
 @mcp.tool()
-def create_visualization(
+@instrumentation.tool()
+def fetch_result(
+    handle: str,
+    path: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Read one page of a large result that a tool stored instead of returning.
+
+    Tools return a result_handle (and stored_fields) when their per-bus or
+    per-step data is too large to send at once. Stored results are shared by
+    all sessions.
+
+    Args:
+        handle: Result handle returned by a tool
+        path: Location inside the result, e.g. "bus_voltages",
+            "harmonics.individual_harmonics.5" or "timesteps"; for streamed
+            time-series results, a column name (default: the top level)
+        offset: First entry to return (default: 0)
+        limit: Maximum number of entries to return (default: 100, at most 5000)
+        fields: Keys to keep from each entry, or columns of a streamed result
+
+    Returns:
+        Dictionary containing the requested items, total and next_offset
+    """
+    logger.info(f"Fetching {handle} path={path} offset={offset} limit={limit}")
+    return tool_function("fetch_result")(handle, path, offset, limit, fields)
+
+
+@mcp.tool()
+@instrumentation.tool()
+def delete_result(handle: str) -> Dict[str, Any]:
+    """
+    Delete a stored result once it is no longer needed.
+
+    Stored results are also deleted automatically after 24 hours or when the
+    results directory exceeds its size limit.
+
+    Args:
+        handle: Result handle returned by a tool
+
+    Returns:
+        Dictionary containing the handle, kind and freed_bytes of the result
+    """
+    logger.info(f"Deleting stored result {handle}")
+    return tool_function("delete_result")(handle)
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def create_visualization(
     plot_type: str,
     data_source: str = "last_power_flow",
     options: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Generate professional visualizations for power system analysis results.
@@ -336,13 +826,20 @@ def create_visualization(
             - title: Custom plot title
             - show_violations: Highlight voltage violations with colors (default: True)
             - bus_filter: List of specific buses to include (None = all)
+        session_id: Session to run in (default: the server's own circuit)
 
     Returns:
         Dictionary with visualization data (file path or base64 image) and metadata
     """
     try:
         logger.info(f"Creating {plot_type} visualization from {data_source}")
-        result = generate_visualization(plot_type, data_source, options or {})
+        result = await run_in_session(
+            session_id,
+            tool_function("generate_visualization"),
+            plot_type,
+            data_source,
+            options or {},
+        )
 
         if not result.get("success", False):
             error_msg = result.get("errors", ["Unknown error creating visualization"])
@@ -361,10 +858,256 @@ def create_visualization(
         return {"success": False, "data": None, "metadata": None, "errors": [error_msg]}
 
 
+@mcp.tool()
+@instrumentation.tool()
+def create_session(session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Open a session with its own OpenDSS engine.
+
+    Every session runs in a separate process with its own circuit and
+    solution settings, so tools called with different session_ids do not
+    affect each other. Pass the returned session_id to the other tools.
+
+    Args:
+        session_id: Name of the session (default: a generated identifier)
+
+    Returns:
+        Dictionary containing the session_id and the open sessions
+    """
+    try:
+        session_id = session_manager.create(session_id)
+        return format_success_response(
+            {"session_id": session_id, "open_sessions": session_manager.list_ids()}
+        )
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error creating session: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def close_session(session_id: str) -> Dict[str, Any]:
+    """
+    Close a session and stop its OpenDSS engine.
+
+    Args:
+        session_id: Session to close
+
+    Returns:
+        Dictionary containing the final usage information of the session
+    """
+    try:
+        # Closing waits for the session's running call and its process to stop
+        info = await asyncio.to_thread(session_manager.close, session_id)
+        return format_success_response(info)
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error closing session {session_id}: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
+
+
+@mcp.tool()
+@instrumentation.tool()
+def list_sessions() -> Dict[str, Any]:
+    """
+    List the open sessions.
+
+    Returns:
+        Dictionary containing usage information of every open session
+    """
+    return format_success_response({"sessions": session_manager.info()})
+
+
+@mcp.tool()
+@instrumentation.tool()
+def submit_job(
+    tool: str,
+    arguments: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Start a long-running study in the background and return a job ID at once.
+
+    Without a session the job runs in a worker process on its own copy of the
+    feeder loaded with load_feeder (changes made to the circuit afterwards are
+    not seen). With a session it runs on that session's circuit.
+
+    Args:
+        tool: Tool to run ("run_timeseries", "analyze_capacity", "optimize_der",
+            "analyze_hosting_capacity_map", "analyze_stochastic_hosting_capacity",
+            "run_contingency_analysis")
+        arguments: Arguments of the tool, as for a direct call
+        session_id: Session to run in (default: a job worker process)
+
+    Returns:
+        Dictionary containing the job_id and initial job status
+    """
+    try:
+        if tool not in JOB_TOOLS:
+            return format_error_response(
+                f"Unsupported job tool '{tool}'. Supported tools: {', '.join(JOB_TOOLS)}"
+            )
+        feeder = None
+        if session_id is None:
+            feeder = tool_function("get_loaded_feeder")()
+            if feeder is None:
+                return format_error_response(
+                    "No circuit loaded. Please load a feeder first using load_feeder tool."
+                )
+        job_id = job_manager.submit(
+            tool,
+            tool_function(JOB_TOOLS[tool]),
+            arguments or {},
+            feeder=feeder,
+            session_id=session_id,
+        )
+        return format_success_response(job_manager.status(job_id))
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error submitting {tool} job: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
+
+
+@mcp.tool()
+@instrumentation.tool()
+def get_job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Report the state and progress of a job, or of all jobs.
+
+    Args:
+        job_id: Job to report (default: all jobs)
+
+    Returns:
+        Dictionary containing state ("pending", "running", "cancelling",
+        "completed", "failed", "cancelled") and progress (done, total, percent)
+    """
+    try:
+        if job_id is None:
+            return format_success_response({"jobs": job_manager.info()})
+        return format_success_response(job_manager.status(job_id))
+    except ValueError as e:
+        return format_error_response(str(e))
+
+
+@mcp.tool()
+@instrumentation.tool()
+def get_job_result(job_id: str) -> Dict[str, Any]:
+    """
+    Return the result of a completed job.
+
+    Args:
+        job_id: Job whose result to return
+
+    Returns:
+        The tool's response, exactly as a direct call would return it
+    """
+    try:
+        return job_manager.result(job_id)
+    except ValueError as e:
+        return format_error_response(str(e))
+
+
+@mcp.tool()
+@instrumentation.tool()
+def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a pending or running job.
+
+    Pending jobs never start; running jobs stop at their next progress update.
+
+    Args:
+        job_id: Job to cancel
+
+    Returns:
+        Dictionary containing the job status after the request
+    """
+    try:
+        return format_success_response(job_manager.cancel(job_id))
+    except ValueError as e:
+        return format_error_response(str(e))
+
+
+@mcp.tool()
+@instrumentation.tool()
+async def wait_for_job(
+    job_id: str, timeout_s: float = 60.0, ctx: Optional[Context] = None
+) -> Dict[str, Any]:
+    """
+    Wait for a job to finish, sending progress notifications while it runs.
+
+    Args:
+        job_id: Job to wait for
+        timeout_s: Maximum seconds to wait before returning the current status
+            (default: 60)
+
+    Returns:
+        Dictionary containing the job status when it finished or the wait timed out
+    """
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout_s
+        while True:
+            status = job_manager.status(job_id)
+            progress = status["progress"]
+            if ctx is not None and progress["done"]:
+                await ctx.report_progress(
+                    progress["done"],
+                    progress["total"],
+                    f"{status['tool']}: {status['state']}",
+                )
+            if status["state"] in ("completed", "failed", "cancelled"):
+                return format_success_response(status)
+            if asyncio.get_running_loop().time() >= deadline:
+                return format_success_response(status)
+            await asyncio.sleep(0.5)
+    except ValueError as e:
+        return format_error_response(str(e))
+
+
+@mcp.tool()
+def get_performance_stats(reset: bool = False) -> Dict[str, Any]:
+    """
+    Report where tool calls spent their time.
+
+    For every tool called since the server started (or the last reset):
+    number of calls and errors, call duration statistics (mean, p50, p95,
+    max), time spent compiling, solving, extracting results, solving
+    harmonics, plotting and serializing, and OpenDSS API calls. Time spent
+    in sessions is included; time in background jobs is not.
+
+    Args:
+        reset: Clear the statistics after reporting them (default: False)
+
+    Returns:
+        Dictionary containing per-tool statistics
+    """
+    stats = instrumentation.stats()
+    if reset:
+        instrumentation.reset()
+    return format_success_response(stats, {"reset": reset})
+
+
+@mcp.resource("opendss://performance", mime_type="application/json")
+def performance_resource() -> str:
+    """Per-tool call counts, durations, phase timings and OpenDSS API calls."""
+    return json.dumps(instrumentation.stats(), indent=2)
+
+
 def main() -> None:
     """Start the MCP server with stdio transport."""
     try:
         logger.info("Starting OpenDSS MCP Server")
+        if os.environ.get(PREWARM_ENV, "") not in ("", "0", "false"):
+            # FastMCP has no public hook for the initialized notification
+            mcp._mcp_server.notification_handlers[types.InitializedNotification] = (
+                _prewarm_after_initialized
+            )
         mcp.run(transport="stdio")
     except Exception as e:
         logger.critical(f"Server error: {str(e)}", exc_info=True)
@@ -1,4 +1,4 @@
 """
 OpenDSS MCP Server tools package.
-Contains 7 MCP tools.
+Contains 8 MCP tools.
 """
@@ -6,11 +6,18 @@ at a specific bus before constraint violations occur.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import opendssdirect as dss
 
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.der_probe import DERProbe, bus_connection
 from ..utils.formatters import format_success_response, format_error_response
+from ..utils.line_loading import LineLoadings
+from ..utils.solver import SOLVE_STRATEGIES, PowerFlowSolver
+from ..utils.dss_wrapper import get_name_index
 from ..utils.validators import validate_positive_float
 from .voltage_checker import check_voltage_violations
 
@@ -22,6 +29,9 @@ MAX_ITERATIONS = 1000
 # Supported DER types
 SUPPORTED_DER_TYPES = ["solar", "battery", "wind"]
 
+# Supported capacity search strategies
+SUPPORTED_SEARCH_STRATEGIES = ["linear", "bisection", "secant"]
+
 
 def _check_line_loading() -> Dict[str, Any]:
     """Check if any lines exceed 100% loading.
@@ -36,41 +46,12 @@ def _check_line_loading() -> Dict[str, Any]:
     max_loading = 0.0
 
     try:
-        # Iterate through all lines
-        line_count = dss.Lines.Count()
-        if line_count == 0:
-            return {
-                "has_overloads": False,
-                "overloaded_lines": [],
-                "max_loading_pct": 0.0,
-            }
-
-        dss.Lines.First()
-        for _ in range(line_count):
-            line_name = dss.Lines.Name()
-
-            # Get line currents and normal ampacity
-            dss.Circuit.SetActiveElement(f"Line.{line_name}")
-            currents = dss.CktElement.CurrentsMagAng()
-            normal_amps = dss.CktElement.NormalAmps()
-
-            if normal_amps > 0 and currents:
-                # Get maximum phase current (currents are interleaved mag/angle)
-                phase_currents = [currents[i] for i in range(0, len(currents), 2)]
-                max_current = max(phase_currents) if phase_currents else 0.0
-
-                # Calculate loading percentage
-                loading_pct = (max_current / normal_amps) * 100.0
-
-                if loading_pct > max_loading:
-                    max_loading = loading_pct
-
-                if loading_pct > 100.0:
-                    overloaded_lines.append(
-                        {"line": line_name, "loading_pct": round(loading_pct, 2)}
-                    )
-
-            dss.Lines.Next()
+        # One bulk read of every line current
+        loadings = LineLoadings.capture()
+        loading_pct = loadings.loading_pct()
+        if np.any(loadings.rated):
+            max_loading = float(np.nanmax(loading_pct))
+        overloaded_lines = loadings.overloaded(100.0)
 
     except Exception as e:
         logger.error(f"Error checking line loading: {e}")
@@ -78,14 +59,18 @@ def _check_line_loading() -> Dict[str, Any]:
     return {
         "has_overloads": len(overloaded_lines) > 0,
         "overloaded_lines": overloaded_lines,
-        "max_loading_pct": round(max_loading, 2),
+        "max_loading_pct": round(max(max_loading, 0.0), 2),
     }
 
 
-def _add_der(bus_id: str, der_type: str, capacity_kw: float) -> bool:
-    """Add a DER to the specified bus.
+def _add_der(probe: DERProbe, bus_id: str, der_type: str, capacity_kw: float) -> bool:
+    """Connect the test DER to the specified bus with the given capacity.
+
+    The probe keeps one element per DER type and edits it in place, so
+    repeated calls move or resize the same element instead of adding new ones.
 
     Args:
+        probe: DER probe owning the test elements
         bus_id: Bus identifier
         der_type: Type of DER ("solar", "battery", "wind")
         capacity_kw: DER capacity in kW
@@ -94,32 +79,44 @@ def _add_der(bus_id: str, der_type: str, capacity_kw: float) -> bool:
         bool: True if DER was added successfully
     """
     try:
-        # Get bus voltage base
-        dss.Circuit.SetActiveBus(bus_id)
-        kv_base = dss.Bus.kVBase()
+        # Connect to every phase of the bus at its nominal voltage
+        connection = bus_connection(bus_id)
 
-        if kv_base == 0:
+        if connection is None:
             logger.error(f"Bus {bus_id} has zero voltage base")
             return False
 
-        # Create unique DER name
-        der_name = f"der_test_{bus_id}"
+        bus = connection["bus"]
+        rating = {"phases": connection["phases"], "kV": connection["kV"]}
 
         if der_type == "solar":
             # Add PV system
-            dss.Text.Command(
-                f"New PVSystem.{der_name} Bus1={bus_id} kV={kv_base} kVA={capacity_kw} Pmpp={capacity_kw} irradiance=1.0"
+            probe.place(
+                "PVSystem",
+                bus,
+                {
+                    **rating,
+                    "kVA": capacity_kw,
+                    "Pmpp": capacity_kw,
+                    "irradiance": 1.0,
+                },
             )
         elif der_type == "battery":
             # Add storage
-            dss.Text.Command(
-                f"New Storage.{der_name} Bus1={bus_id} kV={kv_base} kWrated={capacity_kw} kWhrated={capacity_kw * 4} %stored=100 %discharge=100"
+            probe.place(
+                "Storage",
+                bus,
+                {
+                    **rating,
+                    "kWrated": capacity_kw,
+                    "kWhrated": capacity_kw * 4,
+                    "%stored": 100,
+                    "%discharge": 100,
+                },
             )
         elif der_type == "wind":
             # Add generator (simplified wind model)
-            dss.Text.Command(
-                f"New Generator.{der_name} Bus1={bus_id} kV={kv_base} kW={capacity_kw} PF=1.0"
-            )
+            probe.place("Generator", bus, {**rating, "kW": capacity_kw, "PF": 1.0})
         else:
             logger.error(f"Unsupported DER type: {der_type}")
             return False
@@ -131,22 +128,206 @@ def _add_der(bus_id: str, der_type: str, capacity_kw: float) -> bool:
         return False
 
 
-def _remove_der(bus_id: str) -> None:
-    """Remove test DER from the circuit.
+def _capture_control_state() -> Dict[str, Any]:
+    """Record transformer taps and capacitor step states of the circuit.
+
+    Regulator taps and switched capacitors move during a solve and keep their
+    position for the next one. Restoring the baseline state before every
+    capacity evaluation makes each result independent of the order in which
+    capacities are tested, which the bisection and secant searches rely on.
+
+    Returns:
+        Dictionary with transformer taps and capacitor states
+    """
+    taps: List[tuple] = []
+    if dss.Transformers.First() > 0:
+        while True:
+            name = dss.Transformers.Name()
+            for winding in range(1, dss.Transformers.NumWindings() + 1):
+                dss.Transformers.Wdg(winding)
+                taps.append((name, winding, dss.Transformers.Tap()))
+            if not dss.Transformers.Next() > 0:
+                break
+
+    capacitors: List[tuple] = []
+    if dss.Capacitors.First() > 0:
+        while True:
+            capacitors.append((dss.Capacitors.Name(), dss.Capacitors.States()))
+            if not dss.Capacitors.Next() > 0:
+                break
+
+    return {"taps": taps, "capacitors": capacitors}
+
+
+def _restore_control_state(state: Dict[str, Any]) -> None:
+    """Restore taps and capacitor states recorded by _capture_control_state().
 
     Args:
+        state: Control state to restore
+    """
+    for name, winding, tap in state["taps"]:
+        dss.Transformers.Name(name)
+        dss.Transformers.Wdg(winding)
+        dss.Transformers.Tap(tap)
+    for name, states in state["capacitors"]:
+        dss.Capacitors.Name(name)
+        dss.Capacitors.States(states)
+
+
+def _capacity_margin(
+    snapshot: CircuitSnapshot,
+    loading_check: Dict[str, Any],
+    min_voltage_pu: float,
+    max_voltage_pu: float,
+    max_line_loading_pct: float,
+) -> float:
+    """Distance to the nearest constraint, in percent (negative when violated).
+
+    Voltage margins are expressed in percent of nominal voltage and loading
+    margins in percent of normal amps, so the smallest of them is the binding
+    constraint. Used by the secant search to estimate where the margin
+    crosses zero.
+
+    Args:
+        snapshot: Voltage snapshot of the current solution
+        loading_check: Result of _check_line_loading()
+        min_voltage_pu: Minimum voltage limit
+        max_voltage_pu: Maximum voltage limit
+        max_line_loading_pct: Maximum line loading limit
+
+    Returns:
+        Constraint margin in percent
+    """
+    voltages = snapshot.phase_matrix()
+    voltages = voltages[~np.isnan(voltages)]
+    margins = [min(max_line_loading_pct, 100.0) - loading_check["max_loading_pct"]]
+    if voltages.size:
+        margins.append((float(voltages.min()) - min_voltage_pu) * 100.0)
+        margins.append((max_voltage_pu - float(voltages.max())) * 100.0)
+    return min(margins)
+
+
+def _evaluate_capacity(
+    probe: DERProbe,
+    bus_id: str,
+    der_type: str,
+    capacity: float,
+    min_voltage_pu: float,
+    max_voltage_pu: float,
+    max_line_loading_pct: float,
+    control_state: Optional[Dict[str, Any]] = None,
+    solver: Optional[PowerFlowSolver] = None,
+    change: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Solve the circuit with a test DER of the given size and check constraints.
+
+    The test DER stays connected afterwards; the next evaluation resizes it.
+
+    Args:
+        probe: DER probe owning the test elements
         bus_id: Bus identifier
+        der_type: Type of DER ("solar", "battery", "wind")
+        capacity: DER capacity in kW
+        min_voltage_pu: Minimum voltage limit
+        max_voltage_pu: Maximum voltage limit
+        max_line_loading_pct: Maximum line loading limit
+        control_state: Optional baseline control state to restore before solving
+        solver: Solver choosing the start of the solution (default: a new
+            "auto" solver)
+        change: Relative size of the change since the previous solve
+
+    Returns:
+        Dictionary with the capacity curve point ("point"), the constraint
+        margin, the limiting constraint and violation details, or None if the
+        DER could not be added
     """
-    try:
-        der_name = f"der_test_{bus_id}"
-        # Try to disable all possible DER types
-        for element_type in ["PVSystem", "Storage", "Generator"]:
-            try:
-                dss.Text.Command(f"{element_type}.{der_name}.enabled=no")
-            except:
-                pass  # Element might not exist
-    except Exception as e:
-        logger.error(f"Error removing DER: {e}")
+    if not _add_der(probe, bus_id, der_type, capacity):
+        return None
+
+    if control_state is not None:
+        _restore_control_state(control_state)
+
+    # Run power flow; OpenDSS raises when control iterations run out
+    solve = (solver or PowerFlowSolver()).solve(change)
+    converged = solve["converged"]
+    if solve["error"]:
+        failure_details = f"Power flow solution failed: {solve['error']}"
+    else:
+        failure_details = "Power flow solution did not converge"
+
+    if not converged:
+        # Power flow didn't converge - capacity limit reached
+        return {
+            "point": None,
+            "margin": None,
+            "has_violations": True,
+            "limiting_constraint": "convergence_failure",
+            "violation_details": failure_details,
+        }
+
+    # Check voltage violations
+    snapshot = CircuitSnapshot.capture()
+    voltage_check = check_voltage_violations(
+        min_voltage_pu, max_voltage_pu, snapshot=snapshot
+    )
+    has_voltage_violations = (
+        voltage_check.get("success", False)
+        and voltage_check.get("data", {}).get("summary", {}).get("total_violations", 0)
+        > 0
+    )
+
+    # Check line loading
+    loading_check = _check_line_loading()
+    has_loading_violations = (
+        loading_check["has_overloads"]
+        or loading_check["max_loading_pct"] > max_line_loading_pct
+    )
+
+    point = {
+        "capacity_kw": round(capacity, 2),
+        "converged": True,
+        "voltage_violations": voltage_check.get("data", {})
+        .get("summary", {})
+        .get("total_violations", 0),
+        "max_line_loading_pct": loading_check["max_loading_pct"],
+        "has_violations": has_voltage_violations or has_loading_violations,
+        "iterations": solve["iterations"],
+        "solve_time_ms": solve["time_ms"],
+    }
+
+    limiting_constraint = None
+    violation_details = None
+    if has_voltage_violations:
+        limiting_constraint = "voltage_violation"
+        worst = voltage_check.get("data", {}).get("summary", {}).get("worst_violation")
+        if worst:
+            violation_details = f"Voltage violation at bus {worst['bus']} phase {worst['phase']}: {worst['voltage_pu']} pu"
+        else:
+            violation_details = "Voltage limit exceeded"
+    elif has_loading_violations:
+        limiting_constraint = "line_overload"
+        overloaded = loading_check["overloaded_lines"]
+        if overloaded:
+            line_info = overloaded[0]
+            violation_details = (
+                f"Line {line_info['line']} overloaded: {line_info['loading_pct']}%"
+            )
+        else:
+            violation_details = f"Line loading exceeded {max_line_loading_pct}%"
+
+    return {
+        "point": point,
+        "margin": _capacity_margin(
+            snapshot,
+            loading_check,
+            min_voltage_pu,
+            max_voltage_pu,
+            max_line_loading_pct,
+        ),
+        "has_violations": point["has_violations"],
+        "limiting_constraint": limiting_constraint,
+        "violation_details": violation_details,
+    }
 
 
 def analyze_feeder_capacity(
@@ -155,13 +336,24 @@ def analyze_feeder_capacity(
     increment_kw: float = 100,
     max_capacity_kw: float = 10000,
     constraints: Optional[Dict[str, Any]] = None,
+    search: str = "linear",
+    tolerance_kw: Optional[float] = None,
+    solve_strategy: str = "auto",
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
 ) -> Dict[str, Any]:
     """Analyze maximum DER hosting capacity at a specific bus.
 
-    This function performs an iterative capacity analysis by incrementally
-    adding DER capacity at the specified bus and checking for constraint
-    violations (voltage limits and line loading). The analysis stops when
-    a violation is detected or the maximum capacity is reached.
+    This function determines the largest DER capacity at the specified bus
+    that causes no constraint violations (voltage limits and line loading).
+
+    With search="linear" DER capacity is added in steps of increment_kw until
+    a violation is detected or the maximum capacity is reached. With
+    search="bisection" the first violation is bracketed between 0 and
+    max_capacity_kw and the bracket is halved until it is narrower than
+    tolerance_kw, which takes O(log(max_capacity_kw / tolerance_kw)) solves.
+    search="secant" shrinks the same bracket using the secant estimate of
+    where the constraint margin crosses zero (Illinois variant), which
+    usually needs even fewer solves.
 
     Args:
         bus_id: Identifier of the bus where DER will be connected
@@ -172,12 +364,24 @@ def analyze_feeder_capacity(
             - min_voltage_pu: Minimum voltage limit (default: 0.95)
             - max_voltage_pu: Maximum voltage limit (default: 1.05)
             - max_line_loading_pct: Maximum line loading (default: 100%)
+        search: Search strategy - "linear", "bisection", or "secant" (default: "linear")
+        tolerance_kw: Width of the final bracket for bisection/secant search
+            in kW (default: increment_kw)
+        solve_strategy: Start of each solution - "auto" (continue from the
+            previous size unless the step exceeds 25% of the feeder load or the
+            previous size failed), "warm" or "cold" (default: "auto")
+        progress_callback: Optional function called as
+            progress_callback(solves_done, expected_solves) after every
+            evaluated capacity; expected_solves is None for secant search
 
     Returns:
         Dictionary containing:
             - success: Boolean indicating if the operation was successful
-            - data: Dictionary with capacity analysis results
-            - metadata: Additional metadata about the analysis
+            - data: Dictionary with capacity analysis results. For bisection
+              and secant searches the capacity curve holds only the evaluated
+              points, sorted by capacity.
+            - metadata: Additional metadata about the analysis, including
+              statistics of the solves ("solver")
             - errors: List of error messages if any occurred
 
     Example:
@@ -185,17 +389,38 @@ def analyze_feeder_capacity(
         >>> if result['success']:
         ...     max_capacity = result['data']['max_capacity_kw']
         ...     print(f"Maximum capacity: {max_capacity} kW")
+        >>> result = analyze_feeder_capacity("675", search="bisection", tolerance_kw=10)
+
+    Note:
+        Every capacity is evaluated from the baseline regulator tap and
+        capacitor positions. The bracketed searches assume violations persist
+        once they appear; discrete tap steps can make the boundary slightly
+        non-monotonic, so their result may differ from the linear scan by
+        about one tap step.
     """
     try:
         # Validate inputs
         validate_positive_float(increment_kw, "increment_kw")
         validate_positive_float(max_capacity_kw, "max_capacity_kw")
+        if tolerance_kw is None:
+            tolerance_kw = increment_kw
+        validate_positive_float(tolerance_kw, "tolerance_kw")
 
         if der_type not in SUPPORTED_DER_TYPES:
             return format_error_response(
                 f"Unsupported DER type '{der_type}'. Supported types: {', '.join(SUPPORTED_DER_TYPES)}"
             )
 
+        if search not in SUPPORTED_SEARCH_STRATEGIES:
+            return format_error_response(
+                f"Unsupported search strategy '{search}'. Supported strategies: {', '.join(SUPPORTED_SEARCH_STRATEGIES)}"
+            )
+
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return format_error_response(
+                f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
+
         if increment_kw > max_capacity_kw:
             return format_error_response(
                 f"increment_kw ({increment_kw}) cannot be greater than max_capacity_kw ({max_capacity_kw})"
@@ -208,10 +433,10 @@ def analyze_feeder_capacity(
             )
 
         # Validate bus exists
-        all_buses = [bus.lower() for bus in dss.Circuit.AllBusNames()]
-        if bus_id.lower() not in all_buses:
+        names = get_name_index()
+        if not names.has_bus(bus_id):
             return format_error_response(
-                f"Bus '{bus_id}' not found in circuit. Available buses: {', '.join(all_buses[:5])}..."
+                f"Bus '{bus_id}' not found in circuit. Available buses: {', '.join(names.bus_names[:5])}..."
             )
 
         # Parse constraints
@@ -221,107 +446,151 @@ def analyze_feeder_capacity(
         max_line_loading_pct = constraints.get("max_line_loading_pct", 100.0)
 
         # Get baseline (no DER) metrics
-        dss.Solution.Solve()
-        if not dss.Solution.Converged():
+        solver = PowerFlowSolver(solve_strategy)
+        if not solver.solve()["converged"]:
             return format_error_response("Baseline power flow did not converge")
+        baseline_load_kw = abs(dss.Circuit.TotalPower()[0])
 
         baseline_voltage_check = check_voltage_violations(
             min_voltage_pu, max_voltage_pu
         )
         baseline_loading = _check_line_loading()
+        control_state = _capture_control_state()
 
         # Initialize capacity curve data
         capacity_curve: List[Dict[str, Any]] = []
         max_capacity_reached = 0.0
         limiting_constraint = None
         violation_details = None
-
-        # Iterative capacity analysis
-        capacity = 0.0
         iteration = 0
 
-        while capacity <= max_capacity_kw and iteration < MAX_ITERATIONS:
-            iteration += 1
-
-            # Add DER at current capacity
-            if not _add_der(bus_id, der_type, capacity):
-                return format_error_response(f"Failed to add DER at bus {bus_id}")
+        # Solves the search needs at most (unknown in advance for secant)
+        if search == "linear":
+            expected_solves: Optional[int] = min(
+                int(max_capacity_kw // increment_kw) + 1, MAX_ITERATIONS
+            )
+        elif search == "bisection":
+            expected_solves = 2 + max(
+                0, math.ceil(math.log2(max_capacity_kw / tolerance_kw))
+            )
+        else:
+            expected_solves = None
 
-            # Run power flow
-            dss.Solution.Solve()
+        # One reusable test element, resized in place at every step
+        probe = DERProbe("der_test")
 
-            if not dss.Solution.Converged():
-                # Power flow didn't converge - capacity limit reached
-                _remove_der(bus_id)
-                limiting_constraint = "convergence_failure"
-                violation_details = "Power flow solution did not converge"
-                break
+        previous_capacity = [0.0]
 
-            # Check voltage violations
-            voltage_check = check_voltage_violations(min_voltage_pu, max_voltage_pu)
-            has_voltage_violations = (
-                voltage_check.get("success", False)
-                and voltage_check.get("data", {})
-                .get("summary", {})
-                .get("total_violations", 0)
-                > 0
+        def evaluate(capacity: float) -> Dict[str, Any]:
+            nonlocal iteration
+            iteration += 1
+            # Size of the step relative to the feeder load
+            change = (
+                abs(capacity - previous_capacity[0]) / baseline_load_kw
+                if baseline_load_kw
+                else None
             )
-
-            # Check line loading
-            loading_check = _check_line_loading()
-            has_loading_violations = (
-                loading_check["has_overloads"]
-                or loading_check["max_loading_pct"] > max_line_loading_pct
+            previous_capacity[0] = capacity
+            evaluation = _evaluate_capacity(
+                probe,
+                bus_id,
+                der_type,
+                capacity,
+                min_voltage_pu,
+                max_voltage_pu,
+                max_line_loading_pct,
+                control_state,
+                solver,
+                change,
             )
-
-            # Store iteration data
-            iteration_data = {
-                "capacity_kw": round(capacity, 2),
-                "converged": True,
-                "voltage_violations": voltage_check.get("data", {})
-                .get("summary", {})
-                .get("total_violations", 0),
-                "max_line_loading_pct": loading_check["max_loading_pct"],
-                "has_violations": has_voltage_violations or has_loading_violations,
-            }
-            capacity_curve.append(iteration_data)
-
-            # Check for violations
-            if has_voltage_violations or has_loading_violations:
-                # Violation detected - capacity limit reached
-                _remove_der(bus_id)
-
-                if has_voltage_violations:
-                    limiting_constraint = "voltage_violation"
-                    worst = (
-                        voltage_check.get("data", {})
-                        .get("summary", {})
-                        .get("worst_violation")
-                    )
-                    if worst:
-                        violation_details = f"Voltage violation at bus {worst['bus']} phase {worst['phase']}: {worst['voltage_pu']} pu"
-                    else:
-                        violation_details = "Voltage limit exceeded"
+            if evaluation is None:
+                raise RuntimeError(f"Failed to add DER at bus {bus_id}")
+            if evaluation["point"] is not None:
+                capacity_curve.append(evaluation["point"])
+            if progress_callback is not None:
+                progress_callback(iteration, expected_solves)
+            return evaluation
+
+        try:
+            if search == "linear":
+                # Iterative capacity analysis
+                capacity = 0.0
+                while capacity <= max_capacity_kw and iteration < MAX_ITERATIONS:
+                    evaluation = evaluate(capacity)
+
+                    # Check for violations
+                    if evaluation["has_violations"]:
+                        # Violation detected - capacity limit reached
+                        limiting_constraint = evaluation["limiting_constraint"]
+                        violation_details = evaluation["violation_details"]
+                        break
+
+                    # No violations - update max capacity and continue
+                    max_capacity_reached = capacity
+                    capacity += increment_kw
+            else:
+                # Bracket the first violation between a passing and a failing point
+                low, high = 0.0, float(max_capacity_kw)
+                low_eval = evaluate(low)
+                failing = None
+
+                if low_eval["has_violations"]:
+                    failing = low_eval
                 else:
-                    limiting_constraint = "line_overload"
-                    overloaded = loading_check["overloaded_lines"]
-                    if overloaded:
-                        line_info = overloaded[0]
-                        violation_details = f"Line {line_info['line']} overloaded: {line_info['loading_pct']}%"
+                    high_eval = evaluate(high)
+                    if high_eval["has_violations"]:
+                        failing = high_eval
                     else:
-                        violation_details = (
-                            f"Line loading exceeded {max_line_loading_pct}%"
-                        )
-
-                break
-
-            # No violations - update max capacity and continue
-            max_capacity_reached = capacity
-            _remove_der(bus_id)
-            capacity += increment_kw
-
-        # Remove test DER
-        _remove_der(bus_id)
+                        max_capacity_reached = high
+
+                if failing is not None and failing is not low_eval:
+                    low_margin = low_eval["margin"]
+                    high_margin = high_eval["margin"]
+                    last_side = None
+
+                    while high - low > tolerance_kw and iteration < MAX_ITERATIONS:
+                        candidate = (low + high) / 2.0
+                        if (
+                            search == "secant"
+                            and low_margin is not None
+                            and high_margin is not None
+                            and low_margin > 0 > high_margin
+                        ):
+                            # Secant estimate of the zero-margin capacity, kept
+                            # strictly inside the bracket
+                            candidate = low + (high - low) * low_margin / (
+                                low_margin - high_margin
+                            )
+                            step = min(tolerance_kw / 2.0, (high - low) / 4.0)
+                            candidate = min(max(candidate, low + step), high - step)
+
+                        evaluation = evaluate(candidate)
+                        if evaluation["has_violations"]:
+                            high, high_margin, failing = (
+                                candidate,
+                                evaluation["margin"],
+                                evaluation,
+                            )
+                            if last_side == "high" and low_margin is not None:
+                                low_margin /= 2.0
+                            last_side = "high"
+                        else:
+                            low, low_margin = candidate, evaluation["margin"]
+                            if last_side == "low" and high_margin is not None:
+                                high_margin /= 2.0
+                            last_side = "low"
+
+                    max_capacity_reached = low
+
+                if failing is not None:
+                    limiting_constraint = failing["limiting_constraint"]
+                    violation_details = failing["violation_details"]
+
+                # Sparse curve of the evaluated points
+                capacity_curve.sort(key=lambda point: point["capacity_kw"])
+        finally:
+            # Disconnect the test DER at the end of the study
+            probe.close()
 
         # Prepare results
         data = {
@@ -346,18 +615,23 @@ def analyze_feeder_capacity(
                 "increment_kw": increment_kw,
                 "max_capacity_tested_kw": max_capacity_kw,
                 "iterations_performed": iteration,
+                "search": search,
+                "tolerance_kw": tolerance_kw if search != "linear" else None,
             },
         }
 
         metadata = {
             "circuit_name": dss.Circuit.Name(),
             "analysis_type": "hosting_capacity",
+            "solver": solver.stats(),
         }
 
         return format_success_response(data, metadata)
 
     except ValueError as e:
         return format_error_response(str(e))
+    except RuntimeError as e:
+        return format_error_response(str(e))
     except Exception as e:
         error_msg = f"Error analyzing feeder capacity: {str(e)}"
         logger.exception(error_msg)
@@ -0,0 +1,521 @@
+"""
+N-1 contingency analysis for OpenDSS.
+
+This module opens each line and transformer of the feeder in turn (or a
+given list of elements), re-solves the circuit and records the voltage and
+loading violations the outage causes. Contingencies are spread across worker
+processes; each worker compiles the feeder once, solves the base case and
+then, for every element it receives, opens the element, solves, reads all
+node voltages and line currents with one bulk call each, and closes the
+element again.
+
+Every contingency is classified without aborting the run:
+
+- non_convergent: the power flow did not converge (or OpenDSS raised)
+- islanded: nodes energized in the base case lost their supply
+- violations: new voltage or loading violations compared to the base case
+- secure: none of the above
+- error: the element could not be opened or solved for another reason
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import opendssdirect as dss
+
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.formatters import format_success_response, format_error_response
+from ..utils.line_loading import LineLoadings
+from ..utils.result_store import DEFAULT_INLINE_LIMIT, store_large_fields
+from ..utils.solver import SOLVE_STRATEGIES, PowerFlowSolver
+from ..utils.validators import validate_voltage_limits
+from ..utils.workers import default_worker_count, run_parallel, worker_feeder_error
+from .capacity import _capture_control_state, _restore_control_state
+from .feeder_loader import get_loaded_feeder
+
+logger = logging.getLogger(__name__)
+
+# Element types that can be taken out of service, by OpenDSS class
+ELEMENT_TYPES = {"line": "Line", "transformer": "Transformer"}
+
+# Node voltage (pu) below which a node counts as de-energized. An open phase
+# keeps a voltage induced by the other phases through line coupling and
+# loads (0.15 to 0.25 pu when a regulator phase of IEEE13 is opened), so the
+# threshold sits well above zero.
+DEENERGIZED_PU = 0.5
+
+# Contingency classes, from most to least severe
+STATUSES = ["non_convergent", "islanded", "violations", "secure", "error"]
+
+# Number of contingencies listed as critical in the summary
+NUM_CRITICAL = 10
+
+# Base case of the feeder compiled by this worker process
+_worker_case: Dict[str, Any] = {"base": None}
+
+
+def _element_names(element_types: List[str]) -> List[str]:
+    """List the enabled elements of the given types in circuit order.
+
+    Args:
+        element_types: Keys of ELEMENT_TYPES
+
+    Returns:
+        Full element names ("Line.650632", "Transformer.sub")
+    """
+    interfaces = {"line": dss.Lines, "transformer": dss.Transformers}
+    names = []
+    for element_type in element_types:
+        element_class = ELEMENT_TYPES[element_type]
+        names.extend(
+            f"{element_class}.{name}" for name in interfaces[element_type].AllNames()
+        )
+    return names
+
+
+def _load_phases(node_names: List[str]) -> tuple:
+    """Locate the nodes that supply each phase of every load.
+
+    A load's kW is split evenly over its phases. A wye phase is supplied by
+    its own node, a delta phase by the two nodes it is connected between, so
+    a phase is lost as soon as one of its nodes is.
+
+    Args:
+        node_names: Node names of the circuit snapshot
+
+    Returns:
+        Tuple of (two node indexes per load phase, kW of each load phase)
+    """
+    position = {name.lower(): i for i, name in enumerate(node_names)}
+    nodes, kw = [], []
+    if dss.Loads.First() > 0:
+        while True:
+            bus = dss.CktElement.BusNames()[0].split(".")[0].lower()
+            phases = dss.CktElement.NumPhases()
+            order = dss.CktElement.NodeOrder()[: dss.CktElement.NumConductors()]
+            # Ground (node 0) is always supplied
+            index = [position.get(f"{bus}.{node}") for node in order]
+            for phase in range(phases):
+                pair = [index[phase]]
+                if dss.Loads.IsDelta():
+                    pair.append(index[(phase + 1) % len(index)])
+                pair = [node for node in pair if node is not None]
+                if pair:
+                    nodes.append((pair[0], pair[-1]))
+                    kw.append(float(dss.Loads.kW()) / phases)
+            if not dss.Loads.Next() > 0:
+                break
+    return np.array(nodes, dtype=int).reshape(-1, 2), np.array(kw, dtype=float)
+
+
+def _violation_masks(
+    snapshot: CircuitSnapshot,
+    loadings: LineLoadings,
+    limits: Dict[str, float],
+) -> Dict[str, np.ndarray]:
+    """Node voltage and line loading violations of a solution.
+
+    Args:
+        snapshot: Voltage snapshot of the solution
+        loadings: Line loadings of the solution
+        limits: min_voltage_pu, max_voltage_pu and max_line_loading_pct
+
+    Returns:
+        Dictionary with per-node "energized", "under" and "over" masks,
+        per-line "loading" percentages and "overloaded" mask
+    """
+    vmag_pu = snapshot.vmag_pu
+    energized = vmag_pu >= DEENERGIZED_PU
+    loading = loadings.loading_pct()
+    with np.errstate(invalid="ignore"):
+        return {
+            "energized": energized,
+            "under": energized & (vmag_pu < limits["min_voltage_pu"]),
+            "over": energized & (vmag_pu > limits["max_voltage_pu"]),
+            "loading": loading,
+            "overloaded": loading > limits["max_line_loading_pct"],
+        }
+
+
+def _setup_worker(params: Dict[str, Any]) -> None:
+    """Solve the base case of the worker's circuit on its first task.
+
+    Args:
+        params: Study parameters
+    """
+    solver = PowerFlowSolver(params["solve_strategy"])
+    converged = solver.solve()["converged"]
+    base: Dict[str, Any] = {"converged": converged, "solver": solver}
+    if converged:
+        snapshot = CircuitSnapshot.capture()
+        loadings = LineLoadings.capture()
+        base.update(
+            control_state=_capture_control_state(),
+            masks=_violation_masks(snapshot, loadings, params["limits"]),
+            bus_names=snapshot.bus_names,
+            node_bus=snapshot.node_bus,
+            node_number=snapshot.node_number,
+            line_names=loadings.names,
+        )
+        base["load_nodes"], base["load_kw"] = _load_phases(snapshot.node_names)
+    _worker_case["base"] = base
+
+
+def _contingency_task(task: tuple) -> Dict[str, Any]:
+    """Open one element, solve and classify the outcome inside a worker.
+
+    Args:
+        task: Tuple of (full element name, study parameters)
+
+    Returns:
+        Row of the contingency table for the element
+    """
+    element, params = task
+    row: Dict[str, Any] = {
+        "element": element,
+        "status": "error",
+        "converged": False,
+        "deenergized_buses": 0,
+        "deenergized_nodes": 0,
+        "load_lost_kw": 0.0,
+        "min_voltage_pu": None,
+        "max_voltage_pu": None,
+        "max_line_loading_pct": None,
+        "voltage_violations": 0,
+        "new_voltage_violations": 0,
+        "overloaded_lines": 0,
+        "new_overloads": 0,
+        "worst_voltage": None,
+        "worst_overload": None,
+        "error": None,
+    }
+
+    feeder_error = worker_feeder_error()
+    if feeder_error:
+        row["error"] = feeder_error
+        return row
+
+    try:
+        if _worker_case["base"] is None:
+            _setup_worker(params)
+        base = _worker_case["base"]
+        if not base["converged"]:
+            row["error"] = "Base case power flow did not converge"
+            return row
+
+        _restore_control_state(base["control_state"])
+        dss.Text.Command(f"Open {element} 1")
+        try:
+            solve = base["solver"].solve()
+            if not solve["converged"]:
+                row["status"] = "non_convergent"
+                row["error"] = solve["error"]
+                return row
+            # Opening an element keeps every bus, node and PD element
+            snapshot = CircuitSnapshot.capture(reuse_layout=True)
+            loadings = LineLoadings.capture(reuse_layout=True)
+        finally:
+            dss.Text.Command(f"Close {element} 1")
+
+        row.update(_classify(snapshot, loadings, base, params["limits"]))
+    except Exception as e:
+        row["status"] = "error"
+        row["error"] = str(e)
+    return row
+
+
+def _classify(
+    snapshot: CircuitSnapshot,
+    loadings: LineLoadings,
+    base: Dict[str, Any],
+    limits: Dict[str, float],
+) -> Dict[str, Any]:
+    """Compare a converged contingency solution with the base case.
+
+    Args:
+        snapshot: Voltage snapshot of the contingency
+        loadings: Line loadings of the contingency
+        base: Base case of the worker
+        limits: min_voltage_pu, max_voltage_pu and max_line_loading_pct
+
+    Returns:
+        Row fields: status, islanding, voltage and loading results
+    """
+    masks = _violation_masks(snapshot, loadings, limits)
+    base_masks = base["masks"]
+
+    # Islanding: nodes supplied in the base case that lost their supply, and
+    # the load phases connected to them
+    lost_nodes = base_masks["energized"] & ~masks["energized"]
+    load_lost = lost_nodes[base["load_nodes"]].any(axis=1)
+
+    # Nodes de-energized in the base case are ignored throughout
+    supplied = masks["energized"] & base_masks["energized"]
+    under = masks["under"] & supplied
+    over = masks["over"] & supplied
+    new_voltage = (under & ~base_masks["under"]) | (over & ~base_masks["over"])
+    overloaded = masks["overloaded"]
+    new_overloads = overloaded & ~base_masks["overloaded"]
+
+    vmag_pu = snapshot.vmag_pu[supplied]
+    loading = masks["loading"]
+    fields: Dict[str, Any] = {
+        "converged": True,
+        "deenergized_buses": int(np.unique(base["node_bus"][lost_nodes]).size),
+        "deenergized_nodes": int(lost_nodes.sum()),
+        "load_lost_kw": round(float(base["load_kw"][load_lost].sum()), 2),
+        "min_voltage_pu": round(float(vmag_pu.min()), 6) if vmag_pu.size else None,
+        "max_voltage_pu": round(float(vmag_pu.max()), 6) if vmag_pu.size else None,
+        "max_line_loading_pct": (
+            round(float(np.nanmax(loading)), 2) if np.any(loadings.rated) else 0.0
+        ),
+        "voltage_violations": int((under | over).sum()),
+        "new_voltage_violations": int(new_voltage.sum()),
+        "overloaded_lines": int(overloaded.sum()),
+        "new_overloads": int(new_overloads.sum()),
+    }
+
+    if new_voltage.any():
+        # Largest deviation among the new violations
+        deviation = np.where(
+            under,
+            limits["min_voltage_pu"] - snapshot.vmag_pu,
+            snapshot.vmag_pu - limits["max_voltage_pu"],
+        )
+        node = int(np.argmax(np.where(new_voltage, deviation, -np.inf)))
+        fields["worst_voltage"] = {
+            "bus": base["bus_names"][base["node_bus"][node]],
+            "node": int(base["node_number"][node]),
+            "voltage_pu": round(float(snapshot.vmag_pu[node]), 6),
+            "violation_type": "undervoltage" if under[node] else "overvoltage",
+        }
+    if new_overloads.any():
+        line = int(np.nanargmax(np.where(new_overloads, loading, -np.inf)))
+        fields["worst_overload"] = {
+            "line": base["line_names"][line],
+            "loading_pct": round(float(loading[line]), 2),
+        }
+
+    if fields["deenergized_nodes"]:
+        fields["status"] = "islanded"
+    elif fields["new_voltage_violations"] or fields["new_overloads"]:
+        fields["status"] = "violations"
+    else:
+        fields["status"] = "secure"
+    return fields
+
+
+def _severity_key(row: Dict[str, Any]) -> tuple:
+    """Sort key ranking contingencies from most to least severe."""
+    return (
+        STATUSES.index(row["status"]),
+        -row["load_lost_kw"],
+        -(row["new_voltage_violations"] + row["new_overloads"]),
+        -(row["max_line_loading_pct"] or 0.0),
+    )
+
+
+def _summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize a contingency table.
+
+    Args:
+        rows: Per-contingency rows
+
+    Returns:
+        Dictionary with status counts and the most severe contingencies
+    """
+    status_counts = {status: 0 for status in STATUSES}
+    for row in rows:
+        status_counts[row["status"]] += 1
+
+    critical = [
+        {
+            key: row[key]
+            for key in (
+                "element",
+                "status",
+                "deenergized_buses",
+                "deenergized_nodes",
+                "load_lost_kw",
+                "new_voltage_violations",
+                "new_overloads",
+                "max_line_loading_pct",
+            )
+        }
+        for row in sorted(rows, key=_severity_key)
+        if row["status"] not in ("secure", "error")
+    ][:NUM_CRITICAL]
+
+    return {
+        "contingencies_analyzed": len(rows),
+        "status_counts": status_counts,
+        "secure_pct": round(status_counts["secure"] / len(rows) * 100.0, 2),
+        "critical_contingencies": critical,
+    }
+
+
+def run_contingency_analysis(
+    elements: Optional[List[str]] = None,
+    element_types: Optional[List[str]] = None,
+    constraints: Optional[Dict[str, Any]] = None,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    inline_limit: Optional[int] = DEFAULT_INLINE_LIMIT,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """Run an N-1 contingency analysis of the loaded feeder.
+
+    Each element is opened (all phases of terminal 1) in turn, the circuit is
+    re-solved from the base case control settings and the result is compared
+    with the base case. Only violations the outage adds are counted as new;
+    nodes and lines already violating in the base case are reported but do
+    not make a contingency insecure.
+
+    Args:
+        elements: Elements to take out of service, as "Line.name",
+            "Transformer.name" or a bare line/transformer name (default: every
+            element of element_types)
+        element_types: Types to screen when elements is not given: "line"
+            and/or "transformer" (default: both)
+        constraints: Optional constraint limits (min_voltage_pu,
+            max_voltage_pu, max_line_loading_pct; default: 0.95, 1.05, 100)
+        solve_strategy: Start of each solution - "auto", "warm" or "cold"
+            (default: "auto")
+        max_workers: Number of worker processes (default: CPU count)
+        inline_limit: Maximum number of table values returned inline; larger
+            tables return a result_handle for fetch_result (default: 10000)
+        progress_callback: Optional function called as
+            progress_callback(contingencies_done, num_contingencies)
+
+    Returns:
+        Dictionary containing:
+            - success: Boolean indicating if the operation was successful
+            - data: Per-contingency table, base case and summary
+            - metadata: Additional metadata about the analysis
+            - errors: List of error messages if any occurred
+
+    Example:
+        >>> load_ieee_test_feeder("IEEE34")
+        >>> result = run_contingency_analysis(max_workers=4)
+        >>> for row in result['data']['summary']['critical_contingencies']:
+        ...     print(row['element'], row['status'], row['load_lost_kw'])
+
+    Note:
+        Like analyze_hosting_capacity_map, the workers compile the feeder
+        loaded with load_feeder; later changes to the active circuit are not
+        seen.
+    """
+    try:
+        # Validate inputs
+        element_types = list(element_types or ELEMENT_TYPES)
+        unknown_types = [t for t in element_types if t not in ELEMENT_TYPES]
+        if unknown_types:
+            return format_error_response(
+                f"Unsupported element types: {', '.join(unknown_types)}. Supported types: {', '.join(ELEMENT_TYPES)}"
+            )
+        if max_workers is not None and max_workers < 1:
+            return format_error_response("max_workers must be at least 1")
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return format_error_response(
+                f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
+
+        constraints = constraints or {}
+        limits = {
+            "min_voltage_pu": constraints.get("min_voltage_pu", 0.95),
+            "max_voltage_pu": constraints.get("max_voltage_pu", 1.05),
+            "max_line_loading_pct": constraints.get("max_line_loading_pct", 100.0),
+        }
+        validate_voltage_limits(limits["min_voltage_pu"], limits["max_voltage_pu"])
+
+        # Check if circuit is loaded
+        loaded_feeder = get_loaded_feeder()
+        if not dss.Circuit.Name() or loaded_feeder is None:
+            return format_error_response(
+                "No circuit loaded. Please load a feeder first using load_feeder tool."
+            )
+
+        # Resolve the contingency list
+        available = {name.lower(): name for name in _element_names(list(ELEMENT_TYPES))}
+        if elements is None:
+            candidates = _element_names(element_types)
+        else:
+            candidates, unknown = [], []
+            for element in elements:
+                key = element.lower()
+                matches = (
+                    [key]
+                    if "." in key
+                    else [f"{ELEMENT_TYPES[t].lower()}.{key}" for t in ELEMENT_TYPES]
+                )
+                found = [available[m] for m in matches if m in available]
+                if found:
+                    candidates.append(found[0])
+                else:
+                    unknown.append(element)
+            if unknown:
+                return format_error_response(
+                    f"Elements not found in circuit: {', '.join(unknown[:5])}"
+                )
+
+        if not candidates:
+            return format_error_response("No elements to analyze")
+
+        params = {"limits": limits, "solve_strategy": solve_strategy}
+        workers = min(
+            max_workers or default_worker_count(len(candidates)), len(candidates)
+        )
+        rows = run_parallel(
+            loaded_feeder["feeder_id"],
+            _contingency_task,
+            [(element, params) for element in candidates],
+            max_workers=workers,
+            modifications=loaded_feeder["modifications"],
+            progress_callback=progress_callback,
+        )
+
+        errors = [
+            f"{row['element']}: {row['error']}"
+            for row in rows
+            if row["status"] == "error"
+        ]
+        if len(errors) == len(rows):
+            return format_error_response(errors[:5])
+
+        data = {
+            "feeder_id": loaded_feeder["feeder_id"],
+            "contingencies": rows,
+            "summary": _summarize(rows),
+            "analysis_parameters": {
+                "element_types": element_types if elements is None else None,
+                "num_elements": len(candidates),
+                "solve_strategy": solve_strategy,
+                "constraints": limits,
+            },
+        }
+        store_large_fields(
+            "contingency",
+            data,
+            ["contingencies"],
+            inline_limit=inline_limit,
+            summary={"feeder_id": loaded_feeder["feeder_id"], **data["summary"]},
+        )
+
+        metadata = {
+            "circuit_name": dss.Circuit.Name(),
+            "analysis_type": "n_minus_1_contingency",
+            "num_contingencies": len(candidates),
+            "max_workers": workers,
+        }
+        if errors:
+            metadata["contingency_errors"] = errors[:10]
+
+        return format_success_response(data, metadata)
+
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error running contingency analysis: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
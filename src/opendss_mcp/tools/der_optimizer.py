@@ -3,17 +3,30 @@ DER placement optimization module for OpenDSS.
 
 This module provides functions for optimizing the placement of Distributed Energy
 Resources (DER) based on specified objectives such as minimizing losses or
-maximizing capacity utilization.
+maximizing capacity utilization. Candidate buses can be evaluated serially on
+the active circuit or sharded across worker processes.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
 
 import opendssdirect as dss
 
+from ..utils.der_probe import DERProbe, bus_connection
 from ..utils.formatters import format_success_response, format_error_response
+from ..utils.sensitivity import der_sensitivities
+from ..utils.dss_wrapper import get_name_index
 from ..utils.validators import validate_positive_float
-from ..utils.inverter_control import load_curve, configure_volt_var_control
+from ..utils.inverter_control import (
+    configure_volt_var_control,
+    load_curve,
+    update_volt_var_control,
+)
+from ..utils.workers import default_worker_count, run_parallel, worker_feeder_error
+from .capacity import _capture_control_state, _restore_control_state
+from .feeder_loader import get_loaded_feeder
 from .voltage_checker import check_voltage_violations
 
 logger = logging.getLogger(__name__)
@@ -32,6 +45,23 @@ SUPPORTED_DER_TYPES = [
 # Supported optimization objectives
 SUPPORTED_OBJECTIVES = ["minimize_losses", "maximize_capacity", "minimize_violations"]
 
+# Supported candidate screening methods
+SUPPORTED_SCREENING = ["none", "sensitivity"]
+
+# Why a candidate could not be evaluated, as reported in failed_candidates
+FAILURE_REASONS = {
+    "der_not_added": "could not connect the DER",
+    "non_convergent": "did not converge",
+    "control_iterations_exceeded": "exceeded the control iteration limit",
+    "error": "raised an error",
+}
+
+# OpenDSS error number raised when controls do not settle within MaxControlIter
+MAX_CONTROL_ITERATIONS_ERROR = 485
+
+# Test DER of a worker process, reused for every candidate it evaluates
+_worker_probe = DERProbe("der_opt")
+
 
 def _get_total_losses() -> float:
     """Get total system losses in kW.
@@ -47,72 +77,94 @@ def _get_total_losses() -> float:
         return 0.0
 
 
-def _get_der_reactive_power(bus_id: str, der_type: str) -> float:
-    """Get reactive power output from DER at specified bus.
+def _solve_from_initial_guess() -> None:
+    """Solve a snapshot power flow without reusing the previous solution.
+
+    OpenDSS normally starts iterating from the last solved voltages, so the
+    converged result of a candidate depends slightly on the candidates solved
+    before it. Re-selecting snapshot mode makes OpenDSS rebuild its initial
+    guess, which keeps results identical however candidates are ordered or
+    sharded across workers.
+    """
+    dss.Text.Command("Set Mode=Snap")
+    dss.Solution.Solve()
+
+
+def _inverter_kva(pmpp_kw: float, curve_points: List[tuple]) -> float:
+    """Inverter rating that delivers the curve's full var range at rated power.
+
+    Volt-var curves give vars in per-unit of the inverter rating. An inverter
+    rated at exactly Pmpp has no reactive headroom at full output, so its
+    InvControl keeps requesting vars it cannot deliver and OpenDSS stops at
+    the control iteration limit.
 
     Args:
-        bus_id: Bus identifier
+        pmpp_kw: Rated active power in kW
+        curve_points: Volt-var curve as (voltage_pu, var_pu) tuples
+
+    Returns:
+        Inverter kVA rating
+    """
+    q_max = max(abs(q) for _, q in curve_points)
+    return round(pmpp_kw * math.sqrt(1.0 + q_max**2), 6)
+
+
+def _get_der_reactive_power(probe: DERProbe, der_type: str) -> float:
+    """Get reactive power output from the test DER.
+
+    Args:
+        probe: DER probe owning the test elements
         der_type: Type of DER
 
     Returns:
         Reactive power in kvar (positive = absorbing, negative = injecting)
     """
     try:
-        der_name = f"der_opt_{bus_id}"
         base_type = der_type.replace("_vvc", "")
 
         # Determine element name based on type
-        if base_type in ["solar", "wind"]:
-            if base_type == "solar":
-                element_name = f"PVSystem.{der_name}"
-            else:
-                element_name = f"Generator.{der_name}"
-
-            # Set active element
-            result = dss.Circuit.SetActiveElement(element_name)
-            if result < 0:
-                return 0.0
-
-            # Get powers: [P1, Q1, P2, Q2, ...] for each terminal
-            powers = dss.CktElement.Powers()
-            if len(powers) >= 2:
-                # Sum reactive power across all phases (odd indices)
-                q_kvar = sum(powers[i] for i in range(1, len(powers), 2))
-                return q_kvar
-            return 0.0
-
-        elif base_type == "solar_battery":
+        if base_type in ["solar", "solar_battery"]:
             # Get reactive power from PV component only
-            element_name = f"PVSystem.{der_name}_pv"
-            result = dss.Circuit.SetActiveElement(element_name)
-            if result < 0:
-                return 0.0
-
-            powers = dss.CktElement.Powers()
-            if len(powers) >= 2:
-                q_kvar = sum(powers[i] for i in range(1, len(powers), 2))
-                return q_kvar
-            return 0.0
-
+            element_name = probe.element_name("PVSystem")
+        elif base_type == "wind":
+            element_name = probe.element_name("Generator")
         else:
             # Battery, EV charger don't typically provide reactive power in this model
             return 0.0
 
+        # Set active element
+        result = dss.Circuit.SetActiveElement(element_name)
+        if result < 0:
+            return 0.0
+
+        # Get powers: [P1, Q1, P2, Q2, ...] for each terminal
+        powers = dss.CktElement.Powers()
+        if len(powers) >= 2:
+            # Sum reactive power across all phases (odd indices)
+            q_kvar = sum(powers[i] for i in range(1, len(powers), 2))
+            return q_kvar
+        return 0.0
+
     except Exception as e:
-        logger.error(f"Error getting reactive power for {bus_id}: {e}")
+        logger.error(f"Error getting reactive power for {probe.name}: {e}")
         return 0.0
 
 
 def _add_der_at_bus(
+    probe: DERProbe,
     bus_id: str,
     der_type: str,
     capacity_kw: float,
     battery_kwh: Optional[float] = None,
     control_settings: Optional[Dict[str, Any]] = None,
 ) -> bool:
-    """Add a DER to the specified bus with optional volt-var control.
+    """Move the test DER to the specified bus with optional volt-var control.
+
+    The probe keeps one element per OpenDSS class and edits it in place, so
+    evaluating many candidate buses does not add elements to the circuit.
 
     Args:
+        probe: DER probe owning the test elements
         bus_id: Bus identifier
         der_type: Type of DER (supports "_vvc" suffix for volt-var control)
         capacity_kw: DER capacity in kW
@@ -125,26 +177,46 @@ def _add_der_at_bus(
         bool: True if DER was added successfully
     """
     try:
-        # Get bus voltage base
-        dss.Circuit.SetActiveBus(bus_id)
-        kv_base = dss.Bus.kVBase()
+        # Connect to every phase of the bus at its nominal voltage
+        connection = bus_connection(bus_id)
 
-        if kv_base == 0:
+        if connection is None:
             logger.error(f"Bus {bus_id} has zero voltage base")
             return False
 
+        bus = connection["bus"]
+        rating = {"phases": connection["phases"], "kV": connection["kV"]}
+
         # Parse DER type and check for volt-var control
         base_type = der_type.replace("_vvc", "")
-        has_vvc = "_vvc" in der_type
+        has_vvc = "_vvc" in der_type and base_type in ["solar", "solar_battery"]
 
-        # Create unique DER name
-        der_name = f"der_opt_{bus_id}"
+        # Volt-var inverters are sized for reactive headroom at full output
+        curve_points = None
+        pv_kva = capacity_kw
+        if has_vvc:
+            control_settings = control_settings or {}
+            curve_name = control_settings.get("curve", "IEEE1547")
+            response_time = control_settings.get("response_time", 10.0)
+            try:
+                curve_points = load_curve(curve_name)
+                pv_kva = _inverter_kva(capacity_kw, curve_points)
+            except Exception as e:
+                logger.warning(f"Failed to configure volt-var control: {e}")
+                # Continue without control - don't fail the entire operation
 
         # Add DER based on base type
         if base_type == "solar":
             # Add PV system
-            dss.Text.Command(
-                f"New PVSystem.{der_name} Bus1={bus_id} kV={kv_base} kVA={capacity_kw} Pmpp={capacity_kw} irradiance=1.0"
+            probe.place(
+                "PVSystem",
+                bus,
+                {
+                    **rating,
+                    "kVA": pv_kva,
+                    "Pmpp": capacity_kw,
+                    "irradiance": 1.0,
+                },
             )
 
         elif base_type == "battery":
@@ -152,58 +224,70 @@ def _add_der_at_bus(
             kwh = (
                 battery_kwh if battery_kwh else capacity_kw * 4
             )  # Default 4-hour storage
-            dss.Text.Command(
-                f"New Storage.{der_name} Bus1={bus_id} kV={kv_base} kWrated={capacity_kw} kWhrated={kwh} %stored=50 %discharge=50"
+            probe.place(
+                "Storage",
+                bus,
+                {
+                    **rating,
+                    "kWrated": capacity_kw,
+                    "kWhrated": kwh,
+                    "%stored": 50,
+                    "%discharge": 50,
+                },
             )
 
         elif base_type == "solar_battery":
             # Add both PV and storage
-            dss.Text.Command(
-                f"New PVSystem.{der_name}_pv Bus1={bus_id} kV={kv_base} kVA={capacity_kw} Pmpp={capacity_kw} irradiance=1.0"
+            probe.place(
+                "PVSystem",
+                bus,
+                {
+                    **rating,
+                    "kVA": pv_kva,
+                    "Pmpp": capacity_kw,
+                    "irradiance": 1.0,
+                },
             )
             kwh = (
                 battery_kwh if battery_kwh else capacity_kw * 2
             )  # Default 2-hour for hybrid
-            dss.Text.Command(
-                f"New Storage.{der_name}_batt Bus1={bus_id} kV={kv_base} kWrated={capacity_kw * 0.5} kWhrated={kwh} %stored=50"
+            probe.place(
+                "Storage",
+                bus,
+                {
+                    **rating,
+                    "kWrated": capacity_kw * 0.5,
+                    "kWhrated": kwh,
+                    "%stored": 50,
+                },
             )
 
         elif base_type == "ev_charger":
             # Add EV charger as load (negative for generation during V2G)
-            dss.Text.Command(
-                f"New Load.{der_name} Bus1={bus_id} kV={kv_base} kW={capacity_kw} PF=0.95"
-            )
+            probe.place("Load", bus, {**rating, "kW": capacity_kw, "PF": 0.95})
 
         elif base_type == "wind":
             # Add wind generator
-            dss.Text.Command(
-                f"New Generator.{der_name} Bus1={bus_id} kV={kv_base} kW={capacity_kw} PF=0.95"
-            )
+            probe.place("Generator", bus, {**rating, "kW": capacity_kw, "PF": 0.95})
 
         else:
             logger.error(f"Unsupported DER type: {base_type}")
             return False
 
-        # Configure volt-var control if requested
-        if has_vvc and base_type in ["solar", "solar_battery"]:
-            control_settings = control_settings or {}
-            curve_name = control_settings.get("curve", "IEEE1547")
-            response_time = control_settings.get("response_time", 10.0)
-
+        # Configure volt-var control if requested; the probe's InvControl is
+        # created once and edited to the requested settings when reused
+        if curve_points is not None:
+            inv_control = f"InvControl.InvCtrl_{probe.name}"
             try:
-                # Load curve
-                curve_points = load_curve(curve_name)
-
-                # Configure volt-var for PV system(s)
-                if base_type == "solar":
-                    configure_volt_var_control(der_name, curve_points, response_time)
-                elif base_type == "solar_battery":
-                    configure_volt_var_control(
-                        f"{der_name}_pv", curve_points, response_time
-                    )
+                # Configure volt-var for the PV system
+                if probe.exists(inv_control):
+                    update_volt_var_control(probe.name, curve_points, response_time)
+                else:
+                    configure_volt_var_control(probe.name, curve_points, response_time)
+                probe.track(inv_control)
 
                 logger.info(
-                    f"Configured volt-var control for {der_name} with {curve_name} curve"
+                    f"Configured volt-var control for {probe.name} with {curve_name} curve"
                 )
             except Exception as e:
                 logger.warning(f"Failed to configure volt-var control: {e}")
@@ -216,37 +300,6 @@ def _add_der_at_bus(
         return False
 
 
-def _remove_der_from_bus(bus_id: str, der_type: str) -> None:
-    """Remove test DER from the circuit.
-
-    Args:
-        bus_id: Bus identifier
-        der_type: Type of DER
-    """
-    try:
-        der_name = f"der_opt_{bus_id}"
-
-        # Try to disable all possible elements
-        element_types = ["PVSystem", "Storage", "Generator", "Load"]
-
-        for element_type in element_types:
-            try:
-                dss.Text.Command(f"{element_type}.{der_name}.enabled=no")
-            except:
-                pass
-
-        # For solar_battery, also remove the separate components
-        if der_type == "solar_battery":
-            try:
-                dss.Text.Command(f"PVSystem.{der_name}_pv.enabled=no")
-                dss.Text.Command(f"Storage.{der_name}_batt.enabled=no")
-            except:
-                pass
-
-    except Exception as e:
-        logger.error(f"Error removing DER: {e}")
-
-
 def _calculate_objective(
     objective: str,
     baseline_losses: float,
@@ -283,6 +336,166 @@ def _calculate_objective(
         return 0.0
 
 
+def _screen_candidates(
+    candidate_buses: List[str],
+    objective: str,
+    capacity_kw: float,
+    min_voltage_pu: float,
+    max_voltage_pu: float,
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """Rank candidate buses with linear sensitivities of the solved circuit.
+
+    The objective is estimated from the voltages and losses predicted by
+    der_sensitivities() for capacity_kw injected at each bus, so the ranking
+    uses the same criteria as the exact evaluation.
+
+    Args:
+        candidate_buses: Buses to screen
+        objective: Optimization objective
+        capacity_kw: DER capacity in kW
+        min_voltage_pu: Minimum voltage limit
+        max_voltage_pu: Maximum voltage limit
+        top_k: Number of buses to keep
+
+    Returns:
+        Screening rows of the top_k buses, best first
+    """
+    sensitivities = der_sensitivities(
+        candidate_buses, capacity_kw, min_voltage_pu, max_voltage_pu
+    )
+    loss_reduction = (
+        sensitivities["baseline_losses_kw"] - sensitivities["predicted_losses_kw"]
+    )
+    violations = sensitivities["predicted_violations"]
+
+    if objective == "minimize_violations":
+        # Fewer predicted violations first, then larger loss reduction
+        scores = [(-int(v), float(r)) for v, r in zip(violations, loss_reduction)]
+    else:
+        scores = [(float(r),) for r in loss_reduction]
+
+    # Stable sort keeps candidate order between equal scores
+    order = sorted(range(len(candidate_buses)), key=lambda i: scores[i], reverse=True)
+
+    return [
+        {
+            "bus_id": candidate_buses[i],
+            "predicted_loss_reduction_kw": round(float(loss_reduction[i]), 2),
+            "predicted_violations": int(violations[i]),
+            "dv_dp_pu_per_mw": round(float(sensitivities["dv_dp_pu_per_mw"][i]), 4),
+            "dloss_dp_kw_per_mw": round(
+                float(sensitivities["dloss_dp_kw_per_mw"][i]), 2
+            ),
+        }
+        for i in order[:top_k]
+    ]
+
+
+def _evaluate_candidate(
+    probe: DERProbe, bus_id: str, params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Evaluate the objective with the test DER placed at one bus.
+
+    Args:
+        probe: DER probe owning the test elements
+        bus_id: Candidate bus
+        params: Study parameters (DER settings, objective, voltage limits,
+            baseline losses and baseline control state)
+
+    Returns:
+        Comparison table row. Candidates that could not be evaluated get
+        converged=False and a failure key from FAILURE_REASONS.
+    """
+    der_type = params["der_type"]
+
+    def failed(reason: str) -> Dict[str, Any]:
+        return {"bus_id": bus_id, "converged": False, "failure": reason}
+
+    try:
+        # Move DER to candidate bus
+        if not _add_der_at_bus(
+            probe,
+            bus_id,
+            der_type,
+            params["capacity_kw"],
+            params["battery_kwh"],
+            params["control_settings"],
+        ):
+            logger.warning(f"Failed to add DER at bus {bus_id}, skipping")
+            probe.park()
+            return failed("der_not_added")
+
+        # Run power flow from the baseline regulator/capacitor state
+        _restore_control_state(params["control_state"])
+        try:
+            _solve_from_initial_guess()
+        except Exception as e:
+            if e.args[:1] != (MAX_CONTROL_ITERATIONS_ERROR,):
+                raise
+            logger.warning(
+                f"Controls did not settle with DER at {bus_id} within "
+                f"{dss.Solution.MaxControlIterations()} control iterations, skipping"
+            )
+            return failed("control_iterations_exceeded")
+
+        if not dss.Solution.Converged():
+            logger.warning(
+                f"Power flow did not converge with DER at {bus_id}, skipping"
+            )
+            return failed("non_convergent")
+
+        # Get metrics
+        baseline_losses = params["baseline_losses"]
+        current_losses = _get_total_losses()
+        voltage_check = check_voltage_violations(
+            params["min_voltage_pu"], params["max_voltage_pu"]
+        )
+        num_violations = (
+            voltage_check.get("data", {}).get("summary", {}).get("total_violations", 0)
+        )
+
+        # Get reactive power support (for VVC-enabled DERs)
+        q_support_kvar = (
+            _get_der_reactive_power(probe, der_type) if "_vvc" in der_type else 0.0
+        )
+
+        # Calculate objective value
+        objective_value = _calculate_objective(
+            params["objective"], baseline_losses, current_losses, voltage_check
+        )
+
+        return {
+            "bus_id": bus_id,
+            "objective_value": round(objective_value, 4),
+            "losses_kw": round(current_losses, 2),
+            "loss_reduction_kw": round(baseline_losses - current_losses, 2),
+            "voltage_violations": num_violations,
+            "q_support_kvar": round(q_support_kvar, 2),
+            "converged": True,
+        }
+
+    except Exception as e:
+        logger.error(f"Error evaluating bus {bus_id}: {e}")
+        return failed("error")
+
+
+def _candidate_task(task: tuple) -> Dict[str, Any]:
+    """Evaluate one candidate bus inside a worker process.
+
+    Args:
+        task: Tuple of (bus_id, study parameters for _evaluate_candidate)
+
+    Returns:
+        Comparison table row, or a failure row as from _evaluate_candidate
+    """
+    bus_id, params = task
+    if worker_feeder_error():
+        logger.warning(f"Skipping bus {bus_id}: {worker_feeder_error()}")
+        return {"bus_id": bus_id, "converged": False, "failure": "error"}
+    return _evaluate_candidate(_worker_probe, bus_id, params)
+
+
 def optimize_der_placement(
     der_type: str,
     capacity_kw: float,
@@ -291,6 +504,11 @@ def optimize_der_placement(
     candidate_buses: Optional[List[str]] = None,
     constraints: Optional[Dict[str, Any]] = None,
     control_settings: Optional[Dict[str, Any]] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    screening: str = "none",
+    top_k: int = 10,
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
 ) -> Dict[str, Any]:
     """Optimize DER placement to achieve specified objective with optional volt-var control.
 
@@ -319,10 +537,23 @@ def optimize_der_placement(
         constraints: Optional constraint limits:
             - min_voltage_pu: Minimum voltage limit (default: 0.95)
             - max_voltage_pu: Maximum voltage limit (default: 1.05)
-            - max_candidates: Maximum number of candidates to evaluate (default: 20)
+            - max_candidates: Maximum number of candidates to evaluate when
+              candidate_buses is None (default: 20, or all buses if parallel
+              or screening)
         control_settings: Optional volt-var control settings (for "_vvc" DER types):
             - curve: Control curve name ("IEEE1547", "RULE21") or path to custom JSON
             - response_time: Response time in seconds (default: 10.0)
+        parallel: Evaluate candidates in worker processes that each load their
+                  own copy of the feeder (default: False)
+        max_workers: Number of worker processes when parallel (default: CPU count)
+        screening: Candidate pre-screening - "none" evaluates every candidate
+                   with a full power flow, "sensitivity" ranks all candidates
+                   with linear sensitivities from the system Y matrix and
+                   evaluates only the top_k of them (default: "none")
+        top_k: Number of screened candidates kept for exact evaluation (default: 10)
+        progress_callback: Optional function called as
+            progress_callback(candidates_done, num_candidates) after every
+            serially evaluated candidate (once at the end when parallel)
 
     Returns:
         Dictionary containing:
@@ -337,6 +568,10 @@ def optimize_der_placement(
                 - baseline: Pre-DER system metrics
                 - constraints: Voltage and loading constraints used
                 - analysis_parameters: Number of candidates evaluated
+                - failed_candidates: Candidates that could not be evaluated,
+                  with the reason (see FAILURE_REASONS)
+                - screening: Sensitivity ranking of the kept candidates
+                  (only with screening="sensitivity")
             - metadata: Additional metadata about the optimization
             - errors: List of error messages if any occurred
 
@@ -382,6 +617,14 @@ def optimize_der_placement(
         - Control curves are loaded from src/opendss_mcp/data/control_curves/
         - Reactive power support (q_support_kvar) is included in results for VVC DERs
         - Positive q_support = absorbing vars (inductive), negative = injecting vars (capacitive)
+        - Every candidate starts from the regulator and capacitor state of the
+          baseline solve, so results do not depend on evaluation order and a
+          parallel run returns the same table as a serial one
+        - Sensitivity screening ignores regulator/capacitor actions and load
+          voltage dependence; it only selects which buses get a full power flow
+        - In parallel mode the workers load the feeder that is currently loaded
+          (same feeder ID and modifications); later changes to the active
+          circuit are not seen by them
     """
     try:
         # Validate inputs
@@ -400,6 +643,17 @@ def optimize_der_placement(
                 f"Unsupported objective '{objective}'. Supported objectives: {', '.join(SUPPORTED_OBJECTIVES)}"
             )
 
+        if max_workers is not None and max_workers < 1:
+            return format_error_response("max_workers must be at least 1")
+
+        if screening not in SUPPORTED_SCREENING:
+            return format_error_response(
+                f"Unsupported screening '{screening}'. Supported screening: {', '.join(SUPPORTED_SCREENING)}"
+            )
+
+        if top_k < 1:
+            return format_error_response("top_k must be at least 1")
+
         # Check if circuit is loaded
         if not dss.Circuit.Name():
             return format_error_response(
@@ -410,10 +664,12 @@ def optimize_der_placement(
         constraints = constraints or {}
         min_voltage_pu = constraints.get("min_voltage_pu", 0.95)
         max_voltage_pu = constraints.get("max_voltage_pu", 1.05)
-        max_candidates = constraints.get("max_candidates", 20)
+        max_candidates = constraints.get(
+            "max_candidates", None if parallel or screening != "none" else 20
+        )
 
         # Get baseline metrics
-        dss.Solution.Solve()
+        _solve_from_initial_guess()
         if not dss.Solution.Converged():
             return format_error_response("Baseline power flow did not converge")
 
@@ -424,92 +680,106 @@ def optimize_der_placement(
 
         # Determine candidate buses
         if candidate_buses is None:
-            # Use all buses, but limit to max_candidates
-            all_buses = dss.Circuit.AllBusNames()
+            # Use all buses, limited to max_candidates if set
+            all_buses = get_name_index().bus_names
             candidate_buses = all_buses[:max_candidates]
-            logger.info(f"Evaluating all buses (limited to {max_candidates})")
+            logger.info(
+                f"Evaluating all buses (limited to {max_candidates})"
+                if max_candidates
+                else f"Evaluating all {len(candidate_buses)} buses"
+            )
         else:
             # Validate provided buses exist
-            all_buses_lower = [bus.lower() for bus in dss.Circuit.AllBusNames()]
-            invalid_buses = [
-                bus for bus in candidate_buses if bus.lower() not in all_buses_lower
-            ]
+            names = get_name_index()
+            invalid_buses = [bus for bus in candidate_buses if not names.has_bus(bus)]
             if invalid_buses:
                 return format_error_response(
                     f"Invalid bus IDs: {', '.join(invalid_buses)}"
                 )
 
-        # Evaluate each candidate
-        evaluation_results: List[Dict[str, Any]] = []
-
-        for bus_id in candidate_buses:
-            try:
-                # Add DER at candidate bus
-                if not _add_der_at_bus(
-                    bus_id, der_type, capacity_kw, battery_kwh, control_settings
-                ):
-                    logger.warning(f"Failed to add DER at bus {bus_id}, skipping")
-                    continue
-
-                # Run power flow
-                dss.Solution.Solve()
-
-                if not dss.Solution.Converged():
-                    logger.warning(
-                        f"Power flow did not converge with DER at {bus_id}, skipping"
-                    )
-                    _remove_der_from_bus(bus_id, der_type)
-                    continue
-
-                # Get metrics
-                current_losses = _get_total_losses()
-                voltage_check = check_voltage_violations(min_voltage_pu, max_voltage_pu)
-                num_violations = (
-                    voltage_check.get("data", {})
-                    .get("summary", {})
-                    .get("total_violations", 0)
-                )
-
-                # Get reactive power support (for VVC-enabled DERs)
-                q_support_kvar = (
-                    _get_der_reactive_power(bus_id, der_type)
-                    if "_vvc" in der_type
-                    else 0.0
-                )
+        # Keep the most promising candidates for exact evaluation
+        num_candidates = len(candidate_buses)
+        screening_rows: List[Dict[str, Any]] = []
+        if screening == "sensitivity":
+            screening_rows = _screen_candidates(
+                list(candidate_buses),
+                objective,
+                capacity_kw,
+                min_voltage_pu,
+                max_voltage_pu,
+                top_k,
+            )
+            candidate_buses = [row["bus_id"] for row in screening_rows]
+            logger.info(
+                f"Screened {num_candidates} candidates, evaluating top {len(candidate_buses)}"
+            )
 
-                # Calculate objective value
-                objective_value = _calculate_objective(
-                    objective, baseline_losses, current_losses, voltage_check
-                )
+        params = {
+            "der_type": der_type,
+            "capacity_kw": capacity_kw,
+            "battery_kwh": battery_kwh,
+            "control_settings": control_settings,
+            "objective": objective,
+            "min_voltage_pu": min_voltage_pu,
+            "max_voltage_pu": max_voltage_pu,
+            "baseline_losses": baseline_losses,
+            "control_state": _capture_control_state(),
+        }
 
-                # Store results
-                evaluation_results.append(
-                    {
-                        "bus_id": bus_id,
-                        "objective_value": round(objective_value, 4),
-                        "losses_kw": round(current_losses, 2),
-                        "loss_reduction_kw": round(baseline_losses - current_losses, 2),
-                        "voltage_violations": num_violations,
-                        "q_support_kvar": round(q_support_kvar, 2),
-                        "converged": True,
-                    }
+        # Evaluate each candidate
+        if parallel:
+            loaded_feeder = get_loaded_feeder()
+            if loaded_feeder is None:
+                return format_error_response(
+                    "Parallel evaluation requires a feeder loaded with load_feeder tool."
                 )
-
-                # Remove DER for next iteration
-                _remove_der_from_bus(bus_id, der_type)
-
-            except Exception as e:
-                logger.error(f"Error evaluating bus {bus_id}: {e}")
-                _remove_der_from_bus(bus_id, der_type)
-                continue
+            workers = min(
+                max_workers or default_worker_count(len(candidate_buses)),
+                len(candidate_buses),
+            )
+            rows = run_parallel(
+                loaded_feeder["feeder_id"],
+                _candidate_task,
+                [(bus_id, params) for bus_id in candidate_buses],
+                max_workers=workers,
+                modifications=loaded_feeder["modifications"],
+            )
+            if progress_callback is not None:
+                progress_callback(len(rows), len(candidate_buses))
+        else:
+            workers = 1
+            # One reusable test element per class, moved from bus to bus
+            probe = DERProbe("der_opt")
+            try:
+                rows = []
+                for bus_id in candidate_buses:
+                    rows.append(_evaluate_candidate(probe, bus_id, params))
+                    if progress_callback is not None:
+                        progress_callback(len(rows), len(candidate_buses))
+            finally:
+                # Disconnect the test DER and leave controls as in the baseline
+                probe.close()
+                _restore_control_state(params["control_state"])
+
+        evaluation_results = [row for row in rows if row and row["converged"]]
+        failed_candidates = [
+            {"bus_id": row["bus_id"], "reason": row["failure"]}
+            for row in rows
+            if row and not row["converged"]
+        ]
 
         # Check if we have any valid results
         if not evaluation_results:
+            counts = Counter(row["reason"] for row in failed_candidates)
+            details = ", ".join(
+                f"{count} {FAILURE_REASONS[reason]}" for reason, count in counts.items()
+            )
             return format_error_response(
-                "No valid candidate buses found. All candidates failed power flow convergence."
+                f"No valid candidate buses found. Candidates failed: {details or 'none evaluated'}."
             )
 
-        # Rank by objective value (higher is better)
+        # Rank by objective value (higher is better); the sort is stable, so
+        # ties keep candidate order and serial and parallel runs rank alike
         evaluation_results.sort(key=lambda x: x["objective_value"], reverse=True)
 
         # Get top candidate
@@ -553,15 +823,21 @@ def optimize_der_placement(
             },
             "analysis_parameters": {
                 "candidates_evaluated": len(evaluation_results),
-                "candidates_requested": (
-                    len(candidate_buses) if candidate_buses else "all"
-                ),
+                "candidates_requested": num_candidates,
+                "screening": screening,
             },
+            "failed_candidates": failed_candidates,
         }
 
+        if screening == "sensitivity":
+            data["analysis_parameters"]["top_k"] = top_k
+            data["screening"] = screening_rows
+
         metadata = {
             "circuit_name": dss.Circuit.Name(),
             "analysis_type": "der_placement_optimization",
+            "parallel": parallel,
+            "max_workers": workers,
         }
 
         return format_success_response(data, metadata)
@@ -0,0 +1,206 @@
+"""
+Fault study module for OpenDSS.
+
+This module runs one solution in OpenDSS FaultStudy mode and extracts the
+short-circuit currents and Thevenin impedances of all buses in bulk, for
+protection coordination screens (device interrupting duty from the maximum
+currents, relay and fuse sensitivity from the minimum ground fault currents).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import opendssdirect as dss
+
+from ..utils.formatters import format_success_response, format_error_response
+from ..utils.result_store import DEFAULT_INLINE_LIMIT, store_large_fields
+from ..utils.short_circuit import ShortCircuitArrays
+from ..utils.solver import PowerFlowSolver
+from ..utils.dss_wrapper import get_name_index
+from .power_flow import SOLUTION_MODES
+
+logger = logging.getLogger(__name__)
+
+# Fault types reported per bus, by result field
+FAULT_TYPES = {
+    "all_phase_a": "all-phase",
+    "slg_max_a": "single-line-to-ground",
+    "ll_a": "line-to-line",
+}
+
+
+def _extreme(
+    sc: ShortCircuitArrays, values: np.ndarray, indices: np.ndarray, largest: bool
+) -> Optional[Dict[str, Any]]:
+    """Bus with the largest or smallest value among the given buses.
+
+    Args:
+        sc: Short-circuit arrays
+        values: Per-bus values
+        indices: Bus indices to consider
+        largest: Pick the largest value instead of the smallest
+
+    Returns:
+        Dictionary with bus and current_a, or None if no value is defined
+    """
+    subset = values[indices]
+    if np.all(np.isnan(subset)):
+        return None
+    position = np.nanargmax(subset) if largest else np.nanargmin(subset)
+    return {
+        "bus": sc.bus_names[indices[position]].lower(),
+        "current_a": round(float(subset[position]), 2),
+    }
+
+
+def _capture_solution_settings() -> Dict[str, Any]:
+    """Record the solution settings that switching to FaultStudy mode resets."""
+    solution = dss.Solution
+    return {
+        "mode": solution.Mode(),
+        "number": solution.Number(),
+        "step_size": solution.StepSize(),
+        "hour": solution.Hour(),
+        "seconds": solution.Seconds(),
+    }
+
+
+def _restore_solution(settings: Dict[str, Any]) -> None:
+    """Return to the recorded settings and solve the circuit again.
+
+    FaultStudy mode leaves the engine holding the fault study solution
+    (sources shorted out), which every later voltage or flow read would see.
+    Time-stepping modes advance the clock before they solve, so the clock is
+    set one step back first and the re-solve lands on the recorded step.
+
+    Args:
+        settings: Settings from _capture_solution_settings()
+    """
+    solution = dss.Solution
+    solution.Mode(settings["mode"])
+    solution.Number(settings["number"])
+    solution.StepSize(settings["step_size"])
+    previous_step = settings["hour"] * 3600.0 + settings["seconds"]
+    previous_step -= settings["step_size"]
+    if settings["mode"] != SOLUTION_MODES["snapshot"] and previous_step >= 0:
+        solution.Hour(int(previous_step // 3600))
+        solution.Seconds(previous_step % 3600)
+
+    solve = PowerFlowSolver("cold").solve()
+    if not solve["converged"]:
+        logger.warning(
+            f"Power flow did not converge after the fault study: {solve['error']}"
+        )
+    solution.Hour(settings["hour"])
+    solution.Seconds(settings["seconds"])
+
+
+def run_fault_study(
+    buses: Optional[List[str]] = None,
+    fault_resistance_ohm: float = 0.0,
+    inline_limit: Optional[int] = DEFAULT_INLINE_LIMIT,
+) -> Dict[str, Any]:
+    """Compute short-circuit currents and Thevenin impedances of all buses.
+
+    The circuit is solved once in FaultStudy mode, which builds the Thevenin
+    equivalent of every bus. All-phase, single-line-to-ground and
+    line-to-line fault currents are then computed for all buses at once from
+    those equivalents; no solve is run per bus. Afterwards the previous
+    solution mode is restored and the circuit is solved again in it, so later
+    tools read the same power flow state as before the study.
+
+    Args:
+        buses: Buses to report (default: all buses with phase nodes)
+        fault_resistance_ohm: Fault resistance in ohms (default: 0, bolted
+            faults)
+        inline_limit: Maximum number of per-bus values returned inline; larger
+            feeders return a result_handle for fetch_result (default: 10000)
+
+    Returns:
+        Dictionary containing:
+            - success: Boolean indicating if the operation was successful
+            - data: Per-bus fault currents and impedances and a summary
+            - metadata: Additional metadata about the analysis
+            - errors: List of error messages if any occurred
+
+    Example:
+        >>> load_ieee_test_feeder("IEEE34")
+        >>> result = run_fault_study()
+        >>> bus = result['data']['fault_currents']['890']
+        >>> print(bus['all_phase_a'], bus['slg_min_a'], bus['x_r_ratio'])
+
+    Note:
+        Currents are in amperes and impedances in ohms. all_phase_a is the
+        fault of all phases of the bus to ground (the three-phase fault at
+        three-phase buses); slg_min_a is the lowest phase-to-ground fault
+        current, the limiting value for protection sensitivity.
+    """
+    try:
+        if fault_resistance_ohm < 0:
+            return format_error_response("fault_resistance_ohm must not be negative")
+
+        # Check if circuit is loaded
+        if not dss.Circuit.Name():
+            return format_error_response(
+                "No circuit loaded. Please load a feeder first using load_feeder tool."
+            )
+
+        names = get_name_index()
+        if buses is not None:
+            unknown = [bus for bus in buses if not names.has_bus(bus)]
+            if unknown:
+                return format_error_response(
+                    f"Buses not found in circuit: {', '.join(unknown[:5])}"
+                )
+
+        settings = _capture_solution_settings()
+        try:
+            dss.Solution.Mode(SOLUTION_MODES["faultstudy"])
+            dss.Solution.Solve()
+            if not dss.Solution.Converged():
+                return format_error_response("Fault study solution did not converge")
+            sc = ShortCircuitArrays.capture(fault_resistance_ohm)
+        finally:
+            _restore_solution(settings)
+
+        if buses is None:
+            indices = np.flatnonzero(sc.num_phases > 0)
+        else:
+            indices = np.array([names.bus_index(bus) for bus in buses], dtype=int)
+
+        fault_currents = sc.to_rows(indices)
+        summary = {
+            "num_buses": len(fault_currents),
+            "max_fault": {
+                field: _extreme(sc, getattr(sc, field), indices, largest=True)
+                for field in FAULT_TYPES
+            },
+            "min_slg_fault": _extreme(sc, sc.slg_min_a, indices, largest=False),
+        }
+
+        result = {
+            "fault_currents": fault_currents,
+            "summary": summary,
+            "fault_types": FAULT_TYPES,
+            "fault_resistance_ohm": fault_resistance_ohm,
+        }
+        store_large_fields(
+            "fault_study",
+            result,
+            ["fault_currents"],
+            inline_limit=inline_limit,
+            summary=summary,
+        )
+
+        metadata = {
+            "circuit_name": dss.Circuit.Name(),
+            "analysis_type": "fault_study",
+            "solves": 1,
+        }
+        return format_success_response(result, metadata)
+
+    except Exception as e:
+        error_msg = f"Error running fault study: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
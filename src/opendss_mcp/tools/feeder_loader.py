@@ -2,7 +2,9 @@
 Feeder loading functionality for OpenDSS MCP.
 
 This module provides tools to load and analyze official IEEE test feeders,
-including metadata collection and basic circuit analysis.
+including metadata collection and basic circuit analysis. Synthetic feeders
+(SYNTH1K, SYNTH10K, SYNTH50K) are generated on first use and loaded the same
+way.
 """
 
 import os
@@ -11,7 +13,12 @@ from typing import Any, Dict, List, Optional, Union
 
 import opendssdirect as dss
 
-from ..utils.dss_wrapper import DSSCircuit
+from ..utils.circuit_snapshot import invalidate_node_layout
+from ..utils.dss_wrapper import DSSCircuit, invalidate_name_index
+from ..utils.instrumentation import instrumentation
+from ..utils.line_loading import invalidate_line_layout
+from ..utils.synthetic_feeder import SYNTHETIC_FEEDERS, synthetic_feeder_path
+from ..utils.topology import invalidate_topology
 from ..utils.validators import validate_feeder_id
 from ..utils.formatters import format_success_response, format_error_response
 
@@ -23,8 +30,26 @@ FEEDER_CONFIG = {
     "IEEE13": {"file": "IEEE13.dss", "base_dir": ""},
     "IEEE34": {"file": "IEEE34.dss", "base_dir": ""},
     "IEEE123": {"file": "IEEE123.dss", "base_dir": ""},
+    **{feeder_id: {"synthetic": True} for feeder_id in SYNTHETIC_FEEDERS},
 }
 
+# Feeder most recently loaded into the active OpenDSS circuit
+_loaded_feeder: Dict[str, Any] = {"feeder_id": None, "modifications": None}
+
+
+def get_loaded_feeder() -> Optional[Dict[str, Any]]:
+    """Return the feeder currently loaded in OpenDSS.
+
+    Worker processes use this to compile their own copy of the same feeder.
+
+    Returns:
+        Dictionary with feeder_id and modifications, or None if no feeder
+        has been loaded through load_ieee_test_feeder
+    """
+    if _loaded_feeder["feeder_id"] is None:
+        return None
+    return dict(_loaded_feeder)
+
 
 def _calculate_total_line_length() -> float:
     """Calculate the total length of all lines in the circuit in kilometers.
@@ -150,6 +175,7 @@ def load_ieee_test_feeder(
 
     Args:
         feeder_id: Identifier for the IEEE test feeder (e.g., 'IEEE13', 'IEEE34')
+            or a synthetic feeder ('SYNTH1K', 'SYNTH10K', 'SYNTH50K')
         modifications: Optional dictionary of circuit modifications to apply
             after loading the base model. Currently not implemented.
 
@@ -179,25 +205,34 @@ def load_ieee_test_feeder(
         config = FEEDER_CONFIG[feeder_id]
 
         # Build feeder path - handle empty base_dir
-        if config["base_dir"]:
-            feeder_dir = FEEDERS_DIR / config["base_dir"]
+        if config.get("synthetic"):
+            feeder_file = synthetic_feeder_path(feeder_id)
+            feeder_dir = feeder_file.parent
         else:
-            feeder_dir = FEEDERS_DIR
-
-        feeder_file = feeder_dir / config["file"]
+            if config["base_dir"]:
+                feeder_dir = FEEDERS_DIR / config["base_dir"]
+            else:
+                feeder_dir = FEEDERS_DIR
+            feeder_file = feeder_dir / config["file"]
 
         if not feeder_file.exists():
             return format_error_response(f"Feeder file not found: {feeder_file}")
 
         # Clear any existing circuit
         dss.Text.Command("Clear")
+        _loaded_feeder.update(feeder_id=None, modifications=None)
+        invalidate_topology()
+        invalidate_name_index()
+        invalidate_node_layout()
+        invalidate_line_layout()
 
         # Change to the feeder directory to handle relative paths in DSS files
         current_dir = Path.cwd()
         try:
             os.chdir(feeder_dir)
             # Load the feeder file with full path to ensure it's found
-            dss.Text.Command(f"compile [{feeder_file.absolute()}]")
+            with instrumentation.phase("compile"):
+                dss.Text.Command(f"compile [{feeder_file.absolute()}]")
         except Exception as e:
             return format_error_response(f"Error loading feeder {feeder_id}: {str(e)}")
         finally:
@@ -231,6 +266,8 @@ def load_ieee_test_feeder(
             "feeder_length_km": round(feeder_length, 2),
         }
 
+        _loaded_feeder.update(feeder_id=feeder_id, modifications=modifications)
+
         return format_success_response(data)
 
     except Exception as e:
@@ -0,0 +1,285 @@
+"""
+Feeder-wide hosting capacity map for OpenDSS.
+
+This module computes the DER hosting capacity of every candidate bus of a
+feeder by fanning the buses out across worker processes. Each worker compiles
+its own copy of the feeder once and runs analyze_feeder_capacity for all the
+buses it receives; the per-bus results are merged into one table.
+"""
+
+import logging
+import statistics
+from typing import Any, Callable, Dict, List, Optional
+
+import opendssdirect as dss
+
+from ..utils.formatters import format_success_response, format_error_response
+from ..utils.solver import SOLVE_STRATEGIES
+from ..utils.dss_wrapper import get_name_index
+from ..utils.topology import get_topology
+from ..utils.validators import validate_positive_float
+from ..utils.workers import default_worker_count, run_parallel, worker_feeder_error
+from .capacity import (
+    SUPPORTED_DER_TYPES,
+    SUPPORTED_SEARCH_STRATEGIES,
+    _capture_control_state,
+    _restore_control_state,
+    analyze_feeder_capacity,
+)
+from .feeder_loader import get_loaded_feeder
+
+logger = logging.getLogger(__name__)
+
+# Control state of the worker's circuit after its first solve
+_worker_control_state: Dict[str, Any] = {"state": None}
+
+
+def _capacity_task(task: tuple) -> Dict[str, Any]:
+    """Analyze hosting capacity of one bus inside a worker process.
+
+    Args:
+        task: Tuple of (bus_id, keyword arguments for analyze_feeder_capacity)
+
+    Returns:
+        Row of the hosting capacity table for the bus
+    """
+    bus_id, params = task
+    row: Dict[str, Any] = {
+        "bus_id": bus_id,
+        "max_capacity_kw": None,
+        "limiting_constraint": None,
+        "violation_details": None,
+        "iterations": 0,
+        "error": None,
+    }
+
+    feeder_error = worker_feeder_error()
+    if feeder_error:
+        row["error"] = feeder_error
+        return row
+
+    try:
+        # Start every bus from the same regulator/capacitor state so a row does
+        # not depend on which buses the worker evaluated before it
+        if _worker_control_state["state"] is None:
+            dss.Solution.Solve()
+            _worker_control_state["state"] = _capture_control_state()
+        else:
+            _restore_control_state(_worker_control_state["state"])
+
+        result = analyze_feeder_capacity(bus_id, **params)
+    except Exception as e:
+        row["error"] = str(e)
+        return row
+
+    if not result.get("success", False):
+        row["error"] = (result.get("errors") or ["Unknown error"])[0]
+        return row
+
+    data = result["data"]
+    row.update(
+        max_capacity_kw=data["max_capacity_kw"],
+        limiting_constraint=data["limiting_constraint"],
+        violation_details=data["violation_details"],
+        iterations=data["analysis_parameters"]["iterations_performed"],
+    )
+    return row
+
+
+def _summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize a hosting capacity table.
+
+    Args:
+        rows: Per-bus result rows
+
+    Returns:
+        Dictionary with capacity statistics and limiting constraint counts
+    """
+    analyzed = [row for row in rows if row["error"] is None]
+    capacities = [row["max_capacity_kw"] for row in analyzed]
+
+    constraint_counts: Dict[str, int] = {}
+    for row in analyzed:
+        key = row["limiting_constraint"] or "none"
+        constraint_counts[key] = constraint_counts.get(key, 0) + 1
+
+    summary: Dict[str, Any] = {
+        "buses_analyzed": len(analyzed),
+        "buses_failed": len(rows) - len(analyzed),
+        "min_capacity_kw": min(capacities) if capacities else None,
+        "max_capacity_kw": max(capacities) if capacities else None,
+        "mean_capacity_kw": (
+            round(statistics.fmean(capacities), 2) if capacities else None
+        ),
+        "median_capacity_kw": (
+            round(statistics.median(capacities), 2) if capacities else None
+        ),
+        "limiting_constraint_counts": constraint_counts,
+        "total_solves": sum(row["iterations"] for row in rows),
+    }
+    if analyzed:
+        weakest = min(analyzed, key=lambda row: row["max_capacity_kw"])
+        summary["min_capacity_bus"] = weakest["bus_id"]
+    return summary
+
+
+def analyze_hosting_capacity_map(
+    bus_ids: Optional[List[str]] = None,
+    der_type: str = "solar",
+    increment_kw: float = 100,
+    max_capacity_kw: float = 10000,
+    constraints: Optional[Dict[str, Any]] = None,
+    search: str = "bisection",
+    tolerance_kw: Optional[float] = None,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """Compute DER hosting capacity for many buses of the loaded feeder.
+
+    The candidate buses are split across worker processes. Every worker
+    loads its own copy of the feeder that is currently loaded (same feeder
+    ID and modifications) once, then runs analyze_feeder_capacity for each
+    bus it is given. Rows are returned in the order of the candidate buses
+    regardless of which worker evaluated them.
+
+    Args:
+        bus_ids: Buses to analyze (default: all buses except the source bus)
+        der_type: Type of DER to analyze - "solar", "battery", or "wind" (default: "solar")
+        increment_kw: Capacity increment for the linear search in kW (default: 100)
+        max_capacity_kw: Maximum capacity to test in kW (default: 10000)
+        constraints: Optional constraint limits (min_voltage_pu,
+            max_voltage_pu, max_line_loading_pct)
+        search: Search strategy - "linear", "bisection", or "secant" (default: "bisection")
+        tolerance_kw: Final bracket width for bisection/secant search in kW
+            (default: increment_kw)
+        solve_strategy: Start of each solution - "auto", "warm" or "cold"
+            (default: "auto")
+        max_workers: Number of worker processes (default: CPU count)
+        progress_callback: Optional function called as
+            progress_callback(buses_done, num_buses)
+
+    Returns:
+        Dictionary containing:
+            - success: Boolean indicating if the operation was successful
+            - data: Dictionary with the per-bus table and a summary
+            - metadata: Additional metadata about the analysis
+            - errors: List of error messages if any occurred
+
+    Example:
+        >>> load_ieee_test_feeder("IEEE123")
+        >>> result = analyze_hosting_capacity_map(der_type="solar", max_workers=4)
+        >>> if result['success']:
+        ...     for row in result['data']['buses']:
+        ...         print(row['bus_id'], row['max_capacity_kw'])
+
+    Note:
+        Changes made to the active circuit after loading the feeder (added
+        DER, control settings) are not seen by the workers.
+    """
+    try:
+        # Validate inputs
+        validate_positive_float(increment_kw, "increment_kw")
+        validate_positive_float(max_capacity_kw, "max_capacity_kw")
+        if tolerance_kw is not None:
+            validate_positive_float(tolerance_kw, "tolerance_kw")
+        if max_workers is not None and max_workers < 1:
+            return format_error_response("max_workers must be at least 1")
+
+        if der_type not in SUPPORTED_DER_TYPES:
+            return format_error_response(
+                f"Unsupported DER type '{der_type}'. Supported types: {', '.join(SUPPORTED_DER_TYPES)}"
+            )
+
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return format_error_response(
+                f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
+
+        if search not in SUPPORTED_SEARCH_STRATEGIES:
+            return format_error_response(
+                f"Unsupported search strategy '{search}'. Supported strategies: {', '.join(SUPPORTED_SEARCH_STRATEGIES)}"
+            )
+
+        # Check if circuit is loaded
+        loaded_feeder = get_loaded_feeder()
+        if not dss.Circuit.Name() or loaded_feeder is None:
+            return format_error_response(
+                "No circuit loaded. Please load a feeder first using load_feeder tool."
+            )
+
+        # Resolve candidate buses
+        if bus_ids is None:
+            topology = get_topology()
+            source_buses = set(topology.source_buses.tolist())
+            candidates = [
+                bus for i, bus in enumerate(topology.bus_names) if i not in source_buses
+            ]
+        else:
+            names = get_name_index()
+            unknown = [bus for bus in bus_ids if not names.has_bus(bus)]
+            if unknown:
+                return format_error_response(
+                    f"Buses not found in circuit: {', '.join(unknown[:5])}"
+                )
+            candidates = list(bus_ids)
+
+        if not candidates:
+            return format_error_response("No candidate buses to analyze")
+
+        params = {
+            "der_type": der_type,
+            "increment_kw": increment_kw,
+            "max_capacity_kw": max_capacity_kw,
+            "constraints": constraints or {},
+            "search": search,
+            "tolerance_kw": tolerance_kw,
+            "solve_strategy": solve_strategy,
+        }
+
+        workers = min(
+            max_workers or default_worker_count(len(candidates)), len(candidates)
+        )
+        rows = run_parallel(
+            loaded_feeder["feeder_id"],
+            _capacity_task,
+            [(bus_id, params) for bus_id in candidates],
+            max_workers=workers,
+            modifications=loaded_feeder["modifications"],
+            progress_callback=progress_callback,
+        )
+
+        data = {
+            "feeder_id": loaded_feeder["feeder_id"],
+            "der_type": der_type,
+            "buses": rows,
+            "summary": _summarize(rows),
+            "analysis_parameters": {
+                "increment_kw": increment_kw,
+                "max_capacity_tested_kw": max_capacity_kw,
+                "search": search,
+                "tolerance_kw": tolerance_kw,
+                "solve_strategy": solve_strategy,
+                "constraints": constraints or {},
+            },
+        }
+
+        metadata = {
+            "circuit_name": dss.Circuit.Name(),
+            "analysis_type": "hosting_capacity_map",
+            "num_candidates": len(candidates),
+            "max_workers": workers,
+        }
+
+        errors = [f"{row['bus_id']}: {row['error']}" for row in rows if row["error"]]
+        if errors and len(errors) == len(rows):
+            return format_error_response(errors)
+
+        return format_success_response(data, metadata)
+
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error analyzing hosting capacity map: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
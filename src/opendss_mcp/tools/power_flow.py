@@ -11,26 +11,38 @@ from typing import Any
 import opendssdirect as dss
 
 from ..utils.formatters import format_success_response, format_error_response
-from ..utils.harmonics import get_harmonic_voltages, get_harmonic_currents
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.harmonics import run_harmonic_sweep
+from ..utils.result_store import DEFAULT_INLINE_LIMIT, store_large_fields
+from ..utils.solver import SOLVE_STRATEGIES, PowerFlowSolver
 
 # Map of solution mode names to their corresponding integer values in OpenDSS
+# (the SolveModes enumeration of the engine)
 SOLUTION_MODES = {
     "snapshot": 0,
     "snap": 0,
     "daily": 1,
     "yearly": 2,
-    "dutycycle": 3,
-    "direct": 4,
-    "montecarlo1": 5,
-    "montecarlo2": 6,
-    "montecarlo3": 7,
-    "faultstudy": 8,
-    "mf": 9,
-    "peakday": 10,
-    "loadduration1": 11,
+    "montecarlo1": 3,
+    "loadduration1": 4,
+    "peakday": 5,
+    "dutycycle": 6,
+    "direct": 7,
+    "mf": 8,
+    "faultstudy": 9,
+    "montecarlo2": 10,
+    "montecarlo3": 11,
     "loadduration2": 12,
 }
 
+# Per-bus and per-line fields stored server-side when the response gets large
+LARGE_FIELDS = [
+    "bus_voltages",
+    "harmonics.thd_voltage",
+    "harmonics.thd_current",
+    "harmonics.individual_harmonics",
+]
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,8 +51,9 @@ def _perform_harmonic_analysis(
 ) -> dict[str, Any]:
     """Perform harmonic analysis on all buses and lines in the circuit.
 
-    This internal helper function calculates THD for voltages at all buses
-    and currents through all lines, and identifies the worst THD location.
+    This internal helper function runs a single harmonic sweep (one solve per
+    order), calculates THD for voltages at all buses and currents through all
+    lines from the bulk results, and identifies the worst THD location.
 
     Args:
         all_buses: List of all bus names in the circuit
@@ -62,35 +75,30 @@ def _perform_harmonic_analysis(
     for order in harmonic_orders:
         individual_harmonics[order] = {}
 
-    # Calculate THD for all buses
-    logger.info(f"Calculating voltage THD for {len(all_buses)} buses...")
+    # Solve each order once for the whole circuit
+    logger.info(
+        f"Running harmonic sweep over {len(harmonic_orders)} orders "
+        f"for {len(all_buses)} buses..."
+    )
+    sweep = run_harmonic_sweep(harmonic_orders)
+    for error in sweep.get("errors", []):
+        logger.warning(f"Harmonic sweep: {error}")
+
+    # THD for all buses
     for bus_name in all_buses:
-        try:
-            result = get_harmonic_voltages(bus_name, harmonic_orders)
-            if result.get("success", False):
-                # Store THD value
-                thd_voltage[bus_name] = result.get("thd_percent", 0.0)
-
-                # Store individual harmonic voltages
-                harmonic_voltages = result.get("harmonic_voltages", {})
-                for order, data in harmonic_voltages.items():
-                    avg_voltage = data.get("avg_voltage_pu", 0.0)
-                    individual_harmonics[order][bus_name] = avg_voltage
-        except Exception as e:
-            logger.warning(f"Error analyzing harmonics for bus {bus_name}: {e}")
-            continue
-
-    # Calculate THD for all lines
-    all_lines = dss.Lines.AllNames()
-    logger.info(f"Calculating current THD for {len(all_lines)} lines...")
-    for line_name in all_lines:
-        try:
-            result = get_harmonic_currents(line_name, harmonic_orders)
-            if result.get("success", False):
-                thd_current[line_name] = result.get("thd_percent", 0.0)
-        except Exception as e:
-            logger.warning(f"Error analyzing harmonics for line {line_name}: {e}")
-            continue
+        if bus_name in sweep["thd_voltage"]:
+            thd_voltage[bus_name] = sweep["thd_voltage"][bus_name]
+
+    # Individual harmonic voltages (average across phases)
+    for order in sweep["orders"]:
+        avg_voltages = sweep["bus_avg_voltages"][order]
+        for bus_name in all_buses:
+            if bus_name in avg_voltages:
+                individual_harmonics[order][bus_name] = round(avg_voltages[bus_name], 6)
+
+    # THD for all lines
+    thd_current.update(sweep["thd_current"])
+    logger.info(f"Computed current THD for {len(thd_current)} lines")
 
     # Find worst THD bus
     worst_thd_bus = ""
@@ -127,6 +135,11 @@ def run_power_flow(
             - control_mode: Control mode for the solution (default: 'snapshot')
             - harmonic_analysis: Enable harmonic analysis (default: False)
             - harmonic_orders: List of harmonic orders to analyze (default: [1, 3, 5, 7, 9, 11, 13])
+            - solve_strategy: Start of the solution: "auto", "warm" (from the
+              previous solution) or "cold" (from a direct solution) (default: "auto")
+            - inline_limit: Maximum number of per-bus/per-line values returned
+              inline; larger results are stored and fetched with fetch_result
+              (default: 10000, 0 to always store)
 
     Returns:
         Dictionary containing power flow results and metadata:
@@ -135,7 +148,10 @@ def run_power_flow(
                 - feeder_id: The feeder identifier
                 - converged: Boolean indicating convergence
                 - iterations: Number of iterations performed
+                - solve: Statistics of the solve (iterations, control_iterations,
+                  time_ms, start, y_rebuilt, retried)
                 - bus_voltages: Dictionary of bus voltages in per-unit
+                - num_buses: Number of buses
                 - min_voltage: Minimum voltage across all buses
                 - max_voltage: Maximum voltage across all buses
                 - options: The options used for the analysis
@@ -145,6 +161,9 @@ def run_power_flow(
                     - individual_harmonics: Dictionary of harmonic orders with bus voltages
                     - worst_thd_bus: Bus ID with highest voltage THD
                     - worst_thd_value: THD percentage at worst bus
+                - result_handle: (Only for large results) Handle of the stored
+                  per-bus/per-line fields, which are then left out
+                - stored_fields: (Only for large results) Paths of the stored fields
             - metadata: Additional metadata
             - errors: List of error messages if any occurred
 
@@ -160,6 +179,10 @@ def run_power_flow(
         >>> if result['success']:
         ...     harmonics = result['data']['harmonics']
         ...     print(f"Worst THD: {harmonics['worst_thd_value']:.2f}% at bus {harmonics['worst_thd_bus']}")
+        >>>
+        >>> # Keep per-bus data server-side and page through it
+        >>> result = run_power_flow("IEEE123", {"inline_limit": 0})
+        >>> fetch_result(result['data']['result_handle'], "bus_voltages", limit=50)
 
     Note:
         - Harmonic analysis is optional and disabled by default for backward compatibility
@@ -174,6 +197,12 @@ def run_power_flow(
         control_mode = options.get("control_mode", "snapshot")
         harmonic_analysis = options.get("harmonic_analysis", False)
         harmonic_orders = options.get("harmonic_orders", [1, 3, 5, 7, 9, 11, 13])
+        solve_strategy = options.get("solve_strategy", "auto")
+
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return format_error_response(
+                f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
 
         # Configure power flow settings
         dss.Solution.MaxControlIterations(max_iterations)
@@ -185,24 +214,22 @@ def run_power_flow(
         # Note: Using default tolerance as it's not configurable in this API
 
         # Solve the power flow
-        dss.Solution.Solve()
-
-        # Check if the solution converged
-        converged = dss.Solution.Converged()
-        iterations = dss.Solution.Iterations()
+        solve = PowerFlowSolver(solve_strategy).solve()
+        converged = solve["converged"]
+        iterations = solve["iterations"]
 
+        if solve["error"]:
+            return format_error_response(f"Error running power flow: {solve['error']}")
         if not converged:
             return format_error_response("Power flow did not converge")
 
-        # Get bus voltages
-        bus_voltages = {}
-        all_buses = dss.Circuit.AllBusNames()
-        for bus_name in all_buses:
-            dss.Circuit.SetActiveBus(bus_name)
-            voltages = dss.Bus.puVmagAngle()
-            # Take the magnitude of the first phase voltage (simplified)
-            if voltages and len(voltages) > 0:
-                bus_voltages[bus_name.lower()] = voltages[0]
+        # Get bus voltages (magnitude of the first phase, simplified)
+        snapshot = CircuitSnapshot.capture()
+        all_buses = snapshot.bus_names
+        bus_voltages = {
+            bus_name.lower(): voltage
+            for bus_name, voltage in snapshot.to_dict(snapshot.bus_first()).items()
+        }
 
         # Calculate min/max voltages
         if bus_voltages:
@@ -216,13 +243,16 @@ def run_power_flow(
             "feeder_id": feeder_id,
             "converged": converged,
             "iterations": iterations,
+            "solve": {key: solve[key] for key in solve if key != "error"},
             "bus_voltages": bus_voltages,
+            "num_buses": len(bus_voltages),
             "min_voltage": min_voltage,
             "max_voltage": max_voltage,
             "options": {
                 "max_iterations": max_iterations,
                 "tolerance": tolerance,
                 "control_mode": control_mode,
+                "solve_strategy": solve_strategy,
             },
         }
 
@@ -234,6 +264,19 @@ def run_power_flow(
             result["options"]["harmonic_analysis"] = True
             result["options"]["harmonic_orders"] = harmonic_orders
 
+        store_large_fields(
+            "power_flow",
+            result,
+            LARGE_FIELDS,
+            inline_limit=options.get("inline_limit", DEFAULT_INLINE_LIMIT),
+            summary={
+                "feeder_id": feeder_id,
+                "num_buses": len(bus_voltages),
+                "min_voltage": min_voltage,
+                "max_voltage": max_voltage,
+            },
+        )
+
         return format_success_response(result)
 
     except Exception as e:
@@ -0,0 +1,197 @@
+"""
+Paginated retrieval of stored results.
+
+Tools that produce large results (every bus voltage of a big feeder, harmonic
+voltages for every order and bus, long time-series runs) store them on disk
+and return a compact summary with a result handle. This module reads such
+results back one page at a time and deletes them once they are no longer needed.
+"""
+
+import logging
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from ..utils.formatters import format_error_response, format_success_response
+from ..utils.result_store import (
+    delete_result as delete_stored_result,
+    read_document,
+    read_manifest,
+    read_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default and maximum number of entries returned by one fetch
+DEFAULT_FETCH_LIMIT = 100
+MAX_FETCH_LIMIT = 5000
+
+
+def _project(record: Any, fields: List[str]) -> Dict[str, Any]:
+    """Keep only the given keys of a record.
+
+    Args:
+        record: Entry of a stored list or mapping
+        fields: Keys to keep
+
+    Returns:
+        Dictionary with the requested keys that the record has
+
+    Raises:
+        ValueError: If the record is not a dictionary
+    """
+    if not isinstance(record, dict):
+        raise ValueError("fields can only be selected from entries that are objects")
+    return {field: record[field] for field in fields if field in record}
+
+
+def _page_document(
+    handle: str,
+    path: Optional[str],
+    offset: int,
+    limit: int,
+    fields: Optional[List[str]],
+) -> Dict[str, Any]:
+    """Read one page of a stored document.
+
+    Lists are paged by index and mappings by entry, in stored order. A scalar
+    at path is returned as is.
+    """
+    node = read_document(handle, path)
+    if isinstance(node, list):
+        total = len(node)
+        items: Any = node[offset : offset + limit]
+        if fields:
+            items = [_project(item, fields) for item in items]
+    elif isinstance(node, dict):
+        total = len(node)
+        items = dict(islice(node.items(), offset, offset + limit))
+        if fields:
+            items = {key: _project(value, fields) for key, value in items.items()}
+    else:
+        return {"total": None, "items": node, "next_offset": None}
+
+    next_offset = offset + limit if offset + limit < total else None
+    return {"total": total, "items": items, "next_offset": next_offset}
+
+
+def _page_arrays(
+    handle: str,
+    manifest: Dict[str, Any],
+    path: Optional[str],
+    offset: int,
+    limit: int,
+    fields: Optional[List[str]],
+) -> Dict[str, Any]:
+    """Read one page of rows of a stored per-step result.
+
+    A path names a single column and is the same as fields=[path].
+    """
+    if path:
+        fields = [path]
+    rows = read_rows(handle, fields=fields, offset=offset, limit=limit)
+    total = manifest["num_rows"]
+    next_offset = offset + limit if offset + limit < total else None
+    labels = {
+        name: manifest["labels"][name] for name in rows if name in manifest["labels"]
+    }
+    return {
+        "total": total,
+        "items": {name: values.tolist() for name, values in rows.items()},
+        "labels": labels,
+        "next_offset": next_offset,
+    }
+
+
+def fetch_result(
+    handle: str,
+    path: Optional[str] = None,
+    offset: int = 0,
+    limit: int = DEFAULT_FETCH_LIMIT,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Read part of a stored result.
+
+    Args:
+        handle: Result handle returned by a tool (data.result_handle)
+        path: Dot-separated location inside the result, e.g. "bus_voltages",
+            "harmonics.individual_harmonics.5" or "timesteps". For per-step
+            results written with stream=True, the name of one column.
+            Default: the top level of the result
+        offset: First entry (list index, mapping entry or row) to return
+            (default: 0)
+        limit: Maximum number of entries to return (default: 100, at most 5000)
+        fields: Keys to keep from each entry (documents) or columns to return
+            (per-step results). Default: everything
+
+    Returns:
+        Dictionary containing:
+            - handle, kind, path, offset, limit: The request
+            - total: Number of entries at path (None for a single value)
+            - items: The requested entries (a list, a mapping, a single value,
+              or one list per column for per-step results)
+            - labels: Entry labels of array columns (per-step results only)
+            - next_offset: Offset of the next page, or None at the end
+
+    Example:
+        >>> result = run_power_flow("IEEE123", {"inline_limit": 0})
+        >>> handle = result['data']['result_handle']
+        >>> page = fetch_result(handle, "bus_voltages", offset=0, limit=50)
+        >>> while page['data']['next_offset'] is not None:
+        ...     page = fetch_result(handle, "bus_voltages",
+        ...                         offset=page['data']['next_offset'], limit=50)
+    """
+    try:
+        if offset < 0:
+            return format_error_response("offset must be non-negative")
+        if not 1 <= limit <= MAX_FETCH_LIMIT:
+            return format_error_response(
+                f"limit must be between 1 and {MAX_FETCH_LIMIT}"
+            )
+
+        manifest = read_manifest(handle)
+        if manifest.get("format", "arrays") == "document":
+            page = _page_document(handle, path, offset, limit, fields)
+        else:
+            page = _page_arrays(handle, manifest, path, offset, limit, fields)
+
+        data = {
+            "handle": handle,
+            "kind": manifest["kind"],
+            "path": path,
+            "offset": offset,
+            "limit": limit,
+            **page,
+        }
+        return format_success_response(data)
+
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error fetching result {handle}: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
+
+
+def delete_result(handle: str) -> Dict[str, Any]:
+    """
+    Delete a stored result.
+
+    Stored results are also deleted automatically once they are old or the
+    results directory grows too large; deleting a result as soon as it has
+    been read frees its disk space right away.
+
+    Args:
+        handle: Result handle returned by a tool (data.result_handle)
+
+    Returns:
+        Dictionary containing the handle, kind and freed_bytes of the result
+    """
+    try:
+        return format_success_response(delete_stored_result(handle))
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error deleting result {handle}: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
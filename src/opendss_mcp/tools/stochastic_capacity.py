@@ -0,0 +1,607 @@
+"""
+Stochastic (Monte Carlo) hosting capacity analysis for OpenDSS.
+
+analyze_feeder_capacity sizes one DER at one bus. Utility hosting capacity
+studies instead place many small PV systems on randomly chosen customers and
+repeat the deployment over many scenarios, because where the PV lands matters
+as much as how much of it there is. This module does that:
+
+- Every load of the feeder is a customer. A scenario draws, from a seed, the
+  order in which customers adopt PV and each customer's PV size (a random
+  multiple of its load kW).
+- Each scenario is evaluated at increasing penetration levels (percent of
+  customers with PV). Adopters are added incrementally, so one scenario costs
+  one power flow per level.
+- Scenarios are spread across worker processes. Each worker compiles the
+  feeder once and creates one PVSystem per customer, switched on and off
+  through its irradiance, so no elements are added while scenarios run.
+- Constraints are checked on the bulk voltage and line loading arrays of each
+  solution, and the per-scenario results are stacked into (scenarios x
+  levels) arrays to compute violation probabilities per penetration level.
+
+Scenario k always draws from the seed pair (seed, k), so results do not
+depend on the number of workers.
+"""
+
+import logging
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import opendssdirect as dss
+
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.formatters import format_success_response, format_error_response
+from ..utils.line_loading import LineLoadings
+from ..utils.result_store import DEFAULT_INLINE_LIMIT, store_large_fields
+from ..utils.solver import SOLVE_STRATEGIES, PowerFlowSolver
+from ..utils.validators import validate_positive_float, validate_voltage_limits
+from ..utils.workers import default_worker_count, run_parallel, worker_feeder_error
+from .capacity import _capture_control_state, _restore_control_state
+from .feeder_loader import get_loaded_feeder
+
+logger = logging.getLogger(__name__)
+
+# Largest number of scenarios per study
+MAX_SCENARIOS = 10000
+
+# Default penetration levels, in percent of customers with PV
+DEFAULT_PENETRATION_LEVELS = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+
+# Default PV size range, as a multiple of the customer's load kW
+DEFAULT_PV_SIZE_RANGE = (0.5, 2.0)
+
+# Name prefix of the customer PV systems created in worker processes
+PV_PREFIX = "mc_pv"
+
+# Constraints in the order they are reported as the first violation
+CONSTRAINTS = ["convergence_failure", "overvoltage", "undervoltage", "line_overload"]
+
+# Margin by which PV must worsen a violation already present without PV
+BASELINE_TOLERANCE = 1e-4
+
+# Customers and PV systems of the feeder compiled by this worker process
+_worker_study: Dict[str, Any] = {"customers": None}
+
+
+def _customers() -> List[Dict[str, Any]]:
+    """List the loads of the active circuit that can host customer PV.
+
+    Returns:
+        One dictionary per load with positive kW: name, bus (with nodes),
+        phases, kV and kW, in circuit order
+    """
+    customers = []
+    if dss.Loads.First() > 0:
+        while True:
+            kw = float(dss.Loads.kW())
+            if kw > 0:
+                customers.append(
+                    {
+                        "name": dss.Loads.Name(),
+                        "bus": dss.CktElement.BusNames()[0],
+                        "phases": int(dss.CktElement.NumPhases()),
+                        "kV": float(dss.Loads.kV()),
+                        "kW": kw,
+                    }
+                )
+            if not dss.Loads.Next() > 0:
+                break
+    return customers
+
+
+def scenario_deployment(
+    scenario: int, seed: int, load_kw: np.ndarray, pv_size_range: tuple
+) -> tuple:
+    """Draw the PV deployment of one scenario.
+
+    Args:
+        scenario: Scenario index
+        seed: Seed of the study
+        load_kw: Load kW of each customer
+        pv_size_range: (low, high) PV size as a multiple of load kW
+
+    Returns:
+        Tuple of (adoption order as customer indexes, PV kW of each customer)
+    """
+    rng = np.random.default_rng([seed, scenario])
+    order = rng.permutation(len(load_kw))
+    sizes_kw = load_kw * rng.uniform(pv_size_range[0], pv_size_range[1], len(load_kw))
+    return order, sizes_kw
+
+
+def adopters_per_level(levels: List[float], num_customers: int) -> np.ndarray:
+    """Number of customers with PV at each penetration level.
+
+    Args:
+        levels: Penetration levels in percent of customers
+        num_customers: Number of customers
+
+    Returns:
+        Array of adopter counts (at least one per level)
+    """
+    counts = np.ceil(np.asarray(levels, dtype=float) / 100.0 * num_customers - 1e-9)
+    return np.clip(counts.astype(int), 1, num_customers)
+
+
+def _solution_limits(reuse_layout: bool = False) -> Dict[str, float]:
+    """Extreme voltages and line loading of the current solution.
+
+    Args:
+        reuse_layout: Skip re-reading bus, node and line names (valid while
+            only PV settings change between solves)
+
+    Returns:
+        Dictionary with min_voltage_pu, max_voltage_pu and max_line_loading_pct
+    """
+    vmag_pu = CircuitSnapshot.capture(reuse_layout=reuse_layout).vmag_pu
+    loadings = LineLoadings.capture(reuse_layout=reuse_layout)
+    max_loading = 0.0
+    if np.any(loadings.rated):
+        max_loading = float(np.nanmax(loadings.loading_pct()))
+    return {
+        "min_voltage_pu": float(vmag_pu.min()) if vmag_pu.size else math.nan,
+        "max_voltage_pu": float(vmag_pu.max()) if vmag_pu.size else math.nan,
+        "max_line_loading_pct": max_loading,
+    }
+
+
+def _setup_worker(params: Dict[str, Any]) -> None:
+    """Prepare the worker's circuit for scenarios on its first task.
+
+    Sets the load level, solves the baseline without PV and creates one
+    disconnected (zero irradiance) PVSystem per customer.
+
+    Args:
+        params: Study parameters
+    """
+    dss.Solution.LoadMult(params["load_multiplier"])
+    solve = PowerFlowSolver(params["solve_strategy"]).solve()
+    baseline = _solution_limits() if solve["converged"] else None
+    control_state = _capture_control_state()
+
+    customers = _customers()
+    for i, customer in enumerate(customers):
+        dss.Text.Command(
+            f"New PVSystem.{PV_PREFIX}{i} Bus1={customer['bus']} "
+            f"phases={customer['phases']} kV={customer['kV']} "
+            f"kVA=1 Pmpp=1 irradiance=0"
+        )
+    # Activating PV systems by index avoids a name lookup per customer
+    index = {name.lower(): k + 1 for k, name in enumerate(dss.PVsystems.AllNames())}
+
+    _worker_study.update(
+        customers=customers,
+        pv_index=[index[f"{PV_PREFIX}{i}"] for i in range(len(customers))],
+        load_kw=np.array([customer["kW"] for customer in customers]),
+        baseline=baseline,
+        control_state=control_state,
+        active=[],
+        pv_kw=0.0,
+    )
+
+
+def _scenario_task(task: tuple) -> Dict[str, Any]:
+    """Evaluate one deployment scenario at every penetration level.
+
+    Args:
+        task: Tuple of (scenario index, study parameters)
+
+    Returns:
+        Row with per-level PV kW, extreme voltages, maximum line loading and
+        convergence, or an error
+    """
+    scenario, params = task
+    row: Dict[str, Any] = {"scenario": scenario, "error": None}
+
+    feeder_error = worker_feeder_error()
+    if feeder_error:
+        row["error"] = feeder_error
+        return row
+
+    try:
+        if _worker_study["customers"] is None:
+            _setup_worker(params)
+        study = _worker_study
+        if study["baseline"] is None:
+            row["error"] = "Baseline power flow did not converge"
+            return row
+        if not study["customers"]:
+            row["error"] = "Circuit has no loads to place customer PV on"
+            return row
+
+        order, sizes_kw = scenario_deployment(
+            scenario, params["seed"], study["load_kw"], params["pv_size_range"]
+        )
+        counts = adopters_per_level(params["levels"], len(order))
+
+        # Disconnect the previous scenario's PV and size this scenario's adopters
+        pv_index = study["pv_index"]
+        for i in study["active"]:
+            dss.PVsystems.Idx(pv_index[i])
+            dss.PVsystems.Irradiance(0.0)
+        for i in order[: counts[-1]]:
+            dss.PVsystems.Idx(pv_index[i])
+            dss.PVsystems.kVARated(float(sizes_kw[i]))
+            dss.PVsystems.Pmpp(float(sizes_kw[i]))
+        study["active"] = [int(i) for i in order[: counts[-1]]]
+        _restore_control_state(study["control_state"])
+
+        total_load_kw = float(study["load_kw"].sum())
+        solver = PowerFlowSolver(params["solve_strategy"])
+        columns: Dict[str, List[Any]] = {
+            "pv_kw": [],
+            "min_voltage_pu": [],
+            "max_voltage_pu": [],
+            "max_line_loading_pct": [],
+            "converged": [],
+        }
+        connected = 0
+        for count in counts:
+            for i in order[connected:count]:
+                dss.PVsystems.Idx(pv_index[i])
+                dss.PVsystems.Irradiance(1.0)
+            connected = count
+
+            # The first level starts from the previous scenario's solution
+            pv_kw = float(sizes_kw[order[:count]].sum())
+            solve = solver.solve(change=abs(pv_kw - study["pv_kw"]) / total_load_kw)
+            study["pv_kw"] = pv_kw
+            if solve["converged"]:
+                limits = _solution_limits(reuse_layout=True)
+            else:
+                limits = dict.fromkeys(
+                    ["min_voltage_pu", "max_voltage_pu", "max_line_loading_pct"],
+                    math.nan,
+                )
+            columns["pv_kw"].append(pv_kw)
+            columns["converged"].append(solve["converged"])
+            for key, value in limits.items():
+                columns[key].append(value)
+
+        row.update(columns)
+        row["solves"] = solver.stats()["solves"]
+        row["baseline"] = study["baseline"]
+    except Exception as e:
+        row["error"] = str(e)
+    return row
+
+
+def _violations(
+    rows: List[Dict[str, Any]],
+    baseline: Dict[str, float],
+    min_voltage_pu: float,
+    max_voltage_pu: float,
+    max_line_loading_pct: float,
+) -> Dict[str, np.ndarray]:
+    """Check every scenario and level against the constraints at once.
+
+    A limit already exceeded without PV only counts as violated where PV
+    makes it worse.
+
+    Args:
+        rows: Scenario rows without errors
+        baseline: Limits of the solution without PV
+        min_voltage_pu: Minimum voltage limit
+        max_voltage_pu: Maximum voltage limit
+        max_line_loading_pct: Maximum line loading limit
+
+    Returns:
+        Boolean (scenarios x levels) array per constraint in CONSTRAINTS
+    """
+    vmin = np.array([row["min_voltage_pu"] for row in rows], dtype=float)
+    vmax = np.array([row["max_voltage_pu"] for row in rows], dtype=float)
+    loading = np.array([row["max_line_loading_pct"] for row in rows], dtype=float)
+    converged = np.array([row["converged"] for row in rows], dtype=bool)
+
+    # NaN (non-converged) entries compare False and are covered by convergence
+    with np.errstate(invalid="ignore"):
+        return {
+            "convergence_failure": ~converged,
+            "overvoltage": (vmax > max_voltage_pu)
+            & (vmax > baseline["max_voltage_pu"] + BASELINE_TOLERANCE),
+            "undervoltage": (vmin < min_voltage_pu)
+            & (vmin < baseline["min_voltage_pu"] - BASELINE_TOLERANCE),
+            "line_overload": (loading > max_line_loading_pct)
+            & (loading > baseline["max_line_loading_pct"] + BASELINE_TOLERANCE),
+        }
+
+
+def _percentiles(values: np.ndarray, digits: int = 2) -> Dict[str, float]:
+    """Min, p5, median, p95, max and mean of an array."""
+    p5, p50, p95 = np.percentile(values, [5, 50, 95])
+    return {
+        "min": round(float(values.min()), digits),
+        "p5": round(float(p5), digits),
+        "median": round(float(p50), digits),
+        "p95": round(float(p95), digits),
+        "max": round(float(values.max()), digits),
+        "mean": round(float(values.mean()), digits),
+    }
+
+
+def _aggregate(
+    rows: List[Dict[str, Any]],
+    levels: List[float],
+    counts: np.ndarray,
+    total_load_kw: float,
+    limits: Dict[str, float],
+) -> Dict[str, Any]:
+    """Turn the scenario rows into penetration curves and hosting capacities.
+
+    Args:
+        rows: Scenario rows without errors
+        levels: Penetration levels in percent of customers
+        counts: Customers with PV at each level
+        total_load_kw: Total customer load kW
+        limits: min_voltage_pu, max_voltage_pu and max_line_loading_pct
+
+    Returns:
+        Dictionary with the penetration curve, hosting capacity statistics and
+        one summary per scenario
+    """
+    flags = _violations(rows, rows[0]["baseline"], **limits)
+    violated = np.logical_or.reduce([flags[name] for name in CONSTRAINTS])
+    pv_kw = np.array([row["pv_kw"] for row in rows], dtype=float)
+    vmax = np.array([row["max_voltage_pu"] for row in rows], dtype=float)
+    loading = np.array([row["max_line_loading_pct"] for row in rows], dtype=float)
+
+    probability = violated.mean(axis=0)
+    curve = []
+    for j, level in enumerate(levels):
+        point = {
+            "penetration_pct": level,
+            "customers_with_pv": int(counts[j]),
+            "mean_pv_kw": round(float(pv_kw[:, j].mean()), 2),
+            "mean_pv_pct_of_load": round(
+                float(pv_kw[:, j].mean()) / total_load_kw * 100.0, 2
+            ),
+            "violation_probability": round(float(probability[j]), 4),
+        }
+        for name in CONSTRAINTS:
+            point[f"{name}_probability"] = round(float(flags[name][:, j].mean()), 4)
+        with np.errstate(invalid="ignore"):
+            if not np.all(np.isnan(vmax[:, j])):
+                point["max_voltage_pu_p50"] = round(float(np.nanmedian(vmax[:, j])), 4)
+                point["max_voltage_pu_p95"] = round(
+                    float(np.nanpercentile(vmax[:, j], 95)), 4
+                )
+                point["max_line_loading_pct_p95"] = round(
+                    float(np.nanpercentile(loading[:, j], 95)), 2
+                )
+        curve.append(point)
+
+    # Hosting capacity of a scenario: the last level before its first violation
+    any_violation = violated.any(axis=1)
+    first = np.where(any_violation, violated.argmax(axis=1), len(levels))
+    level_values = np.concatenate(([0.0], np.asarray(levels, dtype=float)))
+    scenario_pct = level_values[first]
+    padded_kw = np.concatenate((np.zeros((len(rows), 1)), pv_kw), axis=1)
+    scenario_kw = padded_kw[np.arange(len(rows)), first]
+
+    scenarios = []
+    constraint_counts: Dict[str, int] = {}
+    for i, row in enumerate(rows):
+        limiting = None
+        if any_violation[i]:
+            limiting = next(n for n in CONSTRAINTS if flags[n][i, first[i]])
+        key = limiting or "none"
+        constraint_counts[key] = constraint_counts.get(key, 0) + 1
+        scenarios.append(
+            {
+                "scenario": row["scenario"],
+                "hosting_capacity_pct": float(scenario_pct[i]),
+                "hosting_capacity_kw": round(float(scenario_kw[i]), 2),
+                "limiting_constraint": limiting,
+            }
+        )
+
+    # Minimum: highest level no scenario violates; maximum: highest level
+    # some scenario passes (both counted up from the lowest level)
+    safe = np.concatenate(([True], probability == 0))
+    feasible = np.concatenate(([True], probability < 1))
+    minimum = int(np.argmin(safe)) - 1 if not safe.all() else len(levels)
+    maximum = int(np.argmin(feasible)) - 1 if not feasible.all() else len(levels)
+    mean_kw = np.concatenate(([0.0], pv_kw.mean(axis=0)))
+
+    hosting_capacity = {
+        "minimum_pct": float(level_values[minimum]),
+        "minimum_kw": round(float(mean_kw[minimum]), 2),
+        "maximum_pct": float(level_values[maximum]),
+        "maximum_kw": round(float(mean_kw[maximum]), 2),
+        "scenario_pct": _percentiles(scenario_pct),
+        "scenario_kw": _percentiles(scenario_kw),
+        "scenarios_without_violation": int((~any_violation).sum()),
+        "limiting_constraint_counts": constraint_counts,
+    }
+    return {
+        "penetration_curve": curve,
+        "hosting_capacity": hosting_capacity,
+        "scenarios": scenarios,
+    }
+
+
+def analyze_stochastic_hosting_capacity(
+    num_scenarios: int = 100,
+    penetration_levels: Optional[List[float]] = None,
+    pv_size_range: Optional[List[float]] = None,
+    load_multiplier: float = 1.0,
+    constraints: Optional[Dict[str, Any]] = None,
+    seed: int = 0,
+    solve_strategy: str = "auto",
+    max_workers: Optional[int] = None,
+    inline_limit: Optional[int] = DEFAULT_INLINE_LIMIT,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """Estimate hosting capacity from random customer PV deployments.
+
+    Every scenario places PV on a random order of customers (the loads of
+    the feeder) with random sizes, and is solved at each penetration level.
+    A level is violated when the power flow fails, a voltage leaves the
+    limits or a line exceeds its loading limit; limits already exceeded
+    without PV only count where PV makes them worse. The scenario's hosting
+    capacity is the last level before its first violation.
+
+    Args:
+        num_scenarios: Number of random deployments (default: 100, at most 10000)
+        penetration_levels: Percent of customers with PV to evaluate
+            (default: 10, 20, ..., 100)
+        pv_size_range: [low, high] PV size as a multiple of the customer's
+            load kW, drawn uniformly (default: [0.5, 2.0])
+        load_multiplier: Load level during the study, e.g. 0.3 for minimum
+            daytime load (default: 1.0)
+        constraints: Optional constraint limits (min_voltage_pu,
+            max_voltage_pu, max_line_loading_pct; default: 0.95, 1.05, 100)
+        seed: Seed of the random deployments (default: 0)
+        solve_strategy: Start of each solution - "auto", "warm" or "cold"
+            (default: "auto")
+        max_workers: Number of worker processes (default: CPU count)
+        inline_limit: Maximum number of per-scenario values returned inline;
+            larger studies return a result_handle for fetch_result
+            (default: 10000)
+        progress_callback: Optional function called as
+            progress_callback(scenarios_done, num_scenarios)
+
+    Returns:
+        Dictionary containing:
+            - success: Boolean indicating if the operation was successful
+            - data: Penetration curve (violation probabilities per level),
+              hosting capacity statistics and per-scenario results
+            - metadata: Additional metadata about the analysis
+            - errors: List of error messages if any occurred
+
+    Example:
+        >>> load_ieee_test_feeder("IEEE34")
+        >>> result = analyze_stochastic_hosting_capacity(
+        ...     num_scenarios=200, load_multiplier=0.4, max_workers=4
+        ... )
+        >>> for point in result['data']['penetration_curve']:
+        ...     print(point['penetration_pct'], point['violation_probability'])
+
+    Note:
+        Like analyze_hosting_capacity_map, the workers compile the feeder
+        loaded with load_feeder; later changes to the active circuit are not
+        seen.
+    """
+    try:
+        # Validate inputs
+        if not 1 <= num_scenarios <= MAX_SCENARIOS:
+            return format_error_response(
+                f"num_scenarios must be between 1 and {MAX_SCENARIOS}"
+            )
+        levels = sorted(
+            {float(level) for level in penetration_levels or DEFAULT_PENETRATION_LEVELS}
+        )
+        if not levels or levels[0] <= 0 or levels[-1] > 100:
+            return format_error_response(
+                "penetration_levels must be percentages in (0, 100]"
+            )
+        size_range = tuple(pv_size_range or DEFAULT_PV_SIZE_RANGE)
+        if len(size_range) != 2 or not 0 < size_range[0] <= size_range[1]:
+            return format_error_response(
+                "pv_size_range must be [low, high] with 0 < low <= high"
+            )
+        validate_positive_float(load_multiplier, "load_multiplier")
+        if max_workers is not None and max_workers < 1:
+            return format_error_response("max_workers must be at least 1")
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return format_error_response(
+                f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
+
+        constraints = constraints or {}
+        limits = {
+            "min_voltage_pu": constraints.get("min_voltage_pu", 0.95),
+            "max_voltage_pu": constraints.get("max_voltage_pu", 1.05),
+            "max_line_loading_pct": constraints.get("max_line_loading_pct", 100.0),
+        }
+        validate_voltage_limits(limits["min_voltage_pu"], limits["max_voltage_pu"])
+
+        # Check if circuit is loaded
+        loaded_feeder = get_loaded_feeder()
+        if not dss.Circuit.Name() or loaded_feeder is None:
+            return format_error_response(
+                "No circuit loaded. Please load a feeder first using load_feeder tool."
+            )
+
+        customers = _customers()
+        if not customers:
+            return format_error_response("Circuit has no loads to place customer PV on")
+        total_load_kw = sum(customer["kW"] for customer in customers)
+        counts = adopters_per_level(levels, len(customers))
+
+        params = {
+            "seed": seed,
+            "levels": levels,
+            "pv_size_range": size_range,
+            "load_multiplier": load_multiplier,
+            "solve_strategy": solve_strategy,
+        }
+        workers = min(max_workers or default_worker_count(num_scenarios), num_scenarios)
+        rows = run_parallel(
+            loaded_feeder["feeder_id"],
+            _scenario_task,
+            [(scenario, params) for scenario in range(num_scenarios)],
+            max_workers=workers,
+            modifications=loaded_feeder["modifications"],
+            progress_callback=progress_callback,
+        )
+
+        analyzed = [row for row in rows if row["error"] is None]
+        errors = [
+            f"Scenario {row['scenario']}: {row['error']}"
+            for row in rows
+            if row["error"]
+        ]
+        if not analyzed:
+            return format_error_response(errors[:5])
+
+        data = {
+            "feeder_id": loaded_feeder["feeder_id"],
+            "num_customers": len(customers),
+            "total_load_kw": round(total_load_kw, 2),
+            "baseline": {
+                key: round(value, 4) for key, value in analyzed[0]["baseline"].items()
+            },
+            **_aggregate(analyzed, levels, counts, total_load_kw, limits),
+            "scenarios_failed": len(errors),
+            "analysis_parameters": {
+                "num_scenarios": num_scenarios,
+                "penetration_levels": levels,
+                "pv_size_range": list(size_range),
+                "load_multiplier": load_multiplier,
+                "seed": seed,
+                "solve_strategy": solve_strategy,
+                "constraints": limits,
+            },
+        }
+        store_large_fields(
+            "stochastic_hosting_capacity",
+            data,
+            ["scenarios"],
+            inline_limit=inline_limit,
+            summary={
+                "feeder_id": loaded_feeder["feeder_id"],
+                "num_scenarios": len(analyzed),
+                "hosting_capacity": data["hosting_capacity"],
+            },
+        )
+
+        metadata = {
+            "circuit_name": dss.Circuit.Name(),
+            "analysis_type": "stochastic_hosting_capacity",
+            "num_scenarios": num_scenarios,
+            "max_workers": workers,
+            "total_solves": sum(row["solves"] for row in analyzed),
+        }
+        if errors:
+            metadata["scenario_errors"] = errors[:10]
+
+        return format_success_response(data, metadata)
+
+    except ValueError as e:
+        return format_error_response(str(e))
+    except Exception as e:
+        error_msg = f"Error analyzing stochastic hosting capacity: {str(e)}"
+        logger.exception(error_msg)
+        return format_error_response(error_msg)
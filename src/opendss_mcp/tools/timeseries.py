@@ -2,19 +2,58 @@
 Time-Series Simulation Tool for OpenDSS MCP Server.
 
 This module provides functionality to run time-series power flow simulations
-with load and generation profiles.
+with load and generation profiles. Profiles are applied either by rescaling
+every load from Python before each snapshot solve, or natively by OpenDSS
+through LoadShape objects in daily/yearly solution mode.
 """
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 import json
+import numpy as np
 import opendssdirect as dss
 
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.line_loading import LineLoadings
+from ..utils.online_stats import (
+    ElementExtremes,
+    RunningStats,
+    ThresholdTimer,
+    VectorStats,
+)
+from ..utils.result_store import (
+    DEFAULT_INLINE_LIMIT,
+    ShardedArrayWriter,
+    store_large_fields,
+)
+from ..utils.solver import SOLVE_STRATEGIES, PowerFlowSolver
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Supported ways of applying the profiles
+SUPPORTED_MODES = ["snapshot", "loadshape"]
+
+# Names of the LoadShapes created for the "loadshape" mode
+LOAD_SHAPE_NAME = "mcp_ts_load"
+GENERATION_SHAPE_NAME = "mcp_ts_gen"
+FLAT_SHAPE_NAME = "mcp_ts_flat"
+
+# Default limits of the time-beyond-limit counters
+DEFAULT_CONSTRAINTS = {
+    "min_voltage_pu": 0.95,
+    "max_voltage_pu": 1.05,
+    "max_line_loading_pct": 100.0,
+}
+
+# Percentiles reported for the bus voltage distribution
+VOLTAGE_QUANTILES = (0.01, 0.05, 0.5, 0.95, 0.99)
+
+# Number of buses/lines listed in the worst-element summaries
+WORST_ELEMENTS = 10
+
 
 def run_time_series_simulation(
     load_profile: str | dict,
@@ -22,6 +61,13 @@ def run_time_series_simulation(
     duration_hours: int = 24,
     timestep_minutes: int = 60,
     output_variables: list[str] | None = None,
+    mode: str = "snapshot",
+    stream: bool = False,
+    shard_steps: int = 1000,
+    constraints: dict[str, float] | None = None,
+    inline_limit: int | None = DEFAULT_INLINE_LIMIT,
+    solve_strategy: str = "auto",
+    progress_callback: Callable[[int, int | None], None] | None = None,
 ) -> dict[str, Any]:
     """
     Run time-series power flow simulation with load and generation profiles.
@@ -46,13 +92,42 @@ def run_time_series_simulation(
             - "loadings": Line loading percentages
             - "powers": Bus powers (kW, kvar)
             - Default: ["voltages", "losses", "loadings"]
+        mode: How profiles are applied. Options:
+            - "snapshot": Set every load kW and PV irradiance from Python,
+              then run a snapshot solve (default)
+            - "loadshape": Attach the profiles to all loads and PV systems as
+              OpenDSS LoadShapes and let OpenDSS step through time in daily
+              (yearly for runs over 24 hours) mode, so no per-element work is
+              done in Python between steps
+        stream: Write per-step results to disk instead of returning them.
+            Each step's scalars and per-bus/per-line arrays (bus voltages,
+            line loadings, bus powers) are appended to .npz shards and the
+            response holds only the summary and a result handle, so memory
+            stays bounded for long runs (default: False)
+        shard_steps: Timesteps per shard file when streaming (default: 1000)
+        constraints: Limits used for the time-beyond-limit counters
+            (min_voltage_pu, max_voltage_pu, max_line_loading_pct;
+            default: 0.95, 1.05 and 100)
+        inline_limit: Maximum number of per-step values returned inline. Longer
+            "timesteps" lists are stored and fetched with fetch_result; the
+            response then holds the summary and a result handle
+            (default: 10000, 0 to always store, None for no limit)
+        solve_strategy: Start of each step's solution (default: "auto"):
+            - "auto": Continue from the previous step's solution unless the
+              load or generation changed by more than 25% or the previous
+              step failed; retry a failed warm start from a direct solution
+            - "warm": Always continue from the previous solution
+            - "cold": Always start from a direct solution
+        progress_callback: Optional function called as
+            progress_callback(steps_done, num_timesteps) after every timestep
 
     Returns:
         dict: Results dictionary with structure:
             {
                 "success": bool,
                 "data": {
-                    "timesteps": list[dict],  # Per-timestep results
+                    "timesteps": list[dict],  # Per-timestep results (if small enough)
+                    "result_handle": str,     # Stored per-step results (otherwise)
                     "summary": {
                         "duration_hours": float,
                         "num_timesteps": int,
@@ -63,14 +138,18 @@ def run_time_series_simulation(
                         "min_voltage_pu": float,
                         "max_voltage_pu": float,
                         "avg_voltage_pu": float,
-                        "max_line_loading_pct": float
+                        "max_line_loading_pct": float,
+                        "voltage_statistics": dict,  # mean, std, percentiles, extremes
+                        "time_beyond_limits": dict,  # hours outside each limit
+                        "worst_buses": dict,         # per-bus running extremes
+                        ...
                     },
                     "profiles_applied": {
                         "load_profile_name": str,
                         "generation_profile_name": str | None
                     }
                 },
-                "metadata": {...},
+                "metadata": {...},  # Includes "solver" statistics of all solves
                 "errors": list[str]
             }
 
@@ -96,12 +175,31 @@ def run_time_series_simulation(
         ...     duration_hours=24
         ... )
 
+        >>> # Year-long hourly run stepped natively by OpenDSS
+        >>> result = run_time_series_simulation(
+        ...     load_profile="residential_summer",
+        ...     duration_hours=8760,
+        ...     mode="loadshape"
+        ... )
+
+        >>> # Week at 1-minute resolution, written to disk
+        >>> result = run_time_series_simulation(
+        ...     load_profile="residential_summer",
+        ...     duration_hours=168,
+        ...     timestep_minutes=1,
+        ...     mode="loadshape",
+        ...     stream=True
+        ... )
+        >>> handle = result['data']['result_handle']
+
         >>> # Access time-series data
         >>> timesteps = result['data']['timesteps']
         >>> for ts in timesteps[:3]:
         ...     print(f"Hour {ts['hour']}: {ts['total_load_kw']:.1f} kW")
     """
     errors: list[str] = []
+    writer = None
+    saved_shapes = None
 
     try:
         logger.info(
@@ -113,6 +211,26 @@ def run_time_series_simulation(
         if output_variables is None:
             output_variables = ["voltages", "losses", "loadings"]
 
+        if solve_strategy not in SOLVE_STRATEGIES:
+            return {
+                "success": False,
+                "data": {},
+                "metadata": {},
+                "errors": [
+                    f"Unsupported solve strategy '{solve_strategy}'. Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+                ],
+            }
+
+        if mode not in SUPPORTED_MODES:
+            return {
+                "success": False,
+                "data": {},
+                "metadata": {},
+                "errors": [
+                    f"Unsupported mode '{mode}'. Supported modes: {', '.join(SUPPORTED_MODES)}"
+                ],
+            }
+
         # Validate circuit is loaded
         if not _validate_circuit():
             return {
@@ -142,8 +260,9 @@ def run_time_series_simulation(
         # Get base load and generation values
         base_loads, total_base_load_kw = _get_base_loads()
         base_pvs = {}
+        total_base_pv_kw = 0.0
         if gen_profile_data:
-            base_pvs, _ = _get_base_pvs()
+            base_pvs, total_base_pv_kw = _get_base_pvs()
 
         # Calculate number of timesteps
         num_timesteps = int((duration_hours * 60) / timestep_minutes)
@@ -162,12 +281,35 @@ def run_time_series_simulation(
                 repeats = (num_timesteps // len(gen_multipliers)) + 1
                 gen_multipliers = (gen_multipliers * repeats)[:num_timesteps]
 
+        if mode == "loadshape":
+            saved_shapes = _start_loadshape_mode(
+                load_multipliers[:num_timesteps],
+                gen_multipliers[:num_timesteps] if gen_multipliers else None,
+                duration_hours,
+                timestep_minutes,
+            )
+
         # Run time-series simulation
         timesteps_data = []
-        all_voltages = []
-        all_losses = []
-        all_loadings = []
-        all_total_loads = []
+        converged_count = 0
+        # Streaming accumulators: summary memory does not grow with duration
+        stats = _SummaryAccumulator(
+            {**DEFAULT_CONSTRAINTS, **(constraints or {})}, timestep_minutes / 60.0
+        )
+        solver = PowerFlowSolver(solve_strategy)
+        previous_mults: tuple[float, float] | None = None
+
+        if stream:
+            writer = ShardedArrayWriter(
+                "timeseries",
+                shard_size=shard_steps,
+                attributes={
+                    "duration_hours": duration_hours,
+                    "timestep_minutes": timestep_minutes,
+                    "output_variables": output_variables,
+                    "mode": mode,
+                },
+            )
 
         logger.info(f"Running {num_timesteps} timesteps...")
 
@@ -179,24 +321,38 @@ def run_time_series_simulation(
             load_mult = load_multipliers[step]
             gen_mult = gen_multipliers[step] if gen_multipliers else 0.0
 
-            # Scale loads
-            for load_name, base_kw in base_loads.items():
-                scaled_kw = base_kw * load_mult
-                dss.Loads.Name(load_name)
-                dss.Loads.kW(scaled_kw)
-
-            # Scale generation
-            if base_pvs:
-                for pv_name, base_pmpp in base_pvs.items():
-                    scaled_pmpp = base_pmpp * gen_mult
-                    # Set via text command since PVSystems don't have direct kW setter
-                    dss.Text.Command(f"PVSystem.{pv_name}.Pmpp={scaled_pmpp}")
-                    dss.Text.Command(f"PVSystem.{pv_name}.irradiance={gen_mult}")
+            if mode == "snapshot":
+                # Scale loads
+                for load_name, base_kw in base_loads.items():
+                    scaled_kw = base_kw * load_mult
+                    dss.Loads.Name(load_name)
+                    dss.Loads.kW(scaled_kw)
+
+                # Scale generation (PV output is Pmpp x irradiance). The
+                # interface setter changes the injection only, whereas a
+                # Text edit would force a Y matrix rebuild at every step.
+                for pv_name in base_pvs:
+                    dss.PVsystems.Name(pv_name)
+                    dss.PVsystems.Irradiance(gen_mult)
+
+            # Size of the change since the previous step, relative to its load
+            change = None
+            if previous_mults is not None:
+                previous_load_kw = total_base_load_kw * previous_mults[0]
+                change_kw = (
+                    abs(load_mult - previous_mults[0]) * total_base_load_kw
+                    + abs(gen_mult - previous_mults[1]) * total_base_pv_kw
+                )
+                change = change_kw / previous_load_kw if previous_load_kw else None
+            previous_mults = (load_mult, gen_mult)
 
-            # Solve power flow
-            dss.Solution.Solve()
-            converged = dss.Solution.Converged()
+            # Solve power flow (in loadshape mode OpenDSS advances the clock)
+            solve = solver.solve(change)
+            if solve["error"]:
+                raise RuntimeError(solve["error"])
+            converged = solve["converged"]
 
+            converged_count += int(converged)
             if not converged:
                 logger.warning(
                     f"Power flow did not converge at timestep {step} (hour {hour:.2f})"
@@ -209,79 +365,134 @@ def run_time_series_simulation(
                 "load_multiplier": round(load_mult, 4),
                 "generation_multiplier": round(gen_mult, 4) if gen_multipliers else 0.0,
                 "converged": converged,
+                "iterations": solve["iterations"],
+                "solve_time_ms": solve["time_ms"],
             }
 
             # Calculate total load
             total_load_kw = total_base_load_kw * load_mult
             timestep_result["total_load_kw"] = round(total_load_kw, 2)
-            all_total_loads.append(total_load_kw)
+            stats.total_load.update(total_load_kw, timestep_result["hour"])
 
             # Collect requested output variables
             if "losses" in output_variables:
                 losses = dss.Circuit.Losses()
                 losses_kw = losses[0] / 1000.0
                 timestep_result["losses_kw"] = round(losses_kw, 2)
-                all_losses.append(losses_kw)
+                stats.losses.update(losses_kw, timestep_result["hour"])
+
+            arrays: dict[str, Any] = {}
 
             if "voltages" in output_variables:
                 voltages_pu = _get_all_bus_voltages()
-                timestep_result["min_voltage_pu"] = round(min(voltages_pu.values()), 4)
-                timestep_result["max_voltage_pu"] = round(max(voltages_pu.values()), 4)
-                timestep_result["avg_voltage_pu"] = round(
-                    sum(voltages_pu.values()) / len(voltages_pu), 4
+                values = np.fromiter(voltages_pu.values(), dtype=float)
+                timestep_result["min_voltage_pu"] = round(float(values.min()), 4)
+                timestep_result["max_voltage_pu"] = round(float(values.max()), 4)
+                timestep_result["avg_voltage_pu"] = round(float(values.mean()), 4)
+                stats.update_voltages(
+                    list(voltages_pu), values, timestep_result["hour"]
                 )
-                all_voltages.extend(voltages_pu.values())
+                arrays["bus_voltages_pu"] = (list(voltages_pu), values)
 
             if "loadings" in output_variables:
                 line_loadings = _get_line_loadings()
+                loading_values = np.fromiter(line_loadings.values(), dtype=float)
                 if line_loadings:
-                    max_loading = max(line_loadings.values())
+                    max_loading = float(loading_values.max())
                     timestep_result["max_line_loading_pct"] = round(max_loading, 2)
-                    all_loadings.append(max_loading)
+                    stats.update_loadings(
+                        list(line_loadings), loading_values, timestep_result["hour"]
+                    )
                 else:
                     timestep_result["max_line_loading_pct"] = 0.0
+                arrays["line_loading_pct"] = (list(line_loadings), loading_values)
 
             if "powers" in output_variables:
                 bus_powers = _get_bus_powers()
-                timestep_result["bus_powers"] = bus_powers
+                if writer is None:
+                    timestep_result["bus_powers"] = bus_powers
+                buses = list(bus_powers)
+                arrays["bus_kw"] = (buses, [bus_powers[b]["kw"] for b in buses])
+                arrays["bus_kvar"] = (buses, [bus_powers[b]["kvar"] for b in buses])
+
+            if writer is None:
+                timesteps_data.append(timestep_result)
+            else:
+                if writer.num_rows == 0:
+                    writer.set_labels(
+                        {name: labels for name, (labels, _) in arrays.items()}
+                    )
+                writer.append(
+                    {
+                        **timestep_result,
+                        **{name: values for name, (_, values) in arrays.items()},
+                    }
+                )
+
+            if progress_callback is not None:
+                progress_callback(step + 1, num_timesteps)
 
-            timesteps_data.append(timestep_result)
+        if mode == "loadshape":
+            _end_loadshape_mode(saved_shapes)
 
         logger.info("Time-series simulation completed successfully")
 
         # Calculate summary statistics
         summary = _calculate_summary_statistics(
-            timesteps_data=timesteps_data,
-            all_voltages=all_voltages,
-            all_losses=all_losses,
-            all_loadings=all_loadings,
-            all_total_loads=all_total_loads,
+            converged_count=converged_count,
+            stats=stats,
             duration_hours=duration_hours,
             num_timesteps=num_timesteps,
             timestep_minutes=timestep_minutes,
         )
 
+        profiles_applied = {
+            "load_profile_name": load_profile_data.get("name", "CUSTOM"),
+            "generation_profile_name": (
+                gen_profile_data.get("name", "CUSTOM") if gen_profile_data else None
+            ),
+        }
+
+        if writer is None:
+            data = {
+                "timesteps": timesteps_data,
+                "summary": summary,
+                "profiles_applied": profiles_applied,
+            }
+            store_large_fields(
+                "timeseries",
+                data,
+                ["timesteps"],
+                inline_limit=inline_limit,
+                summary={**summary, "profiles_applied": profiles_applied},
+            )
+        else:
+            manifest = writer.close(
+                summary={**summary, "profiles_applied": profiles_applied}
+            )
+            data = {
+                "result_handle": writer.handle,
+                "result_path": str(writer.directory),
+                "columns": list(manifest["columns"]),
+                "num_shards": len(manifest["shards"]),
+                "summary": summary,
+                "profiles_applied": profiles_applied,
+            }
+
         # Prepare result
         result = {
             "success": True,
-            "data": {
-                "timesteps": timesteps_data,
-                "summary": summary,
-                "profiles_applied": {
-                    "load_profile_name": load_profile_data.get("name", "CUSTOM"),
-                    "generation_profile_name": (
-                        gen_profile_data.get("name", "CUSTOM")
-                        if gen_profile_data
-                        else None
-                    ),
-                },
-            },
+            "data": data,
             "metadata": {
                 "tool": "run_time_series_simulation",
                 "duration_hours": duration_hours,
                 "timestep_minutes": timestep_minutes,
                 "num_timesteps": num_timesteps,
                 "output_variables": output_variables,
+                "mode": mode,
+                "stream": stream,
+                "solve_strategy": solve_strategy,
+                "solver": solver.stats(),
             },
             "errors": errors,
         }
@@ -290,10 +501,133 @@ def run_time_series_simulation(
 
     except Exception as e:
         logger.error(f"Error in time-series simulation: {e}", exc_info=True)
+        if mode == "loadshape":
+            _end_loadshape_mode(saved_shapes)
+        if writer is not None:
+            writer.discard()
         errors.append(f"Simulation error: {str(e)}")
         return {"success": False, "data": {}, "metadata": {}, "errors": errors}
 
 
+def _define_loadshape(
+    name: str, multipliers: list[float], timestep_minutes: int
+) -> None:
+    """
+    Create or redefine a LoadShape with one multiplier per timestep.
+
+    Args:
+        name: LoadShape name
+        multipliers: Multipliers, the first one applying at the end of the first step
+        timestep_minutes: Interval between points in minutes
+    """
+    if name in [shape.lower() for shape in dss.LoadShape.AllNames()]:
+        dss.LoadShape.Name(name)
+    else:
+        dss.LoadShape.New(name)
+    dss.LoadShape.Npts(len(multipliers))
+    dss.LoadShape.MinInterval(timestep_minutes)
+    dss.LoadShape.PMult([float(mult) for mult in multipliers])
+
+
+def _start_loadshape_mode(
+    load_multipliers: list[float],
+    gen_multipliers: list[float] | None,
+    duration_hours: int,
+    timestep_minutes: int,
+) -> dict[str, Any]:
+    """
+    Attach the profiles as LoadShapes and switch OpenDSS to time stepping.
+
+    Runs up to 24 hours use daily mode and the "daily" shape property; longer
+    runs use yearly mode and the "yearly" property. Controls stay in static
+    mode so each step settles like a snapshot solve.
+
+    Args:
+        load_multipliers: Load multiplier for every timestep
+        gen_multipliers: PV irradiance multiplier for every timestep, or None
+        duration_hours: Simulation duration in hours
+        timestep_minutes: Time step resolution in minutes
+
+    Returns:
+        The shape assignments, PV irradiance and control mode replaced by the
+        run, for _end_loadshape_mode to put back
+    """
+    solution_mode, shape_property = (
+        ("Yearly", "yearly") if duration_hours > 24 else ("Daily", "daily")
+    )
+    load_shape = dss.Loads.Yearly if shape_property == "yearly" else dss.Loads.Daily
+    saved: dict[str, Any] = {
+        "shape_property": shape_property,
+        "control_mode": dss.Solution.ControlMode(),
+        "loads": {},
+        "pvsystems": {},
+    }
+    for name in dss.Loads.AllNames():
+        dss.Loads.Name(name)
+        saved["loads"][name] = load_shape()
+
+    _define_loadshape(LOAD_SHAPE_NAME, load_multipliers, timestep_minutes)
+    dss.Text.Command(f"BatchEdit Load..* {shape_property}={LOAD_SHAPE_NAME}")
+
+    if gen_multipliers is not None and dss.PVsystems.Count() > 0:
+        pv_shape = getattr(dss.PVsystems, shape_property)
+        for name in dss.PVsystems.AllNames():
+            dss.PVsystems.Name(name)
+            saved["pvsystems"][name] = (pv_shape(), dss.PVsystems.Irradiance())
+        _define_loadshape(GENERATION_SHAPE_NAME, gen_multipliers, timestep_minutes)
+        dss.Text.Command(
+            f"BatchEdit PVSystem..* {shape_property}={GENERATION_SHAPE_NAME} irradiance=1"
+        )
+
+    dss.Text.Command(f"Set Mode={solution_mode} Stepsize={timestep_minutes}m Number=1")
+    dss.Text.Command("Set ControlMode=Static")
+    dss.Solution.Hour(0)
+    dss.Solution.Seconds(0)
+    return saved
+
+
+def _end_loadshape_mode(saved: dict[str, Any] | None) -> None:
+    """
+    Undo a loadshape run: restore shapes, irradiance and snapshot mode.
+
+    OpenDSS cannot clear a PVSystem shape once assigned, so a PV that had
+    none gets a flat 1.0 shape instead (or, for yearly runs, its daily shape,
+    which is what an empty yearly shape falls back to). Both solve exactly
+    like the original.
+
+    Args:
+        saved: State returned by _start_loadshape_mode, or None if it failed
+            before returning
+    """
+    try:
+        if saved is not None:
+            shape_property = saved["shape_property"]
+            load_shape = (
+                dss.Loads.Yearly if shape_property == "yearly" else dss.Loads.Daily
+            )
+            for name, shape in saved["loads"].items():
+                dss.Loads.Name(name)
+                load_shape(shape)
+
+            pv_shape = getattr(dss.PVsystems, shape_property)
+            for name, (shape, irradiance) in saved["pvsystems"].items():
+                dss.PVsystems.Name(name)
+                if not shape:
+                    if shape_property == "yearly":
+                        shape = dss.PVsystems.daily()
+                    if not shape:
+                        _define_loadshape(FLAT_SHAPE_NAME, [1.0], 60)
+                        dss.PVsystems.Name(name)
+                        shape = FLAT_SHAPE_NAME
+                pv_shape(shape)
+                dss.PVsystems.Irradiance(irradiance)
+
+            dss.Solution.ControlMode(saved["control_mode"])
+        dss.Text.Command("Set Mode=Snap")
+    except Exception as e:
+        logger.warning(f"Could not restore the circuit after a loadshape run: {e}")
+
+
 def _validate_circuit() -> bool:
     """Validate that a circuit is loaded in OpenDSS."""
     try:
@@ -414,25 +748,9 @@ def _get_all_bus_voltages() -> dict[str, float]:
     Returns:
         Dict mapping bus_name to voltage_pu
     """
-    voltages = {}
-
-    all_bus_names = dss.Circuit.AllBusNames()
-    if not all_bus_names:
-        return voltages
-
-    for bus_name in all_bus_names:
-        dss.Circuit.SetActiveBus(bus_name)
-        bus_voltages = dss.Bus.puVmagAngle()
-
-        # Get magnitude values (even indices)
-        mags = [bus_voltages[i] for i in range(0, len(bus_voltages), 2)]
-
-        # Use average voltage if multi-phase
-        if mags:
-            avg_voltage = sum(mags) / len(mags)
-            voltages[bus_name] = avg_voltage
-
-    return voltages
+    # Use average voltage if multi-phase
+    snapshot = CircuitSnapshot.capture()
+    return snapshot.to_dict(snapshot.bus_mean())
 
 
 def _get_line_loadings() -> dict[str, float]:
@@ -442,31 +760,8 @@ def _get_line_loadings() -> dict[str, float]:
     Returns:
         Dict mapping line_name to loading_percent
     """
-    loadings = {}
-
-    line_names = dss.Lines.AllNames()
-    if not line_names:
-        return loadings
-
-    for line_name in line_names:
-        dss.Lines.Name(line_name)
-        # Get normal amps rating
-        norm_amps = dss.Lines.NormAmps()
-
-        if norm_amps > 0:
-            # Set active element and get currents
-            dss.Circuit.SetActiveElement(f"Line.{line_name}")
-            currents = dss.CktElement.CurrentsMagAng()
-
-            # Get magnitude values (even indices)
-            current_mags = [currents[i] for i in range(0, len(currents), 2)]
-
-            if current_mags:
-                max_current = max(current_mags)
-                loading_pct = (max_current / norm_amps) * 100.0
-                loadings[line_name] = loading_pct
-
-    return loadings
+    loadings = LineLoadings.capture()
+    return loadings.to_dict(loadings.loading_pct())
 
 
 def _get_bus_powers() -> dict[str, dict[str, float]]:
@@ -532,18 +827,62 @@ def _get_bus_powers() -> dict[str, dict[str, float]]:
     return bus_powers
 
 
+class _SummaryAccumulator:
+    """
+    Running summary statistics of a time-series simulation.
+
+    Every timestep is folded in as it is solved, so memory is proportional to
+    the number of buses and lines, not to the number of timesteps.
+    """
+
+    def __init__(self, constraints: dict[str, float], timestep_hours: float) -> None:
+        self.timestep_hours = timestep_hours
+        self.losses = RunningStats()
+        self.total_load = RunningStats()
+        self.max_loading = RunningStats()
+        self.voltages = VectorStats(
+            low=0.0, high=2.0, resolution=0.0005, quantiles=VOLTAGE_QUANTILES
+        )
+        self.undervoltage = ThresholdTimer(constraints["min_voltage_pu"], above=False)
+        self.overvoltage = ThresholdTimer(constraints["max_voltage_pu"], above=True)
+        self.overload = ThresholdTimer(constraints["max_line_loading_pct"], above=True)
+        self.bus_extremes: ElementExtremes | None = None
+        self.line_extremes: ElementExtremes | None = None
+
+    def update_voltages(
+        self, buses: list[str], values: np.ndarray, hour: float
+    ) -> None:
+        """Fold one timestep of bus voltages (pu) into the statistics."""
+        if values.size == 0:
+            return
+        if self.bus_extremes is None:
+            self.bus_extremes = ElementExtremes(buses)
+        self.voltages.update(values, hour)
+        self.bus_extremes.update(values, hour)
+        self.undervoltage.update(float(values.min()), self.timestep_hours, hour)
+        self.overvoltage.update(float(values.max()), self.timestep_hours, hour)
+
+    def update_loadings(
+        self, lines: list[str], values: np.ndarray, hour: float
+    ) -> None:
+        """Fold one timestep of line loadings (%) into the statistics."""
+        if self.line_extremes is None:
+            self.line_extremes = ElementExtremes(lines)
+        max_loading = float(values.max())
+        self.max_loading.update(max_loading, hour)
+        self.line_extremes.update(values, hour)
+        self.overload.update(max_loading, self.timestep_hours, hour)
+
+
 def _calculate_summary_statistics(
-    timesteps_data: list[dict],
-    all_voltages: list[float],
-    all_losses: list[float],
-    all_loadings: list[float],
-    all_total_loads: list[float],
+    converged_count: int,
+    stats: _SummaryAccumulator,
     duration_hours: int,
     num_timesteps: int,
     timestep_minutes: int,
 ) -> dict[str, Any]:
     """
-    Calculate summary statistics from time-series data.
+    Calculate summary statistics from the running accumulators.
 
     Returns:
         Dict with summary statistics
@@ -555,38 +894,63 @@ def _calculate_summary_statistics(
     }
 
     # Losses statistics
-    if all_losses:
-        summary["avg_losses_kw"] = round(sum(all_losses) / len(all_losses), 2)
-        summary["peak_losses_kw"] = round(max(all_losses), 2)
-        summary["min_losses_kw"] = round(min(all_losses), 2)
+    if stats.losses.count:
+        summary["avg_losses_kw"] = round(stats.losses.total / stats.losses.count, 2)
+        summary["peak_losses_kw"] = round(stats.losses.max, 2)
+        summary["min_losses_kw"] = round(stats.losses.min, 2)
+        summary["losses_statistics"] = stats.losses.summary(2, "hour")
 
     # Load statistics
-    if all_total_loads:
-        summary["peak_load_kw"] = round(max(all_total_loads), 2)
-        summary["min_load_kw"] = round(min(all_total_loads), 2)
-        summary["avg_load_kw"] = round(sum(all_total_loads) / len(all_total_loads), 2)
+    if stats.total_load.count:
+        summary["peak_load_kw"] = round(stats.total_load.max, 2)
+        summary["min_load_kw"] = round(stats.total_load.min, 2)
+        summary["avg_load_kw"] = round(
+            stats.total_load.total / stats.total_load.count, 2
+        )
 
         # Calculate energy served (kWh)
         # Energy = average power * time
         timestep_hours = timestep_minutes / 60.0
-        energy_kwh = sum(load_kw * timestep_hours for load_kw in all_total_loads)
-        summary["energy_served_kwh"] = round(energy_kwh, 2)
+        summary["energy_served_kwh"] = round(stats.total_load.total * timestep_hours, 2)
+        summary["load_statistics"] = stats.total_load.summary(2, "hour")
 
     # Voltage statistics
-    if all_voltages:
-        summary["min_voltage_pu"] = round(min(all_voltages), 4)
-        summary["max_voltage_pu"] = round(max(all_voltages), 4)
-        summary["avg_voltage_pu"] = round(sum(all_voltages) / len(all_voltages), 4)
+    if stats.voltages.count:
+        summary["min_voltage_pu"] = round(stats.voltages.min, 4)
+        summary["max_voltage_pu"] = round(stats.voltages.max, 4)
+        summary["avg_voltage_pu"] = round(stats.voltages.mean, 4)
+        summary["voltage_statistics"] = stats.voltages.summary(4, "hour")
+        summary["worst_buses"] = {
+            "lowest_voltage": stats.bus_extremes.worst(
+                WORST_ELEMENTS, lowest=True, digits=4, time_label="hour"
+            ),
+            "highest_voltage": stats.bus_extremes.worst(
+                WORST_ELEMENTS, lowest=False, digits=4, time_label="hour"
+            ),
+        }
 
     # Loading statistics
-    if all_loadings:
-        summary["max_line_loading_pct"] = round(max(all_loadings), 2)
+    if stats.max_loading.count:
+        summary["max_line_loading_pct"] = round(stats.max_loading.max, 2)
         summary["avg_line_loading_pct"] = round(
-            sum(all_loadings) / len(all_loadings), 2
+            stats.max_loading.total / stats.max_loading.count, 2
+        )
+        summary["line_loading_statistics"] = stats.max_loading.summary(2, "hour")
+        summary["worst_lines"] = stats.line_extremes.worst(
+            WORST_ELEMENTS, lowest=False, digits=2, time_label="hour"
         )
 
+    # Time spent outside the limits
+    time_beyond_limits = {}
+    if stats.voltages.count:
+        time_beyond_limits["undervoltage"] = stats.undervoltage.summary("hour")
+        time_beyond_limits["overvoltage"] = stats.overvoltage.summary("hour")
+    if stats.max_loading.count:
+        time_beyond_limits["line_overload"] = stats.overload.summary("hour")
+    if time_beyond_limits:
+        summary["time_beyond_limits"] = time_beyond_limits
+
     # Convergence statistics
-    converged_count = sum(1 for ts in timesteps_data if ts.get("converged", False))
     summary["convergence_rate_pct"] = round((converged_count / num_timesteps) * 100, 2)
 
     return summary
@@ -2,21 +2,23 @@
 Visualization Tool for OpenDSS MCP Server.
 
 This module provides functionality to generate various plots and visualizations
-for power system analysis results.
+for power system analysis results. matplotlib and networkx are imported on
+the first plot, so loading this module stays cheap for sessions that never plot.
 """
 
+import functools
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import base64
 from io import BytesIO
 from pathlib import Path
 
-import matplotlib
+from ..utils.circuit_snapshot import CircuitSnapshot
+from ..utils.instrumentation import instrumentation
+from ..utils.topology import get_topology
 
-matplotlib.use("Agg")  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import networkx as nx
-import opendssdirect as dss
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,6 +34,22 @@ _viz_state = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _pyplot() -> Any:
+    """
+    Import matplotlib.pyplot with the non-interactive Agg backend.
+
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def store_visualization_data(data_type: str, data: dict[str, Any]) -> None:
     """
     Store data for later visualization.
@@ -149,39 +167,39 @@ def generate_visualization(
             return {"success": False, "data": {}, "metadata": {}, "errors": errors}
 
         # Generate the requested plot
-        if plot_type == "voltage_profile":
-            fig = _plot_voltage_profile(data, options)
-        elif plot_type == "network_diagram":
-            fig = _plot_network_diagram(data, options)
-        elif plot_type == "timeseries":
-            fig = _plot_timeseries(data, options)
-        elif plot_type == "capacity_curve":
-            fig = _plot_capacity_curve(data, options)
-        elif plot_type == "harmonics_spectrum":
-            fig = _plot_harmonics_spectrum(data, options)
-        else:
+        plotters = {
+            "voltage_profile": _plot_voltage_profile,
+            "network_diagram": _plot_network_diagram,
+            "timeseries": _plot_timeseries,
+            "capacity_curve": _plot_capacity_curve,
+            "harmonics_spectrum": _plot_harmonics_spectrum,
+        }
+        if plot_type not in plotters:
             errors.append(f"Unknown plot type: {plot_type}")
             return {"success": False, "data": {}, "metadata": {}, "errors": errors}
+        with instrumentation.phase("plot"):
+            fig = plotters[plot_type](data, options)
 
         # Save or encode the plot
         image_base64 = None
         file_path = None
 
-        if save_path:
-            # Save to file
-            save_path_obj = Path(save_path)
-            fig.savefig(save_path_obj, dpi=dpi, bbox_inches="tight")
-            file_path = str(save_path_obj.absolute())
-            logger.info(f"Saved plot to: {file_path}")
-        else:
-            # Convert to base64
-            buffer = BytesIO()
-            fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode("utf-8")
-            buffer.close()
+        with instrumentation.phase("serialize"):
+            if save_path:
+                # Save to file
+                save_path_obj = Path(save_path)
+                fig.savefig(save_path_obj, dpi=dpi, bbox_inches="tight")
+                file_path = str(save_path_obj.absolute())
+                logger.info(f"Saved plot to: {file_path}")
+            else:
+                # Convert to base64
+                buffer = BytesIO()
+                fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+                buffer.seek(0)
+                image_base64 = base64.b64encode(buffer.read()).decode("utf-8")
+                buffer.close()
 
-        plt.close(fig)
+        _pyplot().close(fig)
 
         # Get dimensions
         width_inches, height_inches = fig.get_size_inches()
@@ -245,30 +263,20 @@ def _query_circuit_state() -> dict[str, Any]:
     """
     data = {"buses": [], "voltages": {}, "lines": []}
 
-    # Get all buses and voltages
-    all_bus_names = dss.Circuit.AllBusNames()
-    for bus_name in all_bus_names:
-        dss.Circuit.SetActiveBus(bus_name)
-        bus_voltages = dss.Bus.puVmagAngle()
-        mags = [bus_voltages[i] for i in range(0, len(bus_voltages), 2)]
-        if mags:
-            avg_voltage = sum(mags) / len(mags)
-            data["buses"].append(bus_name)
-            data["voltages"][bus_name] = avg_voltage
-
-    # Get all lines
-    line_names = dss.Lines.AllNames()
-    if line_names:
-        for line_name in line_names:
-            dss.Lines.Name(line_name)
-            bus1 = dss.Lines.Bus1().split(".")[0]
-            bus2 = dss.Lines.Bus2().split(".")[0]
-            data["lines"].append({"name": line_name, "bus1": bus1, "bus2": bus2})
+    # Get all buses and their average voltages
+    snapshot = CircuitSnapshot.capture()
+    data["voltages"] = snapshot.to_dict(snapshot.bus_mean())
+    data["buses"] = list(data["voltages"])
+
+    # Get all lines from the topology index of the circuit
+    topology = get_topology()
+    data["lines"] = topology.lines()
+    data["topology"] = topology
 
     return data
 
 
-def _plot_voltage_profile(data: dict[str, Any], options: dict) -> plt.Figure:
+def _plot_voltage_profile(data: dict[str, Any], options: dict) -> "Figure":
     """
     Create voltage profile bar chart.
 
@@ -279,6 +287,8 @@ def _plot_voltage_profile(data: dict[str, Any], options: dict) -> plt.Figure:
     Returns:
         Matplotlib figure
     """
+    plt = _pyplot()
+
     # Extract voltage data
     if "voltages" in data:
         voltages = data["voltages"]
@@ -354,7 +364,7 @@ def _plot_voltage_profile(data: dict[str, Any], options: dict) -> plt.Figure:
     return fig
 
 
-def _plot_network_diagram(data: dict[str, Any], options: dict) -> plt.Figure:
+def _plot_network_diagram(data: dict[str, Any], options: dict) -> "Figure":
     """
     Create network topology diagram using networkx.
 
@@ -365,6 +375,10 @@ def _plot_network_diagram(data: dict[str, Any], options: dict) -> plt.Figure:
     Returns:
         Matplotlib figure
     """
+    import networkx as nx
+
+    plt = _pyplot()
+
     # Extract network data
     if "lines" in data:
         lines = data["lines"]
@@ -372,26 +386,35 @@ def _plot_network_diagram(data: dict[str, Any], options: dict) -> plt.Figure:
     else:
         raise ValueError("No network topology data found in data source")
 
-    # Create graph
-    G = nx.Graph()
+    topology = data.get("topology")
+    if topology is not None:
+        # Graph and layout of the current circuit are kept with its topology
+        G = topology.graph()
+        pos = topology.cached(
+            "spring_layout",
+            lambda: nx.spring_layout(G, seed=42, k=0.5, iterations=50),
+        )
+    else:
+        # Create graph
+        G = nx.Graph()
+
+        # Add edges from lines
+        for line_info in lines:
+            if isinstance(line_info, dict):
+                bus1 = line_info["bus1"]
+                bus2 = line_info["bus2"]
+            else:
+                # Handle tuple format
+                bus1, bus2 = line_info[0], line_info[1]
+            G.add_edge(bus1, bus2)
 
-    # Add edges from lines
-    for line_info in lines:
-        if isinstance(line_info, dict):
-            bus1 = line_info["bus1"]
-            bus2 = line_info["bus2"]
-        else:
-            # Handle tuple format
-            bus1, bus2 = line_info[0], line_info[1]
-        G.add_edge(bus1, bus2)
+        # Layout
+        pos = nx.spring_layout(G, seed=42, k=0.5, iterations=50)
 
     # Create figure
     figsize = options.get("figsize", (14, 10))
     fig, ax = plt.subplots(figsize=figsize)
 
-    # Layout
-    pos = nx.spring_layout(G, seed=42, k=0.5, iterations=50)
-
     # Node colors based on voltage
     node_colors = []
     for node in G.nodes():
@@ -444,7 +467,7 @@ def _plot_network_diagram(data: dict[str, Any], options: dict) -> plt.Figure:
     return fig
 
 
-def _plot_timeseries(data: dict[str, Any], options: dict) -> plt.Figure:
+def _plot_timeseries(data: dict[str, Any], options: dict) -> "Figure":
     """
     Create time-series line plots.
 
@@ -455,6 +478,8 @@ def _plot_timeseries(data: dict[str, Any], options: dict) -> plt.Figure:
     Returns:
         Matplotlib figure
     """
+    plt = _pyplot()
+
     # Extract time-series data
     if "timesteps" in data:
         timesteps = data["timesteps"]
@@ -517,7 +542,7 @@ def _plot_timeseries(data: dict[str, Any], options: dict) -> plt.Figure:
     return fig
 
 
-def _plot_capacity_curve(data: dict[str, Any], options: dict) -> plt.Figure:
+def _plot_capacity_curve(data: dict[str, Any], options: dict) -> "Figure":
     """
     Create capacity analysis scatter plot.
 
@@ -528,6 +553,8 @@ def _plot_capacity_curve(data: dict[str, Any], options: dict) -> plt.Figure:
     Returns:
         Matplotlib figure
     """
+    plt = _pyplot()
+
     # Extract capacity data - try multiple possible data structures
     results = None
     if "capacity_curve" in data:
@@ -585,7 +612,7 @@ def _plot_capacity_curve(data: dict[str, Any], options: dict) -> plt.Figure:
     return fig
 
 
-def _plot_harmonics_spectrum(data: dict[str, Any], options: dict) -> plt.Figure:
+def _plot_harmonics_spectrum(data: dict[str, Any], options: dict) -> "Figure":
     """
     Create harmonics spectrum bar chart.
 
@@ -596,6 +623,8 @@ def _plot_harmonics_spectrum(data: dict[str, Any], options: dict) -> plt.Figure:
     Returns:
         Matplotlib figure
     """
+    plt = _pyplot()
+
     # Extract harmonics data
     if "harmonics" in data:
         harmonics_dict = data["harmonics"]
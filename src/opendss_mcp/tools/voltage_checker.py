@@ -8,8 +8,10 @@ and identifying violations with severity classification.
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import opendssdirect as dss
 
+from ..utils.circuit_snapshot import CircuitSnapshot
 from ..utils.formatters import format_success_response, format_error_response
 from ..utils.validators import validate_voltage_limits
 
@@ -34,53 +36,65 @@ def _calculate_severity(deviation_pu: float) -> str:
         return "severe"
 
 
-def _get_bus_voltages_by_phase() -> Dict[str, Dict[str, float]]:
-    """Get voltage magnitudes for all buses organized by phase.
+def _find_violations(
+    snapshot: CircuitSnapshot,
+    min_voltage_pu: float,
+    max_voltage_pu: float,
+    phase: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Find voltage violations with a vectorized scan of the snapshot.
+
+    Args:
+        snapshot: Captured circuit snapshot
+        min_voltage_pu: Minimum acceptable voltage in per-unit
+        max_voltage_pu: Maximum acceptable voltage in per-unit
+        phase: Optional phase filter ('1', '2', '3', or None for all phases)
 
     Returns:
-        Dictionary mapping bus names to phase voltages in per-unit
-        Format: {bus_name: {phase: voltage_pu, ...}}
+        List of violation dictionaries in bus/phase order
     """
-    bus_voltages = {}
-
-    try:
-        # Get all bus names
-        all_buses = dss.Circuit.AllBusNames()
-
-        for bus_name in all_buses:
-            dss.Circuit.SetActiveBus(bus_name)
-
-            # Get voltage magnitudes and angles (interleaved array)
-            volts = dss.Bus.puVmagAngle()
+    matrix = snapshot.phase_matrix(3)
 
-            if not volts:
-                continue
-
-            # Get number of nodes (phases) at this bus
-            num_nodes = dss.Bus.NumNodes()
-
-            # Extract phase voltages (magnitudes only, skip angles)
-            phase_voltages = {}
-            phase_names = ["1", "2", "3"]  # Standard phase naming
-
-            for i in range(min(num_nodes, 3)):  # Limit to 3 phases
-                if i * 2 < len(volts):
-                    voltage_pu = volts[i * 2]  # Skip angles (odd indices)
-                    phase_voltages[phase_names[i]] = voltage_pu
-
-            if phase_voltages:
-                bus_voltages[bus_name.lower()] = phase_voltages
-
-    except Exception as e:
-        logger.error(f"Error getting bus voltages: {e}")
+    if phase is not None:
+        phase_mask = np.zeros(matrix.shape, dtype=bool)
+        phase_mask[:, int(phase) - 1] = True
+    else:
+        phase_mask = np.ones(matrix.shape, dtype=bool)
+
+    with np.errstate(invalid="ignore"):
+        under = (matrix < min_voltage_pu) & phase_mask
+        over = (matrix > max_voltage_pu) & phase_mask
+
+    violations: List[Dict[str, Any]] = []
+    for bus_idx, phase_idx in zip(*np.nonzero(under | over)):
+        voltage_pu = float(matrix[bus_idx, phase_idx])
+
+        if under[bus_idx, phase_idx]:
+            violation_type = "undervoltage"
+            deviation_pu = voltage_pu - min_voltage_pu
+        else:
+            violation_type = "overvoltage"
+            deviation_pu = voltage_pu - max_voltage_pu
+
+        violations.append(
+            {
+                "bus": snapshot.bus_names[bus_idx].lower(),
+                "phase": str(phase_idx + 1),
+                "voltage_pu": round(voltage_pu, 6),
+                "violation_type": violation_type,
+                "deviation_pu": round(deviation_pu, 6),
+                "severity": _calculate_severity(deviation_pu),
+            }
+        )
 
-    return bus_voltages
+    return violations
 
 
 def check_voltage_violations(
     min_voltage_pu: float = 0.95,
     max_voltage_pu: float = 1.05,
     phase: Optional[str] = None,
+    snapshot: Optional[CircuitSnapshot] = None,
 ) -> Dict[str, Any]:
     """Check all bus voltages against specified limits and identify violations.
 
@@ -92,6 +106,8 @@ def check_voltage_violations(
         min_voltage_pu: Minimum acceptable voltage in per-unit (default: 0.95)
         max_voltage_pu: Maximum acceptable voltage in per-unit (default: 1.05)
         phase: Optional phase filter ('1', '2', '3', or None for all phases)
+        snapshot: Optional CircuitSnapshot of the current solution. Callers that
+            already captured one after solving can pass it to avoid a re-read.
 
     Returns:
         Dictionary containing:
@@ -122,46 +138,18 @@ def check_voltage_violations(
                 "No circuit loaded. Please load a feeder first using load_feeder tool."
             )
 
-        # Get bus voltages organized by phase
-        bus_voltages = _get_bus_voltages_by_phase()
+        # Capture all node voltages in one bulk read
+        if snapshot is None:
+            snapshot = CircuitSnapshot.capture()
+        buses_checked = int(np.count_nonzero(snapshot.has_nodes))
 
-        if not bus_voltages:
+        if buses_checked == 0:
             return format_error_response(
                 "No voltage data available. Please run power flow analysis first."
             )
 
         # Find violations
-        violations: List[Dict[str, Any]] = []
-
-        for bus_name, phase_voltages in bus_voltages.items():
-            for phase_id, voltage_pu in phase_voltages.items():
-                # Skip if filtering by phase and this isn't the target phase
-                if phase is not None and phase_id != phase:
-                    continue
-
-                violation_type = None
-                deviation_pu = 0.0
-
-                if voltage_pu < min_voltage_pu:
-                    violation_type = "undervoltage"
-                    deviation_pu = voltage_pu - min_voltage_pu
-                elif voltage_pu > max_voltage_pu:
-                    violation_type = "overvoltage"
-                    deviation_pu = voltage_pu - max_voltage_pu
-
-                if violation_type:
-                    severity = _calculate_severity(deviation_pu)
-
-                    violations.append(
-                        {
-                            "bus": bus_name,
-                            "phase": phase_id,
-                            "voltage_pu": round(voltage_pu, 6),
-                            "violation_type": violation_type,
-                            "deviation_pu": round(deviation_pu, 6),
-                            "severity": severity,
-                        }
-                    )
+        violations = _find_violations(snapshot, min_voltage_pu, max_voltage_pu, phase)
 
         # Sort violations by absolute deviation (worst first)
         violations.sort(key=lambda x: abs(x["deviation_pu"]), reverse=True)
@@ -200,7 +188,7 @@ def check_voltage_violations(
                 "max_voltage_pu": max_voltage_pu,
                 "phase_filter": phase,
             },
-            "total_buses_checked": len(bus_voltages),
+            "total_buses_checked": buses_checked,
         }
 
         metadata = {
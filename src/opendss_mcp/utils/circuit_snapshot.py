@@ -0,0 +1,255 @@
+"""
+Whole-circuit voltage snapshot backed by NumPy arrays.
+
+This module pulls every node voltage of the solved circuit with a handful of
+bulk OpenDSS calls (AllBusNames, AllNodeNames, AllBusMagPu) instead of one
+SetActiveBus + puVmagAngle round trip per bus, and exposes the result as
+arrays indexed by bus and phase.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import opendssdirect as dss
+
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# (circuit signature, bus names, node names, node layout) of the last captured
+# circuit. Replaced as one tuple so concurrent readers never mix two circuits.
+_layout_cache: Optional[
+    Tuple[Tuple[str, int, int, int], List[str], List[str], Dict[str, Any]]
+] = None
+
+
+def circuit_signature(engine: Optional[Any] = None) -> Tuple[str, int, int, int]:
+    """Cheap fingerprint of the active circuit's structure.
+
+    Compiling another circuit or adding elements, buses or nodes changes the
+    signature; solving, opening elements and editing properties do not.
+
+    Args:
+        engine: OpenDSS interface to read from (default: opendssdirect)
+
+    Returns:
+        Tuple of circuit name and numbers of elements, buses and nodes
+    """
+    engine = engine if engine is not None else dss
+    return (
+        engine.Circuit.Name(),
+        engine.Circuit.NumCktElements(),
+        engine.Circuit.NumBuses(),
+        engine.Circuit.NumNodes(),
+    )
+
+
+def invalidate_node_layout() -> None:
+    """Drop the cached node layout (e.g. after compiling a circuit)."""
+    global _layout_cache
+    _layout_cache = None
+
+
+def _build_layout(bus_names: List[str], node_names: List[str]) -> Dict[str, Any]:
+    """Map each node (in AllNodeNames order) to its bus and phase position.
+
+    Args:
+        bus_names: Bus names from Circuit.AllBusNames()
+        node_names: Node names ("bus.node") from Circuit.AllNodeNames()
+
+    Returns:
+        Dictionary with node_bus, node_position, node_number and node_count arrays
+    """
+    bus_position = {name.lower(): i for i, name in enumerate(bus_names)}
+    node_bus = np.empty(len(node_names), dtype=int)
+    node_number = np.empty(len(node_names), dtype=int)
+
+    for i, node_name in enumerate(node_names):
+        bus, _, node = node_name.rpartition(".")
+        node_bus[i] = bus_position[bus.lower()]
+        node_number[i] = int(node) if node.isdigit() else 0
+
+    # AllNodeNames keeps definition order (e.g. "692.3, 692.1, 692.2") while
+    # Bus.puVmagAngle() is sorted by node number, so rank nodes within each bus
+    node_position = np.empty(len(node_names), dtype=int)
+    seen = np.zeros(len(bus_names), dtype=int)
+    for i in np.lexsort((node_number, node_bus)):
+        node_position[i] = seen[node_bus[i]]
+        seen[node_bus[i]] += 1
+
+    return {
+        "node_bus": node_bus,
+        "node_position": node_position,
+        "node_number": node_number,
+        "node_count": seen,
+    }
+
+
+class CircuitSnapshot:
+    """Per-node voltage magnitudes of the solved circuit as NumPy arrays.
+
+    A snapshot is captured once after a solve and then read by any number of
+    consumers. Phases are identified by the rank of the node number within its
+    bus ("1", "2", "3"), which matches the ordering returned by
+    Bus.puVmagAngle().
+
+    Attributes:
+        bus_names: Bus names in circuit order
+        node_names: Node names ("bus.node") in circuit order
+        node_bus: Bus index of each node
+        node_position: 0-based rank of each node within its bus
+        node_number: OpenDSS node number of each node (1, 2, 3, ...)
+        vmag_pu: Voltage magnitude of each node in per-unit
+    """
+
+    def __init__(
+        self,
+        bus_names: List[str],
+        node_names: List[str],
+        vmag_pu: np.ndarray,
+        layout: Dict[str, Any],
+    ) -> None:
+        """Initialize the snapshot from bulk arrays.
+
+        Args:
+            bus_names: Bus names from Circuit.AllBusNames()
+            node_names: Node names from Circuit.AllNodeNames()
+            vmag_pu: Node voltage magnitudes from Circuit.AllBusMagPu()
+            layout: Node layout produced by _build_layout()
+        """
+        self.bus_names = bus_names
+        self.node_names = node_names
+        self.vmag_pu = vmag_pu
+        self.node_bus: np.ndarray = layout["node_bus"]
+        self.node_position: np.ndarray = layout["node_position"]
+        self.node_number: np.ndarray = layout["node_number"]
+        self._node_count: np.ndarray = layout["node_count"]
+
+    @classmethod
+    @instrumentation.timed("extract")
+    def capture(
+        cls, engine: Optional[Any] = None, reuse_layout: bool = False
+    ) -> "CircuitSnapshot":
+        """Capture all node voltages of the active circuit.
+
+        Args:
+            engine: OpenDSS interface to read from (default: opendssdirect)
+            reuse_layout: Use the cached bus and node names without re-reading
+                them while the circuit signature is unchanged. Only valid when
+                the caller knows that no bus or node was replaced since the
+                last capture; saves the name reads on large feeders
+                (default: False)
+
+        Returns:
+            CircuitSnapshot of the current solution
+        """
+        global _layout_cache
+        engine = engine if engine is not None else dss
+
+        signature = circuit_signature(engine)
+        cached = _layout_cache
+        if cached is not None and cached[0] != signature:
+            cached = None
+
+        if reuse_layout and cached is not None:
+            _, bus_names, node_names, layout = cached
+        else:
+            bus_names = list(engine.Circuit.AllBusNames())
+            node_names = list(engine.Circuit.AllNodeNames())
+            if cached is not None and cached[2] == node_names:
+                layout = cached[3]
+            else:
+                layout = _build_layout(bus_names, node_names)
+                _layout_cache = (signature, bus_names, node_names, layout)
+        vmag_pu = np.asarray(engine.Circuit.AllBusMagPu(), dtype=float)
+
+        if vmag_pu.size != len(node_names):
+            logger.warning(
+                f"Voltage array size {vmag_pu.size} does not match "
+                f"{len(node_names)} nodes"
+            )
+            vmag_pu = np.resize(vmag_pu, len(node_names))
+
+        return cls(bus_names, node_names, vmag_pu, layout)
+
+    @property
+    def has_nodes(self) -> np.ndarray:
+        """Boolean mask of buses that have at least one node."""
+        return self._node_count > 0
+
+    def bus_first(self) -> np.ndarray:
+        """Voltage of the first node of each bus (NaN for buses without nodes)."""
+        first = np.full(len(self.bus_names), np.nan)
+        mask = self.node_position == 0
+        first[self.node_bus[mask]] = self.vmag_pu[mask]
+        return first
+
+    def bus_mean(self) -> np.ndarray:
+        """Average node voltage of each bus (NaN for buses without nodes)."""
+        totals = np.bincount(
+            self.node_bus, weights=self.vmag_pu, minlength=len(self.bus_names)
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.has_nodes, totals / self._node_count, np.nan)
+
+    def bus_max(self) -> np.ndarray:
+        """Maximum node voltage of each bus (NaN for buses without nodes)."""
+        result = np.full(len(self.bus_names), -np.inf)
+        np.maximum.at(result, self.node_bus, self.vmag_pu)
+        return np.where(self.has_nodes, result, np.nan)
+
+    def bus_min(self) -> np.ndarray:
+        """Minimum node voltage of each bus (NaN for buses without nodes)."""
+        result = np.full(len(self.bus_names), np.inf)
+        np.minimum.at(result, self.node_bus, self.vmag_pu)
+        return np.where(self.has_nodes, result, np.nan)
+
+    def phase_matrix(self, max_phases: int = 3) -> np.ndarray:
+        """Voltages as a (buses x phases) matrix padded with NaN.
+
+        Args:
+            max_phases: Number of phase positions to keep per bus (default: 3)
+
+        Returns:
+            Array where entry [b, p] is the voltage of the p-th node of bus b
+        """
+        matrix = np.full((len(self.bus_names), max_phases), np.nan)
+        mask = self.node_position < max_phases
+        matrix[self.node_bus[mask], self.node_position[mask]] = self.vmag_pu[mask]
+        return matrix
+
+    def to_dict(self, values: np.ndarray) -> Dict[str, float]:
+        """Convert a per-bus array into a {bus_name: value} dictionary.
+
+        Buses without nodes are omitted.
+
+        Args:
+            values: Array with one entry per bus
+
+        Returns:
+            Dictionary mapping bus names to float values
+        """
+        return {
+            self.bus_names[i]: float(values[i]) for i in np.flatnonzero(self.has_nodes)
+        }
+
+    def phase_voltages(self, max_phases: int = 3) -> Dict[str, Dict[str, float]]:
+        """Voltages organized as {bus_name: {phase: voltage_pu}}.
+
+        Args:
+            max_phases: Number of phase positions to keep per bus (default: 3)
+
+        Returns:
+            Dictionary mapping bus names to phase voltages in per-unit
+        """
+        matrix = self.phase_matrix(max_phases)
+        bus_voltages: Dict[str, Dict[str, float]] = {}
+        for i in np.flatnonzero(self.has_nodes):
+            row = matrix[i]
+            bus_voltages[self.bus_names[i]] = {
+                str(p + 1): float(row[p])
+                for p in range(max_phases)
+                if not np.isnan(row[p])
+            }
+        return bus_voltages
@@ -0,0 +1,167 @@
+"""
+Reusable DER test element for capacity and placement studies.
+
+Studies that try a DER at many buses or sizes used to issue "New PVSystem..."
+for every trial and hide the previous one with enabled=no, so disabled
+elements piled up in the circuit. A DERProbe instead owns one element per
+OpenDSS class (PVSystem, Storage, Generator, Load), moves it between buses and
+changes its rating in place with "Edit", and disables it when the study ends.
+A later probe with the same name picks the existing elements up again, so the
+circuit never holds more than one probe element per class.
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+import opendssdirect as dss
+
+logger = logging.getLogger(__name__)
+
+
+def bus_connection(
+    bus_id: str, engine: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """Connection properties that rate a DER for the phases of a bus.
+
+    OpenDSS interprets kV as line-to-neutral for single-phase elements and
+    line-to-line otherwise, while Bus.kVBase() is always line-to-neutral.
+
+    Args:
+        bus_id: Bus identifier (without node suffix)
+        engine: OpenDSS interface to use (default: opendssdirect)
+
+    Returns:
+        Dictionary with the node-qualified bus ("bus"), number of phases
+        ("phases") and rated kV ("kV"), or None if the bus has no voltage
+        base or no phase nodes
+    """
+    engine = engine if engine is not None else dss
+    engine.Circuit.SetActiveBus(bus_id)
+    kv_base = engine.Bus.kVBase()
+    nodes = sorted(node for node in engine.Bus.Nodes() if 1 <= node <= 3)
+    if kv_base == 0 or not nodes:
+        return None
+
+    phases = len(nodes)
+    return {
+        "bus": ".".join([bus_id] + [str(node) for node in nodes]),
+        "phases": phases,
+        "kV": round(kv_base * math.sqrt(3), 6) if phases > 1 else kv_base,
+    }
+
+
+class DERProbe:
+    """One reusable OpenDSS element per DER class, moved and resized in place.
+
+    OpenDSS can only remove power delivery elements, so probe elements cannot
+    be deleted without recompiling the circuit. close() disables them instead;
+    disabled elements are left out of the system admittance matrix and are
+    reused by the next probe with the same name.
+
+    Attributes:
+        name: Element name shared by all probe elements (e.g. "der_test")
+        placements: Number of place() calls made through this probe
+
+    Example:
+        >>> with DERProbe("der_test") as probe:
+        ...     for kw in (100, 200, 300):
+        ...         probe.place("PVSystem", "675", {"kV": 4.16, "kVA": kw, "Pmpp": kw})
+        ...         dss.Solution.Solve()
+    """
+
+    def __init__(self, name: str = "der_probe", engine: Optional[Any] = None) -> None:
+        """Initialize the probe.
+
+        Args:
+            name: Element name used for every probe element (default: "der_probe")
+            engine: OpenDSS interface to use (default: opendssdirect)
+        """
+        self.name = name
+        self.placements = 0
+        self._engine = engine if engine is not None else dss
+        self._active: List[str] = []
+        self._elements: List[str] = []
+
+    def __enter__(self) -> "DERProbe":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def element_names(self) -> List[str]:
+        """Full names ("Class.name") of every element this probe has used."""
+        return list(self._elements)
+
+    def element_name(self, element_class: str) -> str:
+        """Full name of the probe element of a class.
+
+        Args:
+            element_class: OpenDSS class ("PVSystem", "Storage", "Generator", "Load")
+
+        Returns:
+            Full element name, e.g. "PVSystem.der_probe"
+        """
+        return f"{element_class}.{self.name}"
+
+    def exists(self, full_name: str) -> bool:
+        """Check whether an element is already defined in the circuit.
+
+        Args:
+            full_name: Full element name ("Class.name")
+
+        Returns:
+            True if the element exists (enabled or not)
+        """
+        return self._engine.Circuit.SetActiveElement(full_name) >= 0
+
+    def place(self, element_class: str, bus_id: str, properties: Dict[str, Any]) -> str:
+        """Connect the probe element of a class to a bus with the given rating.
+
+        The element is created on first use and edited afterwards, so moving
+        it to another bus or changing its size does not add elements.
+
+        Args:
+            element_class: OpenDSS class ("PVSystem", "Storage", "Generator", "Load")
+            bus_id: Bus to connect the element to, optionally with nodes ("675.1.2.3")
+            properties: OpenDSS properties to set, e.g. {"kV": 4.16, "Pmpp": 500}
+
+        Returns:
+            Full name of the placed element
+        """
+        full_name = self.element_name(element_class)
+        verb = "Edit" if self.exists(full_name) else "New"
+        assignments = " ".join(
+            f"{key}={value}" for key, value in {"Bus1": bus_id, **properties}.items()
+        )
+        self._engine.Text.Command(f"{verb} {full_name} {assignments} enabled=yes")
+
+        if full_name not in self._active:
+            self._active.append(full_name)
+        self.track(full_name)
+        self.placements += 1
+        return full_name
+
+    def track(self, full_name: str) -> None:
+        """Register an auxiliary element (e.g. an InvControl) to disable on close.
+
+        Args:
+            full_name: Full element name ("Class.name")
+        """
+        if full_name not in self._elements:
+            self._elements.append(full_name)
+
+    def park(self) -> None:
+        """Disconnect the placed elements until the next place() call."""
+        for full_name in self._active:
+            try:
+                self._engine.Text.Command(f"{full_name}.enabled=no")
+            except Exception as e:
+                logger.warning(f"Could not disable {full_name}: {e}")
+        self._active = []
+
+    def close(self) -> None:
+        """Disable every element used by the probe at the end of a study."""
+        self._active = list(self._elements)
+        self.park()
@@ -6,14 +6,145 @@ opendssdirect.py package, with proper error handling and type hints.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import opendssdirect as dss
 
+from .circuit_snapshot import (
+    CircuitSnapshot,
+    circuit_signature,
+    invalidate_node_layout,
+)
+from .instrumentation import instrumentation
+from .line_loading import LineLoadings, invalidate_line_layout
+from .solver import PowerFlowSolver
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Element kinds kept in the name index: kind -> (OpenDSS class, interface)
+NAME_INDEX_CLASSES = {
+    "line": ("Line", "Lines"),
+    "load": ("Load", "Loads"),
+    "pvsystem": ("PVSystem", "PVsystems"),
+    "transformer": ("Transformer", "Transformers"),
+}
+
+# Name index of the active circuit and the circuit signature it was built for
+_name_index_cache: Dict[str, Any] = {"signature": None, "index": None}
+
+
+class NameIndex:
+    """Case-insensitive lookup of the bus and element names of a circuit.
+
+    Validating a name is a dictionary lookup instead of a scan of
+    AllBusNames() or Lines.AllNames(), so checking a list of candidates is
+    linear in the list rather than in list x circuit size.
+
+    Attributes:
+        bus_names: Bus names in circuit order
+    """
+
+    def __init__(
+        self, buses: List[str], elements: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        """Initialize the index from name lists.
+
+        Args:
+            buses: Bus names in circuit order
+            elements: Element names (without class prefix) by kind, for the
+                kinds of NAME_INDEX_CLASSES
+        """
+        self.bus_names = list(buses)
+        self._buses = {name.lower(): i for i, name in enumerate(self.bus_names)}
+        self._elements = {
+            kind: {name.lower(): name for name in (elements or {}).get(kind, [])}
+            for kind in NAME_INDEX_CLASSES
+        }
+
+    @classmethod
+    def build(cls, engine: Optional[Any] = None) -> "NameIndex":
+        """Read all bus and element names of the active circuit.
+
+        Args:
+            engine: OpenDSS interface to read from (default: opendssdirect)
+
+        Returns:
+            NameIndex of the active circuit
+        """
+        engine = engine if engine is not None else dss
+        elements = {
+            kind: list(getattr(engine, interface).AllNames())
+            for kind, (_, interface) in NAME_INDEX_CLASSES.items()
+        }
+        return cls(list(engine.Circuit.AllBusNames()), elements)
+
+    def bus_index(self, bus: str) -> Optional[int]:
+        """Position of a bus in bus_names, or None if it does not exist."""
+        return self._buses.get(bus.lower())
+
+    def has_bus(self, bus: str) -> bool:
+        """Whether the circuit has a bus of this name (any case)."""
+        return bus.lower() in self._buses
+
+    def resolve_bus(self, bus: str) -> Optional[str]:
+        """Bus name as stored in the circuit, or None if it does not exist."""
+        index = self._buses.get(bus.lower())
+        return None if index is None else self.bus_names[index]
+
+    def resolve_element(self, kind: str, name: str) -> Optional[str]:
+        """Element name as stored in the circuit, or None if it does not exist.
+
+        Args:
+            kind: Key of NAME_INDEX_CLASSES ("line", "load", "pvsystem",
+                "transformer")
+            name: Element name, with or without class prefix ("Line.650632")
+
+        Returns:
+            Element name without class prefix, or None
+        """
+        prefix = f"{NAME_INDEX_CLASSES[kind][0].lower()}."
+        key = name.lower()
+        if key.startswith(prefix):
+            key = key[len(prefix) :]
+        return self._elements[kind].get(key)
+
+    def has_element(self, kind: str, name: str) -> bool:
+        """Whether the circuit has an element of this kind and name (any case)."""
+        return self.resolve_element(kind, name) is not None
+
+    def element_names(self, kind: str) -> List[str]:
+        """Names of all elements of a kind, without class prefix."""
+        return list(self._elements[kind].values())
+
+
+def get_name_index(engine: Optional[Any] = None) -> NameIndex:
+    """Name index of the active circuit, rebuilt only when the circuit changed.
+
+    Args:
+        engine: OpenDSS interface to read from (default: opendssdirect)
+
+    Returns:
+        NameIndex of the active circuit
+    """
+    engine = engine if engine is not None else dss
+    signature = circuit_signature(engine)
+    if (
+        _name_index_cache["signature"] != signature
+        or _name_index_cache["index"] is None
+    ):
+        _name_index_cache["index"] = NameIndex.build(engine)
+        _name_index_cache["signature"] = signature
+    return _name_index_cache["index"]
+
+
+def invalidate_name_index() -> None:
+    """Drop the cached name index (e.g. after compiling a circuit)."""
+    _name_index_cache["signature"] = None
+    _name_index_cache["index"] = None
+
 
 class DSSCircuit:
     """A wrapper class for OpenDSS circuit operations with error handling.
@@ -23,10 +154,16 @@ class DSSCircuit:
     currently loaded circuit and provides methods for common operations.
     """
 
-    def __init__(self) -> None:
-        """Initialize the DSSCircuit wrapper."""
+    def __init__(self, solve_strategy: str = "auto") -> None:
+        """Initialize the DSSCircuit wrapper.
+
+        Args:
+            solve_strategy: Start of consecutive solves: "auto" (default),
+                "warm" or "cold" (see PowerFlowSolver)
+        """
         self.current_feeder: Optional[str] = None
         self.dss_file_path: Optional[str] = None
+        self.solver = PowerFlowSolver(solve_strategy, engine=dss)
         self._initialized = False
         try:
             # Initialize OpenDSS
@@ -45,6 +182,7 @@ class DSSCircuit:
         """
         try:
             dss.run_command("Clear")
+            invalidate_name_index()
             self.current_feeder = None
             self.dss_file_path = None
             return True
@@ -62,7 +200,11 @@ class DSSCircuit:
             bool: True if file was loaded successfully, False otherwise.
         """
         try:
-            dss.Text.Command(f"compile {file_path}")
+            with instrumentation.phase("compile"):
+                dss.Text.Command(f"compile {file_path}")
+            invalidate_name_index()
+            invalidate_node_layout()
+            invalidate_line_layout()
             self.dss_file_path = file_path
             self.current_feeder = (
                 file_path.stem
@@ -74,44 +216,54 @@ class DSSCircuit:
             logger.error(f"Failed to load DSS file {file_path}: {e}")
             return False
 
-    def solve_power_flow(self) -> bool:
+    def solve_power_flow(self, change: Optional[float] = None) -> bool:
         """Solve the power flow for the current circuit.
 
+        Iteration count and wall time of the solve are available from
+        get_last_solve().
+
+        Args:
+            change: Relative size of the change since the previous solve,
+                used to choose a warm or cold start (default: unknown)
+
         Returns:
             bool: True if solution converged, False otherwise.
         """
         try:
-            dss.Solution.Solve()
-            if dss.Solution.Converged():
+            solve = self.solver.solve(change)
+            if solve["converged"]:
                 return True
-            logger.warning("Power flow solution did not converge")
+            if solve["error"]:
+                logger.error(f"Error solving power flow: {solve['error']}")
+            else:
+                logger.warning("Power flow solution did not converge")
             return False
         except Exception as e:
             logger.error(f"Error solving power flow: {e}")
             return False
 
+    def get_last_solve(self) -> Optional[Dict[str, Any]]:
+        """Get statistics of the most recent solve_power_flow() call.
+
+        Returns:
+            dict: Converged flag, iterations, time_ms, start ("warm"/"cold"),
+                y_rebuilt and retried, or None before the first solve
+        """
+        return self.solver.last
+
     def get_all_bus_voltages(self) -> Dict[str, float]:
         """Get voltage magnitudes in per-unit for all buses.
 
         Returns:
             dict: Dictionary mapping bus names to their voltage magnitudes (p.u.)
         """
-        voltages = {}
         try:
             dss.Circuit.SetActiveElement("Vsource.source")
             dss.Circuit.Solution.Solve()
 
-            dss.Circuit.SetActiveBus("*")
-            bus_names = dss.Bus.AllBusNames()
-
-            for bus in bus_names:
-                dss.Circuit.SetActiveBus(bus)
-                pu_voltages = dss.Bus.puVmagAngle()
-                # Take the maximum phase voltage as the bus voltage
-                if pu_voltages:
-                    voltages[bus] = max(pu_voltages[0::2])
-
-            return voltages
+            # Take the maximum phase voltage as the bus voltage
+            snapshot = CircuitSnapshot.capture(dss)
+            return snapshot.to_dict(snapshot.bus_max())
         except Exception as e:
             logger.error(f"Error getting bus voltages: {e}")
             return {}
@@ -123,34 +275,18 @@ class DSSCircuit:
             dict: Dictionary mapping line names to their power flow information
                 with keys: 'P' (kW), 'Q' (kvar), 'loading' (%)
         """
-        line_flows = {}
         try:
-            dss.Circuit.SetActiveClass("Line")
-            dss.ActiveClass.First()
-
-            for _ in range(dss.ActiveClass.Count()):
-                line_name = dss.Circuit.ActiveCktElement.Name()
-                powers = dss.CktElement.Powers()
-
-                # Sum P and Q for all phases
-                p_total = sum(abs(p) for p in powers[::2])  # Real power (kW)
-                q_total = sum(abs(q) for q in powers[1::2])  # Reactive power (kvar)
-
-                # Get line loading percentage
-                dss.Circuit.SetActiveElement(line_name)
-                loading = dss.CktElement.NormalAmps()
-                current = max(dss.CktElement.CurrentsMagAng()[::2])
-                loading_pct = (current / loading * 100) if loading > 0 else 0
-
-                line_flows[line_name] = {
-                    "P": p_total,
-                    "Q": q_total,
-                    "loading": loading_pct,
+            loadings = LineLoadings.capture(dss, include_powers=True)
+            loading_pct = np.nan_to_num(loadings.loading_pct())
+
+            return {
+                f"Line.{name}": {
+                    "P": float(loadings.powers[i, 0]),  # Real power (kW)
+                    "Q": float(loadings.powers[i, 1]),  # Reactive power (kvar)
+                    "loading": float(loading_pct[i]),
                 }
-
-                dss.ActiveClass.Next()
-
-            return line_flows
+                for i, name in enumerate(loadings.names)
+            }
         except Exception as e:
             logger.error(f"Error getting line flows: {e}")
             return {}
@@ -180,6 +316,17 @@ class DSSCircuit:
             logger.error(f"Error getting bus names: {e}")
             return []
 
+    def name_index(self) -> NameIndex:
+        """Get the case-insensitive bus and element name index of the circuit.
+
+        The index is built on first use and kept until the circuit is
+        recompiled or gains elements or buses.
+
+        Returns:
+            NameIndex: Name index of the current circuit
+        """
+        return get_name_index(dss)
+
     def get_line_names(self) -> List[str]:
         """Get all line names in the circuit.
 
@@ -4,17 +4,25 @@ Harmonic analysis utilities for OpenDSS.
 This module provides functions for performing frequency scans, calculating
 total harmonic distortion (THD), and extracting harmonic voltage and current
 magnitudes at specific buses and lines in the power system.
+
+All bus and line results are produced by a single harmonic sweep that solves
+each order once and captures the whole circuit with bulk array accessors.
 """
 
 import logging
 import math
 from typing import Any
 
+import numpy as np
 import opendssdirect as dss
 
+from .dss_wrapper import get_name_index
+from .instrumentation import instrumentation
+
 logger = logging.getLogger(__name__)
 
 
+@instrumentation.timed("harmonics")
 def run_frequency_scan(orders: list[int] | None = None) -> dict[str, Any]:
     """Run frequency scan to analyze harmonic content in the circuit.
 
@@ -198,20 +206,249 @@ def calculate_thd(harmonics: dict[int, float]) -> float:
         return 0.0
 
 
+def _vectorized_thd(magnitudes: dict[int, np.ndarray], size: int) -> np.ndarray:
+    """Calculate THD for many locations at once.
+
+    Applies the same formula as calculate_thd() element-wise, so that a whole
+    circuit can be processed without one Python call per bus or line.
+
+    Args:
+        magnitudes: Dictionary mapping harmonic order to an array of magnitudes
+                    (one entry per bus or line)
+        size: Number of locations (length of each array)
+
+    Returns:
+        Array of THD percentages rounded to 4 decimals. Locations without a
+        usable fundamental, or without harmonics above it, get 0.0.
+    """
+    fundamental = magnitudes.get(1)
+    higher_orders = [mags for order, mags in magnitudes.items() if order > 1]
+
+    if fundamental is None or not higher_orders:
+        return np.zeros(size)
+
+    sum_of_squares = np.sum(np.square(np.vstack(higher_orders)), axis=0)
+    thd = np.zeros(size)
+    valid = fundamental != 0
+    thd[valid] = np.sqrt(sum_of_squares[valid]) / fundamental[valid] * 100.0
+
+    return np.round(thd, 4)
+
+
+@instrumentation.timed("harmonics")
+def run_harmonic_sweep(orders: list[int] | None = None) -> dict[str, Any]:
+    """Solve each harmonic order once and capture all buses and lines.
+
+    The sweep switches the circuit to Harmonic mode, solves every requested
+    order exactly once and, after each solve, reads all node voltages
+    (Circuit.AllBusMagPu) and all power delivery element currents
+    (PDElements.AllCurrentsMagAng) with one bulk call each. THD is then
+    computed for every bus and line from those arrays.
+
+    A full-circuit analysis therefore costs len(orders) solves instead of
+    (buses + lines) * len(orders). get_harmonic_voltages() and
+    get_harmonic_currents() are views over the result of this function.
+
+    Args:
+        orders: List of harmonic orders to solve (e.g., [1, 3, 5, 7, 9, 11, 13]).
+                Default is [1, 3, 5, 7, 9, 11, 13] if not specified.
+                Order 1 (fundamental) is required for THD calculation.
+
+    Returns:
+        Dictionary containing:
+            - success: Boolean indicating if at least one order was solved
+            - orders: List of harmonic orders that converged
+            - frequencies_hz: Dictionary mapping order to frequency in Hz
+            - bus_voltages: Dictionary mapping order to {bus: [pu per node]}
+            - bus_avg_voltages: Dictionary mapping order to {bus: average pu}
+            - line_currents: Dictionary mapping order to {line: [amps per conductor]}
+            - line_max_currents: Dictionary mapping order to {line: max amps}
+            - thd_voltage: Dictionary mapping bus to voltage THD percentage
+            - thd_current: Dictionary mapping line to current THD percentage
+            - errors: List of error messages if any occurred
+
+    Example:
+        >>> sweep = run_harmonic_sweep([1, 3, 5, 7])
+        >>> if sweep['success']:
+        ...     worst_bus = max(sweep['thd_voltage'], key=sweep['thd_voltage'].get)
+        ...     print(f"Worst THD at bus {worst_bus}")
+
+    Note:
+        - The circuit must be loaded and solved before calling this function
+        - Harmonic sources must be present for meaningful harmonic analysis
+        - Original solution mode is restored after the sweep completes
+    """
+    if orders is None:
+        orders = [1, 3, 5, 7, 9, 11, 13]
+
+    result: dict[str, Any] = {
+        "success": False,
+        "orders": [],
+        "frequencies_hz": {},
+        "bus_voltages": {},
+        "bus_avg_voltages": {},
+        "line_currents": {},
+        "line_max_currents": {},
+        "thd_voltage": {},
+        "thd_current": {},
+        "errors": [],
+    }
+
+    try:
+        # Check if circuit is loaded
+        if not dss.Circuit.Name():
+            result["errors"] = ["No circuit loaded. Please load a feeder first."]
+            return result
+
+        # Get fundamental frequency
+        fundamental_freq = dss.Solution.Frequency()
+        if fundamental_freq == 0:
+            fundamental_freq = 60.0
+
+        # Static node layout: which bus each node (in AllNodeNames order) belongs to
+        bus_names = dss.Circuit.AllBusNames()
+        bus_position = {name.lower(): i for i, name in enumerate(bus_names)}
+        node_bus = np.array(
+            [
+                bus_position[node.split(".")[0].lower()]
+                for node in dss.Circuit.AllNodeNames()
+            ],
+            dtype=int,
+        )
+        node_counts = np.bincount(node_bus, minlength=len(bus_names))
+        node_order = np.argsort(node_bus, kind="stable")
+        bus_nodes = np.split(node_order, np.cumsum(node_counts)[:-1])
+        has_nodes = node_counts > 0
+
+        # Static current layout: slice of AllCurrentsMagAng magnitudes per line
+        pd_names = dss.PDElements.AllNames()
+        sizes = np.asarray(dss.PDElements.AllNumConductors(), dtype=int) * np.asarray(
+            dss.PDElements.AllNumTerminals(), dtype=int
+        )
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(int)
+        segment_starts = offsets[sizes > 0]
+        line_slices = []
+        line_segments = []
+        for segment, (name, offset, size) in enumerate(
+            (n, o, z) for n, o, z in zip(pd_names, offsets, sizes) if z > 0
+        ):
+            if name.lower().startswith("line."):
+                line_slices.append((name.split(".", 1)[1], int(offset), int(size)))
+                line_segments.append(segment)
+        line_names = [name for name, _, _ in line_slices]
+
+        # Store original solution mode
+        original_mode = dss.Solution.Mode()
+
+        # Set solution mode to Harmonic using Text command
+        dss.Text.Command("Set Mode=Harmonic")
+
+        bus_magnitudes: dict[int, np.ndarray] = {}
+        line_magnitudes: dict[int, np.ndarray] = {}
+        errors: list[str] = []
+
+        # Solve each harmonic order exactly once
+        for order in orders:
+            try:
+                dss.Text.Command(f"Set Harmonic={order}")
+                dss.Text.Command("Solve")
+
+                if not dss.Solution.Converged():
+                    logger.warning(f"Solution did not converge at order {order}")
+                    errors.append(
+                        f"Solution did not converge at harmonic order {order}"
+                    )
+                    continue
+
+                # One bulk read of every node voltage and every PD element current
+                node_mags = np.asarray(dss.Circuit.AllBusMagPu(), dtype=float)
+                current_mags = np.asarray(
+                    dss.PDElements.AllCurrentsMagAng(), dtype=float
+                )[0::2]
+
+                bus_avg = np.bincount(
+                    node_bus, weights=node_mags, minlength=len(bus_names)
+                ) / np.maximum(node_counts, 1)
+                line_max = (
+                    np.maximum.reduceat(current_mags, segment_starts)[line_segments]
+                    if line_segments
+                    else np.zeros(0)
+                )
+
+                result["frequencies_hz"][order] = round(order * fundamental_freq, 2)
+                result["bus_voltages"][order] = {
+                    bus_names[i]: node_mags[nodes].tolist()
+                    for i, nodes in enumerate(bus_nodes)
+                    if nodes.size
+                }
+                result["bus_avg_voltages"][order] = {
+                    bus_names[i]: float(bus_avg[i]) for i in np.flatnonzero(has_nodes)
+                }
+                result["line_currents"][order] = {
+                    name: current_mags[offset : offset + size].tolist()
+                    for name, offset, size in line_slices
+                }
+                result["line_max_currents"][order] = dict(
+                    zip(line_names, line_max.tolist())
+                )
+
+                bus_magnitudes[order] = bus_avg
+                line_magnitudes[order] = line_max
+                result["orders"].append(order)
+
+            except Exception as e:
+                error_msg = f"Error solving harmonic order {order}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        # Restore original solution mode
+        try:
+            dss.Solution.Mode(original_mode)
+        except Exception as e:
+            logger.warning(f"Could not restore original solution mode: {e}")
+
+        if result["orders"]:
+            if 1 not in bus_magnitudes:
+                logger.warning("Fundamental harmonic (order 1) is missing or zero")
+
+            thd_voltage = _vectorized_thd(bus_magnitudes, len(bus_names))
+            thd_current = _vectorized_thd(line_magnitudes, len(line_names))
+
+            result["thd_voltage"] = {
+                bus_names[i]: float(thd_voltage[i]) for i in np.flatnonzero(has_nodes)
+            }
+            result["thd_current"] = dict(zip(line_names, thd_current.tolist()))
+
+        result["success"] = len(result["orders"]) > 0
+        result["errors"] = errors
+        return result
+
+    except Exception as e:
+        error_msg = f"Error running harmonic sweep: {str(e)}"
+        logger.exception(error_msg)
+        result["errors"] = [error_msg]
+        return result
+
+
 def get_harmonic_voltages(
-    bus_id: str, orders: list[int] | None = None
+    bus_id: str,
+    orders: list[int] | None = None,
+    sweep: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Get voltage magnitudes at each harmonic order for a specific bus.
 
-    This function runs a frequency scan and extracts voltage magnitudes
-    at the specified bus for each harmonic order. Results include per-phase
-    voltages and calculated THD.
+    This function is a view over run_harmonic_sweep(): it extracts the voltage
+    magnitudes at the specified bus for each harmonic order from a sweep of the
+    whole circuit. Results include per-phase voltages and calculated THD. Pass
+    an existing sweep to analyze many buses without solving again.
 
     Args:
         bus_id: Identifier of the bus to analyze
         orders: List of harmonic orders to analyze (e.g., [1, 3, 5, 7, 9, 11, 13]).
                 Default is [1, 3, 5, 7, 9, 11, 13] if not specified.
                 Order 1 (fundamental) is required for THD calculation.
+        sweep: Optional result of run_harmonic_sweep() to read from. If None,
+               a new sweep is run for the requested orders.
 
     Returns:
         Dictionary containing:
@@ -255,8 +492,7 @@ def get_harmonic_voltages(
             }
 
         # Validate bus exists
-        all_buses = [bus.lower() for bus in dss.Circuit.AllBusNames()]
-        if bus_id.lower() not in all_buses:
+        if not get_name_index().has_bus(bus_id):
             return {
                 "success": False,
                 "bus_id": bus_id,
@@ -266,71 +502,38 @@ def get_harmonic_voltages(
                 "errors": [f"Bus '{bus_id}' not found in circuit"],
             }
 
-        # Store original solution mode
-        original_mode = dss.Solution.Mode()
-
-        # Get fundamental frequency
-        fundamental_freq = dss.Solution.Frequency()
-        if fundamental_freq == 0:
-            fundamental_freq = 60.0
+        if sweep is None:
+            sweep = run_harmonic_sweep(orders)
 
         harmonic_voltages: dict[int, dict[str, Any]] = {}
-        errors: list[str] = []
+        errors: list[str] = list(sweep.get("errors", []))
         thd_magnitudes: dict[int, float] = {}
 
-        # Set solution mode to Harmonic using Text command
-        dss.Text.Command("Set Mode=Harmonic")
-
-        # Scan each harmonic order
+        # Read this bus out of every solved order
         for order in orders:
-            try:
-                # Set harmonic order and solve using Text commands
-                dss.Text.Command(f"Set Harmonic={order}")
-                frequency_hz = order * fundamental_freq
-                dss.Text.Command("Solve")
+            if order not in sweep["orders"]:
+                continue
 
-                if not dss.Solution.Converged():
-                    logger.warning(f"Solution did not converge at order {order}")
-                    errors.append(
-                        f"Solution did not converge at harmonic order {order}"
-                    )
-                    continue
-
-                # Get voltages at the bus
-                dss.Circuit.SetActiveBus(bus_id)
-                voltages_pu = dss.Bus.puVmagAngle()[
-                    ::2
-                ]  # Get magnitudes only (every other value)
+            voltages_pu = sweep["bus_voltages"][order].get(bus_id.lower())
 
-                if not voltages_pu:
-                    logger.warning(
-                        f"No voltage data available for bus {bus_id} at order {order}"
-                    )
-                    continue
+            if not voltages_pu:
+                logger.warning(
+                    f"No voltage data available for bus {bus_id} at order {order}"
+                )
+                continue
 
-                # Calculate average voltage across phases
-                avg_voltage = sum(voltages_pu) / len(voltages_pu)
+            # Calculate average voltage across phases
+            avg_voltage = sum(voltages_pu) / len(voltages_pu)
 
-                harmonic_voltages[order] = {
-                    "order": order,
-                    "frequency_hz": round(frequency_hz, 2),
-                    "voltages_pu": [round(v, 6) for v in voltages_pu],
-                    "avg_voltage_pu": round(avg_voltage, 6),
-                }
-
-                # Store for THD calculation
-                thd_magnitudes[order] = avg_voltage
-
-            except Exception as e:
-                error_msg = f"Error getting voltages at order {order}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+            harmonic_voltages[order] = {
+                "order": order,
+                "frequency_hz": sweep["frequencies_hz"][order],
+                "voltages_pu": [round(v, 6) for v in voltages_pu],
+                "avg_voltage_pu": round(avg_voltage, 6),
+            }
 
-        # Restore original solution mode
-        try:
-            dss.Solution.Mode(original_mode)
-        except Exception as e:
-            logger.warning(f"Could not restore original solution mode: {e}")
+            # Store for THD calculation
+            thd_magnitudes[order] = avg_voltage
 
         # Calculate THD
         thd_percent = calculate_thd(thd_magnitudes)
@@ -363,19 +566,25 @@ def get_harmonic_voltages(
 
 
 def get_harmonic_currents(
-    line_id: str, orders: list[int] | None = None
+    line_id: str,
+    orders: list[int] | None = None,
+    sweep: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Get current magnitudes at each harmonic order for a specific line.
 
-    This function runs a frequency scan and extracts current magnitudes
-    flowing through the specified line for each harmonic order. Results include
-    per-phase currents and calculated THD.
+    This function is a view over run_harmonic_sweep(): it extracts the current
+    magnitudes flowing through the specified line for each harmonic order from
+    a sweep of the whole circuit. Results include per-phase currents and
+    calculated THD. Pass an existing sweep to analyze many lines without
+    solving again.
 
     Args:
         line_id: Identifier of the line to analyze
         orders: List of harmonic orders to analyze (e.g., [1, 3, 5, 7, 9, 11, 13]).
                 Default is [1, 3, 5, 7, 9, 11, 13] if not specified.
                 Order 1 (fundamental) is required for THD calculation.
+        sweep: Optional result of run_harmonic_sweep() to read from. If None,
+               a new sweep is run for the requested orders.
 
     Returns:
         Dictionary containing:
@@ -420,10 +629,8 @@ def get_harmonic_currents(
             }
 
         # Validate line exists (handle "Line." prefix)
-        line_name = line_id.replace("Line.", "").replace("line.", "")
-        all_lines = [line.lower() for line in dss.Lines.AllNames()]
-
-        if line_name.lower() not in all_lines:
+        line_name = get_name_index().resolve_element("line", line_id)
+        if line_name is None:
             return {
                 "success": False,
                 "line_id": line_id,
@@ -433,77 +640,42 @@ def get_harmonic_currents(
                 "errors": [f"Line '{line_id}' not found in circuit"],
             }
 
-        # Store original solution mode
-        original_mode = dss.Solution.Mode()
-
-        # Get fundamental frequency
-        fundamental_freq = dss.Solution.Frequency()
-        if fundamental_freq == 0:
-            fundamental_freq = 60.0
+        if sweep is None:
+            sweep = run_harmonic_sweep(orders)
 
         harmonic_currents: dict[int, dict[str, Any]] = {}
-        errors: list[str] = []
+        errors: list[str] = list(sweep.get("errors", []))
         thd_magnitudes: dict[int, float] = {}
 
-        # Set solution mode to Harmonic using Text command
-        dss.Text.Command("Set Mode=Harmonic")
-
-        # Scan each harmonic order
+        # Read this line out of every solved order
         for order in orders:
-            try:
-                # Set harmonic order and solve using Text commands
-                dss.Text.Command(f"Set Harmonic={order}")
-                frequency_hz = order * fundamental_freq
-                dss.Text.Command("Solve")
+            if order not in sweep["orders"]:
+                continue
 
-                if not dss.Solution.Converged():
-                    logger.warning(f"Solution did not converge at order {order}")
-                    errors.append(
-                        f"Solution did not converge at harmonic order {order}"
-                    )
-                    continue
-
-                # Get currents through the line
-                dss.Circuit.SetActiveElement(f"Line.{line_name}")
-                currents_mag_ang = dss.CktElement.CurrentsMagAng()
-
-                if not currents_mag_ang:
-                    logger.warning(
-                        f"No current data available for line {line_id} at order {order}"
-                    )
-                    continue
-
-                # Extract magnitudes only (every other value in the interleaved mag/angle array)
-                currents_amps = [
-                    currents_mag_ang[i] for i in range(0, len(currents_mag_ang), 2)
-                ]
-
-                if not currents_amps:
-                    continue
-
-                # Get maximum current across phases
-                max_current = max(currents_amps)
-
-                harmonic_currents[order] = {
-                    "order": order,
-                    "frequency_hz": round(frequency_hz, 2),
-                    "currents_amps": [round(c, 4) for c in currents_amps],
-                    "max_current_amps": round(max_current, 4),
-                }
-
-                # Store for THD calculation (use max current)
-                thd_magnitudes[order] = max_current
-
-            except Exception as e:
-                error_msg = f"Error getting currents at order {order}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+            order_currents = {
+                name.lower(): currents
+                for name, currents in sweep["line_currents"][order].items()
+            }
+            currents_amps = order_currents.get(line_name.lower())
+
+            if not currents_amps:
+                logger.warning(
+                    f"No current data available for line {line_id} at order {order}"
+                )
+                continue
+
+            # Get maximum current across phases
+            max_current = max(currents_amps)
+
+            harmonic_currents[order] = {
+                "order": order,
+                "frequency_hz": sweep["frequencies_hz"][order],
+                "currents_amps": [round(c, 4) for c in currents_amps],
+                "max_current_amps": round(max_current, 4),
+            }
 
-        # Restore original solution mode
-        try:
-            dss.Solution.Mode(original_mode)
-        except Exception as e:
-            logger.warning(f"Could not restore original solution mode: {e}")
+            # Store for THD calculation (use max current)
+            thd_magnitudes[order] = max_current
 
         # Calculate THD
         thd_percent = calculate_thd(thd_magnitudes)
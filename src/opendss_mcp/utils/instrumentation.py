@@ -0,0 +1,403 @@
+"""
+Timing and OpenDSS call counting for tool invocations.
+
+Every MCP tool call is recorded as one invocation with its wall time, the
+time spent in each instrumented phase and the number of OpenDSS API calls it
+made. The phases are:
+
+- compile: compiling a feeder's DSS script
+- solve: power flow solutions (PowerFlowSolver)
+- extract: bulk reads of voltages, powers and line loadings
+- harmonics: harmonic sweeps
+- plot: drawing figures
+- serialize: writing results to disk or encoding images
+
+Phases can nest (a harmonic sweep contains solves); each phase's time is
+counted on its own. OpenDSS calls are counted by a thin proxy in front of
+the CFFI library shared by all opendssdirect interfaces, so every call made
+through opendssdirect is seen, whichever module makes it. The proxy is
+installed when the first invocation starts, so importing this module does not
+load the OpenDSS engine.
+
+Invocations are aggregated per tool with streaming statistics and reported by
+Instrumentation.stats(). With OPENDSS_MCP_RESPONSE_TIMINGS=1 the server also
+adds each invocation's record to the response as metadata.timings.
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from .online_stats import RunningStats
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Instrumented phases, in reporting order
+PHASES = ["compile", "solve", "extract", "harmonics", "plot", "serialize"]
+
+# Environment variable that adds metadata.timings to tool responses
+RESPONSE_TIMINGS_ENV = "OPENDSS_MCP_RESPONSE_TIMINGS"
+
+# Record of the invocation running in the current thread or task
+_current_record: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar("opendss_mcp_invocation", default=None)
+)
+
+
+class _CountingLib:
+    """Proxy of the OpenDSS CFFI library that counts function lookups.
+
+    opendssdirect interfaces look up a library function for every API call
+    (self._lib.Loads_Get_kW()), so the number of lookups is the number of
+    calls.
+    """
+
+    __slots__ = ("lib", "count")
+
+    def __init__(self, lib: Any) -> None:
+        self.lib = lib
+        self.count = 0
+
+    def __getattr__(self, name: str) -> Any:
+        self.count += 1
+        return getattr(self.lib, name)
+
+
+_api_counter: Optional[_CountingLib] = None
+_install_lock = threading.Lock()
+
+
+def install_api_counter() -> None:
+    """Route all opendssdirect interfaces through the counting proxy.
+
+    Safe to call more than once; only the first call installs the proxy.
+    """
+    global _api_counter
+    if _api_counter is not None:
+        return
+    import opendssdirect as dss
+
+    with _install_lock:
+        if _api_counter is not None:
+            return
+        interfaces = [
+            getattr(dss, name)
+            for name in dir(dss)
+            if not name.startswith("_") and hasattr(getattr(dss, name), "_lib")
+        ]
+        if not interfaces:
+            return
+        counter = _CountingLib(interfaces[0]._lib)
+        for interface in interfaces:
+            if interface._lib is counter.lib:
+                # Interfaces freeze their attributes after initialization
+                object.__setattr__(interface, "_lib", counter)
+        _api_counter = counter
+    logger.debug(f"Counting OpenDSS calls of {len(interfaces)} interfaces")
+
+
+def api_call_count() -> int:
+    """Number of OpenDSS API calls made in this process so far.
+
+    Returns:
+        Call count (0 if the counter is not installed)
+    """
+    return _api_counter.count if _api_counter is not None else 0
+
+
+class _ToolStats:
+    """Aggregated statistics of one tool's invocations."""
+
+    def __init__(self) -> None:
+        self.errors = 0
+        self.duration_ms = RunningStats(quantiles=(0.5, 0.95))
+        self.api_calls = 0
+        self.phases_ms: Dict[str, float] = {}
+        self.phase_counts: Dict[str, int] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.duration_ms.update(record["total_ms"], self.duration_ms.count)
+        self.errors += not record["success"]
+        self.api_calls += record["api_calls"]
+        for phase, elapsed_ms in record["phases_ms"].items():
+            self.phases_ms[phase] = self.phases_ms.get(phase, 0.0) + elapsed_ms
+        for phase, count in record["phase_counts"].items():
+            self.phase_counts[phase] = self.phase_counts.get(phase, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        calls = self.duration_ms.count
+        total_ms = self.duration_ms.total
+        return {
+            "calls": calls,
+            "errors": self.errors,
+            "duration_ms": self.duration_ms.summary(digits=3, time_label="call"),
+            "total_ms": round(total_ms, 3),
+            "phases_ms": {
+                phase: round(self.phases_ms[phase], 3)
+                for phase in PHASES
+                if phase in self.phases_ms
+            },
+            "phase_counts": {
+                phase: self.phase_counts[phase]
+                for phase in PHASES
+                if phase in self.phase_counts
+            },
+            "untracked_ms": round(max(0.0, total_ms - sum(self.phases_ms.values())), 3),
+            "api_calls": self.api_calls,
+            "api_calls_per_call": round(self.api_calls / calls, 1) if calls else 0.0,
+        }
+
+
+class Instrumentation:
+    """Collect per-invocation timings and aggregate them per tool.
+
+    Attributes:
+        response_timings: Whether responses carry metadata.timings
+
+    Example:
+        >>> with instrumentation.invocation("run_power_flow_analysis") as record:
+        ...     with instrumentation.phase("solve"):
+        ...         dss.Solution.Solve()
+        >>> record["phases_ms"]["solve"], record["api_calls"]
+        >>> instrumentation.stats()["tools"]["run_power_flow_analysis"]["calls"]
+        1
+    """
+
+    def __init__(self, response_timings: Optional[bool] = None) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            response_timings: Add metadata.timings to responses (default:
+                from the OPENDSS_MCP_RESPONSE_TIMINGS environment variable)
+        """
+        if response_timings is None:
+            response_timings = os.environ.get(RESPONSE_TIMINGS_ENV, "") not in (
+                "",
+                "0",
+                "false",
+            )
+        self.response_timings = response_timings
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all aggregated statistics."""
+        with self._lock:
+            self._tools: Dict[str, _ToolStats] = {}
+            self._since = time.time()
+
+    @contextmanager
+    def invocation(self, tool: str) -> Iterator[Dict[str, Any]]:
+        """Record one tool invocation.
+
+        Phases entered while the invocation runs (in the same thread or task)
+        are added to its record. Set record["success"] to False for a failed
+        call; an exception also marks it failed.
+
+        Args:
+            tool: Tool name
+
+        Yields:
+            Record with tool, total_ms, phases_ms, phase_counts, api_calls
+            and success (totals are filled in when the block ends)
+        """
+        record: Dict[str, Any] = {
+            "tool": tool,
+            "total_ms": 0.0,
+            "phases_ms": {},
+            "phase_counts": {},
+            "api_calls": 0,
+            "success": True,
+        }
+        install_api_counter()
+        token = _current_record.set(record)
+        calls_before = api_call_count()
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record["success"] = False
+            raise
+        finally:
+            record["total_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+            # Calls made in session processes are added by add_to_current()
+            record["api_calls"] += api_call_count() - calls_before
+            record["phases_ms"] = {
+                phase: round(elapsed, 3)
+                for phase, elapsed in record["phases_ms"].items()
+            }
+            _current_record.reset(token)
+            with self._lock:
+                self._tools.setdefault(tool, _ToolStats()).add(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the current invocation.
+
+        Outside an invocation the block runs untimed.
+
+        Args:
+            name: Phase name (one of PHASES)
+        """
+        record = _current_record.get()
+        if record is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            record["phases_ms"][name] = record["phases_ms"].get(name, 0.0) + elapsed_ms
+            record["phase_counts"][name] = record["phase_counts"].get(name, 0) + 1
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """Decorator that times every call of a function as a phase.
+
+        Args:
+            name: Phase name (one of PHASES)
+
+        Returns:
+            Decorator
+        """
+
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.phase(name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def add_to_current(self, record: Dict[str, Any]) -> None:
+        """Add an invocation recorded elsewhere (e.g. in a session process) to the current one.
+
+        Args:
+            record: Invocation record with phases_ms, phase_counts and api_calls
+        """
+        current = _current_record.get()
+        if current is None:
+            return
+        for phase, elapsed_ms in record["phases_ms"].items():
+            current["phases_ms"][phase] = (
+                current["phases_ms"].get(phase, 0.0) + elapsed_ms
+            )
+        for phase, count in record["phase_counts"].items():
+            current["phase_counts"][phase] = (
+                current["phase_counts"].get(phase, 0) + count
+            )
+        current["api_calls"] += record["api_calls"]
+
+    def tool(self, name: Optional[str] = None) -> Callable[[F], F]:
+        """Decorator that records every call of an MCP tool as an invocation.
+
+        A response with success False counts as an error. When
+        response_timings is set, successful responses get the invocation's
+        total_ms, phases_ms and api_calls as metadata.timings. Works for plain
+        and async functions and keeps the signature MCP reads the tool
+        schema from.
+
+        Args:
+            name: Tool name (default: the function name)
+
+        Returns:
+            Decorator
+        """
+
+        def succeeded(result: Any) -> bool:
+            return not (isinstance(result, dict) and result.get("success") is False)
+
+        def add_timings(record: Dict[str, Any], result: Any) -> None:
+            if self.response_timings and record["success"] and isinstance(result, dict):
+                result["metadata"] = {
+                    **(result.get("metadata") or {}),
+                    "timings": {
+                        "total_ms": record["total_ms"],
+                        "phases_ms": record["phases_ms"],
+                        "api_calls": record["api_calls"],
+                    },
+                }
+
+        def decorator(func: F) -> F:
+            tool_name = name or func.__name__
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with self.invocation(tool_name) as record:
+                        result = await func(*args, **kwargs)
+                        record["success"] = succeeded(result)
+                    add_timings(record, result)
+                    return result
+
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.invocation(tool_name) as record:
+                    result = func(*args, **kwargs)
+                    record["success"] = succeeded(result)
+                add_timings(record, result)
+                return result
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregated statistics of every tool invoked since the last reset.
+
+        Returns:
+            Dictionary with since (timestamp), total api_calls and per-tool
+            calls, errors, duration_ms statistics (mean, p50, p95, max),
+            phases_ms, untracked_ms and api_calls
+        """
+        with self._lock:
+            tools = {name: stats.summary() for name, stats in self._tools.items()}
+            since = self._since
+        return {
+            "since": since,
+            "api_calls_total": api_call_count(),
+            "tools": tools,
+        }
+
+
+# Instrumentation of this process
+instrumentation = Instrumentation()
+
+
+class RecordedCall:
+    """Picklable wrapper that runs a tool function as an invocation.
+
+    Used to time tool functions inside session processes: the call returns
+    the function's result together with its invocation record, which the
+    server merges into its own invocation with Instrumentation.add_to_current().
+
+    Attributes:
+        func: Module-level function to run
+    """
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+        self.__name__ = getattr(func, "__name__", str(func))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the function.
+
+        Returns:
+            Tuple of (return value of func, invocation record)
+        """
+        with instrumentation.invocation(self.__name__) as record:
+            result = self.func(*args, **kwargs)
+        return result, record
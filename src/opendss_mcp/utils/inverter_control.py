@@ -229,6 +229,64 @@ def configure_volt_var_control(
         raise RuntimeError(error_msg)
 
 
+def update_volt_var_control(
+    pv_name: str,
+    curve_points: list[tuple[float, float]],
+    response_time: float = 10.0,
+    curve_name: str | None = None,
+) -> None:
+    """Apply a new curve and response time to an existing volt-var control.
+
+    configure_volt_var_control() creates the XYCurve and InvControl; this
+    function edits both in place (and re-enables the InvControl), so a
+    controller that is reused for another study runs with the new settings
+    instead of the ones it was created with.
+
+    Args:
+        pv_name: Name of the controlled PVSystem (without "PVSystem." prefix)
+        curve_points: List of (voltage_pu, var_pu) tuples defining the curve
+        response_time: Response time in seconds for reactive power changes (default: 10.0)
+        curve_name: Name of the XYCurve. If None, derived from pv_name as in
+                    configure_volt_var_control().
+
+    Returns:
+        None
+    """
+    try:
+        if curve_name is None:
+            curve_name = f"vv_{pv_name}"
+
+        if len(curve_points) < 2:
+            raise ValueError("Curve must have at least 2 points")
+
+        x_array_str = "[" + ", ".join(f"{x:.6f}" for x, _ in curve_points) + "]"
+        y_array_str = "[" + ", ".join(f"{y:.6f}" for _, y in curve_points) + "]"
+        dss.Text.Command(
+            f"Edit XYCurve.{curve_name} "
+            f"npts={len(curve_points)} "
+            f"xarray={x_array_str} "
+            f"yarray={y_array_str}"
+        )
+
+        delta_q_factor = min(1.0, max(0.01, 1.0 / response_time))
+        dss.Text.Command(
+            f"Edit InvControl.InvCtrl_{pv_name} "
+            f"vvc_curve1={curve_name} "
+            f"DeltaQ_Factor={delta_q_factor:.4f} "
+            f"enabled=yes"
+        )
+
+        logger.info(
+            f"Volt-var control updated for {pv_name} "
+            f"(curve: {curve_name}, response: {response_time}s)"
+        )
+
+    except Exception as e:
+        error_msg = f"Error updating volt-var control for {pv_name}: {e}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+
 def configure_volt_watt_control(
     pv_name: str, curve_points: list[tuple[float, float]], curve_name: str | None = None
 ) -> None:
@@ -0,0 +1,357 @@
+"""
+Background jobs for long-running studies.
+
+A year-long time-series run or a large placement study can take minutes. Run
+inline, it blocks the stdio server and can't be stopped. A job runs the
+same tool function in a spawned worker process instead. The caller gets a job
+ID right away and polls for status, progress and the result.
+
+Jobs without a session compile their own copy of the feeder currently loaded
+through load_feeder (same feeder ID and modifications). Jobs with a session
+run in that session's process against its circuit. Progress is reported by
+the tool through its progress_callback and shared with the server through a
+multiprocessing manager. Cancellation is cooperative: the next progress
+report of a cancelled job raises JobCancelled inside the worker.
+
+Finished jobs hold their full result in memory, so they are not kept
+forever: whenever a job is submitted, finished jobs older than
+JOB_MAX_AGE_S are dropped, then the oldest finished ones beyond
+MAX_FINISHED_JOBS.
+"""
+
+import atexit
+import inspect
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .sessions import session_manager
+
+logger = logging.getLogger(__name__)
+
+# Job states reported by JobManager.status()
+JOB_STATES = ["pending", "running", "cancelling", "completed", "failed", "cancelled"]
+
+# Default number of jobs running at the same time outside sessions
+DEFAULT_MAX_JOBS = 2
+
+# Minimum seconds between progress updates sent from a worker
+PROGRESS_INTERVAL_S = 0.2
+
+# Seconds a finished job and its result are kept
+JOB_MAX_AGE_S = 3600.0
+
+# Number of finished jobs kept, newest first
+MAX_FINISHED_JOBS = 20
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's worker when the job has been cancelled."""
+
+
+def _run_job(
+    job_id: str,
+    func: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    feeder: Optional[Dict[str, Any]],
+    progress: Any,
+    cancelled: Any,
+) -> Any:
+    """Run a tool function as a job inside a worker process.
+
+    Args:
+        job_id: Identifier of the job
+        func: Module-level tool function
+        kwargs: Keyword arguments for func
+        feeder: Feeder to compile first ({"feeder_id", "modifications"}),
+            or None to use the circuit already in the process (sessions)
+        progress: Shared mapping of job ID to progress information
+        cancelled: Shared mapping of cancelled job IDs
+
+    Returns:
+        Return value of func
+    """
+    progress[job_id] = {"started_at": time.time(), "done": 0, "total": None}
+    if cancelled.get(job_id):
+        raise JobCancelled(f"Job {job_id} was cancelled")
+
+    if feeder is not None:
+        from ..tools.feeder_loader import load_ieee_test_feeder
+
+        loaded = load_ieee_test_feeder(feeder["feeder_id"], feeder["modifications"])
+        if not loaded.get("success", False):
+            return loaded
+
+    last_report = [0.0]
+
+    def report(done: int, total: Optional[int]) -> None:
+        now = time.monotonic()
+        if now - last_report[0] < PROGRESS_INTERVAL_S and done != total:
+            return
+        last_report[0] = now
+        if cancelled.get(job_id):
+            raise JobCancelled(f"Job {job_id} was cancelled")
+        progress[job_id] = {**progress[job_id], "done": done, "total": total}
+
+    if "progress_callback" in inspect.signature(func).parameters:
+        kwargs = {**kwargs, "progress_callback": report}
+    return func(**kwargs)
+
+
+class _Job:
+    """Bookkeeping of one submitted job."""
+
+    def __init__(
+        self, job_id: str, tool: str, session_id: Optional[str], future: Future
+    ) -> None:
+        self.job_id = job_id
+        self.tool = tool
+        self.session_id = session_id
+        self.future = future
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_requested = False
+
+
+class JobManager:
+    """Submit tool functions as background jobs and track them.
+
+    Attributes:
+        max_workers: Number of jobs run at the same time outside sessions
+
+    Example:
+        >>> jobs = JobManager()
+        >>> job_id = jobs.submit("run_timeseries", run_time_series_simulation,
+        ...                      {"load_profile": "residential_summer",
+        ...                       "duration_hours": 8760},
+        ...                      feeder={"feeder_id": "IEEE13", "modifications": None})
+        >>> jobs.status(job_id)["progress"]
+        {'done': 1200, 'total': 8760, 'percent': 13.7}
+        >>> result = jobs.result(job_id)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_JOBS) -> None:
+        """Initialize the manager; processes are started on first submit.
+
+        Args:
+            max_workers: Number of jobs run at the same time outside sessions
+        """
+        self.max_workers = max_workers
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._sync: Any = None
+        self._progress: Any = None
+        self._cancelled: Any = None
+
+    def _start(self) -> None:
+        """Start the worker pool and the shared progress store."""
+        if self._executor is not None:
+            return
+        context = multiprocessing.get_context("spawn")
+        self._sync = context.Manager()
+        self._progress = self._sync.dict()
+        self._cancelled = self._sync.dict()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=context
+        )
+
+    def submit(
+        self,
+        tool: str,
+        func: Callable[..., Any],
+        kwargs: Dict[str, Any],
+        feeder: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """Start a tool function as a job.
+
+        Args:
+            tool: Tool name reported in the job status
+            func: Module-level tool function
+            kwargs: Keyword arguments for func
+            feeder: Feeder the job compiles before running (jobs without a session)
+            session_id: Session to run the job in, instead of the job pool
+
+        Returns:
+            Identifier of the new job
+
+        Raises:
+            ValueError: If neither a feeder nor a session is given, or the
+                session does not exist
+        """
+        if feeder is None and session_id is None:
+            raise ValueError("A job needs a loaded feeder or a session")
+
+        self.prune()
+        job_id = f"job-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._start()
+            args = (job_id, func, kwargs, feeder, self._progress, self._cancelled)
+            if session_id is None:
+                future = self._executor.submit(_run_job, *args)
+            else:
+                future = session_manager.submit(session_id, _run_job, *args)
+            job = _Job(job_id, tool, session_id, future)
+            self._jobs[job_id] = job
+
+        future.add_done_callback(lambda _: setattr(job, "finished_at", time.time()))
+        logger.info(f"Submitted {tool} as {job_id}")
+        return job_id
+
+    def _get(self, job_id: str) -> _Job:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job '{job_id}'")
+        return job
+
+    def _state(self, job: _Job) -> str:
+        future = job.future
+        if future.cancelled():
+            return "cancelled"
+        if future.done():
+            if job.cancel_requested:
+                return "cancelled"
+            return "failed" if future.exception() is not None else "completed"
+        if job.cancel_requested:
+            return "cancelling"
+        return "running" if job.job_id in self._progress else "pending"
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Report the state and progress of a job.
+
+        Args:
+            job_id: Identifier of the job
+
+        Returns:
+            Dictionary with job_id, tool, session_id, state, progress
+            ({"done", "total", "percent"}), timestamps and error (if failed)
+
+        Raises:
+            ValueError: If the job does not exist
+        """
+        job = self._get(job_id)
+        state = self._state(job)
+        info = self._progress.get(job_id) or {}
+        done, total = info.get("done", 0), info.get("total")
+        status = {
+            "job_id": job_id,
+            "tool": job.tool,
+            "session_id": job.session_id,
+            "state": state,
+            "progress": {
+                "done": done,
+                "total": total,
+                "percent": round(100.0 * done / total, 1) if total else None,
+            },
+            "submitted_at": job.submitted_at,
+            "started_at": info.get("started_at"),
+            "finished_at": job.finished_at,
+            "error": None,
+        }
+        if state == "failed":
+            status["error"] = str(job.future.exception())
+        return status
+
+    def result(self, job_id: str) -> Any:
+        """Return the result of a completed job.
+
+        Args:
+            job_id: Identifier of the job
+
+        Returns:
+            Return value of the tool function
+
+        Raises:
+            ValueError: If the job does not exist or has not completed
+        """
+        job = self._get(job_id)
+        state = self._state(job)
+        if state != "completed":
+            detail = f": {job.future.exception()}" if state == "failed" else ""
+            raise ValueError(f"Job {job_id} is {state}{detail}")
+        return job.future.result()
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a pending or running job.
+
+        Pending jobs are removed from the queue. Running jobs stop at their
+        next progress report.
+
+        Args:
+            job_id: Identifier of the job
+
+        Returns:
+            Status of the job after the request
+
+        Raises:
+            ValueError: If the job does not exist
+        """
+        job = self._get(job_id)
+        if not job.future.done():
+            job.cancel_requested = True
+            self._cancelled[job_id] = True
+            job.future.cancel()
+            logger.info(f"Cancellation requested for {job_id}")
+        return self.status(job_id)
+
+    def prune(
+        self,
+        max_age_s: float = JOB_MAX_AGE_S,
+        max_finished: int = MAX_FINISHED_JOBS,
+    ) -> List[str]:
+        """Forget finished jobs that are too old or too many.
+
+        Jobs that finished more than max_age_s ago are dropped, then the
+        oldest finished jobs until at most max_finished remain. Pending and
+        running jobs are always kept.
+
+        Args:
+            max_age_s: Seconds a finished job is kept (default: 3600)
+            max_finished: Number of finished jobs kept (default: 20)
+
+        Returns:
+            Identifiers of the dropped jobs
+        """
+        oldest_kept = time.time() - max_age_s
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.finished_at is not None),
+                key=lambda job: job.finished_at,
+                reverse=True,
+            )
+            dropped = [
+                job.job_id
+                for rank, job in enumerate(finished)
+                if rank >= max_finished or job.finished_at < oldest_kept
+            ]
+            for job_id in dropped:
+                del self._jobs[job_id]
+                self._progress.pop(job_id, None)
+                self._cancelled.pop(job_id, None)
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} finished jobs")
+        return dropped
+
+    def info(self) -> List[Dict[str, Any]]:
+        """Status of every job, oldest first."""
+        with self._lock:
+            job_ids = list(self._jobs)
+        return [self.status(job_id) for job_id in job_ids]
+
+    def shutdown(self) -> None:
+        """Cancel pending jobs and stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._sync.shutdown()
+            self._executor = None
+
+
+# Jobs of the server process
+job_manager = JobManager()
+atexit.register(job_manager.shutdown)
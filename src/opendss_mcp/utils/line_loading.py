@@ -0,0 +1,275 @@
+"""
+Whole-circuit line loading backed by NumPy arrays.
+
+This module reads the currents of every line with one bulk OpenDSS call
+(PDElements.AllCurrentsMagAng) and computes per-phase loading percentages
+against the line ratings, instead of activating each line and querying
+CurrentsMagAng/NormalAmps one element at a time. The static parts of the
+computation (line names, conductor layout, normal amps, name->index map) are
+cached between solves and rebuilt when the circuit or its set of PD elements
+changes, or after invalidate_line_layout() (e.g. when line ratings were edited).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import opendssdirect as dss
+
+from .circuit_snapshot import circuit_signature
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# (circuit signature, PD element names, line layout) of the last captured
+# circuit. Replaced as one tuple so concurrent readers never mix two circuits.
+_layout_cache: Optional[Tuple[Tuple[str, int, int, int], List[str], Dict[str, Any]]] = (
+    None
+)
+
+
+def invalidate_line_layout() -> None:
+    """Drop the cached line layout and ratings.
+
+    Call this after editing line ratings (NormAmps, linecodes) in place; the
+    ratings are otherwise read once per layout.
+    """
+    global _layout_cache
+    _layout_cache = None
+
+
+def _build_layout(engine: Any, pd_names: List[str]) -> Dict[str, Any]:
+    """Locate every line inside the bulk PD element arrays and read its rating.
+
+    Args:
+        engine: OpenDSS interface to read from
+        pd_names: PD element names from PDElements.AllNames()
+
+    Returns:
+        Dictionary with line names, offsets, conductor/terminal counts, normal
+        amps and the name->index map
+    """
+    conductors = np.asarray(engine.PDElements.AllNumConductors(), dtype=int)
+    terminals = np.asarray(engine.PDElements.AllNumTerminals(), dtype=int)
+    sizes = conductors * terminals
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(int)
+
+    # Ratings are static, so read them once per layout
+    ratings: Dict[str, float] = {}
+    if engine.Lines.First() > 0:
+        while True:
+            ratings[engine.Lines.Name().lower()] = float(engine.Lines.NormAmps())
+            if not engine.Lines.Next() > 0:
+                break
+
+    names: List[str] = []
+    line_offsets: List[int] = []
+    line_conductors: List[int] = []
+    line_terminals: List[int] = []
+    normal_amps: List[float] = []
+    for name, offset, n_cond, n_term in zip(pd_names, offsets, conductors, terminals):
+        element_class, _, line_name = name.partition(".")
+        if element_class.lower() != "line" or n_cond == 0:
+            continue
+        names.append(line_name)
+        line_offsets.append(int(offset))
+        line_conductors.append(int(n_cond))
+        line_terminals.append(int(n_term))
+        normal_amps.append(ratings.get(line_name.lower(), 0.0))
+
+    return {
+        "names": names,
+        "offsets": np.asarray(line_offsets, dtype=int),
+        "conductors": np.asarray(line_conductors, dtype=int),
+        "terminals": np.asarray(line_terminals, dtype=int),
+        "normal_amps": np.asarray(normal_amps, dtype=float),
+        "index": {name.lower(): i for i, name in enumerate(names)},
+        "max_conductors": max(line_conductors, default=0),
+    }
+
+
+def _gather_indices(layout: Dict[str, Any]) -> np.ndarray:
+    """Build a (lines x terminals x conductors) index into the magnitude array.
+
+    Positions past a line's own conductor/terminal count point at a trailing
+    NaN sentinel appended to the magnitudes.
+
+    Args:
+        layout: Line layout produced by _build_layout()
+
+    Returns:
+        Integer index array with -1 for padded positions
+    """
+    n_lines = len(layout["names"])
+    max_cond = layout["max_conductors"]
+    max_term = int(layout["terminals"].max()) if n_lines else 0
+    index = np.full((n_lines, max_term, max_cond), -1, dtype=int)
+    for i in range(n_lines):
+        n_cond = layout["conductors"][i]
+        n_term = layout["terminals"][i]
+        block = layout["offsets"][i] + np.arange(n_term * n_cond).reshape(
+            n_term, n_cond
+        )
+        index[i, :n_term, :n_cond] = block
+    return index
+
+
+class LineLoadings:
+    """Per-phase current and loading of every line as NumPy arrays.
+
+    A phase current is the larger of the two terminal currents on that
+    conductor, so the maximum over phases equals the maximum magnitude of
+    CktElement.CurrentsMagAng() used by the per-line code paths.
+
+    Attributes:
+        names: Line names (without the "Line." prefix) in circuit order
+        normal_amps: Normal ampacity of each line
+        phase_currents: (lines x conductors) current magnitudes, NaN padded
+        max_current: Maximum conductor current of each line
+        powers: Optional (lines x 2) array of summed |P| (kW) and |Q| (kvar)
+    """
+
+    def __init__(
+        self,
+        layout: Dict[str, Any],
+        phase_currents: np.ndarray,
+        powers: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize from a cached layout and the gathered currents.
+
+        Args:
+            layout: Line layout produced by _build_layout()
+            phase_currents: (lines x conductors) current magnitudes
+            powers: Optional (lines x 2) array of summed |P| and |Q|
+        """
+        self.names: List[str] = layout["names"]
+        self.normal_amps: np.ndarray = layout["normal_amps"]
+        self.phase_currents = phase_currents
+        self.powers = powers
+        self._index: Dict[str, int] = layout["index"]
+        if phase_currents.size:
+            self.max_current = np.nanmax(phase_currents, axis=1)
+        else:
+            self.max_current = np.zeros(len(self.names))
+
+    @classmethod
+    @instrumentation.timed("extract")
+    def capture(
+        cls,
+        engine: Optional[Any] = None,
+        include_powers: bool = False,
+        reuse_layout: bool = False,
+    ) -> "LineLoadings":
+        """Capture currents (and optionally powers) of all lines.
+
+        Args:
+            engine: OpenDSS interface to read from (default: opendssdirect)
+            include_powers: Also read PDElements.AllPowers() (default: False)
+            reuse_layout: Use the cached layout without re-reading the PD
+                element names while the circuit signature is unchanged. Only
+                valid when the caller knows that no PD element was replaced
+                since the last capture; saves the name read on large feeders
+                (default: False)
+
+        Returns:
+            LineLoadings of the current solution
+        """
+        global _layout_cache
+        engine = engine if engine is not None else dss
+
+        signature = circuit_signature(engine)
+        cached = _layout_cache
+        if cached is not None and cached[0] != signature:
+            cached = None
+
+        if reuse_layout and cached is not None:
+            layout = cached[2]
+        else:
+            pd_names = list(engine.PDElements.AllNames())
+            if cached is not None and cached[1] == pd_names:
+                layout = cached[2]
+            else:
+                layout = _build_layout(engine, pd_names)
+                layout["gather"] = _gather_indices(layout)
+                _layout_cache = (signature, pd_names, layout)
+
+        magnitudes = np.asarray(engine.PDElements.AllCurrentsMagAng(), dtype=float)
+        magnitudes = np.append(magnitudes[0::2], np.nan)
+        # (lines x terminals x conductors) -> larger terminal current per conductor
+        gathered = magnitudes[layout["gather"]]
+        with np.errstate(invalid="ignore"):
+            if gathered.size:
+                phase_currents = np.fmax.reduce(gathered, axis=1)
+            else:
+                phase_currents = np.zeros((len(layout["names"]), 0))
+
+        powers = None
+        if include_powers:
+            values = np.append(
+                np.abs(np.asarray(engine.PDElements.AllPowers(), dtype=float)), 0.0
+            )
+            gather = layout["gather"].reshape(len(layout["names"]), -1)
+            powers = np.stack(
+                [
+                    values[np.where(gather >= 0, 2 * gather, -1)].sum(axis=1),
+                    values[np.where(gather >= 0, 2 * gather + 1, -1)].sum(axis=1),
+                ],
+                axis=1,
+            )
+
+        return cls(layout, phase_currents, powers)
+
+    @property
+    def rated(self) -> np.ndarray:
+        """Boolean mask of lines with a positive normal ampacity."""
+        return self.normal_amps > 0
+
+    def loading_pct(self) -> np.ndarray:
+        """Loading of each line in percent of normal amps (NaN if unrated)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.rated, self.max_current / self.normal_amps * 100.0, np.nan
+            )
+
+    def phase_loading_pct(self) -> np.ndarray:
+        """Per-phase loading in percent of normal amps (NaN if unrated/padded)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.rated[:, None],
+                self.phase_currents / self.normal_amps[:, None] * 100.0,
+                np.nan,
+            )
+
+    def index_of(self, line_name: str) -> Optional[int]:
+        """Return the array index of a line (case-insensitive), or None."""
+        return self._index.get(line_name.lower())
+
+    def overloaded(self, threshold_pct: float = 100.0) -> List[Dict[str, Any]]:
+        """List lines loaded above a threshold.
+
+        Args:
+            threshold_pct: Loading threshold in percent (default: 100.0)
+
+        Returns:
+            List of {line, loading_pct} dictionaries in circuit order
+        """
+        loading = self.loading_pct()
+        with np.errstate(invalid="ignore"):
+            rows = np.flatnonzero(loading > threshold_pct)
+        return [
+            {"line": self.names[i], "loading_pct": round(float(loading[i]), 2)}
+            for i in rows
+        ]
+
+    def to_dict(self, values: np.ndarray) -> Dict[str, float]:
+        """Convert a per-line array into a {line_name: value} dictionary.
+
+        Lines without a rating are omitted.
+
+        Args:
+            values: Array with one entry per line
+
+        Returns:
+            Dictionary mapping line names to float values
+        """
+        return {self.names[i]: float(values[i]) for i in np.flatnonzero(self.rated)}
@@ -0,0 +1,479 @@
+"""
+Streaming summary statistics for long simulations.
+
+Time-series studies used to keep every sample (losses, loadings, all bus
+voltages of every step) in lists and summarize them at the end, so memory
+grew with duration x circuit size. The accumulators in this module are
+updated once per step and keep only a fixed amount of state:
+
+- RunningStats: one value per step (e.g. losses). Welford mean/variance,
+  min/max with the time they occurred and P² quantile estimates.
+- VectorStats: many values per step (e.g. every bus voltage). Batches are
+  merged with Chan's parallel variance update and quantiles come from a
+  fixed-bin histogram.
+- ThresholdTimer: steps and hours spent beyond a limit.
+- ElementExtremes: per-element running minimum/maximum with their times.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+def _quantile_key(q: float) -> str:
+    """Summary key of a quantile, e.g. 0.05 -> "p05", 0.999 -> "p99.9"."""
+    percent = q * 100
+    if float(percent).is_integer():
+        return f"p{int(percent):02d}"
+    return f"p{percent:g}"
+
+
+class P2Quantile:
+    """Single-quantile estimator of Jain and Chlamtac's P² algorithm.
+
+    Keeps five markers whose heights are adjusted with a piecewise-parabolic
+    formula as samples arrive, so a quantile of an unbounded stream is
+    estimated in constant memory. The first five samples are stored exactly.
+
+    Attributes:
+        q: Quantile being estimated (0 < q < 1)
+    """
+
+    def __init__(self, q: float) -> None:
+        """Initialize the estimator.
+
+        Args:
+            q: Quantile to estimate, between 0 and 1 (exclusive)
+        """
+        if not 0 < q < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.q = q
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def update(self, value: float) -> None:
+        """Add one sample.
+
+        Args:
+            value: Sample value
+        """
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Find the cell containing the sample, extending the extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - self._positions[i]
+            if (offset >= 1 and self._positions[i + 1] - self._positions[i] > 1) or (
+                offset <= -1 and self._positions[i - 1] - self._positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                self._positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def value(self) -> Optional[float]:
+        """Current quantile estimate (exact for fewer than six samples).
+
+        Returns:
+            Estimated quantile, or None if no sample was added
+        """
+        if not self._heights:
+            return None
+        if len(self._heights) < 5:
+            return float(np.quantile(self._heights, self.q))
+        return float(self._heights[2])
+
+
+class RunningStats:
+    """Summary statistics of a scalar series updated one sample at a time.
+
+    Attributes:
+        count: Number of samples
+        total: Sum of all samples
+        mean: Running mean (Welford)
+        min / max: Extremes, with min_time / max_time when they occurred
+
+    Example:
+        >>> losses = RunningStats()
+        >>> for hour, value in enumerate([10.0, 12.5, 9.8]):
+        ...     losses.update(value, hour)
+        >>> losses.summary()["max_time"]
+        1
+    """
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            quantiles: Quantiles to estimate with P² (default: 5%, 50%, 95%)
+        """
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.min_time: Any = None
+        self.max_time: Any = None
+        self._quantiles = [P2Quantile(q) for q in quantiles]
+
+    def update(self, value: float, time: Any = None) -> None:
+        """Add one sample.
+
+        Args:
+            value: Sample value
+            time: Optional time stamp of the sample (e.g. simulation hour)
+        """
+        value = float(value)
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min:
+            self.min, self.min_time = value, time
+        if self.max is None or value > self.max:
+            self.max, self.max_time = value, time
+        for estimator in self._quantiles:
+            estimator.update(value)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the samples (0 for fewer than two)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    def summary(self, digits: int = 4, time_label: str = "time") -> Dict[str, Any]:
+        """Summarize the samples.
+
+        Args:
+            digits: Decimal places to round values to (default: 4)
+            time_label: Suffix of the time keys, e.g. "hour" for min_hour (default: "time")
+
+        Returns:
+            Dictionary with count, mean, std, min/max with times and quantiles
+        """
+        if not self.count:
+            return {"count": 0}
+        summary = {
+            "count": self.count,
+            "mean": round(self.total / self.count, digits),
+            "std": round(math.sqrt(self.variance), digits),
+            "min": round(self.min, digits),
+            f"min_{time_label}": self.min_time,
+            "max": round(self.max, digits),
+            f"max_{time_label}": self.max_time,
+        }
+        for estimator in self._quantiles:
+            summary[_quantile_key(estimator.q)] = round(estimator.value(), digits)
+        return summary
+
+
+class VectorStats:
+    """Summary statistics of many samples per step (e.g. all bus voltages).
+
+    Each batch is folded in with vectorized NumPy operations. Quantiles are
+    read from a fixed-bin histogram between low and high; samples outside
+    the range fall into the first or last bin.
+
+    Attributes:
+        count: Number of samples
+        min / max: Extremes, with min_time / max_time when they occurred
+    """
+
+    def __init__(
+        self,
+        low: float,
+        high: float,
+        resolution: float,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            low: Lower edge of the histogram
+            high: Upper edge of the histogram
+            resolution: Histogram bin width (quantile resolution)
+            quantiles: Quantiles to report (default: 5%, 50%, 95%)
+        """
+        self.count = 0
+        self.total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.min_time: Any = None
+        self.max_time: Any = None
+        self._low = low
+        self._resolution = resolution
+        self._counts = np.zeros(
+            int(math.ceil((high - low) / resolution)), dtype=np.int64
+        )
+        self._quantiles = list(quantiles)
+
+    def update(self, values: np.ndarray, time: Any = None) -> None:
+        """Add one batch of samples.
+
+        Args:
+            values: Samples of the step
+            time: Optional time stamp of the step
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        # Chan et al. parallel update of mean and M2
+        n = values.size
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total_count = self.count + n
+        delta = batch_mean - self._mean
+        self._mean += delta * n / total_count
+        self._m2 += batch_m2 + delta**2 * self.count * n / total_count
+        self.count = total_count
+        self.total += float(values.sum())
+
+        low, high = float(values.min()), float(values.max())
+        if self.min is None or low < self.min:
+            self.min, self.min_time = low, time
+        if self.max is None or high > self.max:
+            self.max, self.max_time = high, time
+
+        bins = np.clip(
+            ((values - self._low) / self._resolution).astype(int),
+            0,
+            len(self._counts) - 1,
+        )
+        self._counts += np.bincount(bins, minlength=len(self._counts))
+
+    @property
+    def mean(self) -> float:
+        """Mean of all samples."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance of all samples."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile from the histogram.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated quantile (interpolated within its bin), or None if empty
+        """
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = np.cumsum(self._counts)
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        index = min(index, len(self._counts) - 1)
+        before = cumulative[index - 1] if index > 0 else 0
+        in_bin = self._counts[index]
+        fraction = (target - before) / in_bin if in_bin else 0.0
+        estimate = self._low + (index + fraction) * self._resolution
+        return float(min(max(estimate, self.min), self.max))
+
+    def summary(self, digits: int = 4, time_label: str = "time") -> Dict[str, Any]:
+        """Summarize the samples.
+
+        Args:
+            digits: Decimal places to round values to (default: 4)
+            time_label: Suffix of the time keys, e.g. "hour" for min_hour (default: "time")
+
+        Returns:
+            Dictionary with count, mean, std, min/max with times and quantiles
+        """
+        if not self.count:
+            return {"count": 0}
+        summary = {
+            "count": self.count,
+            "mean": round(self.mean, digits),
+            "std": round(math.sqrt(self.variance), digits),
+            "min": round(self.min, digits),
+            f"min_{time_label}": self.min_time,
+            "max": round(self.max, digits),
+            f"max_{time_label}": self.max_time,
+        }
+        for q in self._quantiles:
+            summary[_quantile_key(q)] = round(self.quantile(q), digits)
+        return summary
+
+
+class ThresholdTimer:
+    """Time a quantity spends beyond a limit.
+
+    Attributes:
+        threshold: Limit value
+        above: True to count values above the limit, False for below
+        steps: Number of steps beyond the limit
+        hours: Total duration beyond the limit in hours
+        first_time / last_time: Times of the first and last such step
+    """
+
+    def __init__(self, threshold: float, above: bool = True) -> None:
+        """Initialize the timer.
+
+        Args:
+            threshold: Limit value
+            above: Count values above (True) or below (False) the limit
+        """
+        self.threshold = threshold
+        self.above = above
+        self.steps = 0
+        self.hours = 0.0
+        self.first_time: Any = None
+        self.last_time: Any = None
+
+    def update(
+        self, value: Optional[float], duration_hours: float, time: Any = None
+    ) -> None:
+        """Record one step.
+
+        Args:
+            value: Worst value of the step (e.g. lowest voltage), or None to skip
+            duration_hours: Length of the step in hours
+            time: Optional time stamp of the step
+        """
+        if value is None:
+            return
+        beyond = value > self.threshold if self.above else value < self.threshold
+        if beyond:
+            self.steps += 1
+            self.hours += duration_hours
+            if self.first_time is None:
+                self.first_time = time
+            self.last_time = time
+
+    def summary(self, time_label: str = "time") -> Dict[str, Any]:
+        """Summarize the time beyond the limit.
+
+        Args:
+            time_label: Suffix of the time keys, e.g. "hour" for first_hour (default: "time")
+
+        Returns:
+            Dictionary with threshold, steps, hours and first/last times
+        """
+        return {
+            "threshold": self.threshold,
+            "steps": self.steps,
+            "hours": round(self.hours, 4),
+            f"first_{time_label}": self.first_time,
+            f"last_{time_label}": self.last_time,
+        }
+
+
+class ElementExtremes:
+    """Per-element running minimum and maximum (e.g. voltage of every bus).
+
+    Memory is proportional to the number of elements, not to the number of
+    steps.
+
+    Attributes:
+        names: Element names
+        min / max: Arrays of running extremes (NaN until first finite value)
+        min_time / max_time: Arrays of the times the extremes occurred
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        """Initialize empty extremes.
+
+        Args:
+            names: Element names, in the order of the values passed to update()
+        """
+        self.names = list(names)
+        self.min = np.full(len(self.names), np.nan)
+        self.max = np.full(len(self.names), np.nan)
+        self.min_time = np.full(len(self.names), np.nan)
+        self.max_time = np.full(len(self.names), np.nan)
+
+    def update(self, values: np.ndarray, time: float) -> None:
+        """Fold one step of element values into the extremes.
+
+        Args:
+            values: One value per element (NaN for missing)
+            time: Numeric time stamp of the step (e.g. simulation hour)
+        """
+        values = np.asarray(values, dtype=float)
+        with np.errstate(invalid="ignore"):
+            lower = np.isfinite(values) & ~(values >= self.min)
+            higher = np.isfinite(values) & ~(values <= self.max)
+        self.min[lower] = values[lower]
+        self.min_time[lower] = time
+        self.max[higher] = values[higher]
+        self.max_time[higher] = time
+
+    def worst(
+        self,
+        count: int = 10,
+        lowest: bool = True,
+        digits: int = 4,
+        time_label: str = "time",
+    ) -> List[Dict[str, Any]]:
+        """List the elements with the most extreme values.
+
+        Args:
+            count: Number of elements to list (default: 10)
+            lowest: List the lowest minima (True) or the highest maxima (False)
+            digits: Decimal places to round values to (default: 4)
+            time_label: Name of the time key (default: "time")
+
+        Returns:
+            List of {name, value, <time_label>} dictionaries, most extreme first
+        """
+        values = self.min if lowest else -self.max
+        order = np.argsort(np.where(np.isnan(values), np.inf, values), kind="stable")
+        rows = []
+        for i in order[:count]:
+            if np.isnan(values[i]):
+                break
+            rows.append(
+                {
+                    "name": self.names[i],
+                    "value": round(
+                        float(self.min[i] if lowest else self.max[i]), digits
+                    ),
+                    time_label: float(self.min_time[i] if lowest else self.max_time[i]),
+                }
+            )
+        return rows
@@ -0,0 +1,571 @@
+"""
+On-disk storage for large study results.
+
+Long studies (time-series runs with thousands of steps, feeder-wide scans)
+produce more per-step data than should be held in memory or returned in one
+response. This module writes such results under a result directory and
+identifies them with a short handle that tools return instead of the raw data.
+
+A result is stored in one of two formats. "arrays" results hold per-step rows
+as columnar NumPy shards::
+
+    <results dir>/<handle>/manifest.json     # columns, labels, shards, summary
+    <results dir>/<handle>/shard_00000.npz   # rows [0, shard_size)
+    <results dir>/<handle>/shard_00001.npz   # rows [shard_size, 2 * shard_size)
+
+"document" results hold the large fields of a tool response (e.g. every bus
+voltage of a power flow) as JSON, to be read back piece by piece::
+
+    <results dir>/<handle>/manifest.json     # summary, stored fields
+    <results dir>/<handle>/document.json     # the stored fields
+
+The results directory defaults to "opendss_mcp_results" in the system temp
+directory and can be changed with the OPENDSS_MCP_RESULTS_DIR environment
+variable.
+
+Results are not kept forever. Whenever a new result is created, results older
+than OPENDSS_MCP_RESULTS_MAX_AGE_H hours (default: 24) are deleted, and then
+the oldest results until the directory holds at most
+OPENDSS_MCP_RESULTS_MAX_MB megabytes (default: 2048). A result can also be
+deleted explicitly with delete_result().
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the results directory
+RESULTS_DIR_ENV = "OPENDSS_MCP_RESULTS_DIR"
+
+# Environment variables overriding the retention limits
+RESULTS_MAX_AGE_ENV = "OPENDSS_MCP_RESULTS_MAX_AGE_H"
+RESULTS_MAX_MB_ENV = "OPENDSS_MCP_RESULTS_MAX_MB"
+
+DEFAULT_MAX_AGE_HOURS = 24.0
+
+DEFAULT_MAX_MB = 2048.0
+
+# Number of parsed documents kept in memory for repeated page reads
+DOCUMENT_CACHE_SIZE = 4
+
+MANIFEST_NAME = "manifest.json"
+
+DOCUMENT_NAME = "document.json"
+
+# Maximum number of values a tool returns inline before storing them instead
+DEFAULT_INLINE_LIMIT = 10000
+
+_HANDLE_PATTERN = re.compile(r"^[a-z0-9_]+-[0-9a-f]{12}$")
+
+# Parsed documents by file path, most recently read last
+_document_cache: "OrderedDict[str, Any]" = OrderedDict()
+_document_lock = threading.Lock()
+
+
+def results_dir() -> Path:
+    """Return the directory that holds all stored results.
+
+    Returns:
+        Path of the results directory (created if missing)
+    """
+    directory = Path(
+        os.environ.get(RESULTS_DIR_ENV)
+        or Path(tempfile.gettempdir()) / "opendss_mcp_results"
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _limit_from_env(name: str, default: float) -> float:
+    """Read a numeric retention limit, falling back to the default if unset or invalid."""
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={os.environ[name]!r}")
+        return default
+
+
+def _forget_document(directory: Path) -> None:
+    """Drop a result's parsed document from the cache."""
+    with _document_lock:
+        _document_cache.pop(str(directory / DOCUMENT_NAME), None)
+
+
+def prune_results(
+    max_age_hours: Optional[float] = None, max_mb: Optional[float] = None
+) -> List[str]:
+    """Delete stored results that are too old or exceed the size budget.
+
+    Results are deleted when they are older than max_age_hours, then oldest
+    first until the remaining ones fit in max_mb. Results still being written
+    (no manifest yet) are only deleted once they are older than max_age_hours.
+
+    Args:
+        max_age_hours: Maximum result age (default: OPENDSS_MCP_RESULTS_MAX_AGE_H
+            or 24 hours)
+        max_mb: Maximum total size in megabytes (default:
+            OPENDSS_MCP_RESULTS_MAX_MB or 2048)
+
+    Returns:
+        Handles of the deleted results
+    """
+    if max_age_hours is None:
+        max_age_hours = _limit_from_env(RESULTS_MAX_AGE_ENV, DEFAULT_MAX_AGE_HOURS)
+    if max_mb is None:
+        max_mb = _limit_from_env(RESULTS_MAX_MB_ENV, DEFAULT_MAX_MB)
+    oldest_kept = time.time() - max_age_hours * 3600.0
+
+    results = []
+    for directory in results_dir().iterdir():
+        if not directory.is_dir() or not _HANDLE_PATTERN.match(directory.name):
+            continue
+        try:
+            files = list(os.scandir(directory))
+            created = directory.stat().st_mtime
+            size = sum(entry.stat().st_size for entry in files)
+        except OSError:
+            continue
+        complete = any(entry.name == MANIFEST_NAME for entry in files)
+        results.append((created, size, complete, directory))
+
+    deleted = []
+    total = sum(size for _, size, complete, _ in results if complete)
+    for created, size, complete, directory in sorted(results, key=lambda r: r[0]):
+        if created < oldest_kept or (complete and total > max_mb * 1024 * 1024):
+            shutil.rmtree(directory, ignore_errors=True)
+            _forget_document(directory)
+            deleted.append(directory.name)
+            if complete:
+                total -= size
+    if deleted:
+        logger.info(f"Deleted {len(deleted)} stored results: {', '.join(deleted)}")
+    return deleted
+
+
+def new_result(kind: str) -> Tuple[str, Path]:
+    """Reserve a handle and directory for a new result.
+
+    Older results are pruned first (see prune_results).
+
+    Args:
+        kind: Short result type used as the handle prefix (e.g. "timeseries")
+
+    Returns:
+        Tuple of (handle, result directory)
+    """
+    prune_results()
+    handle = f"{kind.lower()}-{uuid.uuid4().hex[:12]}"
+    directory = results_dir() / handle
+    directory.mkdir()
+    return handle, directory
+
+
+def result_path(handle: str) -> Path:
+    """Locate the directory of a stored result.
+
+    Args:
+        handle: Result handle returned by a tool
+
+    Returns:
+        Path of the result directory
+
+    Raises:
+        ValueError: If the handle is malformed or no such result exists
+    """
+    if not isinstance(handle, str) or not _HANDLE_PATTERN.match(handle):
+        raise ValueError(f"Invalid result handle: {handle!r}")
+    directory = results_dir() / handle
+    if not (directory / MANIFEST_NAME).exists():
+        raise ValueError(f"Result not found: {handle}")
+    return directory
+
+
+def delete_result(handle: str) -> Dict[str, Any]:
+    """Delete a stored result.
+
+    Args:
+        handle: Result handle
+
+    Returns:
+        Dictionary with the handle, kind and freed_bytes of the deleted result
+
+    Raises:
+        ValueError: If the handle is malformed or no such result exists
+    """
+    directory = result_path(handle)
+    kind = read_manifest(handle).get("kind")
+    freed = sum(entry.stat().st_size for entry in os.scandir(directory))
+    shutil.rmtree(directory)
+    _forget_document(directory)
+    logger.info(f"Deleted stored result {handle}")
+    return {"handle": handle, "kind": kind, "freed_bytes": freed}
+
+
+def read_manifest(handle: str) -> Dict[str, Any]:
+    """Read the manifest of a stored result.
+
+    Args:
+        handle: Result handle
+
+    Returns:
+        Manifest dictionary
+    """
+    with open(result_path(handle) / MANIFEST_NAME, "r") as f:
+        return json.load(f)
+
+
+class ShardedArrayWriter:
+    """Append per-step rows to a result and write them in fixed-size shards.
+
+    Every row is a mapping of column name to a scalar or a 1-D array of a
+    fixed length (e.g. one voltage per bus). Rows are buffered until
+    shard_size of them are collected, then written as one .npz file, so
+    memory use is bounded by one shard regardless of the number of steps.
+
+    Attributes:
+        handle: Handle of the result being written
+        directory: Result directory
+        num_rows: Number of rows appended so far
+
+    Example:
+        >>> writer = ShardedArrayWriter("timeseries", labels={"bus_voltages_pu": buses})
+        >>> for step in range(8760):
+        ...     writer.append({"losses_kw": losses, "bus_voltages_pu": voltages})
+        >>> manifest = writer.close(summary={"peak_losses_kw": 120.5})
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        shard_size: int = 1000,
+        labels: Optional[Dict[str, List[str]]] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Create the result directory.
+
+        Args:
+            kind: Result type used as the handle prefix
+            shard_size: Rows per shard file (default: 1000)
+            labels: Optional column labels for array columns, e.g. bus names
+            attributes: Optional JSON-serializable metadata stored in the manifest
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.handle, self.directory = new_result(kind)
+        self.num_rows = 0
+        self._kind = kind
+        self._shard_size = shard_size
+        self._labels = labels or {}
+        self._attributes = attributes or {}
+        self._buffer: Dict[str, List[Any]] = {}
+        self._shards: List[Dict[str, Any]] = []
+        self._columns: Dict[str, Dict[str, Any]] = {}
+
+    def set_labels(self, labels: Dict[str, List[str]]) -> None:
+        """Set labels of array columns (e.g. bus names of a voltage column).
+
+        Args:
+            labels: Mapping of column name to one label per array entry
+        """
+        self._labels.update(labels)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Append one row.
+
+        Args:
+            row: Mapping of column name to scalar or 1-D array
+        """
+        for name, value in row.items():
+            value = np.asarray(value)
+            if name not in self._columns:
+                self._columns[name] = {
+                    "dtype": str(value.dtype),
+                    "shape": list(value.shape),
+                }
+            self._buffer.setdefault(name, []).append(value)
+        self.num_rows += 1
+        if self.num_rows % self._shard_size == 0:
+            self._flush()
+
+    @instrumentation.timed("serialize")
+    def _flush(self) -> None:
+        """Write the buffered rows as one shard."""
+        if not self._buffer:
+            return
+        start = self._shards[-1]["stop"] if self._shards else 0
+        file_name = f"shard_{len(self._shards):05d}.npz"
+        np.savez(
+            self.directory / file_name,
+            **{name: np.stack(values) for name, values in self._buffer.items()},
+        )
+        self._shards.append({"file": file_name, "start": start, "stop": self.num_rows})
+        self._buffer = {}
+
+    @instrumentation.timed("serialize")
+    def close(self, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write remaining rows and the manifest.
+
+        Args:
+            summary: Optional JSON-serializable summary stored with the result
+
+        Returns:
+            Manifest dictionary
+        """
+        self._flush()
+        manifest = {
+            "handle": self.handle,
+            "kind": self._kind,
+            "format": "arrays",
+            "num_rows": self.num_rows,
+            "shard_size": self._shard_size,
+            "columns": self._columns,
+            "labels": self._labels,
+            "shards": self._shards,
+            "attributes": self._attributes,
+            "summary": summary or {},
+        }
+        with open(self.directory / MANIFEST_NAME, "w") as f:
+            json.dump(manifest, f, indent=2)
+        logger.info(
+            f"Stored {self.num_rows} rows in {len(self._shards)} shards as {self.handle}"
+        )
+        return manifest
+
+    def discard(self) -> None:
+        """Delete the partially written result (e.g. after a failed run)."""
+        self._buffer = {}
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def read_rows(
+    handle: str,
+    fields: Optional[List[str]] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """Read a range of rows of a stored result.
+
+    Only the shards overlapping the requested range are opened.
+
+    Args:
+        handle: Result handle
+        fields: Columns to read (default: all columns)
+        offset: First row to read (default: 0)
+        limit: Maximum number of rows to read (default: all remaining rows)
+
+    Returns:
+        Dictionary mapping column names to arrays with one entry per row
+
+    Raises:
+        ValueError: If the handle or a field is unknown, or the range is invalid
+    """
+    manifest = read_manifest(handle)
+    if manifest.get("format", "arrays") != "arrays":
+        raise ValueError(f"Result {handle} is a document, not per-step rows")
+    columns = manifest["columns"]
+    fields = list(columns) if fields is None else list(fields)
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(columns)}"
+        )
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must be non-negative")
+
+    stop = manifest["num_rows"] if limit is None else offset + limit
+    stop = min(stop, manifest["num_rows"])
+
+    parts: Dict[str, List[np.ndarray]] = {field: [] for field in fields}
+    directory = result_path(handle)
+    for shard in manifest["shards"]:
+        if shard["stop"] <= offset or shard["start"] >= stop:
+            continue
+        lo = max(offset, shard["start"]) - shard["start"]
+        hi = min(stop, shard["stop"]) - shard["start"]
+        with np.load(directory / shard["file"]) as data:
+            for field in fields:
+                parts[field].append(data[field][lo:hi])
+
+    result = {}
+    for field in fields:
+        if parts[field]:
+            result[field] = np.concatenate(parts[field])
+        else:
+            shape = [0] + columns[field]["shape"]
+            result[field] = np.empty(shape, dtype=columns[field]["dtype"])
+    return result
+
+
+def count_values(node: Any) -> int:
+    """Count the scalar values in a JSON-like structure.
+
+    Args:
+        node: Dictionary, list or scalar
+
+    Returns:
+        Number of scalars (leaves) in node
+    """
+    if isinstance(node, dict):
+        return sum(count_values(value) for value in node.values())
+    if isinstance(node, (list, tuple)):
+        return sum(count_values(value) for value in node)
+    return 1
+
+
+@instrumentation.timed("serialize")
+def store_document(
+    kind: str,
+    document: Dict[str, Any],
+    summary: Optional[Dict[str, Any]] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Store a JSON-serializable result as a document.
+
+    Args:
+        kind: Result type used as the handle prefix (e.g. "power_flow")
+        document: Data to store
+        summary: Optional JSON-serializable summary stored with the result
+        attributes: Optional JSON-serializable metadata stored in the manifest
+
+    Returns:
+        Manifest dictionary
+    """
+    handle, directory = new_result(kind)
+    with open(directory / DOCUMENT_NAME, "w") as f:
+        json.dump(document, f)
+    manifest = {
+        "handle": handle,
+        "kind": kind,
+        "format": "document",
+        "fields": list(document),
+        "num_values": count_values(document),
+        "attributes": attributes or {},
+        "summary": summary or {},
+    }
+    with open(directory / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Stored {manifest['num_values']} values as {handle}")
+    return manifest
+
+
+def _load_document(file_path: Path) -> Any:
+    """Parse a document file, reusing one of the recently parsed documents.
+
+    Documents never change once stored, so paging through one parses the
+    file only on the first page.
+    """
+    key = str(file_path)
+    with _document_lock:
+        if key in _document_cache:
+            _document_cache.move_to_end(key)
+            return _document_cache[key]
+    with open(file_path, "r") as f:
+        document = json.load(f)
+    with _document_lock:
+        _document_cache[key] = document
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+    return document
+
+
+def read_document(handle: str, path: Optional[str] = None) -> Any:
+    """Read a stored document, or the part of it at a path.
+
+    The returned value is shared with later reads and must not be modified.
+
+    Args:
+        handle: Result handle
+        path: Dot-separated keys and list indexes into the document, e.g.
+            "harmonics.individual_harmonics.5" (default: the whole document)
+
+    Returns:
+        The value at path
+
+    Raises:
+        ValueError: If the handle is unknown, the result is not a document or
+            the path does not exist
+    """
+    manifest = read_manifest(handle)
+    if manifest.get("format") != "document":
+        raise ValueError(f"Result {handle} holds per-step rows, not a document")
+    node = _load_document(result_path(handle) / DOCUMENT_NAME)
+
+    for key in path.split(".") if path else []:
+        if isinstance(node, dict) and key in node:
+            node = node[key]
+        elif (
+            isinstance(node, list)
+            and key.lstrip("-").isdigit()
+            and (-len(node) <= int(key) < len(node))
+        ):
+            node = node[int(key)]
+        else:
+            raise ValueError(f"Path not found in {handle}: {path}")
+    return node
+
+
+def store_large_fields(
+    kind: str,
+    data: Dict[str, Any],
+    fields: List[str],
+    inline_limit: Optional[int] = DEFAULT_INLINE_LIMIT,
+    summary: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Move the large fields of a tool response to a stored document.
+
+    The fields are stored only if together they hold more than inline_limit
+    values. They are then removed from data, which gains "result_handle" and
+    "stored_fields" entries. Stored fields keep their place in the document,
+    so a field "harmonics.thd_voltage" is read back with that same path.
+
+    Args:
+        kind: Result type used as the handle prefix
+        data: Tool response data, modified in place
+        fields: Dot-separated paths of the fields that may be stored
+        inline_limit: Maximum number of values kept inline (None: no limit,
+            0: always store)
+        summary: Optional summary stored with the result
+
+    Returns:
+        Handle of the stored document, or None if the fields were kept inline
+    """
+    present = []
+    for field in fields:
+        *parents, key = field.split(".")
+        node = data
+        for parent in parents:
+            node = node.get(parent) if isinstance(node, dict) else None
+        if isinstance(node, dict) and key in node:
+            present.append((field, node, parents, key))
+
+    if inline_limit is None or not present:
+        return None
+    if sum(count_values(node[key]) for _, node, _, key in present) <= inline_limit:
+        return None
+
+    document: Dict[str, Any] = {}
+    for _, node, parents, key in present:
+        target = document
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = node.pop(key)
+
+    handle = store_document(kind, document, summary=summary)["handle"]
+    data["result_handle"] = handle
+    data["stored_fields"] = [field for field, _, _, _ in present]
+    return handle
@@ -0,0 +1,237 @@
+"""
+Linear DER sensitivities from the system admittance matrix.
+
+This module estimates, for many candidate buses at once, how node voltages
+and circuit losses respond to real power injected at each bus. Around the
+solved operating point the network is linear in the system Y matrix (loads
+represented by their equivalent admittance, sources by their Norton
+equivalent), so the voltage change caused by an injection is ΔV = Y⁻¹ ΔI.
+The sparse Y matrix is factorized once and all candidates are solved as
+right-hand sides of that factorization, in column blocks of bounded size, so
+memory grows with the node count rather than its square.
+
+The results are first-order estimates used to screen candidates; regulator
+and capacitor control actions and the voltage dependence of loads are not
+modeled.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import opendssdirect as dss
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the entries of each (nodes x candidates) block of voltage
+# changes; candidates are solved in blocks so memory stays linear in nodes
+BLOCK_ENTRIES = 2_000_000
+
+
+def _system_y(engine: Any, num_nodes: int) -> sparse.csc_matrix:
+    """Read the system Y matrix in OpenDSS's compressed sparse column form.
+
+    Args:
+        engine: OpenDSS interface to read from
+        num_nodes: Number of nodes (size of the Y matrix)
+
+    Returns:
+        (nodes x nodes) sparse complex admittance matrix in Siemens
+    """
+    data, rows, indptr = engine.YMatrix.getYsparse()
+    return sparse.csc_matrix(
+        (np.asarray(data, dtype=complex), rows, indptr), shape=(num_nodes, num_nodes)
+    )
+
+
+def _network_y(engine: Any, num_nodes: int) -> sparse.csr_matrix:
+    """Assemble the admittance matrix of the power delivery elements only.
+
+    Losses are the power absorbed by lines, transformers and other PD
+    elements, so they are computed from this matrix rather than the system Y
+    matrix, which also contains load and source admittances. OpenDSS has no
+    bulk accessor for it, so the primitive matrices are read per element and
+    summed into one sparse matrix.
+
+    Args:
+        engine: OpenDSS interface to read from
+        num_nodes: Number of nodes (size of the Y matrix)
+
+    Returns:
+        (nodes x nodes) sparse complex admittance matrix in Siemens
+    """
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    if engine.PDElements.First() > 0:
+        while True:
+            refs = np.asarray(engine.CktElement.NodeRef(), dtype=int) - 1
+            yprim = np.asarray(engine.CktElement.YPrim(), dtype=float)
+            if refs.size and yprim.size == 2 * refs.size**2:
+                yprim = (yprim[0::2] + 1j * yprim[1::2]).reshape(refs.size, refs.size)
+                # Node reference 0 is ground and is not part of the Y matrix
+                keep = np.flatnonzero(refs >= 0)
+                block_rows, block_cols = np.meshgrid(keep, keep, indexing="ij")
+                rows.append(refs[block_rows].ravel())
+                cols.append(refs[block_cols].ravel())
+                values.append(yprim[block_rows, block_cols].ravel())
+            if not engine.PDElements.Next() > 0:
+                break
+
+    if not values:
+        return sparse.csr_matrix((num_nodes, num_nodes), dtype=complex)
+    # Duplicate (row, col) entries of elements sharing nodes are summed
+    return sparse.coo_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(num_nodes, num_nodes),
+    ).tocsr()
+
+
+def der_sensitivities(
+    bus_ids: List[str],
+    injection_kw: float,
+    min_voltage_pu: float = 0.95,
+    max_voltage_pu: float = 1.05,
+    engine: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Estimate the effect of a real power injection at each candidate bus.
+
+    The injection is split evenly over the phase nodes of the bus at unity
+    power factor. Predicted losses use the full quadratic loss expression at
+    the linearly predicted voltages, so they stay close to the exact result
+    for injections that are large compared with the local load.
+
+    Args:
+        bus_ids: Candidate buses
+        injection_kw: Injected real power in kW used for the predictions
+        min_voltage_pu: Minimum voltage limit for predicted violations (default: 0.95)
+        max_voltage_pu: Maximum voltage limit for predicted violations (default: 1.05)
+        engine: OpenDSS interface to read from (default: opendssdirect)
+
+    Returns:
+        Dictionary with one array entry per candidate bus:
+            - bus_ids: Candidate buses in input order
+            - dv_dp_pu_per_mw: Largest node voltage rise per MW injected
+            - dloss_dp_kw_per_mw: Change of circuit losses per MW injected
+            - predicted_losses_kw: Losses with injection_kw at the bus
+            - predicted_max_voltage_pu / predicted_min_voltage_pu: Voltage extremes
+            - predicted_violations: Nodes outside the voltage limits
+          plus the scalar baseline_losses_kw.
+
+    Example:
+        >>> dss.Solution.Solve()
+        >>> result = der_sensitivities(["675", "680"], injection_kw=500)
+        >>> result["dloss_dp_kw_per_mw"]
+        array([-118.2, -96.4])
+
+    Note:
+        The circuit must be solved. The sparse Y matrix is factorized once
+        and candidates are solved in blocks of at most BLOCK_ENTRIES voltage
+        changes.
+    """
+    engine = engine if engine is not None else dss
+
+    node_names = [name.lower() for name in engine.Circuit.YNodeOrder()]
+    num_nodes = len(node_names)
+    volts = np.asarray(engine.Circuit.YNodeVArray(), dtype=float)
+    voltages = volts[0::2] + 1j * volts[1::2]
+
+    # Per-unit bases from the bulk magnitudes, reordered to the Y node order
+    pu_by_name = dict(
+        zip(
+            (name.lower() for name in engine.Circuit.AllNodeNames()),
+            engine.Circuit.AllBusMagPu(),
+        )
+    )
+    magnitudes = np.abs(voltages)
+    vpu = np.array([pu_by_name.get(name, 0.0) for name in node_names])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        base_volts = np.where(vpu > 0, magnitudes / vpu, 0.0)
+    valid = base_volts > 0
+
+    # Phase nodes (1-3) of every bus
+    bus_nodes: Dict[str, List[int]] = {}
+    for index, name in enumerate(node_names):
+        bus, _, node = name.partition(".")
+        if node in ("1", "2", "3"):
+            bus_nodes.setdefault(bus, []).append(index)
+
+    candidate_nodes = []
+    for bus_id in bus_ids:
+        nodes = bus_nodes.get(bus_id.lower(), [])
+        if not nodes:
+            raise ValueError(f"Bus {bus_id} has no phase nodes")
+        candidate_nodes.append(nodes)
+
+    factor = splu(_system_y(engine, num_nodes))
+    y_network = _network_y(engine, num_nodes)
+    branch_currents = y_network @ voltages
+    baseline_losses = float(np.real(voltages @ np.conj(branch_currents))) / 1000.0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        unit = np.where(magnitudes > 0, np.conj(voltages) / magnitudes, 0.0)
+
+    num_candidates = len(bus_ids)
+    dv_dp = np.empty(num_candidates)
+    dloss = np.empty(num_candidates)
+    predicted_losses = np.empty(num_candidates)
+    predicted_max = np.empty(num_candidates)
+    predicted_min = np.empty(num_candidates)
+    violations = np.empty(num_candidates, dtype=int)
+
+    block = max(1, BLOCK_ENTRIES // max(num_nodes, 1))
+    for start in range(0, num_candidates, block):
+        columns = range(start, min(start + block, num_candidates))
+
+        # One injection-current column per candidate for 1 kW, split over phases
+        injections = np.zeros((num_nodes, len(columns)), dtype=complex)
+        for column, candidate in enumerate(columns):
+            nodes = candidate_nodes[candidate]
+            power_va = 1000.0 / len(nodes)
+            injections[nodes, column] = np.conj(power_va / voltages[nodes])
+        delta_v = factor.solve(injections)
+
+        # Voltage magnitude change per kW in per unit (projection onto V)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dv_pu = np.where(
+                valid[:, None],
+                (unit[:, None] * delta_v).real / base_volts[:, None],
+                0.0,
+            )
+        dv_dp[columns] = np.max(dv_pu, axis=0) * 1000.0
+
+        # Losses: first-order sensitivity and quadratic prediction
+        dloss[columns] = (
+            np.real(
+                delta_v.T @ np.conj(branch_currents)
+                + voltages @ np.conj(y_network @ delta_v)
+            )
+            / 1000.0
+        )
+        predicted_v = voltages[:, None] + injection_kw * delta_v
+        predicted_losses[columns] = (
+            np.real(np.sum(predicted_v * np.conj(y_network @ predicted_v), axis=0))
+            / 1000.0
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            predicted_pu = np.abs(predicted_v[valid]) / base_volts[valid, None]
+        predicted_max[columns] = np.max(predicted_pu, axis=0)
+        predicted_min[columns] = np.min(predicted_pu, axis=0)
+        violations[columns] = np.sum(
+            (predicted_pu < min_voltage_pu) | (predicted_pu > max_voltage_pu), axis=0
+        )
+
+    logger.debug(f"Computed sensitivities of {len(bus_ids)} buses on {num_nodes} nodes")
+
+    return {
+        "bus_ids": list(bus_ids),
+        "dv_dp_pu_per_mw": dv_dp,
+        "dloss_dp_kw_per_mw": dloss * 1000.0,
+        "predicted_losses_kw": predicted_losses,
+        "predicted_max_voltage_pu": predicted_max,
+        "predicted_min_voltage_pu": predicted_min,
+        "predicted_violations": violations,
+        "baseline_losses_kw": baseline_losses,
+    }
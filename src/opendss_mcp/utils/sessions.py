@@ -0,0 +1,262 @@
+"""
+Named OpenDSS sessions, each with its own engine in a dedicated process.
+
+All tools operate on the process-global opendssdirect engine, so two clients
+(or a capacity study and a time-series run) that share a process also share
+one circuit and one solution mode. A session gives a client its own engine:
+it owns a single spawned worker process that holds its circuit between calls,
+and tool functions are executed inside that process. Sessions run
+independently of each other and of the server process's own engine, which
+remains the default when no session is given.
+"""
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .instrumentation import RecordedCall, instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of sessions open at the same time (one process each)
+DEFAULT_MAX_SESSIONS = 8
+
+_SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Identifier of the session served by this process (worker processes only)
+_session_state: Dict[str, Any] = {"session_id": None}
+
+
+def _init_session(session_id: str) -> None:
+    """Mark a freshly started worker process as serving a session.
+
+    Args:
+        session_id: Identifier of the session
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+    _session_state["session_id"] = session_id
+
+
+def current_session_id() -> Optional[str]:
+    """Return the session served by this process.
+
+    Returns:
+        Session identifier inside a session process, None in the server process
+    """
+    return _session_state["session_id"]
+
+
+class _Session:
+    """One session: a single-worker process pool and usage counters."""
+
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+        self.calls = 0
+        self.last_tool: Optional[str] = None
+        # A single spawned worker keeps its OpenDSS circuit between calls
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_session,
+            initargs=(session_id,),
+        )
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "last_used_at": self.last_used_at,
+            "calls": self.calls,
+            "last_tool": self.last_tool,
+        }
+
+
+class SessionManager:
+    """Create, use and close named sessions.
+
+    Calls to one session run one at a time in the order they are made; calls
+    to different sessions run concurrently in their own processes.
+
+    Attributes:
+        max_sessions: Maximum number of open sessions
+
+    Example:
+        >>> manager = SessionManager()
+        >>> manager.create("study_a")
+        >>> manager.call("study_a", load_ieee_test_feeder, "IEEE123")
+        >>> manager.call("study_a", run_power_flow, "IEEE123")
+        >>> manager.close("study_a")
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS) -> None:
+        """Initialize the manager with no open sessions.
+
+        Args:
+            max_sessions: Maximum number of open sessions (default: 8)
+        """
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+
+    def create(self, session_id: Optional[str] = None) -> str:
+        """Open a new session.
+
+        Args:
+            session_id: Name of the session (letters, digits, "_" and "-";
+                default: a generated identifier)
+
+        Returns:
+            Identifier of the new session
+
+        Raises:
+            ValueError: If the name is invalid or taken, or too many sessions are open
+        """
+        session_id = session_id or f"session-{uuid.uuid4().hex[:8]}"
+        if not _SESSION_ID_PATTERN.match(session_id):
+            raise ValueError(
+                f"Invalid session_id '{session_id}': use up to 64 letters, digits, '_' or '-'"
+            )
+        with self._lock:
+            if session_id in self._sessions:
+                raise ValueError(f"Session '{session_id}' already exists")
+            if len(self._sessions) >= self.max_sessions:
+                raise ValueError(
+                    f"Too many open sessions (maximum {self.max_sessions}). "
+                    "Close a session first."
+                )
+            self._sessions[session_id] = _Session(session_id)
+        logger.info(f"Created session {session_id}")
+        return session_id
+
+    def _get(self, session_id: str) -> _Session:
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise ValueError(
+                f"Unknown session '{session_id}'. Create it with create_session first."
+            )
+        return session
+
+    def call(
+        self, session_id: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a function inside a session's process and wait for the result.
+
+        Args:
+            session_id: Identifier of the session
+            func: Module-level function to run (pickled by reference)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        return self.submit(session_id, func, *args, **kwargs).result()
+
+    def submit(
+        self, session_id: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Queue a function in a session's process without waiting for it.
+
+        Args:
+            session_id: Identifier of the session
+            func: Module-level function to run (pickled by reference)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future of the return value of func
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        session = self._get(session_id)
+        session.calls += 1
+        session.last_used_at = time.time()
+        session.last_tool = getattr(func, "__name__", str(func))
+        return session.executor.submit(func, *args, **kwargs)
+
+    def close(self, session_id: str) -> Dict[str, Any]:
+        """Close a session and stop its process.
+
+        Args:
+            session_id: Identifier of the session
+
+        Returns:
+            Final usage information of the session
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise ValueError(f"Unknown session '{session_id}'")
+        session.executor.shutdown(wait=True, cancel_futures=True)
+        logger.info(f"Closed session {session_id} after {session.calls} calls")
+        return session.info()
+
+    def close_all(self) -> None:
+        """Close every open session."""
+        for session_id in self.list_ids():
+            try:
+                self.close(session_id)
+            except ValueError:
+                pass
+
+    def list_ids(self) -> List[str]:
+        """Identifiers of the open sessions."""
+        with self._lock:
+            return list(self._sessions)
+
+    def info(self) -> List[Dict[str, Any]]:
+        """Usage information of every open session."""
+        with self._lock:
+            return [session.info() for session in self._sessions.values()]
+
+
+# Sessions of the server process
+session_manager = SessionManager()
+atexit.register(session_manager.close_all)
+
+
+async def run_in_session(
+    session_id: Optional[str], func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Run a tool function in a session, or in this process if no session is given.
+
+    A session call is awaited without blocking the event loop, so calls to
+    different sessions run at the same time. Without a session the function
+    runs directly on the default engine, which serves one call at a time.
+
+    Phase timings and OpenDSS call counts measured in the session's process
+    are added to the current invocation of this process.
+
+    Args:
+        session_id: Identifier of the session, or None for the default engine
+        func: Module-level tool function
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+    """
+    if session_id is None:
+        return func(*args, **kwargs)
+    result, record = await asyncio.wrap_future(
+        session_manager.submit(session_id, RecordedCall(func), *args, **kwargs)
+    )
+    instrumentation.add_to_current(record)
+    return result
@@ -0,0 +1,220 @@
+"""
+Whole-circuit short-circuit results backed by NumPy arrays.
+
+After one solve in FaultStudy mode OpenDSS holds the Thevenin equivalent
+(open-circuit voltages and short-circuit impedance matrix) of every bus. This
+module reads those equivalents into stacked arrays and computes the bolted
+all-phase, single-line-to-ground and line-to-line fault currents of every bus
+with batched NumPy linear algebra, so a protection screen needs no solve per
+bus and no per-bus fault objects.
+"""
+
+import logging
+from itertools import combinations
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import opendssdirect as dss
+
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Node numbers treated as phase conductors; neutral nodes are left out
+PHASE_NODES = (1, 2, 3)
+
+
+def _complex(values: List[float]) -> np.ndarray:
+    """Convert OpenDSS [re, im, re, im, ...] lists into a complex array."""
+    pairs = np.asarray(values, dtype=float)
+    return pairs[0::2] + 1j * pairs[1::2]
+
+
+def _group_currents(
+    z: np.ndarray, v: np.ndarray, fault_resistance: float
+) -> Dict[str, np.ndarray]:
+    """Fault currents of buses that share the same number of phases.
+
+    Args:
+        z: Short-circuit impedance matrices in ohms, shape (buses, k, k)
+        v: Open-circuit phase-to-ground voltages in volts, shape (buses, k)
+        fault_resistance: Fault resistance in ohms (per phase to ground for
+            all-phase and SLG faults, between phases for LL faults)
+
+    Returns:
+        Dictionary of per-bus arrays: all_phase, slg_max, slg_min and ll
+    """
+    k = v.shape[1]
+    diagonal = np.diagonal(z, axis1=1, axis2=2)
+    slg = np.abs(v / (diagonal + fault_resistance))
+
+    # All phases faulted to ground: (Zsc + Rf*I) I = Voc
+    zf = z + fault_resistance * np.eye(k)
+    all_phase = np.full(len(v), np.nan)
+    solvable = np.isfinite(np.linalg.cond(zf))
+    if solvable.any():
+        currents = np.linalg.solve(zf[solvable], v[solvable][..., None])[..., 0]
+        all_phase[solvable] = np.abs(currents).max(axis=1)
+
+    ll = np.zeros(len(v))
+    for i, j in combinations(range(k), 2):
+        loop = z[:, i, i] + z[:, j, j] - z[:, i, j] - z[:, j, i] + fault_resistance
+        ll = np.fmax(ll, np.abs((v[:, i] - v[:, j]) / loop))
+
+    return {
+        "all_phase": all_phase,
+        "slg_max": slg.max(axis=1),
+        "slg_min": slg.min(axis=1),
+        "ll": ll,
+    }
+
+
+class ShortCircuitArrays:
+    """Per-bus fault currents and Thevenin impedances as NumPy arrays.
+
+    Captured once after a FaultStudy solve. All currents are in amperes and
+    all impedances in ohms; NaN marks buses without phase nodes or with a
+    singular short-circuit matrix.
+
+    Attributes:
+        bus_names: Bus names in circuit order
+        kv_base: Line-to-ground base voltage of each bus in kV
+        num_phases: Number of phase nodes of each bus
+        all_phase_a: Bolted fault of all phases to ground (3-phase at
+            three-phase buses), largest phase current
+        slg_max_a: Largest single-line-to-ground fault current over the phases
+        slg_min_a: Smallest single-line-to-ground fault current over the phases
+        ll_a: Largest line-to-line fault current (0 at single-phase buses)
+        z1: Positive-sequence Thevenin impedance (complex ohms)
+        z0: Zero-sequence Thevenin impedance (complex ohms)
+    """
+
+    def __init__(self, bus_names: List[str], arrays: Dict[str, np.ndarray]) -> None:
+        """Initialize from per-bus arrays.
+
+        Args:
+            bus_names: Bus names from Circuit.AllBusNames()
+            arrays: kv_base, num_phases, all_phase_a, slg_max_a, slg_min_a,
+                ll_a, z1 and z0 arrays in bus order
+        """
+        self.bus_names = bus_names
+        self.kv_base: np.ndarray = arrays["kv_base"]
+        self.num_phases: np.ndarray = arrays["num_phases"]
+        self.all_phase_a: np.ndarray = arrays["all_phase_a"]
+        self.slg_max_a: np.ndarray = arrays["slg_max_a"]
+        self.slg_min_a: np.ndarray = arrays["slg_min_a"]
+        self.ll_a: np.ndarray = arrays["ll_a"]
+        self.z1: np.ndarray = arrays["z1"]
+        self.z0: np.ndarray = arrays["z0"]
+
+    @classmethod
+    @instrumentation.timed("extract")
+    def capture(
+        cls, fault_resistance: float = 0.0, engine: Optional[Any] = None
+    ) -> "ShortCircuitArrays":
+        """Read the Thevenin equivalents of all buses after a FaultStudy solve.
+
+        Args:
+            fault_resistance: Fault resistance in ohms (default: 0, bolted)
+            engine: OpenDSS interface to read from (default: opendssdirect)
+
+        Returns:
+            ShortCircuitArrays of the current FaultStudy solution
+        """
+        engine = engine if engine is not None else dss
+        bus_names = list(engine.Circuit.AllBusNames())
+        num_buses = len(bus_names)
+
+        kv_base = np.zeros(num_buses)
+        num_phases = np.zeros(num_buses, dtype=int)
+        z1 = np.full(num_buses, np.nan, dtype=complex)
+        z0 = np.full(num_buses, np.nan, dtype=complex)
+        groups: Dict[int, Dict[str, list]] = {}
+
+        # Reading the stored equivalents is cheap; nothing is solved per bus
+        for b in range(num_buses):
+            engine.Circuit.SetActiveBusi(b)
+            nodes = list(engine.Bus.Nodes())
+            phases = [i for i, node in enumerate(nodes) if node in PHASE_NODES]
+            kv_base[b] = engine.Bus.kVBase()
+            num_phases[b] = len(phases)
+            if not phases:
+                continue
+            z1[b] = complex(*engine.Bus.Zsc1())
+            z0[b] = complex(*engine.Bus.Zsc0())
+            zsc = _complex(engine.Bus.ZscMatrix()).reshape(len(nodes), len(nodes))
+            voc = _complex(engine.Bus.Voc())
+            group = groups.setdefault(len(phases), {"bus": [], "z": [], "v": []})
+            group["bus"].append(b)
+            group["z"].append(zsc[np.ix_(phases, phases)])
+            group["v"].append(voc[phases])
+
+        currents = {
+            name: np.full(num_buses, np.nan)
+            for name in ("all_phase_a", "slg_max_a", "slg_min_a", "ll_a")
+        }
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for group in groups.values():
+                index = np.array(group["bus"])
+                result = _group_currents(
+                    np.array(group["z"]), np.array(group["v"]), fault_resistance
+                )
+                for name, values in result.items():
+                    values[~np.isfinite(values)] = np.nan
+                    currents[f"{name}_a"][index] = values
+
+        return cls(
+            bus_names,
+            {
+                "kv_base": kv_base,
+                "num_phases": num_phases,
+                "z1": z1,
+                "z0": z0,
+                **currents,
+            },
+        )
+
+    def x_r_ratio(self) -> np.ndarray:
+        """Positive-sequence X/R ratio of each bus (NaN where R is 0)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self.z1.imag / self.z1.real
+        return np.where(np.isfinite(ratio), ratio, np.nan)
+
+    def to_rows(
+        self, indices: Optional[np.ndarray] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Convert the arrays into {bus_name: {field: value}} rows.
+
+        Buses without phase nodes are omitted; NaN values become None.
+
+        Args:
+            indices: Bus indices to include (default: all buses)
+
+        Returns:
+            Dictionary mapping lower-case bus names to fault results
+        """
+        if indices is None:
+            indices = np.arange(len(self.bus_names))
+        x_r = self.x_r_ratio()
+
+        def value(array: np.ndarray, i: int, digits: int) -> Optional[float]:
+            return None if np.isnan(array[i]) else round(float(array[i]), digits)
+
+        rows = {}
+        for i in indices:
+            if self.num_phases[i] == 0:
+                continue
+            rows[self.bus_names[i].lower()] = {
+                "kv_base": round(float(self.kv_base[i]), 4),
+                "num_phases": int(self.num_phases[i]),
+                "all_phase_a": value(self.all_phase_a, i, 2),
+                "slg_max_a": value(self.slg_max_a, i, 2),
+                "slg_min_a": value(self.slg_min_a, i, 2),
+                "ll_a": value(self.ll_a, i, 2),
+                "r1_ohm": value(self.z1.real, i, 6),
+                "x1_ohm": value(self.z1.imag, i, 6),
+                "r0_ohm": value(self.z0.real, i, 6),
+                "x0_ohm": value(self.z0.imag, i, 6),
+                "x_r_ratio": value(x_r, i, 3),
+            }
+        return rows
@@ -0,0 +1,208 @@
+"""
+Solve strategies for consecutive power flow solutions.
+
+Studies solve the same circuit many times in a row with small changes in
+between: a capacity search resizes one DER, a time-series run rescales the
+loads. OpenDSS starts every solution from the voltages left by the previous
+one. That warm start saves iterations after a small change, but it costs
+iterations, or convergence, after a large change or a failed solution.
+
+PowerFlowSolver makes the choice explicit. A warm start keeps the previous
+voltages. A cold start first runs a direct solution (loads as constant
+admittances) and iterates from there, which gives the same initial guess
+whatever was solved before. The default "auto" strategy starts warm after a
+converged solution and a small change, starts cold otherwise, and retries
+cold once when a warm start does not converge. In daily and yearly modes
+every Solve() advances the clock, so the retry first winds it back and
+solves the same time step again.
+
+OpenDSS rebuilds the system Y matrix only when an element's admittance may
+have changed. Property edits through Text commands ("Load.x.kW=...") always
+flag a rebuild; the setters of the element interfaces (dss.Loads.kW,
+dss.PVsystems.Irradiance) change injections only and keep the factorized
+matrix. Each solve reports whether a rebuild was pending, with its iteration
+count and wall time.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import opendssdirect as dss
+
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Supported solve strategies
+SOLVE_STRATEGIES = ["auto", "warm", "cold"]
+
+# Largest relative change for which "auto" keeps the previous solution
+WARM_START_MAX_CHANGE = 0.25
+
+
+class PowerFlowSolver:
+    """Solve the active circuit with a warm or cold start and record statistics.
+
+    Attributes:
+        strategy: "auto", "warm" or "cold"
+        max_warm_change: Largest relative change for a warm start in "auto"
+        last: Statistics of the most recent solve (None before the first)
+
+    Example:
+        >>> solver = PowerFlowSolver()
+        >>> for multiplier in load_multipliers:
+        ...     scale_loads(multiplier)
+        ...     solve = solver.solve(change=abs(multiplier - previous) / previous)
+        ...     print(solve["iterations"], solve["time_ms"], solve["start"])
+        >>> solver.stats()["avg_iterations"]
+    """
+
+    def __init__(
+        self,
+        strategy: str = "auto",
+        max_warm_change: float = WARM_START_MAX_CHANGE,
+        engine: Optional[Any] = None,
+    ) -> None:
+        """Initialize the solver.
+
+        Args:
+            strategy: "auto" (default), "warm" (always keep the previous
+                solution) or "cold" (always start from a direct solution)
+            max_warm_change: Largest relative change for which "auto" starts
+                warm (default: 0.25)
+            engine: OpenDSS interface to use (default: opendssdirect)
+
+        Raises:
+            ValueError: If the strategy is not supported
+        """
+        if strategy not in SOLVE_STRATEGIES:
+            raise ValueError(
+                f"Unsupported solve strategy '{strategy}'. "
+                f"Supported strategies: {', '.join(SOLVE_STRATEGIES)}"
+            )
+        self.strategy = strategy
+        self.max_warm_change = max_warm_change
+        self.last: Optional[Dict[str, Any]] = None
+        self._engine = engine if engine is not None else dss
+        self._converged: Optional[bool] = None
+        self._totals: Dict[str, float] = {}
+        self.reset()
+
+    def _warm_start(self, change: Optional[float]) -> bool:
+        """Decide whether the next solve keeps the previous solution.
+
+        Before its first solve the solver leaves the start to OpenDSS, which
+        initializes a freshly compiled circuit itself.
+        """
+        if self.strategy != "auto":
+            return self.strategy == "warm"
+        if self._converged is False:
+            return False
+        return change is None or abs(change) <= self.max_warm_change
+
+    def _run(self, warm: bool) -> Optional[str]:
+        """Run one solution; returns the OpenDSS error message, if any."""
+        try:
+            if not warm:
+                self._engine.Solution.SolveDirect()
+            self._engine.Solution.Solve()
+            return None
+        except Exception as e:
+            return str(e)
+
+    def solve(self, change: Optional[float] = None) -> Dict[str, Any]:
+        """Solve the active circuit.
+
+        Args:
+            change: Relative size of the change since the previous solve, e.g.
+                0.1 after scaling all loads by 10% (default: unknown, treated
+                as small)
+
+        Returns:
+            Dictionary with converged, iterations, control_iterations,
+            time_ms, start ("warm" or "cold"), y_rebuilt, retried and error
+        """
+        solution = self._engine.Solution
+        warm = self._warm_start(change)
+        y_rebuilt = bool(solution.SystemYChanged())
+
+        started = time.perf_counter()
+        with instrumentation.phase("solve"):
+            clock = (solution.Hour(), solution.Seconds())
+            error = self._run(warm)
+            converged = error is None and solution.Converged()
+            retried = False
+            if not converged and warm and self.strategy == "auto":
+                logger.debug("Warm start did not converge, retrying from a cold start")
+                warm, retried = False, True
+                solution.Hour(clock[0])
+                solution.Seconds(clock[1])
+                error = self._run(warm)
+                converged = error is None and solution.Converged()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        self._converged = bool(converged)
+        self.last = {
+            "converged": self._converged,
+            "iterations": int(solution.Iterations()),
+            "control_iterations": int(solution.ControlIterations()),
+            "time_ms": round(elapsed_ms, 3),
+            "start": "warm" if warm else "cold",
+            "y_rebuilt": y_rebuilt,
+            "retried": retried,
+            "error": error,
+        }
+        totals = self._totals
+        totals["solves"] += 1
+        totals["converged"] += self.last["converged"]
+        totals["warm_starts"] += warm
+        totals["cold_starts"] += not warm
+        totals["retries"] += retried
+        totals["y_rebuilds"] += y_rebuilt
+        totals["total_iterations"] += self.last["iterations"]
+        totals["max_iterations"] = max(
+            totals["max_iterations"], self.last["iterations"]
+        )
+        totals["total_time_ms"] += elapsed_ms
+        return self.last
+
+    def reset(self) -> None:
+        """Forget the recorded statistics (the next "auto" start is unchanged)."""
+        self.last = None
+        self._totals = dict.fromkeys(
+            [
+                "solves",
+                "converged",
+                "warm_starts",
+                "cold_starts",
+                "retries",
+                "y_rebuilds",
+                "total_iterations",
+                "max_iterations",
+                "total_time_ms",
+            ],
+            0,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate statistics of every solve since the last reset.
+
+        Returns:
+            Dictionary with strategy, solves, converged, warm_starts,
+            cold_starts, retries, y_rebuilds, total/avg/max iterations and
+            total/avg time in milliseconds
+        """
+        totals = self._totals
+        solves = totals["solves"]
+        return {
+            "strategy": self.strategy,
+            **{key: int(value) for key, value in totals.items()},
+            "avg_iterations": (
+                round(totals["total_iterations"] / solves, 2) if solves else 0.0
+            ),
+            "total_time_ms": round(totals["total_time_ms"], 3),
+            "avg_time_ms": (
+                round(totals["total_time_ms"] / solves, 3) if solves else 0.0
+            ),
+        }
@@ -0,0 +1,387 @@
+"""
+Deterministic synthetic radial feeders for scaling studies.
+
+The IEEE test feeders stop at 123 buses, which says little about how the tools
+behave on utility-sized circuits. This module writes DSS scripts for radial
+12.47 kV feeders of any size. Each feeder has three-phase trunks, each fed by
+its own substation transformer, and laterals branching off them up to a given
+depth, with a mix of three-, two- and single-phase laterals. Loads and PV
+systems are spread over the buses.
+
+The same parameters and seed always give the same script, so results and
+benchmarks are comparable between runs and machines. Scripts are
+self-contained: line codes are defined inline and nothing is redirected.
+
+Named presets (SYNTH1K, SYNTH10K, SYNTH50K) are loaded like the IEEE feeders
+through load_ieee_test_feeder. Other sizes can be written with
+write_synthetic_feeder() and compiled directly.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the generated scripts change, so stale files are not reused
+GENERATOR_VERSION = 1
+
+# Named feeders loadable by feeder ID
+SYNTHETIC_FEEDERS: Dict[str, Dict[str, Any]] = {
+    "SYNTH1K": {"num_buses": 1000},
+    "SYNTH10K": {"num_buses": 10000},
+    "SYNTH50K": {"num_buses": 50000},
+}
+
+# Default generator parameters
+DEFAULT_LATERAL_DEPTH = 3
+DEFAULT_PHASE_MIX = {3: 0.2, 2: 0.1, 1: 0.7}
+DEFAULT_LOAD_DENSITY = 0.6
+DEFAULT_PV_DENSITY = 0.15
+
+# Feeder buses served by one trunk from the substation
+BUSES_PER_TRUNK = 1500
+
+# Segment lengths (km) and load sizes (kW per phase)
+TRUNK_SEGMENT_KM = 0.12
+LATERAL_SEGMENT_KM = 0.04
+LOAD_KW_RANGE = (2.0, 8.0)
+LOAD_PF = 0.95
+
+# Line codes by number of phases: trunk and laterals
+_LINE_CODES = """New Linecode.trunk nphases=3 r1=0.19 x1=0.38 r0=0.48 x0=1.2 normamps=530 units=km
+New Linecode.lateral3 nphases=3 r1=0.39 x1=0.42 r0=0.8 x0=1.4 normamps=300 units=km
+New Linecode.lateral2 nphases=2 r1=0.6 x1=0.45 r0=0.9 x0=1.5 normamps=200 units=km
+New Linecode.lateral1 nphases=1 r1=0.6 x1=0.45 r0=0.6 x0=0.45 normamps=200 units=km
+"""
+
+
+def synthetic_dir() -> Path:
+    """Directory generated feeder scripts are written to.
+
+    Set OPENDSS_MCP_SYNTHETIC_DIR to choose it; the default is a folder in
+    the system temporary directory.
+
+    Returns:
+        Path of the directory (created if missing)
+    """
+    directory = Path(
+        os.environ.get(
+            "OPENDSS_MCP_SYNTHETIC_DIR",
+            Path(tempfile.gettempdir()) / "opendss_mcp_synthetic",
+        )
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _feeder_params(
+    num_buses: int,
+    lateral_depth: int = DEFAULT_LATERAL_DEPTH,
+    phase_mix: Optional[Dict[int, float]] = None,
+    load_density: float = DEFAULT_LOAD_DENSITY,
+    pv_density: float = DEFAULT_PV_DENSITY,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Validate generator parameters and fill in defaults.
+
+    Raises:
+        ValueError: If a parameter is out of range
+    """
+    if not isinstance(num_buses, int) or num_buses < 10:
+        raise ValueError(
+            f"num_buses must be an integer of at least 10, got {num_buses}"
+        )
+    if not isinstance(lateral_depth, int) or lateral_depth < 0:
+        raise ValueError(
+            f"lateral_depth must be a non-negative integer, got {lateral_depth}"
+        )
+    phase_mix = {int(k): float(v) for k, v in (phase_mix or DEFAULT_PHASE_MIX).items()}
+    if not set(phase_mix) <= {1, 2, 3} or any(v < 0 for v in phase_mix.values()):
+        raise ValueError(
+            "phase_mix must map 1, 2 and/or 3 phases to non-negative weights"
+        )
+    if sum(phase_mix.values()) <= 0:
+        raise ValueError("phase_mix must have a positive weight")
+    for name, value in (("load_density", load_density), ("pv_density", pv_density)):
+        if not 0 <= value <= 1:
+            raise ValueError(f"{name} must be between 0 and 1, got {value}")
+    return {
+        "num_buses": num_buses,
+        "lateral_depth": lateral_depth,
+        "phase_mix": dict(sorted(phase_mix.items(), reverse=True)),
+        "load_density": load_density,
+        "pv_density": pv_density,
+        "seed": seed,
+    }
+
+
+def _num_trunks(num_buses: int) -> int:
+    """Number of trunks (and substation transformers) of a feeder."""
+    return max(1, math.ceil(num_buses / (BUSES_PER_TRUNK + 1)))
+
+
+def _build_tree(params: Dict[str, Any], rng: random.Random) -> List[Dict[str, Any]]:
+    """Lay out the feeder buses.
+
+    Returns:
+        One entry per feeder bus with name, parent (None for the first bus of
+        a trunk), trunk index, phases and level (0 for trunks), parents always
+        before their children
+    """
+    num_trunks = _num_trunks(params["num_buses"])
+    # Besides the feeder buses: sourcebus and one substation bus per trunk
+    remaining = params["num_buses"] - 1 - num_trunks
+    depth = params["lateral_depth"]
+    phase_counts = list(params["phase_mix"])
+    weights = list(params["phase_mix"].values())
+
+    buses: List[Dict[str, Any]] = []
+
+    def add_chain(
+        parent: Optional[int],
+        trunk: int,
+        phases: List[int],
+        level: int,
+        length: int,
+        attach: List[int],
+    ) -> None:
+        for _ in range(length):
+            index = len(buses)
+            buses.append(
+                {
+                    "name": f"b{index + 1}",
+                    "parent": parent,
+                    "trunk": trunk,
+                    "phases": phases,
+                    "level": level,
+                }
+            )
+            if level < depth:
+                attach.append(index)
+            parent = index
+
+    # Trunks share the buses evenly. Each holds about sqrt(share) buses on
+    # its main line (all of them without laterals); laterals fill the rest.
+    base_share, extra = divmod(remaining, num_trunks)
+    trunk_length = (
+        base_share + (extra > 0) if depth == 0 else max(2, round(math.sqrt(base_share)))
+    )
+    for trunk in range(num_trunks):
+        share = base_share + (trunk < extra)
+        # Buses of this trunk that laterals may branch from
+        attach: List[int] = []
+        # Lateral buses per phase, to balance the phases of new laterals
+        phase_buses = {1: 0.0, 2: 0.0, 3: 0.0}
+        add_chain(None, trunk, [1, 2, 3], 0, min(trunk_length, share), attach)
+        placed = min(trunk_length, share)
+        while placed < share:
+            parent = attach[rng.randrange(len(attach))]
+            level = buses[parent]["level"] + 1
+            parent_phases = buses[parent]["phases"]
+            count = min(rng.choices(phase_counts, weights)[0], len(parent_phases))
+            candidates = sorted(
+                parent_phases, key=lambda phase: (phase_buses[phase], rng.random())
+            )
+            phases = sorted(candidates[:count])
+            max_length = max(3, trunk_length // level)
+            length = min(rng.randint(2, max_length), share - placed)
+            add_chain(parent, trunk, phases, level, length, attach)
+            placed += length
+            for phase in phases:
+                phase_buses[phase] += length / len(phases)
+
+    return buses
+
+
+def generate_feeder_script(
+    num_buses: int,
+    lateral_depth: int = DEFAULT_LATERAL_DEPTH,
+    phase_mix: Optional[Dict[int, float]] = None,
+    load_density: float = DEFAULT_LOAD_DENSITY,
+    pv_density: float = DEFAULT_PV_DENSITY,
+    seed: int = 0,
+    name: str = "synthetic",
+) -> str:
+    """Generate the DSS script of a synthetic radial feeder.
+
+    Args:
+        num_buses: Total number of buses, including the source and
+            substation buses (at least 10)
+        lateral_depth: Maximum number of lateral levels below the trunks
+            (0: trunks only; default: 3)
+        phase_mix: Relative weights of three-, two- and single-phase
+            laterals, e.g. {3: 0.2, 2: 0.1, 1: 0.7} (default). A lateral never
+            has more phases than the line it branches from.
+        load_density: Fraction of feeder buses with a load (default: 0.6)
+        pv_density: Fraction of loads with a PV system (default: 0.15)
+        seed: Random seed; the same parameters and seed give the same script
+        name: Circuit name
+
+    Returns:
+        DSS script text
+
+    Raises:
+        ValueError: If a parameter is out of range
+
+    Example:
+        >>> script = generate_feeder_script(1000, lateral_depth=2, seed=7)
+        >>> script.count("New Line.")
+        998
+    """
+    params = _feeder_params(
+        num_buses, lateral_depth, phase_mix, load_density, pv_density, seed
+    )
+    rng = random.Random(seed)
+    buses = _build_tree(params, rng)
+
+    lines: List[str] = []
+    loads: List[str] = []
+    pvs: List[str] = []
+    trunk_kw = [0.0] * _num_trunks(params["num_buses"])
+    for index, bus in enumerate(buses):
+        phases = bus["phases"]
+        terminals = "." + ".".join(map(str, phases))
+        if bus["parent"] is None:
+            parent = f"sub{bus['trunk'] + 1}"
+        else:
+            parent = buses[bus["parent"]]["name"]
+        if bus["level"] == 0:
+            code, length = "trunk", TRUNK_SEGMENT_KM
+        else:
+            code, length = f"lateral{len(phases)}", LATERAL_SEGMENT_KM
+        lines.append(
+            f"New Line.l{index + 1} phases={len(phases)} "
+            f"bus1={parent}{terminals} bus2={bus['name']}{terminals} "
+            f"linecode={code} length={length} units=km"
+        )
+
+        if rng.random() >= params["load_density"]:
+            continue
+        kw = round(rng.uniform(*LOAD_KW_RANGE), 2)
+        if len(phases) == 3 and bus["level"] == 0:
+            kw *= 3
+            connection, kv = f"{bus['name']}.1.2.3 phases=3", 12.47
+        else:
+            phase = rng.choice(phases)
+            connection, kv = f"{bus['name']}.{phase} phases=1", 7.2
+        trunk_kw[bus["trunk"]] += kw
+        loads.append(
+            f"New Load.ld{index + 1} bus1={connection} kV={kv} "
+            f"kW={kw:g} pf={LOAD_PF} model=1"
+        )
+
+        if rng.random() >= params["pv_density"]:
+            continue
+        pmpp = round(kw * rng.uniform(0.5, 1.2), 2)
+        pvs.append(
+            f"New PVSystem.pv{index + 1} bus1={connection} kV={kv} "
+            f"Pmpp={pmpp:g} kVA={round(pmpp * 1.1, 2):g} irradiance=1"
+        )
+
+    # One substation transformer per trunk, sized for its load with margin
+    transformers = []
+    for trunk, kw in enumerate(trunk_kw, start=1):
+        kva = max(1000, math.ceil(kw / LOAD_PF * 1.25 / 500) * 500)
+        transformers.append(
+            f"New Transformer.sub{trunk} phases=3 windings=2 XHL=6\n"
+            f"~ wdg=1 bus=sourcebus conn=delta kv=115 kva={kva} %r=0.5\n"
+            f"~ wdg=2 bus=sub{trunk} conn=wye kv=12.47 kva={kva} %r=0.5 tap=1.05"
+        )
+    substation = "\n".join(transformers)
+    header = f"""Clear
+Set DefaultBaseFrequency=60
+
+! Synthetic radial feeder generated by opendss_mcp (generator version {GENERATOR_VERSION})
+! Parameters: {json.dumps(params, sort_keys=True)}
+! Buses: {params['num_buses']}, trunks: {len(trunk_kw)}, loads: {len(loads)},
+! PV systems: {len(pvs)}, load: {sum(trunk_kw):.1f} kW
+
+New Circuit.{name} basekv=115 pu=1.0 phases=3 bus1=sourcebus MVAsc3=20000 MVAsc1=21000
+
+{substation}
+
+{_LINE_CODES}"""
+    footer = """
+Set VoltageBases=[115, 12.47]
+CalcVoltageBases
+"""
+    return "\n".join([header, *lines, "", *loads, "", *pvs, footer])
+
+
+def write_synthetic_feeder(
+    num_buses: int,
+    lateral_depth: int = DEFAULT_LATERAL_DEPTH,
+    phase_mix: Optional[Dict[int, float]] = None,
+    load_density: float = DEFAULT_LOAD_DENSITY,
+    pv_density: float = DEFAULT_PV_DENSITY,
+    seed: int = 0,
+    name: str = "synthetic",
+    directory: Optional[Path] = None,
+) -> Path:
+    """Write a synthetic feeder script, reusing an identical earlier one.
+
+    The file name contains a hash of the parameters and the generator
+    version, so each distinct feeder is generated once.
+
+    Args:
+        num_buses: Total number of buses (see generate_feeder_script)
+        lateral_depth: Maximum lateral depth (default: 3)
+        phase_mix: Weights of three-, two- and single-phase laterals
+        load_density: Fraction of buses with a load (default: 0.6)
+        pv_density: Fraction of loads with a PV system (default: 0.15)
+        seed: Random seed (default: 0)
+        name: Circuit name, also the file name prefix
+        directory: Output directory (default: synthetic_dir())
+
+    Returns:
+        Path of the DSS script
+
+    Raises:
+        ValueError: If a parameter is out of range
+    """
+    params = _feeder_params(
+        num_buses, lateral_depth, phase_mix, load_density, pv_density, seed
+    )
+    key = json.dumps(
+        {**params, "name": name, "version": GENERATOR_VERSION}, sort_keys=True
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:12]
+    directory = Path(directory) if directory is not None else synthetic_dir()
+    path = directory / f"{name}_{digest}.dss"
+    if path.exists():
+        return path
+
+    script = generate_feeder_script(name=name, **params)
+    # Write under a temporary name so concurrent loaders never see a partial file
+    fd, temp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(script)
+    os.replace(temp_name, path)
+    logger.info(f"Generated synthetic feeder {path.name} ({num_buses} buses)")
+    return path
+
+
+def synthetic_feeder_path(feeder_id: str) -> Path:
+    """Write (or reuse) the script of a named synthetic feeder.
+
+    Args:
+        feeder_id: Key of SYNTHETIC_FEEDERS, e.g. "SYNTH10K"
+
+    Returns:
+        Path of the DSS script
+
+    Raises:
+        ValueError: If the feeder ID is not a synthetic feeder
+    """
+    if feeder_id not in SYNTHETIC_FEEDERS:
+        raise ValueError(f"Unknown synthetic feeder: {feeder_id}")
+    return write_synthetic_feeder(
+        name=feeder_id.lower(), **SYNTHETIC_FEEDERS[feeder_id]
+    )
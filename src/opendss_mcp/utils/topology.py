@@ -0,0 +1,379 @@
+"""
+Topology index of the compiled circuit.
+
+Tools used to rediscover the feeder's structure on every call: scanning
+AllBusNames() to validate a bus, walking Lines with Bus1/Bus2 to draw the
+network, rebuilding a networkx graph per plot. This module builds one index
+per compiled circuit with a pass over the PD and PC elements and keeps it
+until the circuit changes. It holds the bus adjacency, the elements connected
+to each bus, a breadth-first tree rooted at the source bus(es) (parent,
+children, depth, distance from the substation) and a pre-order numbering for
+subtree queries, so lookups are O(1) and path queries O(depth).
+"""
+
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import opendssdirect as dss
+
+from .dss_wrapper import circuit_signature
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Conversion of OpenDSS length units (LineUnits codes) to km; "none" (0) is
+# taken as km since the length is then in the units of the line impedances
+LENGTH_UNITS_KM = {
+    0: 1.0,
+    1: 1.609344,  # mi
+    2: 0.3048,  # kft
+    3: 1.0,  # km
+    4: 0.001,  # m
+    5: 0.0003048,  # ft
+    6: 0.0000254,  # in
+    7: 0.00001,  # cm
+    8: 0.000001,  # mm
+}
+
+# Index of the active circuit and the circuit signature it was built for
+_index_cache: Dict[str, Any] = {"signature": None, "index": None}
+
+
+def _bus_of(terminal: str) -> str:
+    """Strip the node suffix from a terminal ("632.1.2.3" -> "632")."""
+    return terminal.split(".")[0].lower()
+
+
+class TopologyIndex:
+    """Bus graph, element lookup and source tree of a compiled circuit.
+
+    Buses are identified by their position in Circuit.AllBusNames(); public
+    methods accept bus names in any case. Series PD elements (lines,
+    transformers, series reactors) form the edges of the bus graph; every
+    element, including shunt PD and PC elements, is listed at its buses.
+    Elements that are open or disabled are still part of the index, which
+    describes the circuit as built rather than its operating state.
+
+    Attributes:
+        bus_names: Bus names in circuit order
+        edges: (element name, from bus index, to bus index) of each series element
+        source_buses: Indices of the buses fed by voltage sources
+        parent: Parent bus index of each bus in the source tree (-1 for
+            source buses and buses not connected to a source)
+        parent_edge: Edge index connecting each bus to its parent (-1 if none)
+        depth: Number of edges from the source (-1 if not connected)
+        distance_km: Line length from the source in km (NaN if not connected)
+        preorder: Depth-first position of each bus in the source tree
+        subtree_end: End (exclusive) of each bus's subtree in pre-order
+        loops: Series elements that close a loop (not part of the tree)
+    """
+
+    def __init__(
+        self,
+        bus_names: List[str],
+        elements: List[Tuple[str, List[str], bool]],
+        line_lengths_km: Dict[str, float],
+        source_elements: List[str],
+    ) -> None:
+        """Build the index from the circuit's elements.
+
+        Args:
+            bus_names: Bus names from Circuit.AllBusNames()
+            elements: (full element name, bus names, is_series) of every element
+            line_lengths_km: Length of each line in km, by lower-case full
+                element name
+            source_elements: Full names of the voltage sources
+        """
+        self.bus_names = bus_names
+        self._position = {name.lower(): i for i, name in enumerate(bus_names)}
+        self._bus_elements: List[List[str]] = [[] for _ in bus_names]
+        self._cache: Dict[Any, Any] = {}
+
+        self.edges: List[Tuple[str, int, int]] = []
+        lengths: List[float] = []
+        for name, buses, is_series in elements:
+            indices = list(
+                dict.fromkeys(
+                    self._position[_bus_of(bus)]
+                    for bus in buses
+                    if _bus_of(bus) in self._position
+                )
+            )
+            for b in indices:
+                self._bus_elements[b].append(name)
+            if is_series:
+                # Multi-winding transformers connect every winding to winding 1
+                for b in indices[1:]:
+                    self.edges.append((name, indices[0], b))
+                    lengths.append(line_lengths_km.get(name.lower(), 0.0))
+
+        self._edge_length = np.array(lengths, dtype=float)
+        self._adjacency: List[List[Tuple[int, int]]] = [[] for _ in bus_names]
+        for e, (_, a, b) in enumerate(self.edges):
+            self._adjacency[a].append((b, e))
+            self._adjacency[b].append((a, e))
+
+        source_names = {name.lower() for name in source_elements}
+        sources = {
+            self._position[_bus_of(buses[0])]
+            for name, buses, _ in elements
+            if name.lower() in source_names and buses
+        }
+        self.source_buses = np.array(sorted(sources), dtype=int)
+        self._build_tree()
+
+    def _build_tree(self) -> None:
+        """Breadth-first tree from the source buses and its pre-order numbering."""
+        n = len(self.bus_names)
+        self.parent = np.full(n, -1, dtype=int)
+        self.parent_edge = np.full(n, -1, dtype=int)
+        self.depth = np.full(n, -1, dtype=int)
+        self.distance_km = np.full(n, np.nan)
+        self._children: List[List[int]] = [[] for _ in range(n)]
+        self.loops: List[str] = []
+
+        queue = deque(int(b) for b in self.source_buses)
+        for b in self.source_buses:
+            self.depth[b] = 0
+            self.distance_km[b] = 0.0
+        tree_edges = set()
+        while queue:
+            bus = queue.popleft()
+            for neighbor, edge in self._adjacency[bus]:
+                if self.depth[neighbor] >= 0:
+                    continue
+                self.parent[neighbor] = bus
+                self.parent_edge[neighbor] = edge
+                self.depth[neighbor] = self.depth[bus] + 1
+                self.distance_km[neighbor] = (
+                    self.distance_km[bus] + self._edge_length[edge]
+                )
+                self._children[bus].append(neighbor)
+                tree_edges.add(edge)
+                queue.append(neighbor)
+        self.loops = [
+            name for e, (name, _, _) in enumerate(self.edges) if e not in tree_edges
+        ]
+
+        # Pre-order positions: the subtree of bus b is preorder[b]:subtree_end[b]
+        self.preorder = np.full(n, -1, dtype=int)
+        self.subtree_end = np.full(n, -1, dtype=int)
+        self._order: List[int] = []
+        for root in self.source_buses:
+            stack = [(int(root), False)]
+            while stack:
+                bus, done = stack.pop()
+                if done:
+                    self.subtree_end[bus] = len(self._order)
+                    continue
+                self.preorder[bus] = len(self._order)
+                self._order.append(bus)
+                stack.append((bus, True))
+                stack.extend((child, False) for child in reversed(self._children[bus]))
+
+    @classmethod
+    @instrumentation.timed("extract")
+    def build(cls, engine: Optional[Any] = None) -> "TopologyIndex":
+        """Build the index of the active circuit.
+
+        Args:
+            engine: OpenDSS interface to read from (default: opendssdirect)
+
+        Returns:
+            TopologyIndex of the active circuit
+        """
+        engine = engine if engine is not None else dss
+        bus_names = list(engine.Circuit.AllBusNames())
+
+        elements: List[Tuple[str, List[str], bool]] = []
+        if engine.Circuit.FirstPDElement() > 0:
+            while True:
+                elements.append(
+                    (
+                        engine.CktElement.Name(),
+                        list(engine.CktElement.BusNames()),
+                        not engine.PDElements.IsShunt(),
+                    )
+                )
+                if not engine.Circuit.NextPDElement() > 0:
+                    break
+        if engine.Circuit.FirstPCElement() > 0:
+            while True:
+                elements.append(
+                    (
+                        engine.CktElement.Name(),
+                        list(engine.CktElement.BusNames()),
+                        False,
+                    )
+                )
+                if not engine.Circuit.NextPCElement() > 0:
+                    break
+
+        # Voltage sources are not part of the PC element list
+        source_elements = []
+        if engine.Vsources.First() > 0:
+            while True:
+                name = engine.CktElement.Name()
+                source_elements.append(name)
+                elements.append((name, list(engine.CktElement.BusNames()), False))
+                if not engine.Vsources.Next() > 0:
+                    break
+
+        line_lengths_km: Dict[str, float] = {}
+        if engine.Lines.First() > 0:
+            while True:
+                factor = LENGTH_UNITS_KM.get(engine.Lines.Units(), 1.0)
+                name = f"line.{engine.Lines.Name()}".lower()
+                line_lengths_km[name] = engine.Lines.Length() * factor
+                if not engine.Lines.Next() > 0:
+                    break
+
+        return cls(bus_names, elements, line_lengths_km, source_elements)
+
+    def bus_index(self, bus: str) -> Optional[int]:
+        """Position of a bus in bus_names, or None if it does not exist."""
+        return self._position.get(bus.lower())
+
+    def has_bus(self, bus: str) -> bool:
+        """Whether the circuit has a bus of this name (case-insensitive)."""
+        return bus.lower() in self._position
+
+    def _require(self, bus: str) -> int:
+        """Position of a bus, raising ValueError if it does not exist."""
+        index = self._position.get(bus.lower())
+        if index is None:
+            raise ValueError(f"Bus '{bus}' not found in circuit")
+        return index
+
+    def elements_at(self, bus: str) -> List[str]:
+        """Full names of all elements connected to a bus."""
+        return list(self._bus_elements[self._require(bus)])
+
+    def neighbors(self, bus: str) -> List[str]:
+        """Buses connected to a bus through one series element."""
+        return [
+            self.bus_names[b]
+            for b in dict.fromkeys(b for b, _ in self._adjacency[self._require(bus)])
+        ]
+
+    def parent_of(self, bus: str) -> Optional[str]:
+        """Next bus towards the source, or None at a source or unconnected bus."""
+        parent = self.parent[self._require(bus)]
+        return self.bus_names[parent] if parent >= 0 else None
+
+    def children(self, bus: str) -> List[str]:
+        """Buses fed from a bus in the source tree."""
+        return [self.bus_names[b] for b in self._children[self._require(bus)]]
+
+    def path_to_source(self, bus: str) -> List[str]:
+        """Buses from a bus up to its source bus, both included.
+
+        Returns an empty list for buses not connected to a source.
+        """
+        b = self._require(bus)
+        if self.depth[b] < 0:
+            return []
+        path = [b]
+        while self.parent[path[-1]] >= 0:
+            path.append(int(self.parent[path[-1]]))
+        return [self.bus_names[i] for i in path]
+
+    def path_elements(self, bus: str) -> List[str]:
+        """Series elements between a bus and its source, nearest first."""
+        b = self._require(bus)
+        elements = []
+        while self.parent_edge[b] >= 0:
+            elements.append(self.edges[self.parent_edge[b]][0])
+            b = int(self.parent[b])
+        return elements
+
+    def downstream(self, bus: str) -> List[str]:
+        """Buses in the subtree fed through a bus, the bus itself first."""
+        b = self._require(bus)
+        if self.preorder[b] < 0:
+            return []
+        return [
+            self.bus_names[i]
+            for i in self._order[self.preorder[b] : self.subtree_end[b]]
+        ]
+
+    def is_downstream(self, bus: str, of: str) -> bool:
+        """Whether bus is fed through bus `of` in the source tree (O(1))."""
+        b, a = self._require(bus), self._require(of)
+        return bool(
+            self.preorder[a] >= 0
+            and self.preorder[a] <= self.preorder[b] < self.subtree_end[a]
+        )
+
+    def lines(self) -> List[Dict[str, str]]:
+        """Line edges as {"name", "bus1", "bus2"} dictionaries."""
+        return [
+            {
+                "name": name.split(".", 1)[1],
+                "bus1": self.bus_names[a],
+                "bus2": self.bus_names[b],
+            }
+            for name, a, b in self.edges
+            if name.lower().startswith("line.")
+        ]
+
+    def cached(self, key: Any, builder: Callable[[], Any]) -> Any:
+        """Value derived from the topology, built on first use for this index.
+
+        Args:
+            key: Hashable key of the derived value
+            builder: Function computing the value
+
+        Returns:
+            The cached or newly built value
+        """
+        if key not in self._cache:
+            self._cache[key] = builder()
+        return self._cache[key]
+
+    def graph(self) -> Any:
+        """Undirected networkx graph of the buses and series elements."""
+
+        def build_graph() -> Any:
+            import networkx as nx
+
+            graph = nx.Graph()
+            graph.add_nodes_from(self.bus_names)
+            graph.add_edges_from(
+                (self.bus_names[a], self.bus_names[b], {"element": name})
+                for name, a, b in self.edges
+            )
+            return graph
+
+        return self.cached("graph", build_graph)
+
+
+def get_topology(engine: Optional[Any] = None) -> TopologyIndex:
+    """Topology index of the active circuit, rebuilt only when it changed.
+
+    The index is reused while the circuit name and the numbers of elements,
+    buses and nodes stay the same, so opening switches, editing element
+    properties or re-solving keeps it. New buses enter OpenDSS's bus list at
+    the next solve, which then triggers a rebuild. Callers that reconnect an
+    existing element to other buses must call invalidate_topology().
+
+    Args:
+        engine: OpenDSS interface to read from (default: opendssdirect)
+
+    Returns:
+        TopologyIndex of the active circuit
+    """
+    engine = engine if engine is not None else dss
+    signature = circuit_signature(engine)
+    if _index_cache["signature"] != signature or _index_cache["index"] is None:
+        _index_cache["index"] = TopologyIndex.build(engine)
+        _index_cache["signature"] = signature
+    return _index_cache["index"]
+
+
+def invalidate_topology() -> None:
+    """Drop the cached topology index (e.g. after recompiling a circuit)."""
+    _index_cache["signature"] = None
+    _index_cache["index"] = None
@@ -9,9 +9,10 @@ from typing import Optional
 
 # Type alias for better readability
 from .dss_wrapper import DSSCircuit
+from .synthetic_feeder import SYNTHETIC_FEEDERS
 
 # Constants for validation
-VALID_FEEDER_IDS = ["IEEE13", "IEEE34", "IEEE123"]
+VALID_FEEDER_IDS = ["IEEE13", "IEEE34", "IEEE123", *SYNTHETIC_FEEDERS]
 MIN_VOLTAGE_PU = 0.8
 MAX_VOLTAGE_PU = 1.2
 
@@ -23,14 +24,17 @@ def validate_bus_id(bus_id: str, dss_circuit: DSSCircuit) -> None:
         bus_id: The bus ID to validate
         dss_circuit: An instance of DSSCircuit to check against
 
+    The lookup is case-insensitive and uses the circuit's cached name index,
+    so validating many buses does not rescan the bus list.
+
     Raises:
         ValueError: If the bus ID is not found in the circuit
         RuntimeError: If there's an error accessing circuit buses
     """
     try:
-        available_buses = dss_circuit.get_bus_names()
-        if bus_id not in available_buses:
-            sample_buses = ", ".join(available_buses[:5])
+        names = dss_circuit.name_index()
+        if not names.has_bus(bus_id):
+            sample_buses = ", ".join(names.bus_names[:5])
             raise ValueError(
                 f"Bus '{bus_id}' not found in circuit. "
                 f"Available buses (first 5): {sample_buses}..."
@@ -71,7 +75,7 @@ def validate_voltage_limits(min_pu: float, max_pu: float) -> None:
 
 
 def validate_feeder_id(feeder_id: str) -> None:
-    """Validate that the feeder ID is one of the supported IEEE test feeders.
+    """Validate that the feeder ID is one of the supported IEEE or synthetic feeders.
 
     Args:
         feeder_id: The feeder ID to validate
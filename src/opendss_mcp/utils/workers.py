@@ -0,0 +1,128 @@
+"""
+Process-pool helpers for running OpenDSS studies in parallel.
+
+OpenDSS keeps a single active circuit per process, so studies that evaluate
+many independent cases (buses, candidates, contingencies) are parallelized by
+giving every worker process its own copy of the feeder. Each worker compiles
+the feeder once in its initializer and then reuses it for all tasks it
+receives. Results are returned in task order, so merged tables do not depend
+on scheduling.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Load result of the feeder compiled by this worker process
+_worker_state: Dict[str, Any] = {"feeder_id": None, "load_result": None}
+
+
+def default_worker_count(num_tasks: int) -> int:
+    """Choose a worker count for a number of tasks.
+
+    Args:
+        num_tasks: Number of tasks to run
+
+    Returns:
+        Number of worker processes (at least 1, at most the CPU count)
+    """
+    return max(1, min(num_tasks, os.cpu_count() or 1))
+
+
+def _init_worker(feeder_id: str, modifications: Optional[Dict[str, Any]]) -> None:
+    """Compile the feeder once in a freshly started worker process.
+
+    Args:
+        feeder_id: Identifier of the feeder to load
+        modifications: Optional circuit modifications passed to the loader
+    """
+    from ..tools.feeder_loader import load_ieee_test_feeder
+
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_state["feeder_id"] = feeder_id
+    _worker_state["load_result"] = load_ieee_test_feeder(feeder_id, modifications)
+
+
+def worker_feeder_error() -> Optional[str]:
+    """Return the feeder load error of this worker process, if any.
+
+    Returns:
+        Error message, or None if the feeder loaded successfully
+    """
+    load_result = _worker_state["load_result"]
+    if load_result is None:
+        return "Worker process has no feeder loaded"
+    if not load_result.get("success", False):
+        errors = load_result.get("errors") or ["Unknown error"]
+        return f"Failed to load feeder {_worker_state['feeder_id']}: {errors[0]}"
+    return None
+
+
+def run_parallel(
+    feeder_id: str,
+    func: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    max_workers: Optional[int] = None,
+    modifications: Optional[Dict[str, Any]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[Any]:
+    """Run func over tasks in worker processes that each hold the feeder.
+
+    Tasks are sent to the workers in chunks so that each worker evaluates
+    many tasks against its compiled circuit. func must be a module-level
+    function (it is pickled by reference) and should catch its own errors,
+    since any exception it raises aborts the whole run.
+
+    Args:
+        feeder_id: Identifier of the feeder every worker loads
+        func: Module-level function applied to each task
+        tasks: Picklable task arguments
+        max_workers: Number of worker processes (default: CPU count)
+        modifications: Optional circuit modifications passed to the loader
+        progress_callback: Optional function called as
+            progress_callback(tasks_done, num_tasks) as results arrive; an
+            exception it raises stops the run without starting queued tasks
+
+    Returns:
+        List of func results in the same order as tasks
+
+    Example:
+        >>> rows = run_parallel("IEEE123", _capacity_task, bus_tasks, max_workers=4)
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+
+    workers = max_workers or default_worker_count(len(tasks))
+    workers = max(1, min(workers, len(tasks)))
+    chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+
+    logger.info(
+        f"Running {len(tasks)} tasks on {workers} worker processes "
+        f"(feeder {feeder_id}, chunksize {chunksize})"
+    )
+
+    # Spawned workers start from a clean interpreter with no OpenDSS state
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(feeder_id, modifications),
+    ) as executor:
+        results = []
+        try:
+            for result in executor.map(func, tasks, chunksize=chunksize):
+                results.append(result)
+                if progress_callback is not None:
+                    progress_callback(len(results), len(tasks))
+        except BaseException:
+            # Drop the queued chunks (e.g. a cancelled job) instead of
+            # waiting for every task on the way out
+            executor.shutdown(cancel_futures=True)
+            raise
+        return results
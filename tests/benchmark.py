@@ -1,22 +1,56 @@
 """
 Performance benchmarks for OpenDSS MCP Server.
 
-This module tests the performance of key operations to ensure they meet
-the project's performance requirements.
-
-Performance Targets:
-- Power flow (IEEE123): < 5 seconds
-- DER optimization (10 candidates): < 30 seconds
-- Time-series simulation (24 hours): < 60 seconds
+Runs every tool on feeders of increasing size and reports how the run time
+scales. Each (tool, feeder) scenario runs in a fresh process: the feeder is
+loaded, the tool is run a few times as warmup, then timed over several
+repetitions. Reported per scenario:
+
+- median, p95, min, max and mean wall time
+- peak resident set size (RSS) of the process and its growth during the runs
+- median time per instrumented phase (compile, solve, extract, ...) and
+  median number of OpenDSS API calls
+
+Results are written as JSON. Given a baseline file from an earlier run, the
+harness compares median times and peak RSS and flags regressions beyond a
+threshold; the exit code is 1 if any scenario regressed or failed.
+
+Usage:
+    python tests/benchmark.py                              # default feeders and tools
+    python tests/benchmark.py --feeders IEEE13 SYNTH10K --tools power_flow timeseries
+    python tests/benchmark.py --output baseline.json
+    python tests/benchmark.py --baseline baseline.json --threshold 0.2
 """
 
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
 import time
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Version of the JSON result format
+SCHEMA_VERSION = 1
+
+DEFAULT_FEEDERS = ["IEEE13", "IEEE34", "IEEE123", "SYNTH1K", "SYNTH10K"]
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+DEFAULT_OUTPUT = "benchmark_results.json"
 
-from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
-from opendss_mcp.tools.power_flow import run_power_flow
-from opendss_mcp.tools.der_optimizer import optimize_der_placement
-from opendss_mcp.tools.timeseries import run_time_series_simulation
+# Relative slowdown flagged as a regression, and the smallest absolute change
+# (seconds) that counts, so timer noise on fast scenarios is not flagged
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_S = 0.005
+
+# Number of candidate buses for the DER optimizer
+OPTIMIZER_CANDIDATES = 10
 
 
 def format_time(seconds: float) -> str:
@@ -38,325 +72,495 @@ def format_time(seconds: float) -> str:
         return f"{minutes}m {remaining_seconds:.2f}s"
 
 
-def print_result(
-    test_name: str,
-    elapsed_time: float,
-    target_time: float,
-    success: bool,
-    details: str = "",
-) -> None:
-    """Print formatted benchmark result.
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
 
-    Args:
-        test_name: Name of the benchmark test
-        elapsed_time: Actual elapsed time
-        target_time: Target time threshold
-        success: Whether the operation succeeded
-        details: Additional details to print
-    """
-    status = "✓ PASS" if elapsed_time < target_time and success else "✗ FAIL"
-    print(f"\n{test_name}")
-    print(f"  Time: {format_time(elapsed_time)} / {format_time(target_time)}")
-    print(f"  Status: {status}")
-    if details:
-        print(f"  Details: {details}")
 
+def _spread(items: List[str], count: int) -> List[str]:
+    """Pick count items evenly spread over a list."""
+    if len(items) <= count:
+        return list(items)
+    step = len(items) / count
+    return [items[int(i * step)] for i in range(count)]
 
-def test_power_flow_performance() -> dict[str, Any]:
-    """Benchmark power flow analysis on IEEE123 (largest test feeder).
 
-    Target: < 5 seconds
+def _prepare(feeder_id: str, solve: bool) -> Dict[str, Any]:
+    """Load the feeder (and solve it) before a timed run.
 
     Returns:
-        Dictionary with test results
+        Context for the tool: buses with a load, in load order
     """
-    print("\n" + "=" * 70)
-    print("BENCHMARK 1: Power Flow Analysis (IEEE123)")
-    print("=" * 70)
+    import opendssdirect as dss
 
-    # Load feeder (not counted in performance time)
-    print("Loading IEEE123 feeder...")
-    load_result = load_ieee_test_feeder("IEEE123")
-    if not load_result["success"]:
-        print(f"  ✗ Failed to load feeder: {load_result.get('errors')}")
-        return {
-            "test": "power_flow",
-            "success": False,
-            "time": 0,
-            "target": 5.0,
-        }
-
-    # Measure power flow time
-    print("Running power flow analysis...")
-    start_time = time.time()
-    pf_result = run_power_flow("IEEE123")
-    elapsed_time = time.time() - start_time
-
-    success = pf_result["success"]
-    details = ""
-    if success:
-        min_v = pf_result["data"]["min_voltage"]
-        max_v = pf_result["data"]["max_voltage"]
-        details = f"Voltage range: {min_v:.4f} - {max_v:.4f} pu"
-
-    print_result(
-        "Power Flow (IEEE123)",
-        elapsed_time,
-        target_time=5.0,
-        success=success,
-        details=details,
-    )
+    from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+    from opendss_mcp.tools.power_flow import run_power_flow
 
-    return {
-        "test": "power_flow",
-        "success": success,
-        "time": elapsed_time,
-        "target": 5.0,
-        "passed": elapsed_time < 5.0 and success,
-    }
+    loaded = load_ieee_test_feeder(feeder_id)
+    if not loaded["success"]:
+        raise RuntimeError(f"Failed to load {feeder_id}: {loaded['errors']}")
+    if solve:
+        run_power_flow(feeder_id)
 
+    load_buses = []
+    for load in dss.Loads.AllNames():
+        dss.Circuit.SetActiveElement(f"Load.{load}")
+        bus = dss.CktElement.BusNames()[0].split(".")[0]
+        if bus not in load_buses:
+            load_buses.append(bus)
+    return {"load_buses": load_buses}
 
-def test_der_optimization_performance() -> dict[str, Any]:
-    """Benchmark DER placement optimization with 10 candidates.
 
-    Target: < 30 seconds
+def _run_load(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+
+    return load_ieee_test_feeder(feeder_id)
+
+
+def _run_power_flow(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.power_flow import run_power_flow
+
+    return run_power_flow(feeder_id)
+
+
+def _run_voltage_check(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.voltage_checker import check_voltage_violations
+
+    return check_voltage_violations()
 
-    Returns:
-        Dictionary with test results
-    """
-    print("\n" + "=" * 70)
-    print("BENCHMARK 2: DER Placement Optimization (10 candidates)")
-    print("=" * 70)
 
-    # Load feeder (not counted in performance time)
-    print("Loading IEEE123 feeder...")
-    load_result = load_ieee_test_feeder("IEEE123")
-    if not load_result["success"]:
-        print(f"  ✗ Failed to load feeder: {load_result.get('errors')}")
-        return {
-            "test": "der_optimization",
-            "success": False,
-            "time": 0,
-            "target": 30.0,
-        }
-
-    # Run initial power flow (not counted)
-    print("Running initial power flow...")
-    run_power_flow("IEEE123")
-
-    # Select 10 candidate buses from IEEE123
-    # Using various buses spread throughout the feeder
-    # These are load buses from the IEEE123 feeder
-    candidate_buses = [
-        "1",
-        "7",
-        "13",
-        "18",
-        "35",
-        "40",
-        "57",
-        "60",
-        "72",
-        "97",
-    ]
-
-    # Measure optimization time
-    print(f"Optimizing DER placement across {len(candidate_buses)} buses...")
-    start_time = time.time()
-    opt_result = optimize_der_placement(
+def _run_capacity(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.capacity import analyze_feeder_capacity
+
+    buses = context["load_buses"]
+    return analyze_feeder_capacity(
+        buses[len(buses) // 2],
+        max_capacity_kw=2000,
+        increment_kw=100,
+        search="bisection",
+    )
+
+
+def _run_optimizer(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.der_optimizer import optimize_der_placement
+
+    return optimize_der_placement(
         der_type="solar",
         capacity_kw=500,
         objective="minimize_losses",
-        candidate_buses=candidate_buses,
+        candidate_buses=_spread(context["load_buses"], OPTIMIZER_CANDIDATES),
     )
-    elapsed_time = time.time() - start_time
-
-    success = opt_result["success"]
-    details = ""
-    if success:
-        optimal_bus = opt_result["data"]["optimal_bus"]
-        loss_reduction = opt_result["data"]["improvement_metrics"]["loss_reduction_pct"]
-        details = f"Optimal bus: {optimal_bus}, Loss reduction: {loss_reduction:.2f}%"
-    else:
-        # Print error for debugging
-        error_msg = opt_result.get("errors", ["Unknown error"])[0]
-        details = f"Error: {error_msg[:50]}"
-
-    print_result(
-        "DER Optimization (10 candidates)",
-        elapsed_time,
-        target_time=30.0,
-        success=success,
-        details=details,
+
+
+def _run_timeseries(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.timeseries import run_time_series_simulation
+
+    return run_time_series_simulation(
+        load_profile="residential_summer",
+        generation_profile="solar_clear_day",
+        duration_hours=24,
     )
 
+
+def _run_harmonics(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.power_flow import run_power_flow
+
+    return run_power_flow(feeder_id, {"harmonic_analysis": True})
+
+
+def _run_visualization(feeder_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    from opendss_mcp.tools.visualization import generate_visualization
+
+    return generate_visualization("voltage_profile", data_source="circuit")
+
+
+# Benchmarked tools: timed function and whether the feeder is solved first
+TOOLS: Dict[str, Dict[str, Any]] = {
+    "load_feeder": {"run": _run_load, "solve": False},
+    "power_flow": {"run": _run_power_flow, "solve": False},
+    "voltage_check": {"run": _run_voltage_check, "solve": True},
+    "capacity": {"run": _run_capacity, "solve": False},
+    "optimizer": {"run": _run_optimizer, "solve": True},
+    "timeseries": {"run": _run_timeseries, "solve": False},
+    "harmonics": {"run": _run_harmonics, "solve": False},
+    "visualization": {"run": _run_visualization, "solve": True},
+}
+
+
+def run_scenario(
+    tool: str,
+    feeder_id: str,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+) -> Dict[str, Any]:
+    """Time one tool on one feeder in the current process.
+
+    The feeder is reloaded before every run (untimed), so each run starts
+    from the same circuit.
+
+    Args:
+        tool: Key of TOOLS
+        feeder_id: Feeder to run on
+        repeat: Number of timed runs
+        warmup: Number of untimed runs before them
+
+    Returns:
+        Scenario result with success, timing statistics, peak RSS, phase
+        timings and OpenDSS API calls (or error on failure)
+    """
+    from opendss_mcp.utils.instrumentation import instrumentation
+
+    scenario: Dict[str, Any] = {
+        "tool": tool,
+        "feeder": feeder_id,
+        "repeat": repeat,
+        "warmup": warmup,
+    }
+    run: Callable[[str, Dict[str, Any]], Dict[str, Any]] = TOOLS[tool]["run"]
+    times: List[float] = []
+    phases: List[Dict[str, float]] = []
+    api_calls: List[int] = []
+    rss_before = None
+
+    try:
+        for index in range(warmup + repeat):
+            context = _prepare(feeder_id, TOOLS[tool]["solve"])
+            if index == warmup:
+                rss_before = _peak_rss_mb()
+            with instrumentation.invocation(f"benchmark.{tool}") as record:
+                started = time.perf_counter()
+                result = run(feeder_id, context)
+                elapsed = time.perf_counter() - started
+            if not result.get("success"):
+                raise RuntimeError((result.get("errors") or ["Unknown error"])[0])
+            if index >= warmup:
+                times.append(elapsed)
+                phases.append(record["phases_ms"])
+                api_calls.append(record["api_calls"])
+    except Exception as e:
+        return {**scenario, "success": False, "error": str(e)}
+
+    peak_rss = _peak_rss_mb()
+    phase_names = sorted({name for run_phases in phases for name in run_phases})
     return {
-        "test": "der_optimization",
-        "success": success,
-        "time": elapsed_time,
-        "target": 30.0,
-        "passed": elapsed_time < 30.0 and success,
+        **scenario,
+        "success": True,
+        "median_s": round(statistics.median(times), 6),
+        "p95_s": round(float(np.percentile(times, 95)), 6),
+        "min_s": round(min(times), 6),
+        "max_s": round(max(times), 6),
+        "mean_s": round(statistics.mean(times), 6),
+        "times_s": [round(t, 6) for t in times],
+        "peak_rss_mb": peak_rss,
+        "rss_growth_mb": (
+            round(peak_rss - rss_before, 1)
+            if peak_rss is not None and rss_before is not None
+            else None
+        ),
+        "phases_ms": {
+            name: round(statistics.median(p.get(name, 0.0) for p in phases), 3)
+            for name in phase_names
+        },
+        "api_calls": int(statistics.median(api_calls)),
     }
 
 
-def test_timeseries_performance() -> dict[str, Any]:
-    """Benchmark 24-hour time-series simulation.
+def run_isolated(
+    tool: str,
+    feeder_id: str,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+) -> Dict[str, Any]:
+    """Run a scenario in a fresh process, so its peak RSS is its own.
 
-    Target: < 60 seconds
+    Args:
+        tool: Key of TOOLS
+        feeder_id: Feeder to run on
+        repeat: Number of timed runs
+        warmup: Number of untimed runs
 
     Returns:
-        Dictionary with test results
+        Scenario result (see run_scenario)
     """
-    print("\n" + "=" * 70)
-    print("BENCHMARK 3: Time-Series Simulation (24 hours)")
-    print("=" * 70)
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        try:
+            return pool.submit(run_scenario, tool, feeder_id, repeat, warmup).result()
+        except Exception as e:
+            return {
+                "tool": tool,
+                "feeder": feeder_id,
+                "repeat": repeat,
+                "warmup": warmup,
+                "success": False,
+                "error": f"Benchmark process failed: {e}",
+            }
 
-    # Load feeder (not counted in performance time)
-    print("Loading IEEE13 feeder...")
-    load_result = load_ieee_test_feeder("IEEE13")
-    if not load_result["success"]:
-        print(f"  ✗ Failed to load feeder: {load_result.get('errors')}")
-        return {
-            "test": "timeseries",
-            "success": False,
-            "time": 0,
-            "target": 60.0,
-        }
-
-    # Create a simple flat load profile for 24 hours
-    load_profile = {
-        "name": "BENCHMARK_FLAT",
-        "multipliers": [1.0] * 24,  # Constant load for 24 hours
-    }
 
-    # Measure time-series simulation
-    print("Running 24-hour simulation (hourly steps)...")
-    start_time = time.time()
-    ts_result = run_time_series_simulation(
-        load_profile=load_profile,
-        duration_hours=24,
-        timestep_minutes=60,  # Hourly
-    )
-    elapsed_time = time.time() - start_time
-
-    success = ts_result["success"]
-    details = ""
-    if success:
-        num_steps = ts_result["data"]["summary"]["num_timesteps"]
-        avg_losses = ts_result["data"]["summary"].get("avg_losses_kw", 0)
-        details = f"Steps: {num_steps}, Avg losses: {avg_losses:.2f} kW"
-
-    print_result(
-        "Time-Series Simulation (24h)",
-        elapsed_time,
-        target_time=60.0,
-        success=success,
-        details=details,
-    )
+def _machine_info() -> Dict[str, Any]:
+    """Describe the machine and library versions the benchmark ran with."""
+    import opendssdirect
 
     return {
-        "test": "timeseries",
-        "success": success,
-        "time": elapsed_time,
-        "target": 60.0,
-        "passed": elapsed_time < 60.0 and success,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "opendssdirect": getattr(opendssdirect, "__version__", "unknown"),
+        "numpy": np.__version__,
     }
 
 
-def print_summary_table(results: list[dict[str, Any]]) -> None:
-    """Print summary table of all benchmark results.
+def run_benchmarks(
+    feeders: List[str],
+    tools: List[str],
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    isolate: bool = True,
+    verbose: bool = True,
+) -> Dict[str, Any]:
+    """Run every tool on every feeder.
 
     Args:
-        results: List of benchmark result dictionaries
+        feeders: Feeder IDs, smallest first
+        tools: Keys of TOOLS
+        repeat: Timed runs per scenario
+        warmup: Untimed runs per scenario
+        isolate: Run each scenario in its own process (default: True)
+        verbose: Print each scenario as it finishes
+
+    Returns:
+        Benchmark report with schema, created, machine, config and results
     """
-    print("\n" + "=" * 70)
-    print("BENCHMARK SUMMARY")
-    print("=" * 70)
+    results = []
+    for feeder_id in feeders:
+        for tool in tools:
+            runner = run_isolated if isolate else run_scenario
+            result = runner(tool, feeder_id, repeat, warmup)
+            results.append(result)
+            if verbose:
+                if result["success"]:
+                    print(
+                        f"  {tool:<14} {feeder_id:<9} "
+                        f"median {format_time(result['median_s']):>10}  "
+                        f"p95 {format_time(result['p95_s']):>10}  "
+                        f"peak RSS {result['peak_rss_mb']} MB"
+                    )
+                else:
+                    print(f"  {tool:<14} {feeder_id:<9} FAILED: {result['error']}")
 
-    # Print table header
-    print(f"\n{'Test':<30} {'Time':<15} {'Target':<15} {'Status':<10}")
-    print("-" * 70)
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": _machine_info(),
+        "config": {
+            "feeders": feeders,
+            "tools": tools,
+            "repeat": repeat,
+            "warmup": warmup,
+            "isolated": isolate,
+        },
+        "results": results,
+    }
 
-    # Print each result
-    for result in results:
-        test_name = result["test"].replace("_", " ").title()
-        time_str = format_time(result["time"])
-        target_str = format_time(result["target"])
-        status = "✓ PASS" if result["passed"] else "✗ FAIL"
 
-        print(f"{test_name:<30} {time_str:<15} {target_str:<15} {status:<10}")
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> List[Dict[str, Any]]:
+    """Compare a benchmark report against a baseline report.
 
-    # Print overall result
-    print("-" * 70)
-    all_passed = all(r["passed"] for r in results)
-    total_time = sum(r["time"] for r in results)
+    A scenario regresses if its median time grew by more than threshold
+    (relative) and min_delta_s (absolute), or its peak RSS grew by more than
+    threshold. It improves if its median time shrank by the same margins.
 
-    print(f"\nTotal execution time: {format_time(total_time)}")
-    print(
-        f"Overall status: {'✓ ALL TESTS PASSED' if all_passed else '✗ SOME TESTS FAILED'}"
-    )
-    print()
+    Args:
+        current: Report of this run
+        baseline: Report of the baseline run
+        threshold: Relative change that counts (default: 0.25)
+        min_delta_s: Smallest absolute time change that counts (default: 5 ms)
+
+    Returns:
+        One entry per scenario of the current run with tool, feeder, status
+        ("ok", "regression", "improvement", "new", "failed"), baseline and
+        current median/peak RSS and the relative time change
+    """
+    previous = {
+        (result["tool"], result["feeder"]): result
+        for result in baseline.get("results", [])
+        if result.get("success")
+    }
+    comparison = []
+    for result in current["results"]:
+        key = (result["tool"], result["feeder"])
+        entry: Dict[str, Any] = {"tool": key[0], "feeder": key[1]}
+        if not result["success"]:
+            comparison.append({**entry, "status": "failed", "error": result["error"]})
+            continue
+        if key not in previous:
+            comparison.append({**entry, "status": "new"})
+            continue
+
+        before, after = previous[key]["median_s"], result["median_s"]
+        change = (after - before) / before if before > 0 else 0.0
+        reasons = []
+        if change > threshold and after - before > min_delta_s:
+            reasons.append(f"median time +{change:.0%}")
+        rss_before = previous[key].get("peak_rss_mb")
+        rss_after = result.get("peak_rss_mb")
+        if rss_before and rss_after and rss_after > rss_before * (1 + threshold):
+            reasons.append(f"peak RSS +{rss_after / rss_before - 1:.0%}")
+
+        if reasons:
+            status = "regression"
+        elif change < -threshold / (1 + threshold) and before - after > min_delta_s:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparison.append(
+            {
+                **entry,
+                "status": status,
+                "reasons": reasons,
+                "baseline_median_s": before,
+                "median_s": after,
+                "change": round(change, 4),
+                "baseline_peak_rss_mb": rss_before,
+                "peak_rss_mb": rss_after,
+            }
+        )
+    return comparison
+
+
+def print_summary_table(results: List[Dict[str, Any]]) -> None:
+    """Print the scaling table: median time per tool and feeder.
 
+    Args:
+        results: Scenario results
+    """
+    feeders = list(dict.fromkeys(result["feeder"] for result in results))
+    tools = list(dict.fromkeys(result["tool"] for result in results))
+    cells = {(result["tool"], result["feeder"]): result for result in results}
 
-def run_all_benchmarks() -> None:
-    """Run all performance benchmarks and print summary."""
     print("\n" + "=" * 70)
-    print("OpenDSS MCP Server - Performance Benchmarks")
+    print("BENCHMARK SUMMARY (median time per run)")
     print("=" * 70)
-    print("\nPerformance Targets:")
-    print("  • Power Flow (IEEE123):        < 5 seconds")
-    print("  • DER Optimization (10 buses): < 30 seconds")
-    print("  • Time-Series (24 hours):      < 60 seconds")
+    print(f"\n{'Tool':<16}" + "".join(f"{feeder:>12}" for feeder in feeders))
+    print("-" * (16 + 12 * len(feeders)))
+    for tool in tools:
+        row = f"{tool:<16}"
+        for feeder in feeders:
+            result = cells.get((tool, feeder))
+            if result is None:
+                text = "-"
+            elif result["success"]:
+                text = format_time(result["median_s"])
+            else:
+                text = "FAILED"
+            row += f"{text:>12}"
+        print(row)
     print()
 
-    results = []
 
-    # Run benchmarks
-    try:
-        results.append(test_power_flow_performance())
-    except Exception as e:
-        print(f"\n✗ Power flow benchmark failed with error: {e}")
-        results.append(
-            {
-                "test": "power_flow",
-                "success": False,
-                "time": 0,
-                "target": 5.0,
-                "passed": False,
-            }
-        )
+def print_comparison(comparison: List[Dict[str, Any]]) -> None:
+    """Print the comparison against the baseline.
 
-    try:
-        results.append(test_der_optimization_performance())
-    except Exception as e:
-        print(f"\n✗ DER optimization benchmark failed with error: {e}")
-        results.append(
-            {
-                "test": "der_optimization",
-                "success": False,
-                "time": 0,
-                "target": 30.0,
-                "passed": False,
-            }
-        )
+    Args:
+        comparison: Output of compare_results
+    """
+    print("=" * 70)
+    print("COMPARISON WITH BASELINE")
+    print("=" * 70)
+    for entry in comparison:
+        name = f"{entry['tool']} / {entry['feeder']}"
+        if entry["status"] in ("new", "failed"):
+            detail = entry.get("error", "no baseline")
+        else:
+            detail = (
+                f"{format_time(entry['baseline_median_s'])} -> "
+                f"{format_time(entry['median_s'])} ({entry['change']:+.0%})"
+            )
+            if entry["reasons"]:
+                detail += "  [" + ", ".join(entry["reasons"]) + "]"
+        print(f"  {entry['status'].upper():<12} {name:<32} {detail}")
+    print()
 
-    try:
-        results.append(test_timeseries_performance())
-    except Exception as e:
-        print(f"\n✗ Time-series benchmark failed with error: {e}")
-        results.append(
-            {
-                "test": "timeseries",
-                "success": False,
-                "time": 0,
-                "target": 60.0,
-                "passed": False,
-            }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv)
+
+    Returns:
+        Exit code: 0 on success, 1 if a scenario failed or regressed
+    """
+    parser = argparse.ArgumentParser(description="OpenDSS MCP Server benchmarks")
+    parser.add_argument(
+        "--feeders", nargs="+", default=DEFAULT_FEEDERS, help="Feeder IDs to run on"
+    )
+    parser.add_argument(
+        "--tools",
+        nargs="+",
+        default=list(TOOLS),
+        choices=list(TOOLS),
+        help="Tools to benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument(
+        "--output", default=DEFAULT_OUTPUT, help="JSON file to write results to"
+    )
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_S)
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run all scenarios in this process (faster; RSS is then cumulative)",
+    )
+    args = parser.parse_args(argv)
+
+    print("\n" + "=" * 70)
+    print("OpenDSS MCP Server - Performance Benchmarks")
+    print("=" * 70)
+    print(
+        f"Feeders: {', '.join(args.feeders)}; {args.repeat} runs "
+        f"after {args.warmup} warmup\n"
+    )
+
+    report = run_benchmarks(
+        args.feeders,
+        args.tools,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        isolate=not args.in_process,
+    )
+    print_summary_table(report["results"])
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}\n")
+
+    failed = any(not result["success"] for result in report["results"])
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparison = compare_results(
+            report, baseline, threshold=args.threshold, min_delta_s=args.min_delta
         )
+        print_comparison(comparison)
+        failed = failed or any(entry["status"] == "regression" for entry in comparison)
 
-    # Print summary
-    print_summary_table(results)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    run_all_benchmarks()
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Tests for the benchmark harness (tests/benchmark.py).
+"""
+
+import json
+
+from benchmark import compare_results, main, run_scenario
+
+
+def _report(**medians):
+    """Benchmark report with one successful power_flow scenario per feeder."""
+    return {
+        "results": [
+            {
+                "tool": "power_flow",
+                "feeder": feeder,
+                "success": True,
+                "median_s": median,
+                "peak_rss_mb": 100.0,
+            }
+            for feeder, median in medians.items()
+        ]
+    }
+
+
+def test_run_scenario_reports_statistics():
+    """A scenario reports timing statistics, phases and OpenDSS calls."""
+    result = run_scenario("power_flow", "IEEE13", repeat=3, warmup=1)
+
+    assert result["success"], result.get("error")
+    assert len(result["times_s"]) == 3
+    assert result["min_s"] <= result["median_s"] <= result["p95_s"] <= result["max_s"]
+    assert "solve" in result["phases_ms"]
+    assert result["api_calls"] > 0
+    assert result["peak_rss_mb"] > 0
+
+    failed = run_scenario("power_flow", "IEEE999", repeat=1, warmup=0)
+    assert not failed["success"]
+    assert "IEEE999" in failed["error"]
+
+
+def test_compare_flags_regressions_and_improvements():
+    """Only changes beyond the relative and absolute thresholds count."""
+    baseline = _report(A=1.0, B=1.0, C=0.001, D=1.0)
+    current = _report(A=1.5, B=0.5, C=0.002, D=1.1, E=1.0)
+    current["results"].append(
+        {"tool": "power_flow", "feeder": "F", "success": False, "error": "boom"}
+    )
+    current["results"][3]["peak_rss_mb"] = 200.0
+
+    status = {
+        entry["feeder"]: entry["status"]
+        for entry in compare_results(current, baseline, threshold=0.25)
+    }
+    assert status == {
+        "A": "regression",
+        "B": "improvement",
+        "C": "ok",  # doubled, but below the 5 ms noise floor
+        "D": "regression",  # peak RSS doubled
+        "E": "new",
+        "F": "failed",
+    }
+
+
+def test_main_writes_json_and_compares(tmp_path):
+    """The command line writes a report and compares it with a baseline."""
+    baseline = tmp_path / "baseline.json"
+    args = ["--feeders", "IEEE13", "--tools", "voltage_check", "--repeat", "2"]
+    args += ["--warmup", "0", "--in-process"]
+
+    assert main(args + ["--output", str(baseline)]) == 0
+    report = json.loads(baseline.read_text())
+    assert report["config"]["tools"] == ["voltage_check"]
+    assert report["results"][0]["success"]
+
+    # A large threshold keeps timer noise from failing the comparison
+    current = tmp_path / "current.json"
+    exit_code = main(
+        args
+        + ["--output", str(current), "--baseline", str(baseline), "--threshold", "10"]
+    )
+    assert exit_code == 0
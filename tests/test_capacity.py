@@ -295,5 +295,92 @@ def test_capacity_limiting_constraint_detected():
         assert result["data"]["violation_details"] is not None
 
 
+def test_capacity_repeated_steps():
+    """Test that the linear scan can evaluate more than one step."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_feeder_capacity(
+        bus_id="822",
+        der_type="solar",
+        increment_kw=500,
+        max_capacity_kw=5000,
+        constraints={"min_voltage_pu": 0.9, "max_voltage_pu": 1.1},
+    )
+
+    assert result["success"], f"Capacity analysis failed: {result.get('errors')}"
+    assert len(result["data"]["capacity_curve"]) > 1
+    assert result["data"]["max_capacity_kw"] > 0
+
+
+@pytest.mark.parametrize("search", ["bisection", "secant"])
+def test_capacity_bracketed_search(search):
+    """Test bisection/secant search against the linear scan."""
+    constraints = {"min_voltage_pu": 0.9, "max_voltage_pu": 1.1}
+
+    load_ieee_test_feeder("IEEE34")
+    linear = analyze_feeder_capacity(
+        bus_id="822",
+        increment_kw=50,
+        max_capacity_kw=5000,
+        constraints=constraints,
+    )
+    load_ieee_test_feeder("IEEE34")
+    result = analyze_feeder_capacity(
+        bus_id="822",
+        increment_kw=50,
+        max_capacity_kw=5000,
+        constraints=constraints,
+        search=search,
+        tolerance_kw=50,
+    )
+
+    assert linear["success"] and result["success"]
+    data = result["data"]
+    linear_data = linear["data"]
+
+    # Same limit within the tolerance, with far fewer solves
+    assert abs(data["max_capacity_kw"] - linear_data["max_capacity_kw"]) <= 100
+    assert data["limiting_constraint"] == linear_data["limiting_constraint"]
+    assert (
+        data["analysis_parameters"]["iterations_performed"]
+        < linear_data["analysis_parameters"]["iterations_performed"] / 3
+    )
+    assert data["analysis_parameters"]["search"] == search
+    assert data["analysis_parameters"]["tolerance_kw"] == 50
+
+    # Sparse curve of evaluated points, sorted by capacity
+    capacities = [point["capacity_kw"] for point in data["capacity_curve"]]
+    assert capacities == sorted(capacities)
+    assert len(capacities) == data["analysis_parameters"]["iterations_performed"]
+
+
+def test_capacity_search_within_max():
+    """Test that a search with no violation returns max_capacity_kw."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_feeder_capacity(
+        bus_id="822",
+        increment_kw=50,
+        max_capacity_kw=500,
+        constraints={"min_voltage_pu": 0.9, "max_voltage_pu": 1.1},
+        search="bisection",
+    )
+
+    assert result["success"]
+    assert result["data"]["max_capacity_kw"] == 500
+    assert result["data"]["limiting_constraint"] is None
+    assert result["data"]["analysis_parameters"]["iterations_performed"] == 2
+
+
+def test_capacity_with_invalid_search():
+    """Test capacity analysis with an unsupported search strategy."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = analyze_feeder_capacity(bus_id="675", search="golden")
+
+    assert not result["success"]
+    assert "Unsupported search strategy" in result["errors"][0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
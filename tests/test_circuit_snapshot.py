@@ -0,0 +1,103 @@
+"""
+Unit tests for the vectorized circuit voltage snapshot.
+"""
+
+import numpy as np
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.voltage_checker import check_voltage_violations
+from opendss_mcp.utils.circuit_snapshot import CircuitSnapshot
+
+
+@pytest.fixture
+def solved_ieee13():
+    """Load and solve the IEEE 13-bus feeder."""
+    result = load_ieee_test_feeder("IEEE13")
+    assert result["success"], f"Failed to load feeder: {result.get('errors')}"
+    dss.Solution.Solve()
+    return result
+
+
+def _per_bus_magnitudes():
+    """Read node magnitudes bus by bus, the way the tools used to."""
+    magnitudes = {}
+    for bus_name in dss.Circuit.AllBusNames():
+        dss.Circuit.SetActiveBus(bus_name)
+        values = dss.Bus.puVmagAngle()
+        magnitudes[bus_name] = [values[i] for i in range(0, len(values), 2)]
+    return magnitudes
+
+
+def test_snapshot_matches_per_bus_reads(solved_ieee13):
+    """Snapshot aggregates should equal the per-bus puVmagAngle values."""
+    snapshot = CircuitSnapshot.capture()
+    expected = _per_bus_magnitudes()
+
+    first = snapshot.to_dict(snapshot.bus_first())
+    mean = snapshot.to_dict(snapshot.bus_mean())
+    maximum = snapshot.to_dict(snapshot.bus_max())
+    minimum = snapshot.to_dict(snapshot.bus_min())
+    phases = snapshot.phase_voltages()
+
+    assert set(first) == {bus for bus, mags in expected.items() if mags}
+    for bus, mags in expected.items():
+        if not mags:
+            continue
+        assert first[bus] == pytest.approx(mags[0])
+        assert mean[bus] == pytest.approx(sum(mags) / len(mags))
+        assert maximum[bus] == pytest.approx(max(mags))
+        assert minimum[bus] == pytest.approx(min(mags))
+        assert list(phases[bus].values()) == pytest.approx(mags[:3])
+
+
+def test_phase_matrix_padding(solved_ieee13):
+    """Buses with fewer than three phases are padded with NaN."""
+    snapshot = CircuitSnapshot.capture()
+    matrix = snapshot.phase_matrix()
+
+    assert matrix.shape == (len(snapshot.bus_names), 3)
+    node_counts = np.count_nonzero(~np.isnan(matrix), axis=1)
+    assert node_counts.min() >= 1
+    assert node_counts.max() == 3
+
+
+def test_reuse_layout_keeps_names(solved_ieee13):
+    """reuse_layout returns the cached names with the new voltages."""
+    first = CircuitSnapshot.capture()
+    dss.Solution.LoadMult(0.5)
+    dss.Solution.Solve()
+
+    reused = CircuitSnapshot.capture(reuse_layout=True)
+
+    assert reused.bus_names == first.bus_names
+    assert np.allclose(reused.vmag_pu, CircuitSnapshot.capture().vmag_pu)
+    assert not np.allclose(reused.vmag_pu, first.vmag_pu)
+
+
+def test_reuse_layout_follows_circuit_change(solved_ieee13):
+    """The cached layout is keyed on the circuit, not shared across feeders."""
+    CircuitSnapshot.capture()
+
+    load_ieee_test_feeder("IEEE34")
+    dss.Solution.Solve()
+    reused = CircuitSnapshot.capture(reuse_layout=True)
+
+    assert reused.bus_names == list(dss.Circuit.AllBusNames())
+    assert (
+        reused.node_bus.size == reused.vmag_pu.size == len(dss.Circuit.AllNodeNames())
+    )
+
+
+def test_voltage_checker_accepts_snapshot(solved_ieee13):
+    """Passing a captured snapshot gives the same result as a fresh read."""
+    snapshot = CircuitSnapshot.capture()
+
+    fresh = check_voltage_violations(min_voltage_pu=0.99, max_voltage_pu=1.03)
+    reused = check_voltage_violations(
+        min_voltage_pu=0.99, max_voltage_pu=1.03, snapshot=snapshot
+    )
+
+    assert fresh["success"] and reused["success"]
+    assert fresh["data"] == reused["data"]
@@ -0,0 +1,133 @@
+"""
+Unit tests for the N-1 contingency analysis.
+"""
+
+import opendssdirect as dss
+
+from opendss_mcp.tools.contingency import run_contingency_analysis
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.results import fetch_result
+
+COMPARED = ("element", "status", "deenergized_buses", "load_lost_kw", "new_overloads")
+
+
+def test_contingencies_are_classified():
+    """Radial outages island load; new violations on supplied nodes are counted."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_contingency_analysis(max_workers=1)
+
+    assert result["success"], result.get("errors")
+    data = result["data"]
+    rows = {row["element"]: row for row in data["contingencies"]}
+    assert len(rows) == len(dss.Lines.AllNames()) + len(dss.Transformers.AllNames())
+
+    # Opening the substation line drops the whole feeder
+    assert rows["Line.650632"]["status"] == "islanded"
+    assert (
+        rows["Line.650632"]["load_lost_kw"] == rows["Transformer.sub"]["load_lost_kw"]
+    )
+    assert rows["Line.684611"]["deenergized_buses"] == 1
+    assert rows["Line.684611"]["load_lost_kw"] == 170.0
+
+    # Losing the 645-646 lateral removes load, which pushes 675 into overvoltage
+    lateral = rows["Line.632645"]
+    assert lateral["deenergized_nodes"] == 4
+    assert lateral["new_voltage_violations"] > 0
+    assert lateral["worst_voltage"]["violation_type"] == "overvoltage"
+
+    summary = data["summary"]
+    assert summary["contingencies_analyzed"] == len(rows)
+    assert sum(summary["status_counts"].values()) == len(rows)
+    critical = summary["critical_contingencies"]
+    assert critical[0]["load_lost_kw"] == max(
+        row["load_lost_kw"] for row in rows.values()
+    )
+
+
+def test_single_phase_regulator_outage():
+    """An open regulator phase de-energizes phase A although the buses stay live."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_contingency_analysis(elements=["Transformer.reg1"], max_workers=1)
+
+    assert result["success"], result.get("errors")
+    row = result["data"]["contingencies"][0]
+    assert row["status"] == "islanded"
+    # Phase A of every bus below the regulator, left at about 0.15 pu
+    assert row["deenergized_nodes"] == 11
+    assert row["deenergized_buses"] == 11
+    # Wye loads on phase A plus the delta phases that touch node 1
+    # (two of the three phases of load 671, and load 692 on nodes 3-1)
+    assert row["load_lost_kw"] == 160.0 + 485.0 + 128.0 + 17.0 + 2 * 385.0 + 170.0
+    assert row["min_voltage_pu"] > 0.9
+
+
+def test_elements_are_restored():
+    """Each outage starts from the restored base case inside a worker."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_contingency_analysis(
+        elements=["Transformer.reg1", "Line.632670", "Transformer.reg1"],
+        max_workers=1,
+    )
+
+    assert result["success"], result.get("errors")
+    first, _, again = result["data"]["contingencies"]
+    for key in COMPARED + ("new_voltage_violations", "worst_voltage"):
+        assert first[key] == again[key], key
+
+
+def test_results_do_not_depend_on_workers():
+    """Contingency classes are the same for one and two workers."""
+    load_ieee_test_feeder("IEEE13")
+
+    progress = []
+    one = run_contingency_analysis(
+        max_workers=1, progress_callback=lambda done, total: progress.append(done)
+    )
+    two = run_contingency_analysis(max_workers=2)
+
+    assert one["success"] and two["success"]
+    for row_one, row_two in zip(
+        one["data"]["contingencies"], two["data"]["contingencies"]
+    ):
+        assert [row_one[key] for key in COMPARED] == [row_two[key] for key in COMPARED]
+    assert progress == list(range(1, len(one["data"]["contingencies"]) + 1))
+
+
+def test_element_list_and_result_store():
+    """Bare and qualified names are accepted; large tables go to the store."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_contingency_analysis(
+        elements=["671692", "transformer.XFM1"], max_workers=1, inline_limit=0
+    )
+
+    assert result["success"], result.get("errors")
+    data = result["data"]
+    assert data["stored_fields"] == ["contingencies"]
+    page = fetch_result(data["result_handle"], "contingencies")
+    assert [row["element"] for row in page["data"]["items"]] == [
+        "Line.671692",
+        "Transformer.xfm1",
+    ]
+
+
+def test_invalid_inputs():
+    """Unknown elements, types and a missing circuit are reported as errors."""
+    load_ieee_test_feeder("IEEE13")
+
+    for kwargs in (
+        {"elements": ["Line.nope"]},
+        {"element_types": ["switch"]},
+        {"solve_strategy": "hot"},
+        {"max_workers": 0},
+        {"constraints": {"min_voltage_pu": 1.1, "max_voltage_pu": 1.0}},
+    ):
+        assert not run_contingency_analysis(**kwargs)["success"], kwargs
+
+    dss.Text.Command("Clear")
+    result = run_contingency_analysis()
+    assert not result["success"]
+    assert "circuit" in result["errors"][0].lower()
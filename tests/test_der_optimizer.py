@@ -2,7 +2,12 @@
 Unit tests for DER placement optimization functionality.
 """
 
+from unittest.mock import patch
+
+import opendssdirect as dss
 import pytest
+from dss import DSSException
+
 from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
 from opendss_mcp.tools.power_flow import run_power_flow
 from opendss_mcp.tools.der_optimizer import optimize_der_placement
@@ -241,6 +246,84 @@ def test_vvc_vs_no_vvc_comparison():
         assert isinstance(entry["q_support_kvar"], (int, float))
 
 
+def test_vvc_on_freshly_loaded_feeder():
+    """VVC candidates converge without a prior power flow."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = optimize_der_placement(
+        der_type="solar_vvc",
+        capacity_kw=500,
+        candidate_buses=["675", "671", "611", "652"],
+    )
+
+    assert result["success"], result.get("errors")
+    data = result["data"]
+    assert sorted(row["bus_id"] for row in data["comparison_table"]) == [
+        "611",
+        "652",
+        "671",
+        "675",
+    ]
+    assert data["failed_candidates"] == []
+
+
+def test_control_iteration_overflow_is_reported():
+    """Candidates whose controls do not settle are reported with their reason."""
+    load_ieee_test_feeder("IEEE13")
+    overflow = DSSException(485, "Warning Max Control Iterations Exceeded.")
+
+    with patch(
+        "opendss_mcp.tools.der_optimizer._solve_from_initial_guess",
+        side_effect=[None, overflow, None],
+    ):
+        result = optimize_der_placement(
+            der_type="solar_vvc",
+            capacity_kw=500,
+            candidate_buses=["675", "671"],
+        )
+
+    assert result["success"], result.get("errors")
+    assert result["data"]["failed_candidates"] == [
+        {"bus_id": "675", "reason": "control_iterations_exceeded"}
+    ]
+    assert [row["bus_id"] for row in result["data"]["comparison_table"]] == ["671"]
+
+    with patch(
+        "opendss_mcp.tools.der_optimizer._solve_from_initial_guess",
+        side_effect=[None, overflow],
+    ):
+        result = optimize_der_placement(
+            der_type="solar_vvc", capacity_kw=500, candidate_buses=["675"]
+        )
+
+    assert not result["success"]
+    assert "exceeded the control iteration limit" in result["errors"][0]
+
+
+def test_vvc_settings_apply_to_reused_control():
+    """A second VVC run edits the probe's curve and response time in place."""
+    load_ieee_test_feeder("IEEE13")
+    run_power_flow("IEEE13")
+
+    optimize_der_placement(
+        der_type="solar_vvc",
+        capacity_kw=500,
+        candidate_buses=["671"],
+        control_settings={"curve": "IEEE1547", "response_time": 10.0},
+    )
+    optimize_der_placement(
+        der_type="solar_vvc",
+        capacity_kw=500,
+        candidate_buses=["671"],
+        control_settings={"curve": "RULE21", "response_time": 1.0},
+    )
+
+    dss.XYCurves.Name("vv_der_opt")
+    assert dss.XYCurves.XArray() == pytest.approx([0.95, 0.99, 1.01, 1.05])
+    dss.Text.Command("? InvControl.InvCtrl_der_opt.DeltaQ_Factor")
+    assert float(dss.Text.Result()) == pytest.approx(1.0)
+
+
 def test_invalid_der_type():
     """Test that invalid DER type returns error."""
     load_ieee_test_feeder("IEEE13")
@@ -449,5 +532,73 @@ def test_zero_loss_reduction_percentage():
     )
 
 
+def test_parallel_matches_serial():
+    """Parallel evaluation returns the same ranked table as a serial run."""
+    kwargs = {
+        "der_type": "solar",
+        "capacity_kw": 500,
+        "candidate_buses": ["675", "671", "611", "652", "634", "680"],
+    }
+
+    # Start both runs from a freshly compiled feeder, as the workers do
+    load_ieee_test_feeder("IEEE13")
+    serial = optimize_der_placement(**kwargs)
+    load_ieee_test_feeder("IEEE13")
+    parallel = optimize_der_placement(parallel=True, max_workers=2, **kwargs)
+
+    assert serial["success"] and parallel["success"]
+    assert parallel["metadata"]["max_workers"] == 2
+    assert parallel["data"]["optimal_bus"] == serial["data"]["optimal_bus"]
+    assert parallel["data"]["comparison_table"] == serial["data"]["comparison_table"]
+
+
+def test_parallel_evaluates_all_buses():
+    """Without candidate_buses, parallel mode is not capped at 20 buses."""
+    load_ieee_test_feeder("IEEE34")
+    num_buses = len(dss.Circuit.AllBusNames())
+    assert num_buses > 20
+
+    result = optimize_der_placement(
+        der_type="solar", capacity_kw=100, parallel=True, max_workers=2
+    )
+
+    assert result["success"], f"DER optimization failed: {result.get('errors')}"
+    assert result["data"]["analysis_parameters"]["candidates_evaluated"] == num_buses
+
+
+def test_sensitivity_screening():
+    """Screening evaluates only top_k buses and finds the exhaustive optimum."""
+    load_ieee_test_feeder("IEEE13")
+    exhaustive = optimize_der_placement(
+        der_type="solar",
+        capacity_kw=500,
+        candidate_buses=dss.Circuit.AllBusNames(),
+    )
+
+    load_ieee_test_feeder("IEEE13")
+    screened = optimize_der_placement(
+        der_type="solar", capacity_kw=500, screening="sensitivity", top_k=3
+    )
+
+    assert screened["success"], f"DER optimization failed: {screened.get('errors')}"
+    params = screened["data"]["analysis_parameters"]
+    assert params["candidates_requested"] == len(dss.Circuit.AllBusNames())
+    assert params["candidates_evaluated"] == 3
+    assert len(screened["data"]["screening"]) == 3
+    assert screened["data"]["optimal_bus"] == exhaustive["data"]["optimal_bus"]
+
+
+def test_invalid_screening():
+    """Test error handling for an unsupported screening method."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = optimize_der_placement(
+        der_type="solar", capacity_kw=500, screening="random"
+    )
+
+    assert not result["success"]
+    assert "Unsupported screening" in result["errors"][0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
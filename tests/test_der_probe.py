@@ -0,0 +1,83 @@
+"""
+Unit tests for the reusable DER probe.
+"""
+
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.utils.der_probe import DERProbe
+
+
+@pytest.fixture
+def ieee13():
+    """Load the IEEE 13-bus feeder."""
+    result = load_ieee_test_feeder("IEEE13")
+    assert result["success"], f"Failed to load feeder: {result.get('errors')}"
+    return result
+
+
+def _pv(kw):
+    return {"kV": 4.16, "kVA": kw, "Pmpp": kw, "irradiance": 1.0}
+
+
+def test_element_count_stays_flat(ieee13):
+    """Moving and resizing the probe does not add circuit elements."""
+    with DERProbe("probe_test") as probe:
+        probe.place("PVSystem", "675", _pv(100))
+        count = len(dss.Circuit.AllElementNames())
+
+        for kw, bus in [(200, "675"), (300, "680"), (400, "634"), (500, "692")]:
+            probe.place("PVSystem", bus, _pv(kw))
+            dss.Solution.Solve()
+
+        assert len(dss.Circuit.AllElementNames()) == count
+        assert probe.placements == 5
+        assert probe.element_names == ["PVSystem.probe_test"]
+
+        dss.Circuit.SetActiveElement("PVSystem.probe_test")
+        assert dss.CktElement.BusNames()[0].split(".")[0] == "692"
+
+
+def test_close_disables_elements(ieee13):
+    """close() disconnects the probe elements from the circuit."""
+    probe = DERProbe("probe_test")
+    probe.place("PVSystem", "675", _pv(500))
+    probe.place("Generator", "680", {"kV": 4.16, "kW": 200, "PF": 0.95})
+    probe.close()
+
+    for name in probe.element_names:
+        dss.Circuit.SetActiveElement(name)
+        assert not dss.CktElement.Enabled()
+
+
+def test_new_probe_reuses_elements(ieee13):
+    """A second probe with the same name edits the existing element."""
+    with DERProbe("probe_test") as probe:
+        probe.place("PVSystem", "675", _pv(100))
+    count = len(dss.Circuit.AllElementNames())
+
+    with DERProbe("probe_test") as probe:
+        probe.place("PVSystem", "680", _pv(100))
+        dss.Circuit.SetActiveElement("PVSystem.probe_test")
+        assert dss.CktElement.Enabled()
+
+    assert len(dss.Circuit.AllElementNames()) == count
+
+
+def test_matches_fresh_element(ieee13):
+    """A moved probe solves to the same voltages as a newly defined element."""
+    with DERProbe("probe_test") as probe:
+        probe.place("PVSystem", "680", _pv(300))
+        dss.Solution.Solve()
+        probe.place("PVSystem", "675", _pv(800))
+        dss.Solution.Solve()
+        probe_voltages = dss.Circuit.AllBusMagPu()
+
+    load_ieee_test_feeder("IEEE13")
+    dss.Text.Command(
+        "New PVSystem.fresh Bus1=675 kV=4.16 kVA=800 Pmpp=800 irradiance=1.0"
+    )
+    dss.Solution.Solve()
+
+    assert probe_voltages == pytest.approx(dss.Circuit.AllBusMagPu(), abs=1e-4)
@@ -9,7 +9,12 @@ import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
-from opendss_mcp.utils.dss_wrapper import DSSCircuit
+from opendss_mcp.utils.dss_wrapper import (
+    DSSCircuit,
+    NameIndex,
+    get_name_index,
+    invalidate_name_index,
+)
 
 
 class TestDSSCircuitInitialization:
@@ -169,11 +174,22 @@ class TestDSSCircuitVoltages:
         mock_dss.Text.Command.return_value = ""
         mock_dss.Circuit.SetActiveElement.return_value = None
         mock_dss.Circuit.Solution.Solve.return_value = None
-        mock_dss.Circuit.SetActiveBus.return_value = None
-        mock_dss.Bus.AllBusNames.return_value = ["bus1", "bus2"]
-        mock_dss.Bus.puVmagAngle.side_effect = [
-            [1.05, 0.0, 1.04, 120.0, 1.06, 240.0],  # bus1
-            [0.95, 0.0, 0.96, 120.0, 0.94, 240.0],  # bus2
+        mock_dss.Circuit.AllBusNames.return_value = ["bus1", "bus2"]
+        mock_dss.Circuit.AllNodeNames.return_value = [
+            "bus1.1",
+            "bus1.2",
+            "bus1.3",
+            "bus2.1",
+            "bus2.2",
+            "bus2.3",
+        ]
+        mock_dss.Circuit.AllBusMagPu.return_value = [
+            1.05,
+            1.04,
+            1.06,  # bus1
+            0.95,
+            0.96,
+            0.94,  # bus2
         ]
 
         circuit = DSSCircuit()
@@ -190,7 +206,9 @@ class TestDSSCircuitVoltages:
         """Test getting voltages when no buses exist."""
         mock_dss.Basic.NumCircuits.return_value = 0
         mock_dss.Text.Command.return_value = ""
-        mock_dss.Bus.AllBusNames.return_value = []
+        mock_dss.Circuit.AllBusNames.return_value = []
+        mock_dss.Circuit.AllNodeNames.return_value = []
+        mock_dss.Circuit.AllBusMagPu.return_value = []
 
         circuit = DSSCircuit()
         voltages = circuit.get_all_bus_voltages()
@@ -218,38 +236,51 @@ class TestDSSCircuitLineFlows:
         """Test getting all line flows successfully."""
         mock_dss.Basic.NumCircuits.return_value = 0
         mock_dss.Text.Command.return_value = ""
-        mock_dss.Circuit.SetActiveClass.return_value = None
-        mock_dss.ActiveClass.First.return_value = 1
-        mock_dss.ActiveClass.Count.return_value = 2
-        mock_dss.Circuit.ActiveCktElement.Name.side_effect = ["line1", "line2"]
-        mock_dss.CktElement.Powers.side_effect = [
-            [100.0, 50.0, 90.0, 45.0],  # line1: P1, Q1, P2, Q2
-            [200.0, 80.0, 190.0, 75.0],  # line2
+        mock_dss.PDElements.AllNames.return_value = ["Line.line1", "Line.line2"]
+        mock_dss.PDElements.AllNumConductors.return_value = [2, 2]
+        mock_dss.PDElements.AllNumTerminals.return_value = [1, 1]
+        mock_dss.PDElements.AllPowers.return_value = [
+            100.0,
+            50.0,
+            90.0,
+            45.0,  # line1: P1, Q1, P2, Q2
+            200.0,
+            80.0,
+            190.0,
+            75.0,  # line2
         ]
-        mock_dss.Circuit.SetActiveElement.return_value = None
-        mock_dss.CktElement.NormalAmps.side_effect = [400.0, 400.0]
-        mock_dss.CktElement.CurrentsMagAng.side_effect = [
-            [300.0, 0.0, 290.0, 120.0],  # line1 currents
-            [350.0, 0.0, 340.0, 120.0],  # line2 currents
+        mock_dss.PDElements.AllCurrentsMagAng.return_value = [
+            300.0,
+            0.0,
+            290.0,
+            120.0,  # line1 currents
+            350.0,
+            0.0,
+            340.0,
+            120.0,  # line2 currents
         ]
-        mock_dss.ActiveClass.Next.return_value = 0
+        mock_dss.Lines.First.return_value = 1
+        mock_dss.Lines.Name.side_effect = ["line1", "line2"]
+        mock_dss.Lines.NormAmps.side_effect = [400.0, 400.0]
+        mock_dss.Lines.Next.side_effect = [2, 0]
 
         circuit = DSSCircuit()
         flows = circuit.get_all_line_flows()
 
         assert isinstance(flows, dict)
-        assert "line1" in flows
-        assert "line2" in flows
-        assert "P" in flows["line1"]
-        assert "Q" in flows["line1"]
-        assert "loading" in flows["line1"]
+        assert "Line.line1" in flows
+        assert "Line.line2" in flows
+        assert flows["Line.line1"]["P"] == 190.0
+        assert flows["Line.line1"]["Q"] == 95.0
+        assert flows["Line.line1"]["loading"] == 75.0  # 300 A / 400 A
+        assert flows["Line.line2"]["loading"] == 87.5  # 350 A / 400 A
 
     @patch("opendss_mcp.utils.dss_wrapper.dss")
     def test_get_all_line_flows_error(self, mock_dss):
         """Test getting line flows with error."""
         mock_dss.Basic.NumCircuits.return_value = 0
         mock_dss.Text.Command.return_value = ""
-        mock_dss.Circuit.SetActiveClass.side_effect = Exception("Circuit error")
+        mock_dss.PDElements.AllNames.side_effect = Exception("Circuit error")
 
         circuit = DSSCircuit()
         flows = circuit.get_all_line_flows()
@@ -347,3 +378,55 @@ class TestDSSCircuitErrorHandling:
 
         assert result is True
         assert circuit.dss_file_path == "/path/to/test.dss"
+
+
+class TestNameIndex:
+    """Test cases for the case-insensitive name index."""
+
+    def test_bus_and_element_lookup(self):
+        """Test that buses and elements resolve regardless of case and prefix."""
+        index = NameIndex(
+            ["SourceBus", "650", "rg60"],
+            {"line": ["650632"], "load": ["671"]},
+        )
+
+        assert index.has_bus("sourcebus")
+        assert index.has_bus("RG60")
+        assert not index.has_bus("nope")
+        assert index.bus_index("RG60") == 2
+        assert index.bus_index("nope") is None
+        assert index.resolve_bus("sourcebus") == "SourceBus"
+
+        assert index.has_element("line", "650632")
+        assert index.resolve_element("line", "Line.650632") == "650632"
+        assert index.resolve_element("line", "LINE.650632") == "650632"
+        assert not index.has_element("line", "Load.671")
+        assert index.has_element("load", "load.671")
+        assert index.element_names("pvsystem") == []
+
+    def test_index_is_cached_until_the_circuit_changes(self):
+        """Test that the index is rebuilt only when the circuit signature changes."""
+        engine = MagicMock()
+        engine.Circuit.Name.return_value = "test"
+        engine.Circuit.NumCktElements.return_value = 3
+        engine.Circuit.NumBuses.return_value = 2
+        engine.Circuit.NumNodes.return_value = 6
+        engine.Circuit.AllBusNames.return_value = ["b1", "b2"]
+        for interface in ("Lines", "Loads", "PVsystems", "Transformers"):
+            getattr(engine, interface).AllNames.return_value = []
+        engine.Lines.AllNames.return_value = ["l1"]
+
+        invalidate_name_index()
+        index = get_name_index(engine)
+        assert get_name_index(engine) is index
+        assert engine.Circuit.AllBusNames.call_count == 1
+
+        engine.Circuit.NumCktElements.return_value = 4
+        engine.Circuit.NumBuses.return_value = 3
+        engine.Circuit.AllBusNames.return_value = ["b1", "b2", "B3"]
+        extended = get_name_index(engine)
+        assert extended is not index
+        assert extended.has_bus("b3")
+
+        invalidate_name_index()
+        assert get_name_index(engine) is not extended
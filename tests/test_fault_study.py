@@ -0,0 +1,130 @@
+"""
+Unit tests for the fault study tool and the bulk short-circuit extractor.
+"""
+
+import numpy as np
+import opendssdirect as dss
+from dss import SolveModes
+
+from opendss_mcp.tools.fault_study import run_fault_study
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import SOLUTION_MODES, run_power_flow
+from opendss_mcp.tools.voltage_checker import check_voltage_violations
+from opendss_mcp.tools.results import fetch_result
+from opendss_mcp.utils.short_circuit import _group_currents
+
+
+def test_solution_modes_match_engine():
+    """Mode names map to the engine's SolveModes values."""
+    assert SOLUTION_MODES["faultstudy"] == SolveModes.FaultStudy
+    assert SOLUTION_MODES["mf"] == SolveModes.MonteFault
+    assert SOLUTION_MODES["dutycycle"] == SolveModes.DutyCycle
+    assert SOLUTION_MODES["loadduration2"] == SolveModes.LD2
+
+
+def test_group_currents_symmetric_source():
+    """Fault currents of a symmetric source match the textbook formulas."""
+    zs, zm = 1.0 + 3.0j, 0.2 + 1.0j
+    z = np.full((1, 3, 3), zm)
+    z[0, np.arange(3), np.arange(3)] = zs
+    v = 1000.0 * np.exp(-2j * np.pi / 3 * np.arange(3))[None, :]
+
+    currents = _group_currents(z, v, 0.0)
+
+    z1 = zs - zm
+    assert np.isclose(currents["all_phase"][0], 1000.0 / abs(z1))
+    assert np.isclose(currents["slg_max"][0], 1000.0 / abs(zs))
+    assert np.isclose(currents["slg_min"][0], 1000.0 / abs(zs))
+    assert np.isclose(currents["ll"][0], np.sqrt(3) * 1000.0 / abs(2 * z1))
+
+
+def test_fault_study_ieee13():
+    """All buses get fault currents from one solve; the circuit is restored."""
+    load_ieee_test_feeder("IEEE13")
+    run_power_flow("IEEE13")
+    before = check_voltage_violations()["data"]
+
+    result = run_fault_study()
+
+    assert result["success"], result.get("errors")
+    assert dss.Solution.Mode() == SOLUTION_MODES["snapshot"]
+    assert result["metadata"]["solves"] == 1
+    faults = result["data"]["fault_currents"]
+    assert len(faults) == len(dss.Circuit.AllBusNames())
+
+    # Three-phase bus: LL and 3-phase currents follow sqrt(3)/2
+    bus_675 = faults["675"]
+    assert bus_675["num_phases"] == 3
+    assert bus_675["slg_min_a"] <= bus_675["slg_max_a"]
+    assert 0.8 < bus_675["ll_a"] / bus_675["all_phase_a"] < 0.95
+    assert bus_675["x_r_ratio"] > 0
+
+    # Single-phase lateral: no line-to-line fault, SLG equals all-phase fault
+    bus_611 = faults["611"]
+    assert bus_611["num_phases"] == 1
+    assert bus_611["ll_a"] == 0.0
+    assert bus_611["slg_max_a"] == bus_611["all_phase_a"]
+
+    # Fault currents fall with distance from the substation
+    assert faults["632"]["all_phase_a"] > faults["671"]["all_phase_a"]
+    summary = result["data"]["summary"]
+    assert summary["min_slg_fault"]["current_a"] == min(
+        row["slg_min_a"] for row in faults.values()
+    )
+
+    # The power flow state is back without solving again
+    after = check_voltage_violations()["data"]
+    assert after["violations"] == before["violations"]
+    assert after["summary"] == before["summary"]
+
+
+def test_fault_resistance_and_bus_list():
+    """Fault resistance lowers currents; large results go to the store."""
+    load_ieee_test_feeder("IEEE13")
+
+    bolted = run_fault_study(buses=["675", "611"])
+    resistive = run_fault_study(
+        buses=["675", "611"], fault_resistance_ohm=5.0, inline_limit=0
+    )
+
+    assert bolted["success"] and resistive["success"]
+    data = resistive["data"]
+    assert data["stored_fields"] == ["fault_currents"]
+    stored = fetch_result(data["result_handle"], "fault_currents")["data"]["items"]
+    assert set(stored) == {"675", "611"}
+    for bus in ("675", "611"):
+        assert (
+            stored[bus]["slg_min_a"]
+            < bolted["data"]["fault_currents"][bus]["slg_min_a"]
+        )
+
+
+def test_invalid_inputs():
+    """Unknown buses, negative resistance and a missing circuit are errors."""
+    load_ieee_test_feeder("IEEE13")
+
+    assert not run_fault_study(buses=["nope"])["success"]
+    assert not run_fault_study(fault_resistance_ohm=-1.0)["success"]
+
+    dss.Text.Command("Clear")
+    result = run_fault_study()
+    assert not result["success"]
+    assert "circuit" in result["errors"][0].lower()
+
+
+def test_fault_study_keeps_time_step():
+    """In daily mode the study returns to the same step and its settings."""
+    load_ieee_test_feeder("IEEE13")
+    dss.Text.Command("Set Mode=Daily Stepsize=1h Number=1")
+    dss.Solution.Hour(0)
+    dss.Solution.Seconds(0)
+    dss.Solution.Solve()
+    dss.Solution.Solve()
+    before = dss.Circuit.AllBusMagPu()
+
+    assert run_fault_study()["success"]
+
+    assert dss.Solution.ModeID() == "Daily"
+    assert (dss.Solution.Hour(), dss.Solution.Number()) == (2, 1)
+    assert np.allclose(dss.Circuit.AllBusMagPu(), before, atol=1e-6)
+    dss.Text.Command("Set Mode=Snap")
@@ -615,5 +615,77 @@ def test_get_harmonic_currents_empty_current_data():
     assert "harmonic_currents" in result
 
 
+def test_harmonic_sweep_solves_each_order_once():
+    """Test that the sweep solves each order once for the whole circuit."""
+    from unittest.mock import patch
+    import opendssdirect as dss
+    from opendss_mcp.utils.harmonics import run_harmonic_sweep
+
+    load_ieee_test_feeder("IEEE13")
+    dss.Solution.Solve()
+
+    orders = [3, 5, 7]
+    with patch("opendss_mcp.utils.harmonics.dss", wraps=dss) as wrapped_dss:
+        sweep = run_harmonic_sweep(orders)
+
+    commands = wrapped_dss.Text.Command.call_args_list
+    solves = [c for c in commands if c.args[0] == "Solve"]
+    assert len(solves) == len(orders)
+
+    assert sweep["success"]
+    assert sweep["orders"] == orders
+    for order in orders:
+        assert set(sweep["bus_voltages"][order]) == set(dss.Circuit.AllBusNames())
+        assert set(sweep["line_currents"][order]) == set(dss.Lines.AllNames())
+    assert set(sweep["thd_current"]) == set(dss.Lines.AllNames())
+
+
+def test_harmonic_views_read_from_sweep():
+    """Test that per-bus and per-line results are views over a shared sweep."""
+    import opendssdirect as dss
+    from opendss_mcp.utils.harmonics import (
+        get_harmonic_currents,
+        get_harmonic_voltages,
+        run_harmonic_sweep,
+    )
+
+    load_ieee_test_feeder("IEEE13")
+    dss.Solution.Solve()
+
+    sweep = run_harmonic_sweep([3, 5])
+
+    voltages = get_harmonic_voltages("675", [3, 5], sweep=sweep)
+    assert voltages["success"]
+    assert voltages["harmonic_voltages"][5]["voltages_pu"] == [
+        round(v, 6) for v in sweep["bus_voltages"][5]["675"]
+    ]
+
+    currents = get_harmonic_currents("Line.692675", [3, 5], sweep=sweep)
+    assert currents["success"]
+    assert currents["harmonic_currents"][5]["max_current_amps"] == round(
+        sweep["line_max_currents"][5]["692675"], 4
+    )
+
+
+def test_vectorized_thd_matches_calculate_thd():
+    """Test that whole-circuit THD matches the scalar THD formula."""
+    import numpy as np
+    from opendss_mcp.utils.harmonics import _vectorized_thd
+
+    magnitudes = {
+        1: np.array([120.0, 100.0, 0.0]),
+        3: np.array([10.0, 50.0, 1.0]),
+        5: np.array([8.0, 30.0, 1.0]),
+    }
+
+    thd = _vectorized_thd(magnitudes, 3)
+
+    for i in range(3):
+        expected = calculate_thd(
+            {order: float(m[i]) for order, m in magnitudes.items()}
+        )
+        assert thd[i] == pytest.approx(expected)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+"""
+Unit tests for the feeder-wide hosting capacity map.
+"""
+
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.capacity import analyze_feeder_capacity
+from opendss_mcp.tools.feeder_loader import get_loaded_feeder, load_ieee_test_feeder
+from opendss_mcp.tools.hosting_capacity import analyze_hosting_capacity_map
+
+CONSTRAINTS = {"min_voltage_pu": 0.9, "max_voltage_pu": 1.1}
+BUSES = ["822", "840", "890", "848"]
+
+
+def test_capacity_map_matches_single_bus_analysis():
+    """Rows come back in bus order and match the single-bus analysis."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_hosting_capacity_map(
+        bus_ids=BUSES,
+        max_capacity_kw=3000,
+        constraints=CONSTRAINTS,
+        max_workers=2,
+    )
+
+    assert result["success"], f"Capacity map failed: {result.get('errors')}"
+    rows = result["data"]["buses"]
+    assert [row["bus_id"] for row in rows] == BUSES
+    assert all(row["error"] is None for row in rows)
+    assert result["metadata"]["max_workers"] == 2
+
+    # A fresh feeder in this process gives the same first row
+    load_ieee_test_feeder("IEEE34")
+    single = analyze_feeder_capacity(
+        BUSES[0], max_capacity_kw=3000, constraints=CONSTRAINTS, search="bisection"
+    )
+    assert single["data"]["max_capacity_kw"] == rows[0]["max_capacity_kw"]
+    assert single["data"]["limiting_constraint"] == rows[0]["limiting_constraint"]
+
+
+def test_capacity_map_is_independent_of_worker_count():
+    """Merging is deterministic regardless of how buses are sharded."""
+    load_ieee_test_feeder("IEEE34")
+    kwargs = {"bus_ids": BUSES, "max_capacity_kw": 3000, "constraints": CONSTRAINTS}
+
+    one = analyze_hosting_capacity_map(max_workers=1, **kwargs)
+    two = analyze_hosting_capacity_map(max_workers=2, **kwargs)
+
+    assert one["success"] and two["success"]
+    assert one["data"]["buses"] == two["data"]["buses"]
+    assert one["data"]["summary"] == two["data"]["summary"]
+
+
+def test_capacity_map_summary():
+    """Summary statistics are computed over the analyzed buses."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_hosting_capacity_map(
+        bus_ids=BUSES, max_capacity_kw=3000, constraints=CONSTRAINTS, max_workers=2
+    )
+
+    summary = result["data"]["summary"]
+    capacities = [row["max_capacity_kw"] for row in result["data"]["buses"]]
+    assert summary["buses_analyzed"] == len(BUSES)
+    assert summary["min_capacity_kw"] == min(capacities)
+    assert summary["max_capacity_kw"] == max(capacities)
+    assert sum(summary["limiting_constraint_counts"].values()) == len(BUSES)
+
+
+def test_capacity_map_with_invalid_bus():
+    """Unknown buses are rejected before any worker starts."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_hosting_capacity_map(bus_ids=["822", "no_such_bus"])
+
+    assert not result["success"]
+    assert "no_such_bus" in result["errors"][0]
+
+
+def test_capacity_map_solve_strategy():
+    """The solve strategy reaches the workers and is validated up front."""
+    load_ieee_test_feeder("IEEE34")
+
+    result = analyze_hosting_capacity_map(
+        bus_ids=BUSES[:1], max_capacity_kw=3000, solve_strategy="cold", max_workers=1
+    )
+    assert result["success"], result.get("errors")
+    assert result["data"]["analysis_parameters"]["solve_strategy"] == "cold"
+
+    result = analyze_hosting_capacity_map(bus_ids=BUSES[:1], solve_strategy="lukewarm")
+    assert not result["success"]
+    assert "lukewarm" in result["errors"][0]
+
+
+def test_capacity_map_without_loaded_circuit():
+    """The map needs a feeder loaded through load_feeder."""
+    dss.Text.Command("Clear")
+
+    result = analyze_hosting_capacity_map(bus_ids=["822"])
+
+    assert not result["success"]
+    # Accept either "no circuit loaded" or OpenDSS's "no active circuit" message
+    assert (
+        "no circuit" in result["errors"][0].lower()
+        or "active circuit" in result["errors"][0].lower()
+    )
+
+
+def test_loaded_feeder_is_tracked():
+    """load_ieee_test_feeder records the feeder workers should compile."""
+    load_ieee_test_feeder("IEEE13")
+
+    assert get_loaded_feeder() == {"feeder_id": "IEEE13", "modifications": None}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+"""
+Tests for per-tool and per-phase timing and OpenDSS call counting.
+"""
+
+import asyncio
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import run_power_flow
+from opendss_mcp.utils.formatters import format_error_response
+from opendss_mcp.utils.instrumentation import (
+    Instrumentation,
+    RecordedCall,
+    api_call_count,
+    instrumentation,
+)
+from opendss_mcp.utils.sessions import SessionManager
+
+
+def test_invocation_records_phases_and_api_calls():
+    """Compile, solve and extract time and OpenDSS calls land in the invocation."""
+    instrumentation.reset()
+    with instrumentation.invocation("study") as record:
+        load_ieee_test_feeder("IEEE13")
+        run_power_flow("IEEE13")
+
+    assert record["success"]
+    assert {"compile", "solve", "extract"} <= set(record["phases_ms"])
+    assert sum(record["phases_ms"].values()) <= record["total_ms"]
+    assert record["api_calls"] > 0
+
+    stats = instrumentation.stats()["tools"]["study"]
+    assert stats["calls"] == 1
+    assert stats["api_calls"] == record["api_calls"]
+    assert stats["phase_counts"]["compile"] == 1
+    assert stats["duration_ms"]["p95"] == record["total_ms"]
+
+    # Outside an invocation phases run untimed but calls are still counted
+    before = api_call_count()
+    run_power_flow("IEEE13")
+    assert api_call_count() > before
+    assert instrumentation.stats()["tools"]["study"]["calls"] == 1
+
+
+def test_tool_decorator_counts_errors_and_adds_timings():
+    """Failed responses count as errors; successful ones carry metadata.timings."""
+    recorder = Instrumentation(response_timings=True)
+
+    @recorder.tool()
+    def power_flow(feeder_id):
+        return run_power_flow(feeder_id)
+
+    @recorder.tool("failing")
+    async def fail():
+        return format_error_response("no circuit")
+
+    load_ieee_test_feeder("IEEE13")
+    result = power_flow("IEEE13")
+    assert result["metadata"]["timings"]["api_calls"] > 0
+    assert "solve" in result["metadata"]["timings"]["phases_ms"]
+    assert asyncio.run(fail())["metadata"] is None
+
+    stats = recorder.stats()["tools"]
+    assert stats["power_flow"]["errors"] == 0
+    assert stats["failing"] == {**stats["failing"], "calls": 1, "errors": 1}
+
+    recorder.reset()
+    assert recorder.stats()["tools"] == {}
+
+
+def test_session_calls_merge_into_current_invocation():
+    """Phases and OpenDSS calls made in a session process count for the caller."""
+    manager = SessionManager(max_sessions=1)
+    try:
+        manager.create("timed")
+        manager.call("timed", load_ieee_test_feeder, "IEEE13")
+        result, record = manager.call("timed", RecordedCall(run_power_flow), "IEEE13")
+        assert result["success"]
+        assert record["tool"] == "run_power_flow"
+        assert record["phase_counts"]["solve"] == 1
+
+        with instrumentation.invocation("outer") as outer:
+            instrumentation.add_to_current(record)
+        assert outer["phase_counts"] == record["phase_counts"]
+        assert outer["api_calls"] == record["api_calls"] > 0
+    finally:
+        manager.close_all()
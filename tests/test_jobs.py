@@ -0,0 +1,163 @@
+"""
+Tests for background jobs with progress reporting and cancellation.
+"""
+
+import time
+
+import pytest
+
+from opendss_mcp.tools.capacity import analyze_feeder_capacity
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.hosting_capacity import analyze_hosting_capacity_map
+from opendss_mcp.tools.timeseries import run_time_series_simulation
+from opendss_mcp.utils.jobs import JobManager
+
+IEEE13 = {"feeder_id": "IEEE13", "modifications": None}
+
+
+@pytest.fixture
+def jobs():
+    """Job manager whose worker pool is stopped after the test."""
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def wait(jobs, job_id, states, timeout=120.0):
+    """Poll a job until it reaches one of the given states."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = jobs.status(job_id)
+        if status["state"] in states:
+            return status
+        time.sleep(0.1)
+    raise AssertionError(f"Job {job_id} stuck in {status['state']}")
+
+
+def test_job_matches_inline_run(jobs):
+    """A job on its own copy of the feeder returns the same result as a direct call."""
+    kwargs = {"load_profile": "residential_summer", "duration_hours": 24}
+    job_id = jobs.submit("run_timeseries", run_time_series_simulation, kwargs, IEEE13)
+
+    status = wait(jobs, job_id, {"completed", "failed"})
+    assert status["state"] == "completed"
+    assert status["progress"] == {"done": 24, "total": 24, "percent": 100.0}
+    assert status["finished_at"] >= status["started_at"] >= status["submitted_at"]
+
+    load_ieee_test_feeder("IEEE13")
+    inline = run_time_series_simulation(**kwargs)
+    result = jobs.result(job_id)
+    assert result["success"]
+    assert result["data"]["summary"] == inline["data"]["summary"]
+
+
+def test_cancel_running_and_pending_jobs(jobs):
+    """Running jobs stop at their next progress update; queued jobs never start."""
+    long_run = {
+        "load_profile": "residential_summer",
+        "duration_hours": 2000,
+        "timestep_minutes": 1,
+    }
+    running = jobs.submit(
+        "run_timeseries", run_time_series_simulation, long_run, IEEE13
+    )
+    queued = jobs.submit("run_timeseries", run_time_series_simulation, long_run, IEEE13)
+
+    status = wait(jobs, running, {"running"})
+    while status["progress"]["done"] == 0:
+        time.sleep(0.1)
+        status = jobs.status(running)
+    assert status["progress"]["total"] == 120000
+
+    assert jobs.cancel(queued)["state"] in ("cancelling", "cancelled")
+    assert jobs.cancel(running)["state"] == "cancelling"
+    assert wait(jobs, running, {"cancelled", "completed"})["state"] == "cancelled"
+    assert wait(jobs, queued, {"cancelled", "completed"})["state"] == "cancelled"
+
+    with pytest.raises(ValueError, match="is cancelled"):
+        jobs.result(running)
+
+
+def test_hosting_capacity_map_job_progress_and_cancel(jobs):
+    """Map jobs report one step per bus and stop when cancelled."""
+    buses = ["675", "611", "652", "634"]
+    kwargs = {"bus_ids": buses, "max_capacity_kw": 2000, "max_workers": 1}
+    job_id = jobs.submit(
+        "analyze_hosting_capacity_map", analyze_hosting_capacity_map, kwargs, IEEE13
+    )
+    status = wait(jobs, job_id, {"completed", "failed"})
+    assert status["state"] == "completed"
+    assert status["progress"]["done"] == status["progress"]["total"] == len(buses)
+    assert len(jobs.result(job_id)["data"]["buses"]) == len(buses)
+
+    # A slow linear search (about 0.7 s per IEEE34 bus) stops without
+    # starting the chunks of buses still queued
+    slow = {
+        "bus_ids": ["810", "812", "814", "816", "818"] * 4,
+        "search": "linear",
+        "increment_kw": 10,
+        "max_capacity_kw": 3000,
+        "constraints": {"min_voltage_pu": 0.8, "max_voltage_pu": 1.2},
+        "max_workers": 1,
+    }
+    ieee34 = {"feeder_id": "IEEE34", "modifications": None}
+    job_id = jobs.submit(
+        "analyze_hosting_capacity_map", analyze_hosting_capacity_map, slow, ieee34
+    )
+    status = wait(jobs, job_id, {"running"})
+    while status["progress"]["done"] == 0:
+        time.sleep(0.1)
+        status = jobs.status(job_id)
+    assert status["progress"]["total"] == 20
+
+    assert jobs.cancel(job_id)["state"] == "cancelling"
+    status = wait(jobs, job_id, {"cancelled", "completed"})
+    assert status["state"] == "cancelled"
+    assert status["progress"]["done"] < 20
+
+
+def test_finished_jobs_are_pruned(jobs):
+    """Finished jobs beyond the retention limits are forgotten; running ones stay."""
+    kwargs = {"load_profile": "residential_summer", "duration_hours": 2}
+    finished = [
+        jobs.submit("run_timeseries", run_time_series_simulation, kwargs, IEEE13)
+        for _ in range(3)
+    ]
+    for job_id in finished:
+        wait(jobs, job_id, {"completed"})
+    long_run = {**kwargs, "duration_hours": 2000, "timestep_minutes": 1}
+    running = jobs.submit(
+        "run_timeseries", run_time_series_simulation, long_run, IEEE13
+    )
+
+    assert jobs.prune(max_finished=1) == finished[1::-1]
+    assert [job["job_id"] for job in jobs.info()] == [finished[2], running]
+    with pytest.raises(ValueError, match="Unknown job"):
+        jobs.result(finished[0])
+
+    assert jobs.prune(max_age_s=0.0) == [finished[2]]
+    jobs.cancel(running)
+    wait(jobs, running, {"cancelled"})
+
+
+def test_job_errors(jobs):
+    """Unknown jobs and jobs without a circuit are rejected."""
+    with pytest.raises(ValueError, match="Unknown job"):
+        jobs.status("job-missing")
+    with pytest.raises(ValueError, match="loaded feeder or a session"):
+        jobs.submit("analyze_capacity", analyze_feeder_capacity, {"bus_id": "675"})
+
+
+def test_capacity_reports_progress():
+    """The capacity search reports each solve against the expected total."""
+    load_ieee_test_feeder("IEEE13")
+    calls = []
+    result = analyze_feeder_capacity(
+        "675",
+        max_capacity_kw=1000,
+        increment_kw=250,
+        progress_callback=lambda done, total: calls.append((done, total)),
+    )
+    assert result["success"]
+    assert calls[0] == (1, 5)
+    assert [done for done, _ in calls] == list(range(1, len(calls) + 1))
@@ -0,0 +1,119 @@
+"""
+Unit tests for the bulk line-loading extractor.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.utils.line_loading import LineLoadings, invalidate_line_layout
+
+
+@pytest.fixture
+def solved_ieee13():
+    """Load and solve the IEEE 13-bus feeder."""
+    result = load_ieee_test_feeder("IEEE13")
+    assert result["success"], f"Failed to load feeder: {result.get('errors')}"
+    dss.Solution.Solve()
+    return result
+
+
+def _per_line_loadings():
+    """Compute loading line by line, the way the tools used to."""
+    loadings = {}
+    for line_name in dss.Lines.AllNames():
+        dss.Circuit.SetActiveElement(f"Line.{line_name}")
+        currents = dss.CktElement.CurrentsMagAng()
+        normal_amps = dss.CktElement.NormalAmps()
+        if normal_amps > 0 and currents:
+            loadings[line_name] = max(currents[0::2]) / normal_amps * 100.0
+    return loadings
+
+
+def test_loading_matches_per_line_reads(solved_ieee13):
+    """Bulk loadings should equal the per-line CurrentsMagAng computation."""
+    loadings = LineLoadings.capture()
+    bulk = loadings.to_dict(loadings.loading_pct())
+    expected = _per_line_loadings()
+
+    assert set(bulk) == set(expected)
+    for line_name, value in expected.items():
+        assert bulk[line_name] == pytest.approx(value)
+
+
+def test_phase_loading_shape(solved_ieee13):
+    """Per-phase loading has one column per conductor and matches the max."""
+    loadings = LineLoadings.capture()
+    phase_loading = loadings.phase_loading_pct()
+
+    assert phase_loading.shape == (len(loadings.names), 3)
+    rated = loadings.rated
+    assert np.nanmax(phase_loading[rated], axis=1) == pytest.approx(
+        loadings.loading_pct()[rated]
+    )
+    assert loadings.index_of("650632") == 0
+    assert loadings.index_of("Line650632") is None
+
+
+def test_static_layout_is_cached(solved_ieee13):
+    """Ratings and conductor layout are read once and reused between solves."""
+    LineLoadings.capture()
+
+    with patch("opendss_mcp.utils.line_loading.dss", wraps=dss) as spy:
+        dss.Solution.Solve()
+        LineLoadings.capture()
+        LineLoadings.capture()
+
+    assert spy.PDElements.AllCurrentsMagAng.call_count == 2
+    assert spy.PDElements.AllNumConductors.call_count == 0
+    assert spy.Lines.NormAmps.call_count == 0
+
+
+def test_reuse_layout_skips_name_read(solved_ieee13):
+    """reuse_layout trusts the cached layout and reads only the currents."""
+    expected = LineLoadings.capture().loading_pct()
+
+    with patch("opendss_mcp.utils.line_loading.dss", wraps=dss) as spy:
+        loadings = LineLoadings.capture(reuse_layout=True)
+
+    assert spy.PDElements.AllNames.call_count == 0
+    assert np.allclose(loadings.loading_pct(), expected, equal_nan=True)
+
+
+def test_rating_edits_after_invalidation(solved_ieee13):
+    """Edited ratings are read again once the layout is invalidated."""
+    index = LineLoadings.capture().index_of("650632")
+
+    dss.Text.Command("Edit Line.650632 NormAmps=123")
+    invalidate_line_layout()
+    loadings = LineLoadings.capture(reuse_layout=True)
+
+    assert loadings.normal_amps[index] == 123.0
+
+
+def test_reuse_layout_follows_circuit_change(solved_ieee13):
+    """The cached layout is keyed on the circuit, not shared across feeders."""
+    LineLoadings.capture()
+
+    load_ieee_test_feeder("IEEE34")
+    dss.Solution.Solve()
+    loadings = LineLoadings.capture(reuse_layout=True)
+
+    assert sorted(name.lower() for name in loadings.names) == sorted(
+        dss.Lines.AllNames()
+    )
+
+
+def test_overloaded_threshold(solved_ieee13):
+    """overloaded() reports every line above the threshold."""
+    loadings = LineLoadings.capture()
+    loading = loadings.loading_pct()
+    threshold = float(np.nanmedian(loading))
+
+    overloaded = loadings.overloaded(threshold)
+
+    assert len(overloaded) == int(np.sum(loading > threshold))
+    assert all(item["loading_pct"] >= round(threshold, 2) for item in overloaded)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the streaming statistics accumulators.
+"""
+
+import numpy as np
+import pytest
+
+from opendss_mcp.utils.online_stats import (
+    ElementExtremes,
+    P2Quantile,
+    RunningStats,
+    ThresholdTimer,
+    VectorStats,
+)
+
+
+@pytest.mark.parametrize(
+    "samples",
+    [
+        np.random.default_rng(0).normal(100.0, 10.0, 20000),
+        np.random.default_rng(1).exponential(5.0, 20000),
+    ],
+)
+def test_running_stats_match_numpy(samples):
+    """Welford moments are exact and P² quantiles are close to numpy's."""
+    stats = RunningStats(quantiles=(0.05, 0.5, 0.95))
+    for step, value in enumerate(samples):
+        stats.update(value, step)
+
+    assert stats.mean == pytest.approx(np.mean(samples), rel=1e-9)
+    assert stats.variance == pytest.approx(np.var(samples), rel=1e-9)
+    assert stats.min == samples.min()
+
+    summary = stats.summary(digits=8)
+    assert summary["count"] == len(samples)
+    assert summary["max_time"] == int(np.argmax(samples))
+
+    spread = np.std(samples)
+    for key, q in (("p05", 0.05), ("p50", 0.5), ("p95", 0.95)):
+        assert abs(summary[key] - np.quantile(samples, q)) < 0.05 * spread
+
+
+def test_p2_quantile_exact_for_few_samples():
+    """Fewer than six samples give the exact quantile."""
+    estimator = P2Quantile(0.5)
+    assert estimator.value() is None
+    for value in (3.0, 1.0, 2.0):
+        estimator.update(value)
+    assert estimator.value() == 2.0
+
+    with pytest.raises(ValueError):
+        P2Quantile(1.0)
+
+
+def test_vector_stats_match_numpy():
+    """Batch updates give the moments and histogram quantiles of all samples."""
+    samples = np.random.default_rng(2).normal(1.0, 0.02, (200, 50))
+    stats = VectorStats(low=0.0, high=2.0, resolution=0.0005, quantiles=(0.05, 0.5))
+    for step, row in enumerate(samples):
+        stats.update(row, step)
+
+    assert stats.mean == pytest.approx(samples.mean(), rel=1e-9)
+    assert stats.variance == pytest.approx(samples.var(), rel=1e-9)
+
+    summary = stats.summary(digits=8, time_label="hour")
+    assert summary["count"] == samples.size
+    assert summary["min_hour"] == int(np.argmin(samples) // samples.shape[1])
+    assert summary["p05"] == pytest.approx(np.quantile(samples, 0.05), abs=0.0005)
+    assert summary["p50"] == pytest.approx(np.quantile(samples, 0.5), abs=0.0005)
+
+
+def test_threshold_timer():
+    """Only steps beyond the limit are counted."""
+    timer = ThresholdTimer(0.95, above=False)
+    for hour, value in enumerate([0.97, 0.94, 0.96, 0.93]):
+        timer.update(value, duration_hours=0.25, time=hour)
+
+    assert timer.summary("hour") == {
+        "threshold": 0.95,
+        "steps": 2,
+        "hours": 0.5,
+        "first_hour": 1,
+        "last_hour": 3,
+    }
+
+
+def test_element_extremes():
+    """Each element keeps its own extremes and the time they occurred."""
+    extremes = ElementExtremes(["a", "b", "c"])
+    extremes.update(np.array([1.00, 0.98, np.nan]), 0.0)
+    extremes.update(np.array([0.96, 1.02, 1.01]), 1.0)
+    extremes.update(np.array([0.99, 1.00, 1.03]), 2.0)
+
+    assert extremes.worst(2, lowest=True) == [
+        {"name": "a", "value": 0.96, "time": 1.0},
+        {"name": "b", "value": 0.98, "time": 0.0},
+    ]
+    assert extremes.worst(1, lowest=False) == [
+        {"name": "c", "value": 1.03, "time": 2.0}
+    ]
@@ -0,0 +1,177 @@
+"""
+Unit tests for the on-disk result store.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from opendss_mcp.utils import result_store
+from opendss_mcp.utils.result_store import (
+    RESULTS_DIR_ENV,
+    RESULTS_MAX_MB_ENV,
+    ShardedArrayWriter,
+    count_values,
+    delete_result,
+    prune_results,
+    read_document,
+    read_manifest,
+    read_rows,
+    result_path,
+    store_document,
+    store_large_fields,
+)
+
+
+@pytest.fixture(autouse=True)
+def results_tmpdir(tmp_path, monkeypatch):
+    """Keep stored results inside the test's temporary directory."""
+    monkeypatch.setenv(RESULTS_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def _write(num_rows, shard_size):
+    writer = ShardedArrayWriter(
+        "test", shard_size=shard_size, labels={"voltages": ["a", "b", "c"]}
+    )
+    for step in range(num_rows):
+        writer.append({"step": step, "voltages": np.full(3, step / 10.0)})
+    writer.close(summary={"rows": num_rows})
+    return writer
+
+
+def test_rows_are_split_into_shards(results_tmpdir):
+    """Rows are written in shard_size chunks and described by the manifest."""
+    writer = _write(25, shard_size=10)
+    manifest = read_manifest(writer.handle)
+
+    assert result_path(writer.handle) == results_tmpdir / writer.handle
+    assert manifest["num_rows"] == 25
+    assert [(s["start"], s["stop"]) for s in manifest["shards"]] == [
+        (0, 10),
+        (10, 20),
+        (20, 25),
+    ]
+    assert manifest["columns"]["voltages"]["shape"] == [3]
+    assert manifest["labels"]["voltages"] == ["a", "b", "c"]
+    assert manifest["summary"] == {"rows": 25}
+
+
+def test_read_rows_across_shards():
+    """A row range spanning several shards is read back in order."""
+    writer = _write(25, shard_size=10)
+
+    rows = read_rows(writer.handle, fields=["step", "voltages"], offset=8, limit=5)
+
+    assert rows["step"].tolist() == [8, 9, 10, 11, 12]
+    assert rows["voltages"].shape == (5, 3)
+    assert rows["voltages"][:, 0] == pytest.approx([0.8, 0.9, 1.0, 1.1, 1.2])
+    assert len(read_rows(writer.handle)["step"]) == 25
+    assert read_rows(writer.handle, offset=30)["voltages"].shape == (0, 3)
+
+
+def test_invalid_requests():
+    """Unknown handles and fields are reported as ValueError."""
+    writer = _write(3, shard_size=10)
+
+    with pytest.raises(ValueError, match="Invalid result handle"):
+        read_rows("../etc")
+    with pytest.raises(ValueError, match="Result not found"):
+        read_rows("test-000000000000")
+    with pytest.raises(ValueError, match="Unknown fields"):
+        read_rows(writer.handle, fields=["currents"])
+
+
+def test_discard_removes_result(results_tmpdir):
+    """discard() deletes a partially written result."""
+    writer = ShardedArrayWriter("test", shard_size=2)
+    writer.append({"step": 0})
+    writer.append({"step": 1})
+    writer.discard()
+
+    assert not (results_tmpdir / writer.handle).exists()
+
+
+def test_document_read_by_path():
+    """Stored documents are read back whole or at a dotted path."""
+    manifest = store_document(
+        "test", {"harmonics": {"5": {"a": 0.01}}, "rows": [1, 2, 3]}
+    )
+    handle = manifest["handle"]
+
+    assert manifest["num_values"] == 4
+    assert read_document(handle, "harmonics.5.a") == 0.01
+    assert read_document(handle, "rows.-1") == 3
+    with pytest.raises(ValueError, match="Path not found"):
+        read_document(handle, "rows.7")
+    with pytest.raises(ValueError, match="is a document"):
+        read_rows(handle)
+
+
+def test_store_large_fields_only_above_limit():
+    """Fields move to a document only when they exceed the inline limit."""
+    small = {"bus_voltages": {"a": 1.0, "b": 0.99}, "harmonics": {"worst": "a"}}
+    assert store_large_fields("test", small, ["bus_voltages"], inline_limit=2) is None
+    assert "bus_voltages" in small
+
+    large = {
+        "bus_voltages": {"a": 1.0, "b": 0.99},
+        "harmonics": {"thd": {"a": 2.0}, "worst": "a"},
+    }
+    handle = store_large_fields(
+        "test", large, ["bus_voltages", "harmonics.thd", "missing"], inline_limit=2
+    )
+
+    assert large == {
+        "harmonics": {"worst": "a"},
+        "result_handle": handle,
+        "stored_fields": ["bus_voltages", "harmonics.thd"],
+    }
+    assert read_document(handle, "harmonics.thd") == {"a": 2.0}
+    assert count_values(read_document(handle)) == 3
+
+
+def test_old_and_excess_results_are_pruned(results_tmpdir, monkeypatch):
+    """Expired results go first, then the oldest until the size budget fits."""
+    handles = [
+        store_document("test", {"rows": list(range(20000))})["handle"] for _ in range(3)
+    ]
+    in_progress = ShardedArrayWriter("test")
+    now = time.time()
+    for age_hours, handle in zip([30, 3, 2], handles):
+        stamp = now - age_hours * 3600
+        os.utime(results_tmpdir / handle, (stamp, stamp))
+    stamp = now - 5 * 3600
+    os.utime(in_progress.directory, (stamp, stamp))
+
+    # Each document is about 0.1 MB: only the newest one fits in 0.15 MB
+    assert prune_results(max_age_hours=24, max_mb=0.15) == handles[:2]
+    assert read_document(handles[2], "rows.-1") == 19999
+    assert in_progress.directory.exists()
+
+    # New results prune with the limits from the environment
+    monkeypatch.setenv(RESULTS_MAX_MB_ENV, "0")
+    store_document("test", {"rows": [1]})
+    assert not (results_tmpdir / handles[2]).exists()
+
+
+def test_documents_are_parsed_once(monkeypatch):
+    """Paging through a document reuses the parsed copy until it is deleted."""
+    handle = store_document("test", {"rows": [1, 2, 3]})["handle"]
+    document_path = str(result_path(handle) / "document.json")
+    loads = []
+    original = result_store.json.load
+    monkeypatch.setattr(
+        result_store.json, "load", lambda f: loads.append(f.name) or original(f)
+    )
+
+    assert read_document(handle, "rows.0") == 1
+    assert read_document(handle, "rows.2") == 3
+    assert loads.count(document_path) == 1
+
+    assert delete_result(handle)["freed_bytes"] > 0
+    with pytest.raises(ValueError, match="Result not found"):
+        read_document(handle)
+    assert document_path not in result_store._document_cache
@@ -0,0 +1,107 @@
+"""
+Tests for result handles and paginated retrieval of stored results.
+"""
+
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import run_power_flow
+from opendss_mcp.tools.results import delete_result, fetch_result
+from opendss_mcp.tools.timeseries import run_time_series_simulation
+from opendss_mcp.utils.result_store import RESULTS_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def results_tmpdir(tmp_path, monkeypatch):
+    """Keep stored results inside the test's temporary directory."""
+    monkeypatch.setenv(RESULTS_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def test_power_flow_pages_match_inline_result():
+    """Stored bus voltages page back to exactly the inline values."""
+    load_ieee_test_feeder("IEEE13")
+    inline = run_power_flow("IEEE13")["data"]
+    stored = run_power_flow("IEEE13", {"inline_limit": 0})["data"]
+
+    assert "bus_voltages" not in stored
+    assert stored["stored_fields"] == ["bus_voltages"]
+    assert stored["num_buses"] == inline["num_buses"]
+    assert stored["min_voltage"] == inline["min_voltage"]
+
+    voltages = {}
+    offset = 0
+    while offset is not None:
+        page = fetch_result(stored["result_handle"], "bus_voltages", offset, limit=5)
+        assert page["success"]
+        assert len(page["data"]["items"]) <= 5
+        assert page["data"]["total"] == inline["num_buses"]
+        voltages.update(page["data"]["items"])
+        offset = page["data"]["next_offset"]
+    assert voltages == inline["bus_voltages"]
+
+
+def test_timeseries_timesteps_stored_above_limit():
+    """Long time-series lists are stored and can be sliced by field."""
+    load_ieee_test_feeder("IEEE13")
+    result = run_time_series_simulation(
+        load_profile="residential_summer",
+        duration_hours=24,
+        output_variables=["losses", "powers"],
+        inline_limit=100,
+    )
+    data = result["data"]
+    assert "timesteps" not in data
+    assert data["summary"]["num_timesteps"] == 24
+
+    page = fetch_result(
+        data["result_handle"], "timesteps", 20, 10, fields=["hour", "losses_kw"]
+    )["data"]
+    assert page["total"] == 24
+    assert page["next_offset"] is None
+    assert [row["hour"] for row in page["items"]] == [20.0, 21.0, 22.0, 23.0]
+    assert set(page["items"][0]) == {"hour", "losses_kw"}
+
+    bus_powers = fetch_result(data["result_handle"], "timesteps.0.bus_powers")
+    assert bus_powers["data"]["total"] > 0
+
+
+def test_streamed_columns_are_paged():
+    """Results written with stream=True are paged by row and column."""
+    load_ieee_test_feeder("IEEE13")
+    result = run_time_series_simulation(
+        load_profile="residential_summer", duration_hours=24, stream=True
+    )
+    page = fetch_result(result["data"]["result_handle"], "bus_voltages_pu", 0, 3)
+
+    assert page["data"]["total"] == 24
+    assert len(page["data"]["items"]["bus_voltages_pu"]) == 3
+    assert len(page["data"]["labels"]["bus_voltages_pu"]) == len(
+        page["data"]["items"]["bus_voltages_pu"][0]
+    )
+
+
+def test_fetch_errors():
+    """Bad handles, paths and limits return error responses."""
+    assert not fetch_result("../etc")["success"]
+    assert not fetch_result("power_flow-000000000000")["success"]
+
+    load_ieee_test_feeder("IEEE13")
+    handle = run_power_flow("IEEE13", {"inline_limit": 0})["data"]["result_handle"]
+    assert "Path not found" in fetch_result(handle, "thd_voltage")["errors"][0]
+    assert not fetch_result(handle, limit=0)["success"]
+    assert not fetch_result(handle, "bus_voltages", fields=["kw"])["success"]
+
+
+def test_delete_result():
+    """A deleted result frees its files and can no longer be fetched."""
+    load_ieee_test_feeder("IEEE13")
+    handle = run_power_flow("IEEE13", {"inline_limit": 0})["data"]["result_handle"]
+    assert fetch_result(handle, "bus_voltages")["success"]
+
+    deleted = delete_result(handle)
+    assert deleted["success"]
+    assert deleted["data"]["kind"] == "power_flow"
+    assert deleted["data"]["freed_bytes"] > 0
+    assert "Result not found" in fetch_result(handle, "bus_voltages")["errors"][0]
+    assert not delete_result(handle)["success"]
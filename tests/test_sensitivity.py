@@ -0,0 +1,94 @@
+"""
+Unit tests for the linear DER sensitivities.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.utils.der_probe import DERProbe, bus_connection
+from opendss_mcp.utils.sensitivity import der_sensitivities
+
+BUSES = ["675", "680", "634", "611", "652"]
+
+
+@pytest.fixture
+def solved_ieee13():
+    """Load the IEEE 13-bus feeder and solve it with controls frozen."""
+    result = load_ieee_test_feeder("IEEE13")
+    assert result["success"], f"Failed to load feeder: {result.get('errors')}"
+    dss.Solution.Solve()
+    dss.Text.Command("Set ControlMode=Off")
+    return result
+
+
+def _exact_losses(bus_id, kw):
+    """Losses with a PV system of kw at the bus, from a full power flow."""
+    connection = bus_connection(bus_id)
+    with DERProbe("sens_test") as probe:
+        probe.place(
+            "PVSystem",
+            connection["bus"],
+            {
+                "phases": connection["phases"],
+                "kV": connection["kV"],
+                "kVA": kw,
+                "Pmpp": kw,
+                "irradiance": 1.0,
+            },
+        )
+        dss.Solution.Solve()
+        losses = dss.Circuit.Losses()[0] / 1000.0
+    dss.Solution.Solve()
+    return losses
+
+
+def test_baseline_losses_match_circuit(solved_ieee13):
+    """Losses assembled from PD element admittances equal Circuit.Losses()."""
+    result = der_sensitivities(BUSES, 100)
+
+    assert result["bus_ids"] == BUSES
+    assert result["baseline_losses_kw"] == pytest.approx(
+        dss.Circuit.Losses()[0] / 1000.0, rel=1e-6
+    )
+
+
+def test_predicted_losses_track_power_flow(solved_ieee13):
+    """Predicted losses are close to full power flow results."""
+    result = der_sensitivities(BUSES, 200)
+
+    for bus_id, predicted in zip(BUSES, result["predicted_losses_kw"]):
+        assert predicted == pytest.approx(_exact_losses(bus_id, 200), rel=0.03)
+
+
+def test_sensitivity_signs(solved_ieee13):
+    """Injection at a loaded bus raises voltage and reduces losses."""
+    result = der_sensitivities(["675"], 100)
+
+    assert result["dv_dp_pu_per_mw"][0] > 0
+    assert result["dloss_dp_kw_per_mw"][0] < 0
+    assert np.isfinite(result["predicted_max_voltage_pu"]).all()
+
+
+def test_candidate_blocks_match_single_solve(solved_ieee13):
+    """Solving candidates in small blocks gives the same results as one block."""
+    whole = der_sensitivities(BUSES, 200)
+
+    num_nodes = len(dss.Circuit.YNodeOrder())
+    with patch("opendss_mcp.utils.sensitivity.BLOCK_ENTRIES", 2 * num_nodes):
+        blocked = der_sensitivities(BUSES, 200)
+
+    for key in ("dv_dp_pu_per_mw", "dloss_dp_kw_per_mw", "predicted_losses_kw"):
+        assert np.allclose(blocked[key], whole[key], rtol=1e-9)
+    assert np.array_equal(
+        blocked["predicted_violations"], whole["predicted_violations"]
+    )
+
+
+def test_unknown_bus_raises(solved_ieee13):
+    """Buses without phase nodes are rejected."""
+    with pytest.raises(ValueError):
+        der_sensitivities(["no_such_bus"], 100)
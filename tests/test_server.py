@@ -0,0 +1,50 @@
+"""
+Tests for lazy tool imports and pre-warming in the MCP server module.
+"""
+
+import subprocess
+import sys
+
+from opendss_mcp import server
+
+
+def test_server_import_defers_heavy_modules():
+    """Importing the server loads neither OpenDSS nor the plotting libraries."""
+    code = (
+        "import sys\n"
+        "import opendss_mcp.server\n"
+        "heavy = ['opendssdirect', 'matplotlib', 'networkx', 'opendss_mcp.tools']\n"
+        "print([m for m in heavy if m in sys.modules])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_visualization_imports_matplotlib_on_first_plot():
+    """The visualization module loads matplotlib and networkx only to plot."""
+    code = (
+        "import sys\n"
+        "from opendss_mcp.tools import visualization\n"
+        "print('matplotlib' in sys.modules, end=' ')\n"
+        "visualization._pyplot()\n"
+        "import matplotlib\n"
+        "print(matplotlib.get_backend().lower())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.split() == ["False", "agg"]
+
+
+def test_tool_functions_resolve_and_prewarm():
+    """Every registered tool function imports, including the job tools."""
+    from opendss_mcp.tools.power_flow import run_power_flow
+
+    assert server.tool_function("run_power_flow") is run_power_flow
+    assert set(server.JOB_TOOLS.values()) <= set(server.TOOL_FUNCTIONS)
+
+    assert server.prewarm() >= 0.0
+    for name in server.TOOL_FUNCTIONS:
+        assert callable(server.tool_function(name))
@@ -0,0 +1,120 @@
+"""
+Tests for named sessions with isolated OpenDSS engines.
+"""
+
+import asyncio
+import time
+
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp import server
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import run_power_flow
+from opendss_mcp.utils.sessions import (
+    SessionManager,
+    current_session_id,
+    run_in_session,
+    session_manager,
+)
+
+
+@pytest.fixture
+def manager():
+    """Session manager whose sessions are closed after the test."""
+    manager = SessionManager(max_sessions=2)
+    yield manager
+    manager.close_all()
+
+
+def test_sessions_hold_separate_circuits(manager):
+    """Each session keeps its own feeder, independent of the default engine."""
+    load_ieee_test_feeder("IEEE13")
+    manager.create("small")
+    manager.create("large")
+
+    small = manager.call("small", load_ieee_test_feeder, "IEEE13")
+    large = manager.call("large", load_ieee_test_feeder, "IEEE34")
+    assert small["data"]["num_buses"] != large["data"]["num_buses"]
+
+    # Later calls see the circuit their session loaded
+    flow = manager.call("small", run_power_flow, "IEEE13")
+    assert flow["success"]
+    assert len(flow["data"]["bus_voltages"]) == small["data"]["num_buses"]
+    assert manager.call("large", current_session_id) == "large"
+
+    # The server process's own circuit is untouched
+    assert dss.Circuit.NumBuses() == small["data"]["num_buses"]
+    assert current_session_id() is None
+
+    info = {row["session_id"]: row for row in manager.info()}
+    assert info["small"]["calls"] == 2
+    assert info["small"]["last_tool"] == "run_power_flow"
+
+
+def test_session_lifecycle_errors(manager):
+    """Unknown, duplicate, invalid and excess sessions are rejected."""
+    with pytest.raises(ValueError, match="Unknown session"):
+        manager.call("missing", current_session_id)
+    with pytest.raises(ValueError, match="Invalid session_id"):
+        manager.create("bad name")
+
+    session_id = manager.create()
+    with pytest.raises(ValueError, match="already exists"):
+        manager.create(session_id)
+
+    manager.create("second")
+    with pytest.raises(ValueError, match="Too many open sessions"):
+        manager.create("third")
+
+    assert manager.close(session_id)["session_id"] == session_id
+    assert manager.list_ids() == ["second"]
+    with pytest.raises(ValueError, match="Unknown session"):
+        manager.close(session_id)
+
+
+def test_session_tools_run_concurrently():
+    """Server tools await their sessions, so two sessions work at the same time."""
+
+    async def ticker(stop):
+        ticks = 0
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.05)
+        return ticks
+
+    async def scenario():
+        server.create_session("left")
+        server.create_session("right")
+        # Start both worker processes before timing anything
+        await asyncio.gather(
+            run_in_session("left", current_session_id),
+            run_in_session("right", current_session_id),
+        )
+
+        stop = asyncio.Event()
+        ticks = asyncio.create_task(ticker(stop))
+        started = time.perf_counter()
+        await asyncio.gather(
+            run_in_session("left", time.sleep, 1.0),
+            run_in_session("right", time.sleep, 1.0),
+        )
+        elapsed = time.perf_counter() - started
+        stop.set()
+
+        left, right = await asyncio.gather(
+            server.load_feeder("IEEE13", session_id="left"),
+            server.load_feeder("IEEE34", session_id="right"),
+        )
+        return elapsed, await ticks, left, right
+
+    try:
+        elapsed, ticks, left, right = asyncio.run(scenario())
+    finally:
+        session_manager.close_all()
+
+    # Both one-second calls overlap and the event loop keeps running meanwhile
+    assert elapsed < 1.8
+    assert ticks >= 10
+    assert left["success"] and right["success"]
+    assert left["data"]["num_buses"] != right["data"]["num_buses"]
@@ -0,0 +1,124 @@
+"""
+Tests for the warm/cold solve strategies and per-solve statistics.
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import run_power_flow
+from opendss_mcp.utils.solver import PowerFlowSolver
+
+
+def test_auto_starts_cold_after_large_change():
+    """Small changes continue from the last solution, large ones start cold."""
+    load_ieee_test_feeder("IEEE13")
+    solver = PowerFlowSolver()
+
+    first = solver.solve()
+    assert first["converged"]
+    assert first["iterations"] > 0
+    assert first["time_ms"] > 0
+    assert solver.solve(change=0.05)["start"] == "warm"
+    assert solver.solve(change=0.8)["start"] == "cold"
+
+    stats = solver.stats()
+    assert stats["solves"] == 3
+    assert stats["warm_starts"] == 2
+    assert stats["cold_starts"] == 1
+    assert stats["max_iterations"] >= first["iterations"]
+    assert stats["avg_iterations"] == pytest.approx(
+        stats["total_iterations"] / 3, abs=0.01
+    )
+
+
+def test_warm_and_cold_starts_reach_same_solution():
+    """The start changes the iterations taken, not the converged voltages."""
+    load_ieee_test_feeder("IEEE13")
+    dss.Solution.Solve()
+    for load in dss.Loads.AllNames():
+        dss.Loads.Name(load)
+        dss.Loads.kW(dss.Loads.kW() * 1.1)
+
+    assert PowerFlowSolver("warm").solve()["converged"]
+    warm = np.array(dss.Circuit.AllBusMagPu())
+    assert PowerFlowSolver("cold").solve()["converged"]
+    cold = np.array(dss.Circuit.AllBusMagPu())
+
+    assert np.abs(warm - cold).max() < 1e-4
+
+
+def test_y_rebuild_reported_for_text_edits_only():
+    """Interface setters change injections without flagging a Y rebuild."""
+    load_ieee_test_feeder("IEEE13")
+    solver = PowerFlowSolver()
+    solver.solve()
+
+    dss.Loads.First()
+    dss.Loads.kW(dss.Loads.kW() * 1.05)
+    assert solver.solve()["y_rebuilt"] is False
+
+    dss.Text.Command(f"Load.{dss.Loads.Name()}.kW={dss.Loads.kW() * 1.05}")
+    assert solver.solve()["y_rebuilt"] is True
+    assert solver.stats()["y_rebuilds"] == 1
+
+
+def test_failed_warm_start_is_retried_cold():
+    """A warm start that does not converge is solved again from a direct solution."""
+    engine = MagicMock()
+    engine.Solution.Converged.side_effect = [False, True]
+    engine.Solution.SystemYChanged.return_value = False
+    engine.Solution.Iterations.return_value = 4
+    engine.Solution.ControlIterations.return_value = 1
+
+    solve = PowerFlowSolver(engine=engine).solve()
+
+    assert solve["converged"]
+    assert solve["retried"]
+    assert solve["start"] == "cold"
+    engine.Solution.SolveDirect.assert_called_once()
+    assert engine.Solution.Solve.call_count == 2
+
+    with pytest.raises(ValueError, match="Unsupported solve strategy"):
+        PowerFlowSolver("hot")
+
+
+def test_retry_keeps_time_step_in_loadshape_mode():
+    """A retried solve in daily mode solves the same hour instead of the next."""
+    load_ieee_test_feeder("IEEE13")
+    dss.Text.Command("Set Mode=Daily Stepsize=1h Number=1")
+    dss.Solution.Hour(0)
+    dss.Solution.Seconds(0)
+    engine = MagicMock(wraps=dss)
+    outcomes = iter([True, False])
+    engine.Solution.Converged.side_effect = lambda: next(
+        outcomes, dss.Solution.Converged()
+    )
+    solver = PowerFlowSolver(engine=engine)
+    solver.solve()
+
+    # The warm start of the second step fails and is retried cold
+    solve = solver.solve(change=0.0)
+
+    assert solve["retried"]
+    assert solve["converged"]
+    assert dss.Solution.Hour() == 2
+    solver.solve(change=0.0)
+    assert dss.Solution.Hour() == 3
+    dss.Text.Command("Set Mode=Snap")
+
+
+def test_power_flow_reports_solve():
+    """The power flow tool returns statistics of its solve."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_power_flow("IEEE13", {"solve_strategy": "cold"})
+    assert result["success"]
+    assert result["data"]["solve"]["start"] == "cold"
+    assert result["data"]["solve"]["iterations"] == result["data"]["iterations"]
+
+    result = run_power_flow("IEEE13", {"solve_strategy": "hot"})
+    assert "Unsupported solve strategy" in result["errors"][0]
@@ -0,0 +1,134 @@
+"""
+Unit tests for the Monte Carlo (stochastic) hosting capacity analysis.
+"""
+
+import numpy as np
+import opendssdirect as dss
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.results import fetch_result
+from opendss_mcp.tools.stochastic_capacity import (
+    adopters_per_level,
+    analyze_stochastic_hosting_capacity,
+    scenario_deployment,
+)
+
+LEVELS = [20, 60, 100]
+
+
+def test_scenarios_are_seeded():
+    """A scenario's deployment depends only on the seed and its index."""
+    load_kw = np.array([100.0, 50.0, 20.0, 80.0])
+
+    order, sizes = scenario_deployment(3, 7, load_kw, (0.5, 2.0))
+    again, same_sizes = scenario_deployment(3, 7, load_kw, (0.5, 2.0))
+    other, _ = scenario_deployment(4, 7, load_kw, (0.5, 2.0))
+
+    assert sorted(order) == [0, 1, 2, 3]
+    assert np.array_equal(order, again) and np.array_equal(sizes, same_sizes)
+    assert np.all((sizes >= 0.5 * load_kw) & (sizes <= 2.0 * load_kw))
+    assert not np.array_equal(sizes, scenario_deployment(3, 8, load_kw, (0.5, 2.0))[1])
+    assert len(other) == 4
+    assert adopters_per_level([1, 50, 100], 15).tolist() == [1, 8, 15]
+
+
+def test_results_do_not_depend_on_workers():
+    """Curves and scenario results are identical for one and two workers."""
+    load_ieee_test_feeder("IEEE13")
+    kwargs = {
+        "num_scenarios": 6,
+        "penetration_levels": LEVELS,
+        "load_multiplier": 0.4,
+        "seed": 11,
+    }
+
+    progress = []
+    one = analyze_stochastic_hosting_capacity(
+        max_workers=1,
+        progress_callback=lambda done, total: progress.append(done),
+        **kwargs,
+    )
+    two = analyze_stochastic_hosting_capacity(max_workers=2, **kwargs)
+
+    assert one["success"], one.get("errors")
+    assert two["success"], two.get("errors")
+    assert one["data"] == two["data"]
+    assert progress == list(range(1, 7))
+    assert one["metadata"]["total_solves"] == 6 * len(LEVELS)
+
+
+def test_penetration_curve_and_hosting_capacity():
+    """Probabilities, adopter counts and scenario capacities are consistent."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = analyze_stochastic_hosting_capacity(
+        num_scenarios=8, penetration_levels=LEVELS, load_multiplier=0.4, max_workers=1
+    )
+
+    assert result["success"], result.get("errors")
+    data = result["data"]
+    curve = data["penetration_curve"]
+    assert [point["penetration_pct"] for point in curve] == LEVELS
+    assert [point["customers_with_pv"] for point in curve] == [
+        3,
+        9,
+        data["num_customers"],
+    ]
+    for point in curve:
+        assert 0 <= point["violation_probability"] <= 1
+        assert point["violation_probability"] >= point["overvoltage_probability"]
+
+    hosting = data["hosting_capacity"]
+    capacities = [row["hosting_capacity_pct"] for row in data["scenarios"]]
+    assert set(capacities) <= {0.0, *LEVELS}
+    assert hosting["scenario_pct"]["min"] == min(capacities)
+    assert hosting["minimum_pct"] <= hosting["scenario_pct"]["median"]
+    assert hosting["scenario_pct"]["max"] <= hosting["maximum_pct"]
+    assert sum(hosting["limiting_constraint_counts"].values()) == 8
+
+
+def test_no_violations_with_loose_limits():
+    """With small PV and wide limits, every level hosts PV."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = analyze_stochastic_hosting_capacity(
+        num_scenarios=3,
+        penetration_levels=LEVELS,
+        pv_size_range=[0.1, 0.2],
+        constraints={
+            "min_voltage_pu": 0.8,
+            "max_voltage_pu": 1.2,
+            "max_line_loading_pct": 1e6,
+        },
+        max_workers=1,
+        inline_limit=0,
+    )
+
+    assert result["success"], result.get("errors")
+    data = result["data"]
+    assert data["hosting_capacity"]["minimum_pct"] == 100.0
+    assert data["hosting_capacity"]["scenarios_without_violation"] == 3
+    assert all(p["violation_probability"] == 0 for p in data["penetration_curve"])
+
+    # Per-scenario rows were moved to the result store
+    assert data["stored_fields"] == ["scenarios"]
+    page = fetch_result(data["result_handle"], "scenarios")
+    assert page["data"]["total"] == 3
+
+
+def test_invalid_inputs():
+    """Bad parameters and a missing circuit are reported as errors."""
+    load_ieee_test_feeder("IEEE13")
+
+    for kwargs in (
+        {"num_scenarios": 0},
+        {"penetration_levels": [0, 50]},
+        {"pv_size_range": [2, 1]},
+        {"solve_strategy": "hot"},
+    ):
+        assert not analyze_stochastic_hosting_capacity(**kwargs)["success"], kwargs
+
+    dss.Text.Command("Clear")
+    result = analyze_stochastic_hosting_capacity(num_scenarios=1)
+    assert not result["success"]
+    assert "circuit" in result["errors"][0].lower()
@@ -0,0 +1,79 @@
+"""
+Tests for the synthetic radial feeder generator.
+"""
+
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.tools.power_flow import run_power_flow
+from opendss_mcp.utils.synthetic_feeder import (
+    generate_feeder_script,
+    write_synthetic_feeder,
+)
+
+
+def test_script_is_deterministic():
+    """The same parameters and seed give the same script; another seed does not."""
+    script = generate_feeder_script(500, seed=3)
+    assert script == generate_feeder_script(500, seed=3)
+    assert script != generate_feeder_script(500, seed=4)
+    assert script.count("New Line.") == 500 - 2
+
+
+def test_generated_feeder_solves(tmp_path):
+    """A compiled feeder has the requested buses and consistent phasing."""
+    path = write_synthetic_feeder(
+        4000, lateral_depth=4, pv_density=0.5, seed=1, directory=tmp_path
+    )
+    assert (
+        write_synthetic_feeder(
+            4000, lateral_depth=4, pv_density=0.5, seed=1, directory=tmp_path
+        )
+        == path
+    )
+
+    dss.Text.Command(f"compile [{path}]")
+    dss.Solution.Solve()
+    assert dss.Solution.Converged()
+    assert dss.Circuit.NumBuses() == 4000
+    assert dss.Transformers.Count() == 3
+    assert dss.PVsystems.Count() > 0
+
+    # A line never has phases that its upstream bus lacks
+    phases = {}
+    for line in dss.Lines.AllNames():
+        dss.Lines.Name(line)
+        bus1, *nodes1 = dss.Lines.Bus1().split(".")
+        bus2, *nodes2 = dss.Lines.Bus2().split(".")
+        assert nodes1 == nodes2
+        assert set(nodes1) <= phases.get(bus1, {"1", "2", "3"})
+        phases[bus2] = set(nodes2)
+
+
+def test_trunks_only_and_invalid_parameters(tmp_path):
+    """lateral_depth=0 gives bare trunks; bad parameters are rejected."""
+    script = generate_feeder_script(200, lateral_depth=0)
+    assert "linecode=lateral" not in script
+    assert script.count("linecode=trunk") == 198
+
+    with pytest.raises(ValueError, match="num_buses"):
+        generate_feeder_script(5)
+    with pytest.raises(ValueError, match="phase_mix"):
+        generate_feeder_script(100, phase_mix={4: 1.0})
+    with pytest.raises(ValueError, match="pv_density"):
+        write_synthetic_feeder(100, pv_density=1.5, directory=tmp_path)
+
+
+def test_load_synthetic_preset(tmp_path, monkeypatch):
+    """Presets load through the feeder loader like the IEEE feeders."""
+    monkeypatch.setenv("OPENDSS_MCP_SYNTHETIC_DIR", str(tmp_path))
+
+    result = load_ieee_test_feeder("SYNTH1K")
+    assert result["success"], result["errors"]
+    assert result["data"]["num_buses"] == 1000
+    assert list(tmp_path.glob("synth1k_*.dss"))
+
+    flow = run_power_flow("SYNTH1K")
+    assert flow["success"]
+    assert 0.9 < flow["data"]["min_voltage"] <= flow["data"]["max_voltage"] < 1.1
@@ -2,9 +2,11 @@
 Unit tests for time-series simulation functionality.
 """
 
+import numpy as np
 import pytest
 from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
 from opendss_mcp.tools.timeseries import run_time_series_simulation
+from opendss_mcp.utils.result_store import RESULTS_DIR_ENV, read_manifest, read_rows
 import opendssdirect as dss
 
 
@@ -481,6 +483,43 @@ def test_line_loading_statistics():
     assert abs(summary["max_line_loading_pct"] - overall_max) < 0.01
 
 
+def test_streaming_statistics():
+    """Percentiles, time beyond limits and per-bus extremes are summarized."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_time_series_simulation(
+        load_profile="residential_summer",
+        duration_hours=24,
+        timestep_minutes=60,
+        constraints={"max_line_loading_pct": 120.0},
+    )
+
+    assert result["success"]
+    timesteps = result["data"]["timesteps"]
+    summary = result["data"]["summary"]
+
+    voltage_stats = summary["voltage_statistics"]
+    assert voltage_stats["min"] <= voltage_stats["p05"] <= voltage_stats["p50"]
+    assert voltage_stats["p50"] <= voltage_stats["p95"] <= voltage_stats["max"]
+    lowest_step = min(timesteps, key=lambda ts: ts["min_voltage_pu"])
+    assert voltage_stats["min_hour"] == lowest_step["hour"]
+
+    losses = [ts["losses_kw"] for ts in timesteps]
+    assert summary["losses_statistics"]["std"] == pytest.approx(
+        np.std(losses), abs=0.02
+    )
+
+    overloaded = [ts for ts in timesteps if ts["max_line_loading_pct"] > 120.0]
+    overload = summary["time_beyond_limits"]["line_overload"]
+    assert overload["threshold"] == 120.0
+    assert overload["steps"] == len(overloaded)
+    assert overload["hours"] == len(overloaded)
+
+    worst = summary["worst_buses"]["lowest_voltage"][0]
+    assert worst["value"] == pytest.approx(summary["min_voltage_pu"], abs=1e-4)
+    assert len(summary["worst_buses"]["lowest_voltage"]) == 10
+
+
 def test_convergence_rate():
     """Test convergence rate calculation."""
     # Load feeder
@@ -509,5 +548,135 @@ def test_convergence_rate():
     assert abs(summary["convergence_rate_pct"] - expected_rate) < 0.01
 
 
+@pytest.mark.parametrize("generation_profile", [None, "solar_clear_day"])
+def test_loadshape_mode_matches_snapshot(generation_profile):
+    """Native LoadShape stepping gives the same results as Python scaling."""
+    results = {}
+    for mode in ["snapshot", "loadshape"]:
+        load_ieee_test_feeder("IEEE13")
+        dss.Text.Command(
+            "New PVSystem.pv_ts Bus1=675.1.2.3 phases=3 kV=4.16 kVA=500 Pmpp=500 irradiance=1"
+        )
+        results[mode] = run_time_series_simulation(
+            load_profile="residential_summer",
+            generation_profile=generation_profile,
+            duration_hours=24,
+            mode=mode,
+        )
+        assert results[mode]["success"], results[mode]["errors"]
+
+    snapshot = results["snapshot"]["data"]["timesteps"]
+    loadshape = results["loadshape"]["data"]["timesteps"]
+    assert [ts["losses_kw"] for ts in loadshape] == pytest.approx(
+        [ts["losses_kw"] for ts in snapshot], abs=0.01
+    )
+    assert [ts["min_voltage_pu"] for ts in loadshape] == pytest.approx(
+        [ts["min_voltage_pu"] for ts in snapshot], abs=1e-4
+    )
+    assert results["loadshape"]["metadata"]["mode"] == "loadshape"
+
+
+def test_loadshape_mode_multi_day():
+    """Runs over 24 hours use yearly mode and leave the circuit as they found it."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_time_series_simulation(
+        load_profile="residential_summer",
+        duration_hours=48,
+        timestep_minutes=30,
+        mode="loadshape",
+    )
+
+    assert result["success"]
+    assert len(result["data"]["timesteps"]) == 96
+    assert result["data"]["summary"]["convergence_rate_pct"] == 100.0
+    assert dss.Solution.ModeID() == "Snap"
+
+    dss.Loads.First()
+    assert dss.Loads.Yearly() == ""
+
+
+def test_loadshape_mode_restores_pv_and_shapes():
+    """Shapes and irradiance replaced for a loadshape run are put back."""
+    load_ieee_test_feeder("IEEE13")
+    dss.Text.Command("New LoadShape.own npts=2 interval=12 mult=[0.5 1.0]")
+    dss.Text.Command("Edit Load.671 daily=own")
+    dss.Text.Command(
+        "New PVSystem.pv_ts Bus1=675.1.2.3 phases=3 kV=4.16 kVA=500 Pmpp=500 irradiance=0.6"
+    )
+    dss.Solution.Solve()
+    dss.Circuit.SetActiveElement("PVSystem.pv_ts")
+    pv_kw = sum(dss.CktElement.Powers()[0::2])
+
+    result = run_time_series_simulation(
+        load_profile="residential_summer",
+        generation_profile="solar_clear_day",
+        duration_hours=24,
+        mode="loadshape",
+    )
+    assert result["success"], result["errors"]
+
+    dss.Loads.Name("671")
+    assert dss.Loads.Daily() == "own"
+    dss.Loads.Name("634a")
+    assert dss.Loads.Daily() == ""
+    dss.PVsystems.Name("pv_ts")
+    assert dss.PVsystems.Irradiance() == pytest.approx(0.6)
+    assert dss.PVsystems.daily().lower() != "mcp_ts_gen"
+
+    # The stand-in for the cleared PV shape leaves daily output unchanged
+    dss.Text.Command("Set Mode=Daily Stepsize=1h Number=1")
+    dss.Solution.Hour(12)
+    dss.Solution.Solve()
+    dss.Circuit.SetActiveElement("PVSystem.pv_ts")
+    assert sum(dss.CktElement.Powers()[0::2]) == pytest.approx(pv_kw, rel=1e-3)
+
+
+def test_invalid_mode():
+    """Test that an unsupported mode is rejected."""
+    load_ieee_test_feeder("IEEE13")
+
+    result = run_time_series_simulation(
+        load_profile="residential_summer", mode="realtime"
+    )
+
+    assert not result["success"]
+    assert "Unsupported mode" in result["errors"][0]
+
+
+def test_streaming_output(tmp_path, monkeypatch):
+    """Streamed runs return a handle whose rows match the in-memory results."""
+    monkeypatch.setenv(RESULTS_DIR_ENV, str(tmp_path))
+    kwargs = {
+        "load_profile": "residential_summer",
+        "duration_hours": 24,
+        "output_variables": ["voltages", "losses", "loadings", "powers"],
+    }
+
+    load_ieee_test_feeder("IEEE13")
+    inline = run_time_series_simulation(**kwargs)
+    load_ieee_test_feeder("IEEE13")
+    streamed = run_time_series_simulation(stream=True, shard_steps=10, **kwargs)
+
+    assert streamed["success"], streamed["errors"]
+    data = streamed["data"]
+    assert "timesteps" not in data
+    assert data["num_shards"] == 3
+    assert data["summary"] == inline["data"]["summary"]
+
+    rows = read_rows(data["result_handle"])
+    timesteps = inline["data"]["timesteps"]
+    assert rows["losses_kw"].tolist() == [ts["losses_kw"] for ts in timesteps]
+    assert rows["min_voltage_pu"] == pytest.approx(
+        rows["bus_voltages_pu"].min(axis=1), abs=1e-4
+    )
+
+    labels = read_manifest(data["result_handle"])["labels"]
+    bus_index = labels["bus_kw"].index("675")
+    assert rows["bus_kw"][:, bus_index].tolist() == [
+        ts["bus_powers"]["675"]["kw"] for ts in timesteps
+    ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
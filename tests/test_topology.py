@@ -0,0 +1,94 @@
+"""
+Unit tests for the topology index of the compiled circuit.
+"""
+
+import numpy as np
+import opendssdirect as dss
+import pytest
+
+from opendss_mcp.tools.feeder_loader import load_ieee_test_feeder
+from opendss_mcp.utils.topology import get_topology, invalidate_topology
+
+
+def test_ieee13_tree():
+    """Parents, paths and distances follow the IEEE 13 bus feeder."""
+    load_ieee_test_feeder("IEEE13")
+    topology = get_topology()
+
+    assert [topology.bus_names[b] for b in topology.source_buses] == ["sourcebus"]
+    assert np.all(topology.depth >= 0)
+    assert topology.path_to_source("675") == [
+        "675",
+        "692",
+        "671",
+        "670",
+        "632",
+        "rg60",
+        "650",
+        "sourcebus",
+    ]
+    assert topology.path_elements("611") == [
+        "Line.684611",
+        "Line.671684",
+        "Line.670671",
+        "Line.632670",
+        "Line.650632",
+        "Transformer.reg1",
+        "Transformer.sub",
+    ]
+    assert topology.parent_of("SourceBus") is None
+    assert sorted(topology.children("632")) == ["633", "645", "670"]
+
+    # 650632 + 632670 + 670671 + 671684 + 684611 = 4600 ft
+    assert topology.distance_km[topology.bus_index("611")] == pytest.approx(
+        4600 * 0.0003048
+    )
+
+    # The parallel single-phase regulators close loops around reg1
+    assert topology.loops == ["Transformer.reg2", "Transformer.reg3"]
+
+
+def test_element_lookup_and_subtrees():
+    """Elements are listed at their buses; subtrees come from pre-order ranges."""
+    load_ieee_test_feeder("IEEE13")
+    topology = get_topology()
+
+    assert "Load.611" in topology.elements_at("611")
+    assert "Capacitor.cap2" in topology.elements_at("611")
+    assert "Vsource.source" in topology.elements_at("sourcebus")
+    assert sorted(topology.neighbors("684")) == ["611", "652", "671"]
+
+    assert sorted(topology.downstream("684")) == ["611", "652", "684"]
+    assert len(topology.downstream("sourcebus")) == len(topology.bus_names)
+    assert topology.is_downstream("652", "671")
+    assert not topology.is_downstream("633", "671")
+
+    assert topology.has_bus("RG60") and not topology.has_bus("nope")
+    with pytest.raises(ValueError):
+        topology.children("nope")
+
+    lines = {line["name"]: line for line in topology.lines()}
+    assert lines["650632"] == {"name": "650632", "bus1": "rg60", "bus2": "632"}
+    assert len(lines) == len(dss.Lines.AllNames())
+
+
+def test_index_is_reused_until_the_circuit_changes():
+    """Re-solving keeps the index; new elements and recompiles rebuild it."""
+    load_ieee_test_feeder("IEEE13")
+    topology = get_topology()
+
+    dss.Solution.Solve()
+    dss.Text.Command("Open Line.671692 1")
+    assert get_topology() is topology
+
+    dss.Text.Command("New Line.extra Bus1=675 Bus2=extra_bus Length=0.1 Units=km")
+    dss.Solution.Solve()
+    extended = get_topology()
+    assert extended is not topology
+    assert extended.parent_of("extra_bus") == "675"
+
+    invalidate_topology()
+    assert get_topology() is not extended
+
+    load_ieee_test_feeder("IEEE13")
+    assert not get_topology().has_bus("extra_bus")
@@ -5,6 +5,7 @@ Tests for the validators module.
 import pytest
 from unittest.mock import MagicMock
 
+from opendss_mcp.utils.dss_wrapper import NameIndex
 from opendss_mcp.utils.validators import (
     validate_bus_id,
     validate_positive_float,
@@ -22,7 +23,7 @@ class TestValidateBusId:
     def test_valid_bus_id(self):
         """Test that a valid bus ID passes validation."""
         mock_circuit = MagicMock()
-        mock_circuit.get_bus_names.return_value = ["bus1", "bus2", "bus3"]
+        mock_circuit.name_index.return_value = NameIndex(["bus1", "bus2", "bus3"])
 
         # Should not raise any exception
         validate_bus_id("bus1", mock_circuit)
@@ -32,7 +33,7 @@ class TestValidateBusId:
     def test_invalid_bus_id(self):
         """Test that an invalid bus ID raises ValueError."""
         mock_circuit = MagicMock()
-        mock_circuit.get_bus_names.return_value = ["bus1", "bus2", "bus3"]
+        mock_circuit.name_index.return_value = NameIndex(["bus1", "bus2", "bus3"])
 
         with pytest.raises(RuntimeError, match="Error validating bus ID"):
             validate_bus_id("invalid_bus", mock_circuit)
@@ -40,7 +41,7 @@ class TestValidateBusId:
     def test_bus_validation_with_circuit_error(self):
         """Test that circuit errors are wrapped in RuntimeError."""
         mock_circuit = MagicMock()
-        mock_circuit.get_bus_names.side_effect = Exception("Circuit error")
+        mock_circuit.name_index.side_effect = Exception("Circuit error")
 
         with pytest.raises(RuntimeError, match="Error validating bus ID"):
             validate_bus_id("bus1", mock_circuit)
@@ -48,18 +49,21 @@ class TestValidateBusId:
     def test_bus_id_error_message_includes_samples(self):
         """Test that error message includes sample buses."""
         mock_circuit = MagicMock()
-        mock_circuit.get_bus_names.return_value = [
-            "bus1",
-            "bus2",
-            "bus3",
-            "bus4",
-            "bus5",
-            "bus6",
-        ]
+        mock_circuit.name_index.return_value = NameIndex(
+            ["bus1", "bus2", "bus3", "bus4", "bus5", "bus6"]
+        )
 
-        with pytest.raises(RuntimeError, match="Error validating bus ID"):
+        with pytest.raises(RuntimeError, match="bus1, bus2, bus3, bus4, bus5\\.\\.\\."):
             validate_bus_id("invalid", mock_circuit)
 
+    def test_bus_id_is_case_insensitive(self):
+        """Test that bus IDs match regardless of case."""
+        mock_circuit = MagicMock()
+        mock_circuit.name_index.return_value = NameIndex(["SourceBus", "rg60"])
+
+        validate_bus_id("sourcebus", mock_circuit)
+        validate_bus_id("RG60", mock_circuit)
+
 
 class TestValidatePositiveFloat:
     """Tests for validate_positive_float function."""